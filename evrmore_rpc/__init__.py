@@ -25,7 +25,21 @@ https://github.com/manticore-tech/evrmore-rpc/issues
 __version__ = "4.0.0"
 
 # Client imports
-from evrmore_rpc.client import EvrmoreClient, EvrmoreConfig, EvrmoreRPCError
+from evrmore_rpc.client import EvrmoreClient, EvrmoreConfig
+from evrmore_rpc.exceptions import (
+    EvrmoreRPCError,
+    EvrmoreConnectionError,
+    EvrmoreWorkQueueError,
+    EvrmoreCircuitOpenError,
+    EvrmoreOverloadError
+)
+from evrmore_rpc.retry import RetryPolicy, CircuitBreaker
+from evrmore_rpc.cache import ResponseCache, CachePolicy
+from evrmore_rpc.diskcache import DiskCache
+from evrmore_rpc.limiter import ConcurrencyLimiter, AdaptiveLimiter
+from evrmore_rpc.pool import EvrmoreClientPool
+from evrmore_rpc.background import EvrmoreBackgroundClient
+from evrmore_rpc.batch import RPCBatch, BatchCall
 
 # If users need model classes, they can import them directly from the models module
 from evrmore_rpc.models import (
@@ -41,6 +55,21 @@ __all__ = [
     "EvrmoreClient",
     "EvrmoreConfig",
     "EvrmoreRPCError",
+    "EvrmoreConnectionError",
+    "EvrmoreWorkQueueError",
+    "EvrmoreCircuitOpenError",
+    "EvrmoreOverloadError",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "ResponseCache",
+    "CachePolicy",
+    "DiskCache",
+    "ConcurrencyLimiter",
+    "AdaptiveLimiter",
+    "EvrmoreClientPool",
+    "EvrmoreBackgroundClient",
+    "RPCBatch",
+    "BatchCall",
     "BlockchainInfo",
     "NetworkInfo",
     "Block",
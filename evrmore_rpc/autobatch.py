@@ -0,0 +1,146 @@
+"""
+evrmore-rpc: Transparent auto-batching for concurrent async calls
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+When enabled, every `await client.<command>(...)` issued within a short
+window is queued and flushed as one JSON-RPC batch. Each caller still gets
+its own result (or EvrmoreRPCError) back:
+
+    client = EvrmoreClient(auto_batch=True, auto_batch_max_delay=0.002)
+    counts = await asyncio.gather(*(client.getblockhash(h) for h in range(1000)))
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from evrmore_rpc.client import EvrmoreClient
+
+
+class AutoBatcher:
+    """
+    Collects async RPC calls and sends them as JSON-RPC batches.
+
+    A batch is flushed when it reaches max_size calls or when max_delay
+    seconds have passed since its first call, whichever comes first. With
+    max_delay=0 only calls issued in the same event loop iteration are
+    batched together.
+    """
+
+    def __init__(self, client: "EvrmoreClient", max_delay: float = 0.001, max_size: int = 100):
+        """
+        Initialize the auto-batcher.
+
+        Args:
+            client: The client used to send batches
+            max_delay: Maximum time in seconds a call waits for more calls to join its batch
+            max_size: Maximum number of calls per batch
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._client = client
+        self.max_delay = max_delay
+        self.max_size = max_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+        # Statistics
+        self.calls_sent = 0
+        self.batches_sent = 0
+
+    def submit(self, command: str, *args: Any) -> asyncio.Future:
+        """
+        Queue an RPC command for the next batch.
+
+        Args:
+            command: The RPC command to execute
+            args: Arguments for the command
+
+        Returns:
+            A future resolved with the command's result
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Calls from a new event loop (e.g. a second asyncio.run) start a clean queue
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+            self._tasks = set()
+
+        future = loop.create_future()
+        self._pending.append((self._client._prepare_payload(command, *args), future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._flush_handle is None:
+            if self.max_delay > 0:
+                self._flush_handle = loop.call_later(self.max_delay, self._flush)
+            else:
+                self._flush_handle = loop.call_soon(self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Send the queued calls as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        task = self._loop.create_task(self._send(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, pending: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Send a batch and resolve each caller's future from the matching response."""
+        payload = [request for request, _ in pending]
+        self.batches_sent += 1
+        self.calls_sent += len(payload)
+
+        try:
+            if len(payload) == 1:
+                # A lone call goes out as a plain request
+                response = await self._client._post_async(payload[0])
+                try:
+                    results = [self._client._handle_response(response, payload[0]["method"])]
+                except Exception as e:
+                    results = [e]
+            else:
+                response = await self._client._post_async(payload)
+                results = self._client._handle_batch_response(payload, response,
+                                                              return_exceptions=True)
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:
+            results = [e] * len(pending)
+
+        for (_, future), result in zip(pending, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def flush(self) -> None:
+        """Send any queued calls now and wait for all in-flight batches."""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get auto-batching statistics."""
+        return {
+            "calls_sent": self.calls_sent,
+            "batches_sent": self.batches_sent,
+            "avg_batch_size": self.calls_sent / self.batches_sent if self.batches_sent else 0.0,
+            "pending": len(self._pending),
+        }
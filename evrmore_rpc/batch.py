@@ -0,0 +1,185 @@
+"""
+evrmore-rpc: JSON-RPC batch builder
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Queue several RPC calls and send them to the node as one JSON-RPC array:
+
+    with client.batch() as batch:
+        hashes = [batch.getblockhash(height) for height in range(1000, 1100)]
+    blocks = client.execute_batch([("getblock", h.result()) for h in hashes])
+
+    async with client.batch() as batch:
+        info = batch.getblockchaininfo()
+    print(info.result()["blocks"])
+"""
+
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+from evrmore_rpc.utils import is_async_context
+
+if TYPE_CHECKING:
+    from evrmore_rpc.client import EvrmoreClient
+
+
+class BatchCall:
+    """
+    Placeholder for the result of a call queued on an RPCBatch.
+
+    The value becomes available once the batch has been executed.
+    """
+
+    def __init__(self, command: str, args: Tuple[Any, ...]):
+        self.command = command
+        self.args = args
+        self._done = False
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+
+    def done(self) -> bool:
+        """Return True once the batch containing this call has been executed."""
+        return self._done
+
+    def result(self) -> Any:
+        """
+        Get the result of the call.
+
+        Raises:
+            RuntimeError: If the batch has not been executed yet
+            EvrmoreRPCError: If the call failed on the node
+        """
+        if not self._done:
+            raise RuntimeError(f"Batch containing '{self.command}' has not been executed yet")
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self) -> Optional[BaseException]:
+        """Get the error raised by the call, or None if it succeeded."""
+        if not self._done:
+            raise RuntimeError(f"Batch containing '{self.command}' has not been executed yet")
+        return self._exception
+
+    def _set(self, value: Any) -> None:
+        """Resolve the placeholder with a result or an EvrmoreRPCError."""
+        if isinstance(value, Exception):
+            self._exception = value
+        else:
+            self._result = value
+        self._done = True
+
+    def __repr__(self) -> str:
+        state = "pending" if not self._done else ("error" if self._exception else "done")
+        return f"<BatchCall {self.command}{self.args!r} {state}>"
+
+
+class RPCBatch:
+    """
+    Builder that collects RPC calls and executes them as one JSON-RPC batch.
+
+    Any RPC command can be queued as a method call, exactly like on
+    EvrmoreClient; each returns a BatchCall placeholder. The batch is sent
+    when execute() is called or when a ``with``/``async with`` block exits
+    without an exception. A batch can be reused after it has been executed.
+    """
+
+    def __init__(self, client: "EvrmoreClient", return_exceptions: bool = False):
+        """
+        Initialize the batch builder.
+
+        Args:
+            client: The client used to send the batch
+            return_exceptions: Return failed entries from execute() instead of
+                               raising the first one
+        """
+        self._client = client
+        self._calls: List[BatchCall] = []
+        self.return_exceptions = return_exceptions
+
+    def add(self, command: str, *args: Any) -> BatchCall:
+        """
+        Queue an RPC command.
+
+        Args:
+            command: The RPC command to execute
+            args: Arguments for the command
+
+        Returns:
+            A placeholder resolved when the batch is executed
+        """
+        call = BatchCall(command, args)
+        self._calls.append(call)
+        return call
+
+    def __getattr__(self, name: str) -> Any:
+        """Queue RPC commands with the same syntax as EvrmoreClient."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def queue_call(*args: Any) -> BatchCall:
+            return self.add(name, *args)
+
+        return queue_call
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _take_calls(self) -> List[BatchCall]:
+        """Detach the queued calls so the batch can be reused."""
+        calls, self._calls = self._calls, []
+        return calls
+
+    def _resolve(self, calls: List[BatchCall], results: List[Any]) -> List[Any]:
+        """Resolve placeholders and apply the return_exceptions policy."""
+        for call, result in zip(calls, results):
+            call._set(result)
+
+        if not self.return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def execute_sync(self) -> List[Any]:
+        """Send the queued calls synchronously and return their results in order."""
+        calls = self._take_calls()
+        results = self._client.execute_batch_sync(
+            [(call.command, *call.args) for call in calls],
+            return_exceptions=True
+        )
+        return self._resolve(calls, results)
+
+    async def execute_async(self) -> List[Any]:
+        """Send the queued calls asynchronously and return their results in order."""
+        calls = self._take_calls()
+        results = await self._client.execute_batch_async(
+            [(call.command, *call.args) for call in calls],
+            return_exceptions=True
+        )
+        return self._resolve(calls, results)
+
+    def execute(self) -> Any:
+        """
+        Send the queued calls (sync or async, following the client's mode).
+
+        Returns:
+            The list of results, or a coroutine resolving to it in async context
+        """
+        async_mode = self._client._async_mode
+        if async_mode is None:
+            async_mode = is_async_context()
+        return self.execute_async() if async_mode else self.execute_sync()
+
+    def __enter__(self) -> "RPCBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None and self._calls:
+            self.execute_sync()
+
+    async def __aenter__(self) -> "RPCBatch":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None and self._calls:
+            await self.execute_async()
@@ -0,0 +1,251 @@
+"""
+evrmore-rpc: Bulk executor for many calls of one command
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+client.bulk() runs one RPC command over a large iterable of parameters,
+for example fetching 100k transactions:
+
+    for item in client.bulk("getrawtransaction", ((txid, True) for txid in txids), workers=8):
+        if item.ok:
+            store(item.result())
+        else:
+            log.warning("%s failed: %s", item.args, item.error)
+
+Parameters are sent in chunks of chunk_size calls, each chunk one JSON-RPC
+batch, by a pool of `workers` threads (or tasks, with `async for`). The
+input is read lazily and at most 2 * workers chunks are pending at a time,
+so memory stays bounded however long the input is.
+
+Every call gets a BulkResult: a failed call, or a chunk whose request
+failed outright, is reported on its own items and the run carries on.
+Results come out in input order, or as chunks complete with ordered=False.
+
+workers defaults to the client's connection pool size, so every worker has
+a pooled connection. With more workers than pool_maxsize, use
+thread_safe="pool" to make the extra workers wait instead of opening
+throwaway connections.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Deque, Iterable, Iterator, List, Optional,
+                    Set, Tuple)
+
+from evrmore_rpc.exceptions import EvrmoreRPCError
+from evrmore_rpc.transport import DEFAULT_POOL_SIZE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from evrmore_rpc.client import EvrmoreClient
+
+DEFAULT_CHUNK_SIZE = 100
+
+# Pending chunks per worker: finished ones wait here to be yielded in order
+BUFFER_FACTOR = 2
+
+# A chunk: its first index and the argument tuples of its calls
+_Chunk = Tuple[int, List[Tuple[Any, ...]]]
+
+
+class BulkResult:
+    """The outcome of one call in a bulk run."""
+
+    __slots__ = ("index", "args", "value", "error")
+
+    def __init__(self, index: int, args: Tuple[Any, ...], value: Any = None,
+                 error: Optional[EvrmoreRPCError] = None):
+        self.index = index
+        self.args = args
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the call succeeded."""
+        return self.error is None
+
+    def result(self) -> Any:
+        """
+        Get the call's result.
+
+        Raises:
+            EvrmoreRPCError: If the call failed
+        """
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+    def __repr__(self) -> str:
+        state = f"error={self.error}" if self.error is not None else "ok"
+        return f"<BulkResult #{self.index} {self.args!r} {state}>"
+
+
+class Bulk:
+    """
+    Runs one command over many parameters: iterate it with `for` or `async for`.
+
+    Yields a BulkResult per call. The parameters are consumed by the first
+    iteration.
+    """
+
+    def __init__(self, client: "EvrmoreClient", command: str, params: Iterable[Any],
+                 workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 ordered: bool = True):
+        """
+        Initialize the bulk run.
+
+        Args:
+            client: The client that sends the requests
+            command: The RPC command to call
+            params: One item per call: a tuple of arguments, or any other value
+                as the only argument
+            workers: Chunks in flight at the same time (defaults to the client's pool size)
+            chunk_size: Calls per JSON-RPC batch; 1 sends single calls
+            ordered: Yield results in input order instead of as chunks complete
+        """
+        if workers is None:
+            workers = client.pool_maxsize or DEFAULT_POOL_SIZE
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.client = client
+        self.command = command
+        self.params = params
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.completed = 0
+        self.failed = 0
+
+    def _chunks(self) -> Iterator[_Chunk]:
+        """Split the parameters into chunks of argument tuples."""
+        chunk: List[Tuple[Any, ...]] = []
+        first = 0
+        for index, item in enumerate(self.params):
+            chunk.append(item if isinstance(item, tuple) else (item,))
+            if len(chunk) == self.chunk_size:
+                yield first, chunk
+                chunk, first = [], index + 1
+        if chunk:
+            yield first, chunk
+
+    def _results(self, chunk: _Chunk, values: Any) -> List[BulkResult]:
+        """Pair a chunk's calls with their values, or with the error of the whole request."""
+        first, calls = chunk
+        if isinstance(values, EvrmoreRPCError):
+            values = [values] * len(calls)
+        results = []
+        for index, (args, value) in enumerate(zip(calls, values), first):
+            if isinstance(value, EvrmoreRPCError):
+                results.append(BulkResult(index, args, error=value))
+            else:
+                results.append(BulkResult(index, args, value))
+        return results
+
+    def _count(self, results: List[BulkResult]) -> List[BulkResult]:
+        for item in results:
+            self.completed += 1
+            self.failed += item.error is not None
+        return results
+
+    def _run_sync(self, chunk: _Chunk) -> List[BulkResult]:
+        client = self.client
+        calls = chunk[1]
+        try:
+            if len(calls) == 1:
+                try:
+                    values: Any = [client.execute_command_sync(self.command, *calls[0])]
+                except EvrmoreRPCError as e:
+                    values = [e]
+            else:
+                values = client.execute_batch_sync([(self.command, *args) for args in calls],
+                                                   return_exceptions=True)
+        except EvrmoreRPCError as e:
+            values = e
+        return self._results(chunk, values)
+
+    async def _run_async(self, chunk: _Chunk) -> List[BulkResult]:
+        client = self.client
+        calls = chunk[1]
+        try:
+            if len(calls) == 1:
+                try:
+                    values: Any = [await client.execute_command_async(self.command, *calls[0])]
+                except EvrmoreRPCError as e:
+                    values = [e]
+            else:
+                values = await client.execute_batch_async([(self.command, *args) for args in calls],
+                                                          return_exceptions=True)
+        except EvrmoreRPCError as e:
+            values = e
+        return self._results(chunk, values)
+
+    def __iter__(self) -> Iterator[BulkResult]:
+        chunks = self._chunks()
+        window = self.workers * BUFFER_FACTOR
+        # The executor's FIFO queue hands free threads the earliest chunks first
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="evrmore-bulk")
+        pending: Deque[Future] = deque()
+        try:
+            while True:
+                while len(pending) < window:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append(executor.submit(self._run_sync, chunk))
+                if not pending:
+                    return
+                if self.ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    done = [future for future in pending if future in finished]
+                    pending = deque(future for future in pending if future not in finished)
+                for future in done:
+                    yield from self._count(future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def __aiter__(self) -> AsyncIterator[BulkResult]:
+        chunks = self._chunks()
+        window = self.workers * BUFFER_FACTOR
+        # Waiters are woken in FIFO order, so the earliest chunks get slots first
+        slots = asyncio.Semaphore(self.workers)
+
+        async def run(chunk: _Chunk) -> List[BulkResult]:
+            async with slots:
+                return await self._run_async(chunk)
+
+        pending: Deque[asyncio.Future] = deque()
+        try:
+            while True:
+                while len(pending) < window:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append(asyncio.ensure_future(run(chunk)))
+                if not pending:
+                    return
+                if self.ordered:
+                    done = [pending.popleft()]
+                else:
+                    finished: Set[asyncio.Future]
+                    finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    done = [task for task in pending if task in finished]
+                    pending = deque(task for task in pending if task not in finished)
+                for task in done:
+                    for item in self._count(await task):
+                        yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def __repr__(self) -> str:
+        return (f"<Bulk {self.command} workers={self.workers} chunk_size={self.chunk_size} "
+                f"completed={self.completed} failed={self.failed}>")
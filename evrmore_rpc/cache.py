@@ -0,0 +1,498 @@
+"""
+evrmore-rpc: Chain-aware response cache
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Caches RPC responses according to how long they stay true:
+
+- IMMUTABLE: never changes once known, e.g. `getblock <hash>` or a raw
+  transaction. Blocks and verbose transactions with fewer than
+  reorg_depth confirmations are kept as TIP entries instead, since a
+  reorg could still orphan them.
+- TIP: valid until the next block, e.g. `getblockchaininfo`,
+  `getmininginfo`, `getassetdata`. All TIP entries are dropped when the
+  chain tip changes.
+- TTL: valid for a fixed number of seconds, e.g. `getrawmempool`.
+
+The tip is tracked by polling `getbestblockhash` every tip_poll_interval
+seconds, or by EvrmoreZMQClient hashblock notifications (attach_zmq).
+
+`getblockhash <height>` is keyed by height. It is cached as IMMUTABLE only
+when the height is at least reorg_depth blocks below the tip, and all
+height-keyed entries are dropped when a reorg is detected (the new tip
+does not build on the previous one).
+
+Entries are stored encoded with the client's JSON codec, which gives an
+exact byte size for the LRU budget and means every hit returns a fresh
+copy that callers may mutate. Note that `confirmations` in a cached block
+or transaction is the value at the time it was fetched.
+
+With a DiskCache attached (disk=...), IMMUTABLE entries that are not
+height-keyed are also written to disk, and memory misses fall back to
+it, so confirmed blocks and transactions survive restarts. warm_start
+fills the memory tier from the most recent disk entries. The async client
+uses get_async() and put_async(), which run the disk tier's SQLite I/O and
+compression in the event loop's default executor.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+from evrmore_rpc.codec import JSONCodec
+from evrmore_rpc.diskcache import DiskCache
+from evrmore_rpc.singleflight import call_key
+
+IMMUTABLE = "immutable"
+TIP = "tip"
+TTL = "ttl"
+
+# Returned by ResponseCache.get() when a call is not cached
+MISS = object()
+
+Classifier = Callable[[Sequence[Any], Any, "ResponseCache"], Tuple[str, Optional[int]]]
+
+
+class CachePolicy:
+    """How long the response to one RPC command stays valid."""
+
+    __slots__ = ("kind", "ttl", "classify")
+
+    def __init__(self, kind: str, ttl: Optional[float] = None,
+                 classify: Optional[Classifier] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            kind: IMMUTABLE, TIP or TTL
+            ttl: Lifetime in seconds (TTL policies)
+            classify: Optional function (args, result, cache) -> (kind, height)
+                      deciding the kind per response; height makes the entry height-keyed
+        """
+        if kind not in (IMMUTABLE, TIP, TTL):
+            raise ValueError(f"Unknown cache policy kind {kind!r}")
+        if kind == TTL and ttl is None:
+            raise ValueError("TTL policies need a ttl")
+        self.kind = kind
+        self.ttl = ttl
+        self.classify = classify
+
+    def resolve(self, args: Sequence[Any], result: Any,
+                cache: "ResponseCache") -> Tuple[str, Optional[int]]:
+        """Get the kind and height key for a response."""
+        if self.classify is None:
+            return self.kind, None
+        return self.classify(args, result, cache)
+
+    def __repr__(self) -> str:
+        return f"<CachePolicy {self.kind}{f' ttl={self.ttl}' if self.ttl is not None else ''}>"
+
+
+def _by_confirmations(args: Sequence[Any], result: Any,
+                      cache: "ResponseCache") -> Tuple[str, Optional[int]]:
+    """Blocks and transactions are immutable once buried deeper than reorg_depth."""
+    if isinstance(result, dict) and result.get("confirmations", 0) < cache.reorg_depth:
+        return TIP, None
+    return IMMUTABLE, None
+
+
+def _by_height(args: Sequence[Any], result: Any,
+               cache: "ResponseCache") -> Tuple[str, Optional[int]]:
+    """Height lookups are immutable once the height is reorg_depth below the tip."""
+    height = args[0] if args else None
+    if not isinstance(height, int):
+        return TIP, None
+    if cache.tip_height is not None and height <= cache.tip_height - cache.reorg_depth:
+        return IMMUTABLE, height
+    return TIP, height
+
+
+DEFAULT_TTL = 2.0
+
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    # Immutable once confirmed
+    "getblock": CachePolicy(IMMUTABLE, classify=_by_confirmations),
+    "getblockheader": CachePolicy(IMMUTABLE, classify=_by_confirmations),
+    "getrawtransaction": CachePolicy(IMMUTABLE, classify=_by_confirmations),
+    "getblockhash": CachePolicy(IMMUTABLE, classify=_by_height),
+    "decodeblock": CachePolicy(IMMUTABLE),
+    "decoderawtransaction": CachePolicy(IMMUTABLE),
+    "decodescript": CachePolicy(IMMUTABLE),
+
+    # Valid until the next block
+    **{command: CachePolicy(TIP) for command in (
+        "getbestblockhash", "getblockchaininfo", "getblockcount", "getchaintips", "getdifficulty",
+        "getmininginfo", "getnetworkhashps", "gettxoutsetinfo", "getblockhashes",
+        "getassetdata", "listassets", "listaddressesbyasset", "listassetbalancesbyaddress",
+        "getsnapshot",
+        "getaddressbalance", "getaddressdeltas", "getaddresstxids", "getaddressutxos",
+        "checkaddressrestriction", "checkaddresstag", "checkglobalrestriction", "getverifierstring",
+        "listaddressesfortag", "listaddressrestrictions", "listglobalrestrictions",
+        "listtagsforaddress",
+    )},
+
+    # Change with the mempool or the network
+    **{command: CachePolicy(TTL, ttl=DEFAULT_TTL) for command in (
+        "getrawmempool", "getmempoolinfo", "getmempoolentry", "getmempoolancestors",
+        "getmempooldescendants",
+        "getaddressmempool", "gettxout", "getspentinfo", "estimatesmartfee", "estimatefee",
+        "getnetworkinfo", "getpeerinfo", "getconnectioncount", "getnettotals",
+    )},
+}
+
+
+class _Entry:
+    __slots__ = ("data", "kind", "expires", "height", "size")
+
+    def __init__(self, data: bytes, kind: str, expires: Optional[float], height: Optional[int],
+                 size: int):
+        self.data = data
+        self.kind = kind
+        self.expires = expires
+        self.height = height
+        self.size = size
+
+
+class ResponseCache:
+    """
+    LRU response cache with a byte budget and chain-tip invalidation.
+
+    Thread-safe; shared by the sync and async paths of a client.
+    """
+
+    def __init__(self,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 policies: Optional[Mapping[str, Optional[CachePolicy]]] = None,
+                 reorg_depth: int = 6,
+                 tip_poll_interval: Optional[float] = 1.0,
+                 disk: Optional[DiskCache] = None,
+                 warm_start: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Budget for encoded responses; least recently used entries are evicted
+            policies: Per-command overrides of DEFAULT_POLICIES (None disables caching a command)
+            reorg_depth: Confirmations after which blocks, transactions and heights are immutable
+            tip_poll_interval: Seconds between getbestblockhash polls (None to rely on attach_zmq)
+            disk: Persistent second tier for immutable responses
+            warm_start: Fill memory from the disk tier when the cache is bound to a client
+        """
+        self.max_bytes = max_bytes
+        self.reorg_depth = reorg_depth
+        self.tip_poll_interval = tip_poll_interval
+        self.policies: Dict[str, CachePolicy] = dict(DEFAULT_POLICIES)
+        for command, policy in (policies or {}).items():
+            if policy is None:
+                self.policies.pop(command, None)
+            else:
+                self.policies[command] = policy
+        self.disk = disk
+        self.warm_start = warm_start
+
+        # Set by the owning client (see bind)
+        self.codec: Optional[JSONCodec] = None
+
+        self.tip_hash: Optional[str] = None
+        self.tip_height: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._last_tip_check = float("-inf")
+        self._pending_tip: Optional[str] = None
+        self._generation = 0
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.tips_seen = 0
+        self.reorgs = 0
+        self.disk_hits = 0
+
+    def bind(self, codec: JSONCodec) -> None:
+        """Attach the owning client's codec, warm-starting from disk if configured."""
+        self.codec = codec
+        if self.disk is not None and self.warm_start:
+            self.load_from_disk()
+
+    def _disk_key(self, key: Tuple[str, str]) -> str:
+        # Satoshi-mode responses are encoded differently, so each number mode gets its own keys
+        return f"{self.codec.numbers}/{key[0]}/{key[1]}"
+
+    def load_from_disk(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Fill the memory tier with the most recent disk entries.
+
+        Args:
+            max_bytes: Bytes to load (defaults to max_bytes)
+
+        Returns:
+            The number of entries loaded
+        """
+        budget = self.max_bytes if max_bytes is None else min(max_bytes, self.max_bytes)
+        prefix = f"{self.codec.numbers}/"
+        loaded = []
+        used = 0
+        for disk_key, data in self.disk.iter_recent():
+            if not disk_key.startswith(prefix):
+                continue
+            command, args_json = disk_key[len(prefix):].split("/", 1)
+            size = len(data) + len(args_json) + len(command)
+            if used + size > budget:
+                break
+            loaded.append(((command, args_json), _Entry(data, IMMUTABLE, None, None, size)))
+            used += size
+        with self._lock:
+            # Oldest first, so the newest end up most recently used
+            for key, entry in reversed(loaded):
+                self._insert(key, entry)
+        return len(loaded)
+
+    def handles(self, command: str) -> bool:
+        """Check whether responses to a command are cached."""
+        return command in self.policies
+
+    def get(self, command: str, args: Sequence[Any]) -> Any:
+        """
+        Look up a cached response.
+
+        Args:
+            command: The RPC command
+            args: Arguments of the call
+
+        Returns:
+            A fresh copy of the cached result, or MISS
+        """
+        key = call_key(command, tuple(args))
+        data = self._get_from_memory(key)
+        if data is None:
+            data = self._get_from_disk(command, key)
+        return self._decode(command, data)
+
+    async def get_async(self, command: str, args: Sequence[Any]) -> Any:
+        """Look up a cached response like get(), reading the disk tier off the event loop."""
+        key = call_key(command, tuple(args))
+        data = self._get_from_memory(key)
+        if data is None and self._uses_disk(command):
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(None, self._get_from_disk, command, key)
+        return self._decode(command, data)
+
+    def _decode(self, command: str, data: Optional[bytes]) -> Any:
+        if data is None:
+            with self._lock:
+                self.misses += 1
+            return MISS
+        return self.codec.convert_result(command, self.codec.loads(data))
+
+    def _get_from_memory(self, key: Tuple[str, str]) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires is not None and entry.expires <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.data
+
+    def _uses_disk(self, command: str) -> bool:
+        policy = self.policies.get(command)
+        return self.disk is not None and policy is not None and policy.kind == IMMUTABLE
+
+    def _get_from_disk(self, command: str, key: Tuple[str, str]) -> Optional[bytes]:
+        if not self._uses_disk(command):
+            return None
+        data = self.disk.get(self._disk_key(key))
+        if data is None:
+            return None
+        size = len(data) + len(key[1]) + len(command)
+        with self._lock:
+            self.disk_hits += 1
+            self.hits += 1
+            if size <= self.max_bytes:
+                self._insert(key, _Entry(data, IMMUTABLE, None, None, size))
+        return data
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped on every tip change; pass it to put() to reject stale responses."""
+        return self._generation
+
+    def put(self, command: str, args: Sequence[Any], result: Any,
+            generation: Optional[int] = None) -> None:
+        """
+        Store a response according to its command's policy.
+
+        Args:
+            command: The RPC command
+            args: Arguments of the call
+            result: The decoded result
+            generation: The generation read before the request was sent; TIP
+                        responses are not stored if the tip moved since
+        """
+        disk_entry = self._put(command, args, result, generation)
+        if disk_entry is not None:
+            self.disk.put(*disk_entry)
+
+    async def put_async(self, command: str, args: Sequence[Any], result: Any,
+                        generation: Optional[int] = None) -> None:
+        """Store a response like put(), writing the disk tier off the event loop."""
+        disk_entry = self._put(command, args, result, generation)
+        if disk_entry is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.disk.put, *disk_entry)
+
+    def _put(self, command: str, args: Sequence[Any], result: Any,
+             generation: Optional[int]) -> Optional[Tuple[str, bytes]]:
+        """Store a response in memory; returns the (key, data) to write to the disk tier, if any."""
+        policy = self.policies.get(command)
+        if policy is None:
+            return None
+        kind, height = policy.resolve(args, result, self)
+        if kind == TIP and self.tip_hash is None and self.tip_poll_interval is None:
+            # Nothing would ever invalidate it
+            return None
+
+        key = call_key(command, tuple(args))
+        data = self.codec.dumps(result)
+        size = len(data) + len(key[1]) + len(command)
+        expires = time.monotonic() + policy.ttl if kind == TTL else None
+
+        disk_entry = None
+        if kind == IMMUTABLE and height is None and self.disk is not None:
+            disk_entry = (self._disk_key(key), data)
+        if size <= self.max_bytes:
+            with self._lock:
+                if kind != TIP or generation is None or generation == self._generation:
+                    self._insert(key, _Entry(data, kind, expires, height, size))
+        return disk_entry
+
+    def _insert(self, key: Hashable, entry: _Entry) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def _drop(self, predicate: Callable[[_Entry], bool]) -> None:
+        for key in [key for key, entry in self._entries.items() if predicate(entry)]:
+            self._remove(key)
+
+    # Chain tip tracking
+
+    def claim_tip_check(self) -> bool:
+        """
+        Check whether the tip should be re-checked now, and if so claim the check.
+
+        Only one caller gets True per interval (or per pending notification).
+        """
+        with self._lock:
+            now = time.monotonic()
+            due = self._pending_tip is not None or (
+                self.tip_poll_interval is not None
+                and now - self._last_tip_check >= self.tip_poll_interval
+            )
+            if due:
+                self._last_tip_check = now
+            return due
+
+    def take_pending_tip(self) -> Optional[str]:
+        """Take the block hash from the latest tip notification, if any."""
+        with self._lock:
+            block_hash, self._pending_tip = self._pending_tip, None
+            return block_hash
+
+    def note_tip(self, block_hash: str) -> None:
+        """
+        Record a new tip announced by a notification.
+
+        TIP entries are dropped at once; the tip's height is resolved by the
+        client on its next call.
+        """
+        with self._lock:
+            if block_hash == self.tip_hash:
+                return
+            self._pending_tip = block_hash
+            self._generation += 1
+            self._drop(lambda entry: entry.kind == TIP)
+
+    def set_tip(self, block_hash: str, height: int, previous_hash: Optional[str] = None) -> None:
+        """
+        Move the cache to a new chain tip.
+
+        Args:
+            block_hash: Hash of the new tip
+            height: Height of the new tip
+            previous_hash: Hash of the block before it, used to detect reorgs
+        """
+        with self._lock:
+            if block_hash == self.tip_hash:
+                return
+            # Without the link to the old tip (e.g. several blocks arrived
+            # between polls) a reorg cannot be ruled out
+            extends = self.tip_hash is None or previous_hash == self.tip_hash
+            self._generation += 1
+            self._drop(lambda entry: entry.kind == TIP)
+            if not extends:
+                self.reorgs += 1
+                self._drop(lambda entry: entry.height is not None)
+            if self.tip_hash is not None:
+                self.tips_seen += 1
+            self.tip_hash = block_hash
+            self.tip_height = height
+
+    def attach_zmq(self, zmq_client: Any) -> None:
+        """
+        Invalidate on hashblock notifications from an EvrmoreZMQClient.
+
+        The ZMQ client must be subscribed to ZMQTopic.HASH_BLOCK.
+        """
+        from evrmore_rpc.zmq import ZMQTopic
+
+        @zmq_client.on(ZMQTopic.HASH_BLOCK)
+        def on_hashblock(notification: Any) -> None:
+            self.note_tip(notification.hex)
+
+    # Maintenance
+
+    def clear(self) -> None:
+        """Drop every in-memory entry (the disk tier is kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "tip_height": self.tip_height,
+                "tips_seen": self.tips_seen,
+                "reorgs": self.reorgs,
+                "disk_hits": self.disk_hits,
+                "disk": self.disk.get_stats() if self.disk is not None else None,
+            }
+
+    def __repr__(self) -> str:
+        return f"<ResponseCache {len(self._entries)} entries {self._bytes}/{self.max_bytes} bytes>"
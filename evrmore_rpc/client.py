@@ -5,18 +5,26 @@ Copyright (c) 2025 Manticore Technologies
 MIT License - See LICENSE file for details
 """
 
-from typing import Any, Dict, List, Optional, Union, Tuple, TypeVar, Type, cast, Callable, overload
+from typing import (AbstractSet, Any, Dict, List, Optional, Union, Tuple, TypeVar, Type, cast,
+                    Callable, overload, Iterable, Iterator, AsyncIterator, Awaitable, Sequence)
 import os
 import json
 import time
 import asyncio
+import itertools
+import socket
+import stat
 import statistics
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 import base64
 from decimal import Decimal
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel, Field
 from functools import wraps
 import inspect
@@ -29,20 +37,58 @@ from evrmore_rpc.models import (
     NetworkInfo
 )
 
+# Import exceptions
+from evrmore_rpc.exceptions import (
+    EvrmoreRPCError,
+    EvrmoreConnectionError,
+    EvrmoreWorkQueueError,
+    EvrmoreCircuitOpenError,
+    EvrmoreOverloadError
+)
+
 # Import utilities
 from evrmore_rpc.utils import sync_or_async, is_async_context, AwaitableResult
+from evrmore_rpc.batch import RPCBatch
+from evrmore_rpc.autobatch import AutoBatcher
+from evrmore_rpc.singleflight import SingleFlight, call_key
+from evrmore_rpc.commands import is_read_only
+from evrmore_rpc.codec import JSONCodec, get_codec
+from evrmore_rpc.methods import METHOD_TABLE, bind_methods
+from evrmore_rpc.retry import RetryPolicy, CircuitBreaker
+from evrmore_rpc.cache import ResponseCache, MISS
+from evrmore_rpc.limiter import ConcurrencyLimiter, AdaptiveLimiter
+from evrmore_rpc.stream import ResponseStream, StreamParser, CHUNK_SIZE
+from evrmore_rpc.projection import Projection, get_projection
+from evrmore_rpc.paginate import Paginator, DEFAULT_PAGE_SIZE, DEFAULT_PREFETCH
+from evrmore_rpc.blocks import BlockRange, DEFAULT_CONCURRENCY
+from evrmore_rpc.bulk import Bulk, DEFAULT_CHUNK_SIZE
+from evrmore_rpc.typed import TypedMethods
+from evrmore_rpc.compact import DeltaTable, UtxoTable
+from evrmore_rpc.transport import HTTPClientSession, UnixSocketAdapter, PerThreadSession
 
 # Default Evrmore data directory
 DEFAULT_DATADIR = Path.home() / ".evrmore"
 
+# Socket file EvrmoreConfig looks for in the data directory
+RPC_SOCKET_NAME = "rpc.sock"
+
+# Sync HTTP transports selectable with transport=
+SYNC_TRANSPORTS = ("requests", "http.client")
+
+# Ways to share the sync client between threads, selectable with thread_safe=
+THREAD_SAFE_MODES = ("pool", "per_thread")
+
+# evrmored defaults for the RPC server's capacity settings
+DEFAULT_RPC_THREADS = 4
+DEFAULT_RPC_WORKQUEUE = 16
+
+# Streamed entries added to a compact table at a time in async mode
+TABLE_CHUNK_SIZE = 1000
+
 # Type variables for better type hints
 T = TypeVar('T')  # Generic type for client
 R = TypeVar('R')  # Return type
 
-class EvrmoreRPCError(Exception):
-    """Exception raised when an RPC command fails."""
-    pass
-
 def format_command_args(*args: Any) -> List[str]:
     """Format command arguments for RPC calls."""
     formatted_args = []
@@ -58,6 +104,10 @@ def format_command_args(*args: Any) -> List[str]:
             formatted_args.append(str(arg))
     return formatted_args
 
+def _address_list(addresses: Union[str, Sequence[str]]) -> List[str]:
+    """Accept one address or several, as the address index commands take a list."""
+    return [addresses] if isinstance(addresses, str) else list(addresses)
+
 class EvrmoreConfig:
     """
     Parser for Evrmore configuration file (evrmore.conf).
@@ -183,6 +233,53 @@ class EvrmoreConfig:
             
         return host, port
     
+    def get_rpc_socket_path(self) -> Optional[str]:
+        """
+        Get the Unix domain socket the RPC server is reachable on, if any.
+        
+        Either set explicitly as rpcconnect=unix:/path/to/socket, or a
+        socket named rpc.sock in the (network's) data directory, e.g. one
+        created by a local socket-activated proxy in front of evrmored.
+        
+        Returns:
+            The socket path, or None to connect over TCP
+        """
+        rpcconnect = self.get('rpcconnect')
+        if isinstance(rpcconnect, str) and rpcconnect.startswith('unix:'):
+            return '/' + rpcconnect[len('unix:'):].lstrip('/')
+        
+        socket_path = self._get_config_path().parent / RPC_SOCKET_NAME
+        try:
+            if stat.S_ISSOCK(socket_path.stat().st_mode):
+                return str(socket_path)
+        except OSError:
+            pass
+        return None
+    
+    def get_rpc_server_limits(self) -> Dict[str, int]:
+        """
+        Get the RPC server capacity settings present in the configuration.
+        
+        Returns:
+            A dictionary with any of 'rpcthreads', 'rpcworkqueue' and
+            'rpcservertimeout' that are set in evrmore.conf. Values that are
+            not integers are left out with a warning.
+        """
+        limits = {}
+        for key in ('rpcthreads', 'rpcworkqueue', 'rpcservertimeout'):
+            value = self.get(key)
+            if value is None:
+                continue
+            try:
+                limits[key] = int(value)
+            except ValueError:
+                warnings.warn(
+                    f"Ignoring {key}={value!r} in {self._get_config_path()}: not an integer",
+                    RuntimeWarning,
+                    stacklevel=2
+                )
+        return limits
+    
     def get_zmq_endpoints(self) -> Dict[str, str]:
         """Get ZMQ endpoints from configuration."""
         endpoints = {}
@@ -227,6 +324,18 @@ class EvrmoreConfig:
         """Check if a configuration key exists."""
         return key in self.config_data
 
+class _PoolAdapter(HTTPAdapter):
+    """HTTPAdapter that applies socket options to every pooled connection."""
+    
+    def __init__(self, socket_options: List[Tuple[int, int, int]], **kwargs: Any):
+        self._socket_options = socket_options
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['socket_options'] = self._socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+@bind_methods
 class EvrmoreClient:
     """
     A polymorphic high-performance JSON-RPC client for Evrmore.
@@ -241,12 +350,30 @@ class EvrmoreClient:
                  rpcport: Optional[int] = None,
                  testnet: bool = False,
                  timeout: int = 30,
-                 async_mode: Optional[bool] = None):
+                 async_mode: Optional[bool] = None,
+                 auto_batch: bool = False,
+                 auto_batch_max_delay: float = 0.001,
+                 auto_batch_max_size: int = 100,
+                 single_flight: bool = False,
+                 pool_maxsize: Optional[int] = None,
+                 pool_maxsize_per_host: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None,
+                 tcp_nodelay: bool = True,
+                 prewarm_connections: int = 0,
+                 json_codec: Union[str, JSONCodec] = "auto",
+                 json_numbers: str = "float",
+                 retry: Union[bool, RetryPolicy, None] = None,
+                 circuit_breaker: Union[bool, CircuitBreaker] = False,
+                 cache: Union[bool, ResponseCache, None] = None,
+                 limiter: Union[bool, ConcurrencyLimiter, None] = None,
+                 transport: str = "requests",
+                 thread_safe: Union[bool, str] = False):
         """
         Initialize the RPC client.
         
         Args:
-            url: The URL of the Evrmore RPC server (e.g., http://localhost:8819/)
+            url: The URL of the Evrmore RPC server (e.g., http://localhost:8819/ or
+                 unix:///run/evrmored/rpc.sock)
             datadir: Path to Evrmore data directory (defaults to ~/.evrmore)
             rpcuser: RPC username (if not provided, will be read from config)
             rpcpassword: RPC password (if not provided, will be read from config)
@@ -254,6 +381,35 @@ class EvrmoreClient:
             testnet: Whether to use testnet
             timeout: Request timeout in seconds
             async_mode: Force async mode (True) or sync mode (False). If None, auto-detect based on context.
+            auto_batch: Send concurrent async calls as JSON-RPC batches
+            auto_batch_max_delay: Maximum time in seconds an async call waits for others to join
+                                  its batch
+            auto_batch_max_size: Maximum number of calls per auto-batch
+            single_flight: Share one request between identical read-only calls already in flight
+            pool_maxsize: Maximum number of pooled connections. Defaults to rpcthreads +
+                          rpcworkqueue when either is set in evrmore.conf, otherwise to the
+                          transport's default
+            pool_maxsize_per_host: Maximum number of connections per host (async transport).
+                                   Defaults to pool_maxsize
+            keepalive_timeout: Seconds an idle async connection is kept open. Defaults to just
+                               under rpcservertimeout when set in evrmore.conf, otherwise aiohttp's
+                               default
+            tcp_nodelay: Disable Nagle's algorithm on sync connections (aiohttp always enables it)
+            prewarm_connections: Number of connections to open when a session is initialized
+            json_codec: JSON codec name ("auto", "orjson", "simdjson", "ujson", "json") or instance
+            json_numbers: Decode fractional numbers as "float", exact "decimal", or integer
+                          "satoshis"
+            retry: Resend failed calls that are safe to resend; True for the default RetryPolicy
+            circuit_breaker: Fail fast while the node keeps failing; True for the default
+                             CircuitBreaker
+            cache: Cache responses by chain-aware per-command policies; True for the default
+                   ResponseCache
+            limiter: Bound in-flight async requests and queue the rest; True for a
+                     ConcurrencyLimiter sized to the node's rpcthreads + rpcworkqueue
+            transport: Sync HTTP transport: "requests", or "http.client" for lower per-call overhead
+            thread_safe: Share the sync client between threads: "pool" (or True) bounds all
+                threads to one pool of pool_maxsize connections, "per_thread" gives every thread
+                its own session
         """
         self.timeout = timeout
         self.testnet = testnet
@@ -262,25 +418,43 @@ class EvrmoreClient:
         # Determine async mode
         self._async_mode = async_mode
         if self._async_mode is None:
-            # Auto-detect based on whether we're in an async context
+            # Auto-detect once, based on whether we're in an async context, so
+            # calls return plain values (or coroutines) rather than AwaitableResult
+            # wrappers. reset() leaves the mode undetermined for clients shared
+            # between sync and async code; calls then return lazy AwaitableResults.
             self._async_mode = is_async_context()
         
         # Load configuration from evrmore.conf if available
         self.config = EvrmoreConfig(datadir=self.datadir, testnet=self.testnet)
         
+        # Initialize sessions to None, will be created when needed
+        self.async_session: Optional[aiohttp.ClientSession] = None
+        self.sync_session: Optional[Union[requests.Session, HTTPClientSession]] = None
+        
+        # Unix domain socket to reach the node on, instead of TCP
+        self.socket_path: Optional[str] = None
+        
         # If URL is provided, parse it for credentials
         if url:
             parsed_url = urlparse(url)
-            self.host = parsed_url.hostname or "127.0.0.1"
-            self.port = parsed_url.port or (8819 if not testnet else 18819)
             self.rpcuser = parsed_url.username or rpcuser
             self.rpcpassword = parsed_url.password or rpcpassword
-            self.url = f"http://{self.host}:{self.port}"
+            if parsed_url.scheme == "unix":
+                if not parsed_url.path:
+                    raise ValueError(f"unix:// URLs need an absolute socket path, "
+                                     f"e.g. unix:///run/evrmored/rpc.sock, got {url!r}")
+                self.socket_path = parsed_url.path
+            else:
+                self.host = parsed_url.hostname or "127.0.0.1"
+                self.port = parsed_url.port or (8819 if not testnet else 18819)
+                self.url = f"http://{self.host}:{self.port}"
         else:
-            # Get connection info from config
+            # Get connection info from config; an explicit port means TCP
             self.host, self.port = self.config.get_rpc_connection_info()
             if rpcport:
                 self.port = rpcport  # Override with explicit port if provided
+            else:
+                self.socket_path = self.config.get_rpc_socket_path()
             self.url = f"http://{self.host}:{self.port}"
             
             # Get credentials from config if not provided
@@ -289,9 +463,80 @@ class EvrmoreClient:
                 self.rpcuser = rpcuser or config_user
                 self.rpcpassword = rpcpassword or config_pass
         
-        # Initialize sessions to None, will be created when needed
-        self.async_session: Optional[aiohttp.ClientSession] = None
-        self.sync_session: Optional[requests.Session] = None
+        if self.socket_path is not None:
+            self.host, self.port = "localhost", None
+            self.url = f"unix://{self.socket_path}"
+        # Requests go to this URL; over a socket, only its Host header matters
+        self._post_url = "http://localhost" if self.socket_path is not None else self.url
+        
+        # Connection pool sizing, matched to the node's RPC capacity when known
+        limits = self.config.get_rpc_server_limits()
+        if pool_maxsize is None and ('rpcthreads' in limits or 'rpcworkqueue' in limits):
+            pool_maxsize = (limits.get('rpcthreads', DEFAULT_RPC_THREADS) +
+                            limits.get('rpcworkqueue', DEFAULT_RPC_WORKQUEUE))
+        if keepalive_timeout is None and limits.get('rpcservertimeout', 0) > 1:
+            # Close idle sockets before the node does, so we never reuse a dead one
+            keepalive_timeout = limits['rpcservertimeout'] - 1
+        self.pool_maxsize = pool_maxsize
+        self.pool_maxsize_per_host = pool_maxsize_per_host or pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+        self.tcp_nodelay = tcp_nodelay
+        self.prewarm_connections = prewarm_connections
+        
+        # Encodes request payloads and decodes response bodies
+        if isinstance(json_codec, JSONCodec):
+            self.codec = json_codec
+        else:
+            self.codec = get_codec(json_codec, json_numbers)
+        
+        # Monotonic JSON-RPC request ids (used to match batch responses)
+        self._request_ids = itertools.count(1)
+        
+        # Collects concurrent async calls into JSON-RPC batches when enabled
+        self.auto_batcher: Optional[AutoBatcher] = None
+        if auto_batch:
+            self.auto_batcher = AutoBatcher(self, max_delay=auto_batch_max_delay,
+                                            max_size=auto_batch_max_size)
+        
+        # Resends transient failures of calls that are safe to resend when enabled
+        self.retry_policy: Optional[RetryPolicy] = (
+            RetryPolicy() if retry is True else (retry or None)
+        )
+        
+        # Stops sending to the node while it keeps failing when enabled
+        self.circuit_breaker: Optional[CircuitBreaker] = (
+            CircuitBreaker() if circuit_breaker is True else (circuit_breaker or None)
+        )
+        
+        # Coalesces identical in-flight read-only calls when enabled
+        self.single_flight: Optional[SingleFlight] = SingleFlight() if single_flight else None
+        
+        # Serves repeated calls from memory until the chain moves on when enabled
+        self.cache: Optional[ResponseCache] = (
+            ResponseCache() if cache is True else (None if cache is False else cache)
+        )
+        if self.cache is not None:
+            self.cache.bind(self.codec)
+        
+        # Caps in-flight async requests and queues the overflow when enabled
+        if limiter is True:
+            limiter = ConcurrencyLimiter(max_in_flight=limits.get('rpcthreads', DEFAULT_RPC_THREADS)
+                                         + limits.get('rpcworkqueue', DEFAULT_RPC_WORKQUEUE))
+        self.limiter: Optional[ConcurrencyLimiter] = limiter or None
+        
+        if transport not in SYNC_TRANSPORTS:
+            raise ValueError(f"transport must be one of {SYNC_TRANSPORTS}, got {transport!r}")
+        self.transport = transport
+        if thread_safe is True:
+            thread_safe = "pool"
+        if thread_safe and thread_safe not in THREAD_SAFE_MODES:
+            raise ValueError(
+                f"thread_safe must be a bool or one of {THREAD_SAFE_MODES}, got {thread_safe!r}"
+            )
+        self.thread_safe: Optional[str] = thread_safe or None
+        # Guards lazy creation of the sync session against racing threads
+        self._sync_lock = threading.Lock()
+        self._typed: Optional[TypedMethods] = None
         
         self.headers = {
             'Content-Type': 'application/json',
@@ -316,18 +561,74 @@ class EvrmoreClient:
         """
         payload = {
             "jsonrpc": "1.0",
-            "id": str(time.time()),
+            "id": next(self._request_ids),
             "method": command,
-            "params": args
+            "params": list(args)
         }
         return payload
     
-    def _handle_response(self, response_data: Dict[str, Any]) -> Any:
+    def _encode_request(self, command: str, args: Sequence[Any]) -> bytes:
+        """
+        Encode a single JSON-RPC request.
+        
+        Known commands are encoded from their precomputed template; others
+        go through _prepare_payload.
+        
+        Args:
+            command: The RPC command to execute
+            args: Arguments for the command
+            
+        Returns:
+            The encoded request body
+        """
+        method = METHOD_TABLE.get(command)
+        if method is None:
+            return self.codec.dumps(self._prepare_payload(command, *args))
+        return method.encode(self.codec, args, next(self._request_ids))
+    
+    def _prepare_batch_payload(self,
+                               calls: Iterable[Union[str, Sequence[Any]]]) -> List[Dict[str, Any]]:
+        """
+        Prepare a JSON-RPC batch payload.
+        
+        Args:
+            calls: Calls to include, each either a command name or a
+                   ``(command, *args)`` tuple
+            
+        Returns:
+            A list of JSON-RPC payloads with unique ids
+        """
+        payload = []
+        for call in calls:
+            if isinstance(call, str):
+                payload.append(self._prepare_payload(call))
+            else:
+                command, *args = call
+                payload.append(self._prepare_payload(command, *args))
+        return payload
+    
+    def _retry_delay(self, commands: Sequence[str], error: EvrmoreRPCError,
+                     attempt: int) -> Optional[float]:
+        """Get the delay before resending a failed request, or None to raise the error."""
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.next_delay(commands, error, attempt)
+    
+    @staticmethod
+    def _http_error(status: int, text: str) -> EvrmoreRPCError:
+        """Build the error for a non-200 HTTP response."""
+        if status == 503 or "Work queue depth exceeded" in text:
+            return EvrmoreWorkQueueError(f"HTTP error {status}: {text}")
+        return EvrmoreRPCError(f"HTTP error {status}: {text}")
+    
+    def _handle_response(self, response_data: Dict[str, Any], command: Optional[str] = None) -> Any:
         """
         Handle the JSON-RPC response.
         
         Args:
             response_data: The JSON-RPC response data
+            command: The command the response is for, which decides how a bare
+                     amount result is decoded in the "satoshis" number mode
             
         Returns:
             The result of the RPC command
@@ -347,15 +648,111 @@ class EvrmoreClient:
         if "result" not in response_data:
             raise EvrmoreRPCError("No result in response")
         
-        return response_data["result"]
+        return self.codec.convert_result(command, response_data["result"])
+    
+    def _handle_batch_response(self, payload: List[Dict[str, Any]], response_data: Any,
+                               return_exceptions: bool = False) -> List[Any]:
+        """
+        Handle a JSON-RPC batch response.
+        
+        Responses are matched to requests by id, so the returned list is in the
+        same order as the payload regardless of the order the node answered in.
+        
+        Args:
+            payload: The batch payload that was sent
+            response_data: The decoded JSON-RPC batch response
+            return_exceptions: Return failed entries as EvrmoreRPCError instances
+                               instead of raising the first one
+            
+        Returns:
+            The results of the batched commands, in request order
+            
+        Raises:
+            EvrmoreRPCError: If the whole batch failed, or if an entry failed
+                             and return_exceptions is False
+        """
+        if not isinstance(response_data, list):
+            # The node rejected the batch as a whole
+            if isinstance(response_data, dict):
+                self._handle_response(response_data)
+            raise EvrmoreRPCError("Invalid batch response")
+        
+        responses = {item.get("id"): item for item in response_data if isinstance(item, dict)}
+        results: List[Any] = []
+        for request in payload:
+            item = responses.get(request["id"])
+            if item is None:
+                results.append(EvrmoreRPCError(
+                    f"No response for batch request {request['id']} ({request['method']})"
+                ))
+                continue
+            try:
+                results.append(self._handle_response(item, request["method"]))
+            except EvrmoreRPCError as e:
+                results.append(e)
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, EvrmoreRPCError):
+                    raise result
+        return results
     
     # Synchronous methods
     
     def initialize_sync(self) -> None:
         """Initialize the synchronous client session."""
-        if self.sync_session is None:
-            self.sync_session = requests.Session()
-            self.sync_session.headers.update(self.headers)
+        if self.sync_session is not None:
+            return
+        with self._sync_lock:
+            if self.sync_session is not None:
+                return
+            if self.thread_safe == "per_thread":
+                self.sync_session = PerThreadSession(self._new_sync_session)
+            else:
+                self.sync_session = self._new_sync_session()
+        
+        # Per-thread sessions are opened by each thread on its first call
+        if self.prewarm_connections > 0 and self.thread_safe != "per_thread":
+            self._prewarm_sync()
+    
+    def _new_sync_session(self) -> Union[requests.Session, HTTPClientSession]:
+        """Create a sync session for the configured transport."""
+        # A bounded pool makes extra threads wait for a connection instead of
+        # opening throwaway ones ("Connection pool is full" warnings)
+        pool_block = self.thread_safe == "pool"
+        if self.transport == "http.client":
+            return HTTPClientSession(self._post_url, self.headers, timeout=self.timeout,
+                                     pool_maxsize=self.pool_maxsize, tcp_nodelay=self.tcp_nodelay,
+                                     socket_path=self.socket_path, pool_block=pool_block)
+        
+        session = requests.Session()
+        session.headers.update(self.headers)
+        
+        socket_options = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)] if self.tcp_nodelay else []
+        adapter_kwargs: Dict[str, Any] = {}
+        if self.pool_maxsize is not None:
+            adapter_kwargs['pool_maxsize'] = self.pool_maxsize
+        if pool_block:
+            adapter_kwargs['pool_block'] = True
+        if self.socket_path is not None:
+            adapter = UnixSocketAdapter(self.socket_path, self.pool_maxsize, pool_block=pool_block)
+        else:
+            adapter = _PoolAdapter(socket_options, **adapter_kwargs)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+    
+    def _prewarm_sync(self) -> None:
+        """Open prewarm_connections pooled connections with concurrent cheap calls."""
+        def ping() -> None:
+            try:
+                self._post_sync(self._prepare_payload("uptime"))
+            except EvrmoreRPCError:
+                pass
+        
+        with ThreadPoolExecutor(max_workers=self.prewarm_connections) as executor:
+            for _ in range(self.prewarm_connections):
+                executor.submit(ping)
     
     def __enter__(self) -> 'EvrmoreClient':
         """Enter the synchronous context manager."""
@@ -367,13 +764,14 @@ class EvrmoreClient:
         if self.sync_session:
             self.sync_session.close()
     
-    def execute_command_sync(self, command: str, *args: Any) -> Any:
+    def execute_command_sync(self, command: str, *args: Any, fields: Any = None) -> Any:
         """
         Execute an RPC command synchronously.
         
         Args:
             command: The RPC command to execute
             args: Arguments for the command
+            fields: Field paths or a pydantic model class to project the result onto
             
         Returns:
             The result of the RPC command
@@ -381,40 +779,236 @@ class EvrmoreClient:
         Raises:
             EvrmoreRPCError: If the RPC command fails
         """
+        if fields is not None:
+            return self._execute_projected_sync(command, args, get_projection(fields))
+        cache = self.cache
+        if cache is not None and cache.handles(command):
+            self._check_tip_sync()
+            result = cache.get(command, args)
+            if result is not MISS:
+                return result
+            generation = cache.generation
+            result = self._execute_shared_sync(command, args)
+            cache.put(command, args, result, generation)
+            return result
+        return self._execute_shared_sync(command, args)
+    
+    def _execute_shared_sync(self, command: str, args: Sequence[Any]) -> Any:
+        """Execute a command synchronously, sharing identical in-flight read-only calls."""
+        if self.single_flight is not None and is_read_only(command):
+            return self.single_flight.do_sync(
+                call_key(command, args),
+                lambda: self._execute_command_sync(command, *args)
+            )
+        return self._execute_command_sync(command, *args)
+    
+    def _check_tip_sync(self) -> None:
+        """Invalidate tip-scoped cache entries if the chain tip moved."""
+        cache = self.cache
+        if not cache.claim_tip_check():
+            return
+        announced = cache.take_pending_tip()
+        try:
+            block_hash = announced or self._execute_command_sync("getbestblockhash")
+            if block_hash != cache.tip_hash:
+                header = self._execute_command_sync("getblockheader", block_hash)
+                cache.set_tip(block_hash, header["height"], header.get("previousblockhash"))
+        except EvrmoreRPCError:
+            if announced:
+                cache.note_tip(announced)
+            raise
+    
+    def _execute_command_sync(self, command: str, *args: Any) -> Any:
+        """Send one RPC command synchronously and return its result."""
+        attempt = 0
+        while True:
+            try:
+                response = self._post_sync(self._encode_request(command, args))
+                return self._handle_response(response, command)
+            except EvrmoreRPCError as e:
+                delay = self._retry_delay((command,), e, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+    
+    def _execute_projected_sync(self, command: str, args: Sequence[Any],
+                                projection: Projection) -> Any:
+        """Send one RPC command synchronously and return only the projected fields of its result."""
+        # Projected results are partial, so they skip the cache and are not
+        # shared with full calls of the same command
+        data = self._encode_request(command, args)
+        decode = lambda body: projection.decode(self.codec, body)
+        attempt = 0
+        while True:
+            try:
+                response = self._post_sync(data, decode)
+                return projection.finish(self._handle_response(response, command))
+            except EvrmoreRPCError as e:
+                delay = self._retry_delay((command,), e, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+    
+    def execute_batch_sync(self, calls: Iterable[Union[str, Sequence[Any]]],
+                           return_exceptions: bool = False) -> List[Any]:
+        """
+        Execute several RPC commands synchronously in one JSON-RPC batch request.
+        
+        Args:
+            calls: Calls to execute, each either a command name or a
+                   ``(command, *args)`` tuple
+            return_exceptions: Return failed entries as EvrmoreRPCError instances
+                               instead of raising the first one
+            
+        Returns:
+            The results of the commands, in the same order as calls
+            
+        Raises:
+            EvrmoreRPCError: If the request fails, or if a command fails and
+                             return_exceptions is False
+        """
+        payload = self._prepare_batch_payload(calls)
+        if not payload:
+            return []
+        attempt = 0
+        while True:
+            try:
+                response = self._post_sync(payload)
+                return self._handle_batch_response(payload, response, return_exceptions)
+            except EvrmoreRPCError as e:
+                delay = self._retry_delay([call["method"] for call in payload], e, attempt)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+    
+    def _post_sync(self, payload: Union[bytes, Dict[str, Any], List[Dict[str, Any]]],
+                   decode: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """
+        Send a JSON-RPC payload (single or batch) synchronously.
+        
+        Args:
+            payload: The JSON-RPC payload, or its already encoded bytes
+            decode: Decodes the response body instead of the codec
+            
+        Returns:
+            The decoded JSON response body
+            
+        Raises:
+            EvrmoreRPCError: If the request fails
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._send_sync(payload, decode)
+        if not breaker.allow():
+            raise EvrmoreCircuitOpenError(
+                f"Circuit open for {self.url}; next attempt in {breaker.retry_after():.1f} seconds"
+            )
+        try:
+            response = self._send_sync(payload, decode)
+        except (EvrmoreConnectionError, EvrmoreWorkQueueError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled, interrupted or undecodable: no evidence either way
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+    
+    def _send_sync(self, payload: Union[bytes, Dict[str, Any], List[Dict[str, Any]]],
+                   decode: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """Send a JSON-RPC payload synchronously, bypassing the circuit breaker."""
         if self.sync_session is None:
             self.initialize_sync()
         
         if self.sync_session is None:
             raise EvrmoreRPCError("Session not initialized")
         
-        payload = self._prepare_payload(command, *args)
+        data = payload if isinstance(payload, bytes) else self.codec.dumps(payload)
         
         try:
             response = self.sync_session.post(
-                self.url,
-                json=payload,
+                self._post_url,
+                data=data,
                 timeout=self.timeout
             )
             
             if response.status_code != 200:
-                raise EvrmoreRPCError(f"HTTP error {response.status_code}: {response.text}")
+                raise self._http_error(response.status_code, response.text)
             
-            response_data = response.json()
-            return self._handle_response(response_data)
+            return (decode or self.codec.loads)(response.content)
         except requests.RequestException as e:
-            raise EvrmoreRPCError(f"Request failed: {str(e)}")
-        except json.JSONDecodeError:
+            raise EvrmoreConnectionError(f"Request failed: {str(e)}")
+        except ValueError:
             raise EvrmoreRPCError("Invalid JSON response")
     
+    def _stream_sync(self, command: str, args: Sequence[Any], chunk_size: int = CHUNK_SIZE,
+                     expand: AbstractSet[str] = frozenset()) -> Iterator[Any]:
+        """Send one RPC command synchronously and yield its result items as the body arrives."""
+        if self.sync_session is None:
+            self.initialize_sync()
+        
+        parser = StreamParser(self.codec.numbers, command, expand)
+        try:
+            response = self.sync_session.post(
+                self._post_url,
+                data=self._encode_request(command, args),
+                timeout=self.timeout,
+                stream=True
+            )
+        except requests.RequestException as e:
+            raise EvrmoreConnectionError(f"Request failed: {str(e)}")
+        
+        try:
+            if response.status_code != 200:
+                raise self._http_error(response.status_code, response.text)
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    yield from parser.feed(chunk)
+                items = parser.close()
+            except requests.RequestException as e:
+                raise EvrmoreConnectionError(f"Request failed: {str(e)}")
+            self._handle_response({"result": None, "error": parser.error})
+            yield from items
+        finally:
+            response.close()
+    
     # Asynchronous methods
     
     async def initialize_async(self) -> None:
         """Initialize the asynchronous client session."""
         if self.async_session is None or self.async_session.closed:
+            connector_kwargs: Dict[str, Any] = {}
+            if self.pool_maxsize is not None:
+                connector_kwargs['limit'] = self.pool_maxsize
+            if self.pool_maxsize_per_host is not None:
+                connector_kwargs['limit_per_host'] = self.pool_maxsize_per_host
+            if self.keepalive_timeout is not None:
+                connector_kwargs['keepalive_timeout'] = self.keepalive_timeout
+            
+            if self.socket_path is not None:
+                connector = aiohttp.UnixConnector(path=self.socket_path, **connector_kwargs)
+            else:
+                connector = aiohttp.TCPConnector(**connector_kwargs)
             self.async_session = aiohttp.ClientSession(
                 headers=self.headers,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=connector
             )
+            
+            if self.prewarm_connections > 0:
+                await self._prewarm_async()
+    
+    async def _prewarm_async(self) -> None:
+        """Open prewarm_connections pooled connections with concurrent cheap calls."""
+        await asyncio.gather(
+            *(self._post_async(self._prepare_payload("uptime"))
+              for _ in range(self.prewarm_connections)),
+            return_exceptions=True
+        )
     
     async def __aenter__(self) -> 'EvrmoreClient':
         """Enter the async context manager."""
@@ -423,6 +1017,8 @@ class EvrmoreClient:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit the async context manager."""
+        if self.auto_batcher is not None:
+            await self.auto_batcher.flush()
         if self.async_session and not self.async_session.closed:
             await self.async_session.close()
     
@@ -431,8 +1027,9 @@ class EvrmoreClient:
         Destructor to ensure resources are properly cleaned up.
         This will attempt to close any open sessions when the client is garbage collected.
         """
+        # Read from __dict__: if __init__ failed early, hasattr() would find an RPC closure
         # Close the sync session if it exists
-        if hasattr(self, 'sync_session') and self.sync_session is not None:
+        if self.__dict__.get('sync_session') is not None:
             try:
                 self.sync_session.close()
                 self.sync_session = None
@@ -440,7 +1037,8 @@ class EvrmoreClient:
                 pass
         
         # For async session, we can't await in __del__, so we need to use a different approach
-        if hasattr(self, 'async_session') and self.async_session is not None and not self.async_session.closed:
+        async_session = self.__dict__.get('async_session')
+        if async_session is not None and not async_session.closed:
             # Create a warning about unclosed session
             import warnings
             warnings.warn(
@@ -471,6 +1069,10 @@ class EvrmoreClient:
         In sync contexts, use:
             client.close_sync()
         """
+        # Send any calls still waiting for an auto-batch
+        if self.auto_batcher is not None:
+            await self.auto_batcher.flush()
+        
         # Close async session if it exists
         if self.async_session and not self.async_session.closed:
             await self.async_session.close()
@@ -490,13 +1092,14 @@ class EvrmoreClient:
             self.sync_session.close()
             self.sync_session = None
     
-    async def execute_command_async(self, command: str, *args: Any) -> Any:
+    async def execute_command_async(self, command: str, *args: Any, fields: Any = None) -> Any:
         """
         Execute an RPC command asynchronously.
         
         Args:
             command: The RPC command to execute
             args: Arguments for the command
+            fields: Field paths or a pydantic model class to project the result onto
             
         Returns:
             The result of the RPC command
@@ -504,33 +1107,227 @@ class EvrmoreClient:
         Raises:
             EvrmoreRPCError: If the RPC command fails
         """
+        if fields is not None:
+            return await self._execute_projected_async(command, args, get_projection(fields))
+        cache = self.cache
+        if cache is not None and cache.handles(command):
+            await self._check_tip_async()
+            result = await cache.get_async(command, args)
+            if result is not MISS:
+                return result
+            generation = cache.generation
+            result = await self._execute_shared_async(command, args)
+            await cache.put_async(command, args, result, generation)
+            return result
+        return await self._execute_shared_async(command, args)
+    
+    async def _execute_shared_async(self, command: str, args: Sequence[Any]) -> Any:
+        """Execute a command asynchronously, sharing identical in-flight read-only calls."""
+        if self.single_flight is not None and is_read_only(command):
+            return await self.single_flight.do_async(
+                call_key(command, args),
+                lambda: self._execute_command_async(command, *args)
+            )
+        return await self._execute_command_async(command, *args)
+    
+    async def _check_tip_async(self) -> None:
+        """Invalidate tip-scoped cache entries if the chain tip moved."""
+        cache = self.cache
+        if not cache.claim_tip_check():
+            return
+        announced = cache.take_pending_tip()
+        try:
+            block_hash = announced or await self._execute_command_async("getbestblockhash")
+            if block_hash != cache.tip_hash:
+                header = await self._execute_command_async("getblockheader", block_hash)
+                cache.set_tip(block_hash, header["height"], header.get("previousblockhash"))
+        except EvrmoreRPCError:
+            if announced:
+                cache.note_tip(announced)
+            raise
+    
+    async def _execute_command_async(self, command: str, *args: Any) -> Any:
+        """Send one RPC command asynchronously and return its result."""
+        attempt = 0
+        while True:
+            try:
+                if self.auto_batcher is not None:
+                    return await self.auto_batcher.submit(command, *args)
+                response = await self._post_async(self._encode_request(command, args))
+                return self._handle_response(response, command)
+            except EvrmoreRPCError as e:
+                delay = self._retry_delay((command,), e, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _execute_projected_async(self, command: str, args: Sequence[Any],
+                                       projection: Projection) -> Any:
+        """Send one RPC command asynchronously and return only the result's projected fields."""
+        data = self._encode_request(command, args)
+        decode = lambda body: projection.decode(self.codec, body)
+        attempt = 0
+        while True:
+            try:
+                response = await self._post_async(data, decode)
+                return projection.finish(self._handle_response(response, command))
+            except EvrmoreRPCError as e:
+                delay = self._retry_delay((command,), e, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def execute_batch_async(self, calls: Iterable[Union[str, Sequence[Any]]],
+                                  return_exceptions: bool = False) -> List[Any]:
+        """
+        Execute several RPC commands asynchronously in one JSON-RPC batch request.
+        
+        Args:
+            calls: Calls to execute, each either a command name or a
+                   ``(command, *args)`` tuple
+            return_exceptions: Return failed entries as EvrmoreRPCError instances
+                               instead of raising the first one
+            
+        Returns:
+            The results of the commands, in the same order as calls
+            
+        Raises:
+            EvrmoreRPCError: If the request fails, or if a command fails and
+                             return_exceptions is False
+        """
+        payload = self._prepare_batch_payload(calls)
+        if not payload:
+            return []
+        attempt = 0
+        while True:
+            try:
+                response = await self._post_async(payload)
+                return self._handle_batch_response(payload, response, return_exceptions)
+            except EvrmoreRPCError as e:
+                delay = self._retry_delay([call["method"] for call in payload], e, attempt)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def _post_async(self, payload: Union[bytes, Dict[str, Any], List[Dict[str, Any]]],
+                          decode: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """
+        Send a JSON-RPC payload (single or batch) asynchronously.
+        
+        Args:
+            payload: The JSON-RPC payload, or its already encoded bytes
+            decode: Decodes the response body instead of the codec
+            
+        Returns:
+            The decoded JSON response body
+            
+        Raises:
+            EvrmoreRPCError: If the request fails
+            EvrmoreOverloadError: If the limiter's queue is full
+        """
+        limiter = self.limiter
+        if limiter is None:
+            return await self._post_guarded_async(payload, decode)
+        await limiter.acquire()
+        start = time.monotonic()
+        error: Optional[BaseException] = None
+        try:
+            return await self._post_guarded_async(payload, decode)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            limiter.release(time.monotonic() - start, error)
+    
+    async def _post_guarded_async(self, payload: Union[bytes, Dict[str, Any], List[Dict[str, Any]]],
+                                  decode: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """Send a JSON-RPC payload asynchronously through the circuit breaker."""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._send_async(payload, decode)
+        if not breaker.allow():
+            raise EvrmoreCircuitOpenError(
+                f"Circuit open for {self.url}; next attempt in {breaker.retry_after():.1f} seconds"
+            )
+        try:
+            response = await self._send_async(payload, decode)
+        except (EvrmoreConnectionError, EvrmoreWorkQueueError):
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled, interrupted or undecodable: no evidence either way
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+    
+    async def _send_async(self, payload: Union[bytes, Dict[str, Any], List[Dict[str, Any]]],
+                          decode: Optional[Callable[[bytes], Any]] = None) -> Any:
+        """Send a JSON-RPC payload asynchronously, bypassing the circuit breaker."""
         if self.async_session is None or self.async_session.closed:
             await self.initialize_async()
         
         if self.async_session is None:
             raise EvrmoreRPCError("Session not initialized")
         
-        payload = self._prepare_payload(command, *args)
+        data = payload if isinstance(payload, bytes) else self.codec.dumps(payload)
         
         try:
             async with self.async_session.post(
-                self.url,
-                json=payload,
+                self._post_url,
+                data=data,
                 timeout=aiohttp.ClientTimeout(total=self.timeout)
             ) as response:
                 if response.status != 200:
                     text = await response.text()
-                    raise EvrmoreRPCError(f"HTTP error {response.status}: {text}")
+                    raise self._http_error(response.status, text)
                 
-                response_data = await response.json()
-                return self._handle_response(response_data)
+                return (decode or self.codec.loads)(await response.read())
         except aiohttp.ClientError as e:
-            raise EvrmoreRPCError(f"Request failed: {str(e)}")
+            raise EvrmoreConnectionError(f"Request failed: {str(e)}")
         except asyncio.TimeoutError:
-            raise EvrmoreRPCError(f"Request timed out after {self.timeout} seconds")
-        except json.JSONDecodeError:
+            raise EvrmoreConnectionError(f"Request timed out after {self.timeout} seconds")
+        except ValueError:
             raise EvrmoreRPCError("Invalid JSON response")
     
+    async def _stream_async(self, command: str, args: Sequence[Any], chunk_size: int = CHUNK_SIZE,
+                            expand: AbstractSet[str] = frozenset()) -> AsyncIterator[Any]:
+        """Send one RPC command asynchronously and yield its result items as the body arrives."""
+        if self.async_session is None or self.async_session.closed:
+            await self.initialize_async()
+        
+        # Streams hold a slot but add no latency samples: their duration
+        # reflects the response size, not the node's load
+        limiter = self.limiter
+        if limiter is not None:
+            await limiter.acquire()
+        parser = StreamParser(self.codec.numbers, command, expand)
+        try:
+            async with self.async_session.post(
+                self._post_url,
+                data=self._encode_request(command, args),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status != 200:
+                    raise self._http_error(response.status, await response.text())
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    for item in parser.feed(chunk):
+                        yield item
+                items = parser.close()
+            self._handle_response({"result": None, "error": parser.error})
+            for item in items:
+                yield item
+        except aiohttp.ClientError as e:
+            raise EvrmoreConnectionError(f"Request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            raise EvrmoreConnectionError(f"Request timed out after {self.timeout} seconds")
+        finally:
+            if limiter is not None:
+                limiter.release()
+    
     # Polymorphic methods
     from typing import Coroutine, Optional
     
@@ -541,7 +1338,7 @@ class EvrmoreClient:
         else:
             return self.initialize_sync()
     
-    def execute_command(self, command: str, *args: Any) -> Any:
+    def execute_command(self, command: str, *args: Any, fields: Any = None) -> Any:
         """
         Execute an RPC command, automatically detecting whether to use sync or async.
         
@@ -551,35 +1348,308 @@ class EvrmoreClient:
         Args:
             command: The RPC command to execute
             *args: Arguments to pass to the command
+            fields: Field paths (e.g. ["tx[].txid"]) or a pydantic model class;
+                    only these fields of the result are decoded and returned
             
         Returns:
             The result of the command, or a coroutine if in async context
         """
-        from evrmore_rpc.utils import AwaitableResult
-        
         # If _async_mode is explicitly set, use that
         if self._async_mode is not None:
             if self._async_mode:
-                return self.execute_command_async(command, *args)
+                return self.execute_command_async(command, *args, fields=fields)
             else:
-                return self.execute_command_sync(command, *args)
+                return self.execute_command_sync(command, *args, fields=fields)
         
-        # Otherwise, create a session for sync execution
-        session = self._get_or_create_sync_session()
+        # Otherwise (after reset()) return an AwaitableResult for either context
+        return self._auto_result(
+            command,
+            lambda: self.execute_command_sync(command, *args, fields=fields),
+            lambda: self.execute_command_async(command, *args, fields=fields)
+        )
+    
+    def _auto_result(self, command: str, sync_func: Callable[[], Any],
+                     async_func: Callable[[], Awaitable[Any]]) -> AwaitableResult:
+        """
+        Wrap a call in auto-detect mode, where the caller may await it or not.
         
-        # Execute the sync method immediately
-        sync_result = self.execute_command_sync(command, *args)
+        The result is lazy: awaiting it runs only the async request, using its
+        value runs only the sync request. A state-changing call is often written
+        as a statement whose result is never used, so outside async code it runs
+        right away, and inside async code dropping it unused raises a RuntimeWarning.
         
-        # Create a coroutine for the async method
-        async_coro = self.execute_command_async(command, *args)
+        Args:
+            command: The RPC command
+            sync_func: Runs the call synchronously
+            async_func: Returns the coroutine that runs the call asynchronously
+            
+        Returns:
+            An AwaitableResult for the call
+        """
+        if is_read_only(command):
+            return AwaitableResult(sync_func=sync_func, async_func=async_func)
+        if not is_async_context():
+            result = AwaitableResult(sync_func=sync_func, async_func=async_func)
+            result.resolve()
+            return result
+        return AwaitableResult(sync_func=sync_func, async_func=async_func,
+                               unused_warning=f"{command} was neither awaited nor used, "
+                                              f"so it was never sent")
+    
+    def execute_batch(self, calls: Iterable[Union[str, Sequence[Any]]],
+                      return_exceptions: bool = False) -> Any:
+        """
+        Execute several RPC commands in one JSON-RPC batch request (sync or async).
         
-        # Return an AwaitableResult that works in both contexts
-        return AwaitableResult(
-            sync_result, 
-            async_coro,
-            # No cleanup needed here as we manage sessions separately
-            cleanup_func=None
-        )
+        Args:
+            calls: Calls to execute, each either a command name or a
+                   ``(command, *args)`` tuple
+            return_exceptions: Return failed entries as EvrmoreRPCError instances
+                               instead of raising the first one
+            
+        Returns:
+            The list of results, or a coroutine resolving to it in async context
+        """
+        if self._async_mode is not None:
+            if self._async_mode:
+                return self.execute_batch_async(calls, return_exceptions)
+            else:
+                return self.execute_batch_sync(calls, return_exceptions)
+        
+        return sync_or_async(
+            self.execute_batch_sync,
+            self.execute_batch_async
+        )(calls, return_exceptions)
+    
+    def stream(self, command: str, *args: Any, chunk_size: int = CHUNK_SIZE,
+               expand: Iterable[str] = ()) -> ResponseStream:
+        """
+        Execute an RPC command and parse its result incrementally.
+        
+        Iterate the returned stream with `for` or `async for`. Array results
+        yield their elements, object results yield (key, value) pairs, and
+        any other result is yielded once. Memory use stays flat however
+        large the response is.
+        
+        Args:
+            command: The RPC command to execute
+            *args: Arguments to pass to the command
+            chunk_size: Bytes read from the connection at a time
+            expand: Members of an object result whose array value is yielded as
+                    one (key, element) pair per element, e.g. ("tx",) for
+                    `getblock <hash> 2`
+            
+        Returns:
+            A ResponseStream over the result
+        """
+        return ResponseStream(self, command, args, chunk_size, expand)
+    
+    def iter_blocks(self, start: int, end: Optional[int] = None, verbosity: int = 1,
+                    concurrency: int = DEFAULT_CONCURRENCY, batch_size: int = 1) -> BlockRange:
+        """
+        Fetch a range of blocks in parallel, yielding (height, block) pairs in height order.
+        
+        Iterate the result with `for` or `async for`.
+        
+        Args:
+            start: First height
+            end: Height to stop before; None for up to and including the current tip
+            verbosity: getblock verbosity; 0 for raw hex (fastest)
+            concurrency: Fetches in flight at the same time, e.g. the node's rpcthreads
+            batch_size: Heights fetched per JSON-RPC batch; 1 sends single calls
+            
+        Returns:
+            A BlockRange over the blocks
+        """
+        return BlockRange(self, start, end, verbosity, concurrency, batch_size)
+    
+    def bulk(self, command: str, params: Iterable[Any], workers: Optional[int] = None,
+             chunk_size: int = DEFAULT_CHUNK_SIZE, ordered: bool = True) -> Bulk:
+        """
+        Call one command for every item of params, in parallel JSON-RPC batches.
+        
+        Iterate the result with `for` (worker threads) or `async for` (tasks).
+        Each call yields a BulkResult; failures are reported per item without
+        stopping the run.
+        
+        Args:
+            command: The RPC command to call
+            params: One item per call: a tuple of arguments, or any other value as the only argument
+            workers: Batches in flight at the same time (defaults to the connection pool size)
+            chunk_size: Calls per JSON-RPC batch; 1 sends single calls
+            ordered: Yield results in input order instead of as batches complete
+            
+        Returns:
+            A Bulk run over the calls
+        """
+        return Bulk(self, command, params, workers, chunk_size, ordered)
+    
+    def utxo_table(self, addresses: Union[str, Sequence[str]]) -> UtxoTable:
+        """
+        Get the unspent outputs of addresses (getaddressutxos) as a compact UtxoTable.
+        
+        The response is streamed into the table's columns, so the full list
+        of dicts is never held in memory.
+        
+        Args:
+            addresses: An address or a list of addresses
+            
+        Returns:
+            A UtxoTable (awaitable in async mode)
+        """
+        return self._fill_table(UtxoTable(), "getaddressutxos",
+                                {"addresses": _address_list(addresses)})
+    
+    def delta_table(self, addresses: Union[str, Sequence[str]], start: Optional[int] = None,
+                    end: Optional[int] = None) -> DeltaTable:
+        """
+        Get the balance changes of addresses (getaddressdeltas) as a compact DeltaTable.
+        
+        Args:
+            addresses: An address or a list of addresses
+            start: First height, together with end
+            end: Last height, together with start
+            
+        Returns:
+            A DeltaTable (awaitable in async mode)
+        """
+        params: Dict[str, Any] = {"addresses": _address_list(addresses)}
+        if start is not None and end is not None:
+            params.update(start=start, end=end)
+        return self._fill_table(DeltaTable(), "getaddressdeltas", params)
+    
+    def _fill_table(self, table: Any, command: str, *args: Any) -> Any:
+        """Stream a command's array result into a table, in the client's sync/async mode."""
+        stream = self.stream(command, *args)
+        
+        def fill_sync() -> Any:
+            table.extend(stream)
+            return table
+        
+        async def fill_async() -> Any:
+            # Added in chunks: extend() has a per-call setup cost
+            chunk: List[Any] = []
+            async for record in stream:
+                chunk.append(record)
+                if len(chunk) == TABLE_CHUNK_SIZE:
+                    table.extend(chunk)
+                    chunk = []
+            table.extend(chunk)
+            return table
+        
+        if self._async_mode is None:
+            return AwaitableResult(sync_func=fill_sync, async_func=fill_async)
+        if self._async_mode:
+            return fill_async()
+        return fill_sync()
+    
+    @property
+    def typed(self) -> TypedMethods:
+        """
+        Methods returning model instances, e.g. client.typed.getblock(hash) -> Block.
+        
+        Results are validated by one cached TypeAdapter per response type;
+        client.typed.trusted builds the models without validation.
+        """
+        if self._typed is None:
+            self._typed = TypedMethods(self)
+        return self._typed
+    
+    def iter_assets(self, pattern: str = "*", verbose: bool = False,
+                    page_size: int = DEFAULT_PAGE_SIZE,
+                    prefetch: int = DEFAULT_PREFETCH, start: int = 0) -> Paginator:
+        """
+        Page through `listassets`, with `for` or `async for`.
+        
+        Args:
+            pattern: Asset name filter, e.g. "CATS*"
+            verbose: Yield (name, details) pairs instead of names
+            page_size: Assets requested per call
+            prefetch: Pages fetched ahead of the one being iterated
+            start: Offset of the first asset, e.g. a saved Paginator.cursor
+            
+        Returns:
+            A Paginator over the matching assets
+        """
+        return Paginator(self, "listassets",
+                         lambda count, offset: (pattern, verbose, count, offset),
+                         page_size, prefetch, start)
+    
+    def iter_my_assets(self, pattern: str = "*", verbose: bool = False, confs: int = 0,
+                       page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = DEFAULT_PREFETCH,
+                       start: int = 0) -> Paginator:
+        """
+        Page through `listmyassets`, yielding (name, balance) pairs.
+        
+        Args:
+            pattern: Asset name filter, e.g. "CATS*"
+            verbose: Yield per-outpoint details instead of balances
+            confs: Minimum confirmations
+            page_size: Assets requested per call
+            prefetch: Pages fetched ahead of the one being iterated
+            start: Offset of the first asset, e.g. a saved Paginator.cursor
+            
+        Returns:
+            A Paginator over the wallet's assets
+        """
+        return Paginator(self, "listmyassets",
+                         lambda count, offset: (pattern, verbose, count, offset, confs),
+                         page_size, prefetch, start)
+    
+    def iter_addresses_by_asset(self, asset_name: str, page_size: int = DEFAULT_PAGE_SIZE,
+                                prefetch: int = DEFAULT_PREFETCH, start: int = 0) -> Paginator:
+        """
+        Page through `listaddressesbyasset`, yielding (address, balance) pairs.
+        
+        Args:
+            asset_name: The asset whose holders to list
+            page_size: Addresses requested per call
+            prefetch: Pages fetched ahead of the one being iterated
+            start: Offset of the first address, e.g. a saved Paginator.cursor
+            
+        Returns:
+            A Paginator over the asset's holders
+        """
+        return Paginator(self, "listaddressesbyasset",
+                         lambda count, offset: (asset_name, False, count, offset),
+                         page_size, prefetch, start)
+    
+    def iter_asset_balances_by_address(self, address: str, page_size: int = DEFAULT_PAGE_SIZE,
+                                       prefetch: int = DEFAULT_PREFETCH,
+                                       start: int = 0) -> Paginator:
+        """
+        Page through `listassetbalancesbyaddress`, yielding (asset, balance) pairs.
+        
+        Args:
+            address: The address whose assets to list
+            page_size: Assets requested per call
+            prefetch: Pages fetched ahead of the one being iterated
+            start: Offset of the first asset, e.g. a saved Paginator.cursor
+            
+        Returns:
+            A Paginator over the address's asset balances
+        """
+        return Paginator(self, "listassetbalancesbyaddress",
+                         lambda count, offset: (address, False, count, offset),
+                         page_size, prefetch, start)
+    
+    def batch(self, return_exceptions: bool = False) -> RPCBatch:
+        """
+        Create a batch builder that sends queued calls as one JSON-RPC batch.
+        
+        Example:
+            with client.batch() as batch:
+                count = batch.getblockcount()
+                best = batch.getbestblockhash()
+            print(count.result(), best.result())
+            
+        Args:
+            return_exceptions: Return failed entries from execute() instead of raising
+            
+        Returns:
+            An RPCBatch bound to this client
+        """
+        return RPCBatch(self, return_exceptions=return_exceptions)
     
     # Add this new method for session management
     def _get_or_create_sync_session(self):
@@ -603,47 +1673,30 @@ class EvrmoreClient:
             except Exception:
                 pass
     
-    # Update the __getattr__ method to use the improved AwaitableResult
     def __getattr__(self, name: str) -> Callable:
         """
         Dynamically create methods for RPC commands.
         
-        This allows calling any RPC command as a method on the client.
-        For example: client.getblockchaininfo() will call the 'getblockchaininfo' RPC command.
+        Known commands are bound on the class by bind_methods and never reach
+        this fallback; it lets any other RPC command be called as a method too.
+        For example: client.getnewcommand() will call the 'getnewcommand' RPC command.
         
         Args:
             name: The name of the RPC command
             
         Returns:
             A callable that will execute the RPC command
+            
+        Raises:
+            AttributeError: For names starting with an underscore, which are never
+                            RPC commands (an unset private attribute must not become one)
         """
-        from evrmore_rpc.utils import AwaitableResult
+        if name.startswith('_'):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         
         # Define the method factory
-        def method_factory(*args: Any) -> Any:
-            # If async_mode is explicitly set, use that mode
-            if self._async_mode is not None:
-                if self._async_mode:
-                    return self.execute_command_async(name, *args)
-                else:
-                    return self.execute_command_sync(name, *args)
-            
-            # Otherwise, create a session for sync execution
-            session = self._get_or_create_sync_session()
-            
-            # Execute the sync method immediately
-            sync_result = self.execute_command_sync(name, *args)
-            
-            # Create a coroutine for the async method
-            async_coro = self.execute_command_async(name, *args)
-            
-            # Return an AwaitableResult that works in both contexts
-            return AwaitableResult(
-                sync_result, 
-                async_coro,
-                # No cleanup needed here as we manage sessions separately
-                cleanup_func=None
-            )
+        def method_factory(*args: Any, **kwargs: Any) -> Any:
+            return self.execute_command(name, *args, **kwargs)
         
         return method_factory
     
@@ -656,51 +1709,31 @@ class EvrmoreClient:
         Args:
             num_calls: Number of calls to make
             command: RPC command to execute
-            concurrency: Number of concurrent calls (simulated with threads)
+            concurrency: Number of worker threads sharing the client
             
         Returns:
             Dictionary with test results
         """
-        import threading
-        from queue import Queue
-        
         if self.sync_session is None:
             self.initialize_sync()
         
         start_time = time.time()
         results = []
-        result_queue = Queue()
         last_result = None
         
-        def worker():
-            while True:
-                try:
-                    call_start = time.time()
-                    result = self.execute_command_sync(command)
-                    call_end = time.time()
-                    result_queue.put(((call_end - call_start) * 1000, result))  # Convert to ms
-                except Exception as e:
-                    print(f"Error during stress test: {e}")
-                    result_queue.put((float('inf'), None))
-                break
+        def call(_: int) -> Tuple[float, Any]:
+            try:
+                call_start = time.time()
+                result = self.execute_command_sync(command)
+                call_end = time.time()
+                return (call_end - call_start) * 1000, result  # Convert to ms
+            except Exception as e:
+                print(f"Error during stress test: {e}")
+                return float('inf'), None
         
-        # Process in batches to control concurrency
-        for i in range(0, num_calls, concurrency):
-            batch_size = min(concurrency, num_calls - i)
-            threads = []
-            
-            for _ in range(batch_size):
-                thread = threading.Thread(target=worker)
-                thread.start()
-                threads.append(thread)
-            
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
-            
-            # Collect results
-            for _ in range(batch_size):
-                time_taken, result = result_queue.get()
+        # Long-lived workers, so per-thread sessions and pooled connections are reused
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            for time_taken, result in executor.map(call, range(num_calls)):
                 results.append(time_taken)
                 last_result = result
         
@@ -781,7 +1814,7 @@ class EvrmoreClient:
         if not valid_results:
             raise EvrmoreRPCError("All stress test calls failed")
         
-        return {
+        report = {
             "total_time": total_time,
             "requests_per_second": num_calls / total_time,
             "avg_time": sum(valid_results) / len(valid_results),
@@ -792,6 +1825,19 @@ class EvrmoreClient:
             "concurrency": concurrency,
             "last_result": last_result
         }
+        # Show how the in-flight window behaved (and converged, if adaptive)
+        report.update(self._limiter_report())
+        return report
+    
+    def _limiter_report(self) -> Dict[str, Any]:
+        """Get the limiter's stats (and limit history, if adaptive) for a stress test report."""
+        limiter = self.limiter
+        if limiter is None:
+            return {}
+        report: Dict[str, Any] = {"limiter": limiter.get_stats()}
+        if isinstance(limiter, AdaptiveLimiter):
+            report["limit_history"] = limiter.get_limit_history()
+        return report
     
     def stress_test(self, num_calls: int = 100, command: str = "getblockcount", concurrency: int = 10) -> Dict[str, Any]:
         """
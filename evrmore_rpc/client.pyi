@@ -1,4 +1,138 @@
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Type, Union
+
+from pydantic import BaseModel
+
+from evrmore_rpc.autobatch import AutoBatcher
+from evrmore_rpc.batch import RPCBatch
+from evrmore_rpc.blocks import BlockRange
+from evrmore_rpc.bulk import Bulk
+from evrmore_rpc.codec import JSONCodec
+from evrmore_rpc.compact import DeltaTable, UtxoTable
+from evrmore_rpc.cache import ResponseCache
+from evrmore_rpc.limiter import ConcurrencyLimiter
+from evrmore_rpc.paginate import Paginator
+from evrmore_rpc.retry import CircuitBreaker, RetryPolicy
+from evrmore_rpc.singleflight import SingleFlight
+from evrmore_rpc.stream import ResponseStream
+from evrmore_rpc.typed import TypedMethods
+
 class EvrmoreClient:
+    # ===== CLIENT METHODS =====
+    
+    auto_batcher: Optional[AutoBatcher]
+    single_flight: Optional[SingleFlight]
+    codec: JSONCodec
+    retry_policy: Optional[RetryPolicy]
+    circuit_breaker: Optional[CircuitBreaker]
+    cache: Optional[ResponseCache]
+    limiter: Optional[ConcurrencyLimiter]
+    url: str
+    socket_path: Optional[str]
+    thread_safe: Optional[str]
+    
+    def __init__(self,
+                 url: Optional[str] = None,
+                 datadir: Optional[Union[str, Path]] = None,
+                 rpcuser: Optional[str] = None,
+                 rpcpassword: Optional[str] = None,
+                 rpcport: Optional[int] = None,
+                 testnet: bool = False,
+                 timeout: int = 30,
+                 async_mode: Optional[bool] = None,
+                 auto_batch: bool = False,
+                 auto_batch_max_delay: float = 0.001,
+                 auto_batch_max_size: int = 100,
+                 single_flight: bool = False,
+                 pool_maxsize: Optional[int] = None,
+                 pool_maxsize_per_host: Optional[int] = None,
+                 keepalive_timeout: Optional[float] = None,
+                 tcp_nodelay: bool = True,
+                 prewarm_connections: int = 0,
+                 json_codec: str = "auto",
+                 json_numbers: str = "float",
+                 retry: Union[bool, RetryPolicy, None] = None,
+                 circuit_breaker: Union[bool, CircuitBreaker] = False,
+                 cache: Union[bool, ResponseCache, None] = None,
+                 limiter: Union[bool, ConcurrencyLimiter, None] = None,
+                 transport: str = "requests",
+                 thread_safe: Union[bool, str] = False) -> None:
+        pass
+    
+    def execute_command(self, command: str, *args: Any,
+                        fields: Union[Sequence[str], Type[BaseModel], None] = None) -> Any:
+        """Execute a command, optionally projecting its result onto fields or a model."""
+        pass
+    
+    def stream(self, command: str, *args: Any, chunk_size: int = 65536,
+               expand: Iterable[str] = ()) -> ResponseStream:
+        """Execute a command and iterate its result incrementally (for / async for)."""
+        pass
+    
+    def iter_blocks(self, start: int, end: Optional[int] = None, verbosity: int = 1,
+                    concurrency: int = 8, batch_size: int = 1) -> BlockRange:
+        """Fetch a block range in parallel, yielding (height, block) in height order."""
+        pass
+    
+    def bulk(self, command: str, params: Iterable[Any], workers: Optional[int] = None,
+             chunk_size: int = 100, ordered: bool = True) -> Bulk:
+        """Call one command per item in parallel JSON-RPC batches, yielding BulkResults."""
+        pass
+    
+    def utxo_table(self, addresses: Union[str, Sequence[str]]) -> UtxoTable:
+        """Stream getaddressutxos into a compact column table."""
+        pass
+    
+    def delta_table(self, addresses: Union[str, Sequence[str]], start: Optional[int] = None,
+                    end: Optional[int] = None) -> DeltaTable:
+        """Stream getaddressdeltas into a compact column table."""
+        pass
+    
+    @property
+    def typed(self) -> TypedMethods:
+        """Methods returning model instances, validated by cached TypeAdapters."""
+        pass
+    
+    def iter_assets(self, pattern: str = "*", verbose: bool = False, page_size: int = 1000,
+                    prefetch: int = 2, start: int = 0) -> Paginator:
+        """Page through listassets (for / async for)."""
+        pass
+    
+    def iter_my_assets(self, pattern: str = "*", verbose: bool = False, confs: int = 0,
+                       page_size: int = 1000,
+                       prefetch: int = 2, start: int = 0) -> Paginator:
+        """Page through listmyassets, yielding (name, balance) pairs."""
+        pass
+    
+    def iter_addresses_by_asset(self, asset_name: str, page_size: int = 1000, prefetch: int = 2,
+                                start: int = 0) -> Paginator:
+        """Page through listaddressesbyasset, yielding (address, balance) pairs."""
+        pass
+    
+    def iter_asset_balances_by_address(self, address: str, page_size: int = 1000, prefetch: int = 2,
+                                       start: int = 0) -> Paginator:
+        """Page through listassetbalancesbyaddress, yielding (asset, balance) pairs."""
+        pass
+    
+    def batch(self, return_exceptions: bool = False) -> RPCBatch:
+        """Create a builder that sends queued calls as one JSON-RPC batch."""
+        pass
+    
+    def execute_batch(self, calls: Iterable[Union[str, Sequence[Any]]],
+                      return_exceptions: bool = False) -> List[Any]:
+        """Execute several commands in one JSON-RPC batch request (sync or async)."""
+        pass
+    
+    def execute_batch_sync(self, calls: Iterable[Union[str, Sequence[Any]]],
+                           return_exceptions: bool = False) -> List[Any]:
+        """Execute several commands synchronously in one JSON-RPC batch request."""
+        pass
+    
+    async def execute_batch_async(self, calls: Iterable[Union[str, Sequence[Any]]],
+                                  return_exceptions: bool = False) -> List[Any]:
+        """Execute several commands asynchronously in one JSON-RPC batch request."""
+        pass
+    
     def getblockchaininfo(self) -> dict:
         pass
 
@@ -0,0 +1,318 @@
+"""
+evrmore-rpc: Pluggable JSON codecs
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Request payloads are encoded to bytes once and response bodies are decoded
+from bytes by a codec. By default the fastest installed library is used
+(orjson, then simdjson, then ujson) with the standard library as fallback.
+
+Number handling:
+- "float":    JSON numbers with a fraction become floats (fastest)
+- "decimal":  they become exact Decimals, e.g. amounts like 1250.12345678
+- "satoshis": amounts become integer satoshis; other fractional numbers
+              (difficulty, verificationprogress, ...) stay floats. A value
+              is an amount by its key (AMOUNT_KEYS: "amount", "fee",
+              "balance", "value", ...), or for a bare result by its command
+              (AMOUNT_RESULTS: getbalance, getreceivedbyaddress, ...)
+
+Only the standard library can hook number parsing, so "decimal" and
+"satoshis" always use it. Decimals are encoded exactly, from their own
+digits, by every codec.
+"""
+
+import json
+import os
+import re
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+NUMBER_MODES = ("float", "decimal", "satoshis")
+
+COIN = 100_000_000
+
+# Keys whose fractional values are EVR amounts, for the "satoshis" number mode
+AMOUNT_KEYS = frozenset({
+    "amount", "fee", "fees", "modifiedfee", "base", "modified", "ancestor", "descendant",
+    "balance", "unconfirmed_balance", "immature_balance", "value", "total_amount",
+    "paytxfee", "relayfee", "incrementalfee", "minrelaytxfee", "mempoolminfee", "feerate",
+})
+
+# Commands whose result is a bare amount
+AMOUNT_RESULTS = frozenset({
+    "getbalance", "getunconfirmedbalance", "getreceivedbyaddress", "getreceivedbyaccount",
+    "estimatefee",
+})
+
+
+class _HasDecimal(TypeError):
+    """Raised by the fast encoders' default hook: the object needs the exact encoder."""
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types the JSON libraries don't handle natively."""
+    if isinstance(obj, Decimal):
+        raise _HasDecimal("Decimal needs exact encoding")
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_exact(obj: Any) -> bytes:
+    """
+    Encode with the standard library's C encoder, writing Decimals as exact numbers.
+
+    Each Decimal is encoded as a placeholder string holding a random marker
+    and its index, and the quoted placeholders are then replaced by the
+    Decimals' digits.
+    """
+    digits: List[str] = []
+    marker = os.urandom(8).hex()
+
+    def default(value: Any) -> Any:
+        if isinstance(value, Decimal):
+            digits.append(format(value, "f"))
+            return f"{marker}{len(digits) - 1}"
+        return _default(value)
+
+    text = json.dumps(obj, separators=(",", ":"), default=default)
+    if digits:
+        text = re.sub(f'"{marker}(\\d+)"', lambda match: digits[int(match.group(1))], text)
+    return text.encode()
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode with the standard library's C encoder, or exactly if there are Decimals."""
+    try:
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+    except _HasDecimal:
+        return _dumps_exact(obj)
+
+
+def to_satoshis(amount: Decimal) -> int:
+    """Convert an exact EVR amount to integer satoshis."""
+    return int(amount * COIN)
+
+
+def satoshi_value(key: str, value: Any) -> Any:
+    """Convert a Decimal (or a list of them) by its key: satoshis for amounts, float otherwise."""
+    if type(value) is Decimal:
+        return to_satoshis(value) if key in AMOUNT_KEYS else float(value)
+    if type(value) is list and any(type(item) is Decimal for item in value):
+        convert = to_satoshis if key in AMOUNT_KEYS else float
+        return [convert(item) if type(item) is Decimal else item for item in value]
+    return value
+
+
+def satoshi_result(command: Optional[str], result: Any) -> Any:
+    """Convert a bare result in the "satoshis" number mode: satoshis for AMOUNT_RESULTS commands."""
+    return satoshi_value("amount" if command in AMOUNT_RESULTS else "result", result)
+
+
+def satoshi_pairs(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    object_pairs_hook of the "satoshis" number mode.
+
+    Numbers are parsed as Decimals, then converted by their key. A response's
+    "result" is left to convert_result(), which knows the command.
+    """
+    return {key: value if key == "result" else satoshi_value(key, value) for key, value in pairs}
+
+
+# parse_float hooks for the standard library decoder, by number mode
+PARSE_FLOAT: Dict[str, Optional[Callable[[str], Any]]] = {
+    "float": None,
+    "decimal": Decimal,
+    "satoshis": Decimal,
+}
+
+# object_pairs_hook for the standard library decoder, by number mode
+OBJECT_PAIRS: Dict[str, Optional[Callable[[List[Tuple[str, Any]]], Any]]] = {
+    "float": None,
+    "decimal": None,
+    "satoshis": satoshi_pairs,
+}
+
+
+class JSONCodec:
+    """
+    Base class for JSON codecs.
+
+    Subclasses implement dumps() and loads() for a specific library.
+    """
+
+    name = "json"
+
+    def __init__(self, numbers: str = "float"):
+        """
+        Initialize the codec.
+
+        Args:
+            numbers: How fractional numbers are decoded: "float", "decimal" or "satoshis"
+        """
+        if numbers not in NUMBER_MODES:
+            raise ValueError(f"numbers must be one of {NUMBER_MODES}, got {numbers!r}")
+        self.numbers = numbers
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as JSON bytes."""
+        raise NotImplementedError
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes (or text)."""
+        raise NotImplementedError
+
+    def convert_result(self, command: Optional[str], result: Any) -> Any:
+        """
+        Finish a decoded result of a command.
+
+        In "satoshis" mode, a bare fractional result (which has no key to go
+        by) is converted by its command; otherwise the result is unchanged.
+        """
+        if self.numbers != "satoshis":
+            return result
+        return satoshi_result(command, result)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} numbers={self.numbers!r}>"
+
+
+class StdlibCodec(JSONCodec):
+    """Codec built on the standard library json module; supports every number mode."""
+
+    name = "json"
+
+    def __init__(self, numbers: str = "float"):
+        super().__init__(numbers)
+        self._parse_float = PARSE_FLOAT[numbers]
+        self._object_pairs = OBJECT_PAIRS[numbers]
+
+    def dumps(self, obj: Any) -> bytes:
+        return _dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        if self._parse_float is None:
+            return json.loads(data)
+        return json.loads(data, parse_float=self._parse_float, object_pairs_hook=self._object_pairs)
+
+
+class OrjsonCodec(JSONCodec):
+    """Codec built on orjson."""
+
+    name = "orjson"
+
+    def __init__(self, numbers: str = "float"):
+        if orjson is None:
+            raise ImportError("orjson is not installed (pip install orjson)")
+        super().__init__(numbers)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=_default)
+        except TypeError:
+            # orjson wraps _HasDecimal; other errors are raised again by the exact encoder
+            return _dumps_exact(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+class SimdjsonCodec(JSONCodec):
+    """Codec using pysimdjson for decoding and the standard library for encoding."""
+
+    name = "simdjson"
+
+    def __init__(self, numbers: str = "float"):
+        if simdjson is None:
+            raise ImportError("pysimdjson is not installed (pip install pysimdjson)")
+        super().__init__(numbers)
+
+    def dumps(self, obj: Any) -> bytes:
+        return _dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return simdjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """
+    Codec built on ujson for decoding.
+
+    Encoding uses the standard library, as ujson writes Decimals as floats.
+    """
+
+    name = "ujson"
+
+    def __init__(self, numbers: str = "float"):
+        if ujson is None:
+            raise ImportError("ujson is not installed (pip install ujson)")
+        super().__init__(numbers)
+
+    def dumps(self, obj: Any) -> bytes:
+        return _dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "simdjson": SimdjsonCodec,
+    "ujson": UjsonCodec,
+    "json": StdlibCodec,
+}
+
+# Preference order for "auto"
+_AUTO_ORDER = (
+    ("orjson", lambda: orjson),
+    ("simdjson", lambda: simdjson),
+    ("ujson", lambda: ujson),
+)
+
+
+def get_codec(name: str = "auto", numbers: str = "float") -> JSONCodec:
+    """
+    Get a JSON codec.
+
+    Args:
+        name: "auto", "orjson", "simdjson", "ujson" or "json"
+        numbers: How fractional numbers are decoded: "float", "decimal" or "satoshis"
+
+    Returns:
+        A codec instance
+
+    Raises:
+        ValueError: If the name is unknown, or a fast codec is requested with
+                    an exact number mode it cannot provide
+        ImportError: If the requested library is not installed
+    """
+    if name == "auto":
+        if numbers != "float":
+            return StdlibCodec(numbers)
+        for codec_name, module in _AUTO_ORDER:
+            if module() is not None:
+                return CODECS[codec_name](numbers)
+        return StdlibCodec(numbers)
+
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON codec {name!r}; expected 'auto' or one of {sorted(CODECS)}")
+    if numbers != "float" and name != "json":
+        raise ValueError(
+            f"The {name} codec cannot parse numbers as {numbers!r}; use the 'json' codec"
+        )
+    return CODECS[name](numbers)
@@ -0,0 +1,164 @@
+"""
+evrmore-rpc: RPC command classification
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Lists the Evrmore RPC commands known to the client (mirroring
+`evrmore-cli help` and examples/features/complete_rpc_coverage.py) and
+classifies them by their side effects. Read-only commands return the same
+answer no matter how many times they are sent, so their in-flight requests
+can be shared between callers, and idempotent commands can be retried.
+"""
+
+from typing import FrozenSet
+
+# Every RPC command the client binds as a method, by `evrmore-cli help` category
+RPC_COMMANDS: FrozenSet[str] = frozenset({
+    # Addressindex
+    "getaddressbalance", "getaddressdeltas", "getaddressmempool", "getaddresstxids",
+    "getaddressutxos",
+
+    # Assets
+    "getassetdata", "getcacheinfo", "getsnapshot", "issue", "issueunique", "listaddressesbyasset",
+    "listassetbalancesbyaddress", "listassets", "listmyassets", "purgesnapshot", "reissue",
+    "transfer", "transferfrom",
+
+    # Blockchain
+    "decodeblock", "getbestblockhash", "getblock", "getblockchaininfo", "getblockcount",
+    "getblockhash", "getblockhashes", "getblockheader", "getchaintips", "getchaintxstats",
+    "getdifficulty", "getmempoolancestorfees", "getmempoolancestors", "getmempooldescendants",
+    "getmempoolentry", "getmempoolinfo", "getrawmempool", "getspentinfo", "gettxout",
+    "gettxoutproof", "gettxoutsetinfo", "preciousblock", "pruneblockchain", "savemempool",
+    "verifychain", "verifytxoutproof",
+
+    # Control
+    "getinfo", "getmemoryinfo", "getrpcinfo", "help", "stop", "uptime",
+
+    # Generating
+    "generate", "generatetoaddress", "getgenerate",
+
+    # Messages
+    "getmessage", "getmessagestatus", "listmessages", "sendmessage", "viewallmessagechannels",
+    "viewallmessages",
+
+    # Mining
+    "getblocktemplate", "getevrprogpowhash", "getmininginfo", "getnetworkhashps",
+    "prioritisetransaction", "submitblock",
+
+    # Network
+    "addnode", "clearbanned", "disconnectnode", "getaddednodeinfo", "getconnectioncount",
+    "getnettotals", "getnetworkinfo", "getpeerinfo", "listbanned", "ping", "setban",
+
+    # Rawtransactions
+    "combinerawtransaction", "createrawtransaction", "decoderawtransaction", "decodescript",
+    "fundrawtransaction", "getrawtransaction", "sendrawtransaction", "signrawtransaction",
+    "testmempoolaccept",
+
+    # Restricted Assets
+    "checkaddressrestriction", "checkaddresstag", "checkglobalrestriction",
+    "getrestrictedassetdata", "getrestrictedassetsnapshot", "getverifierstring",
+    "issuerestrictedasset", "isvalidverifierstring", "listaddressesfortag",
+    "listaddressrestrictions", "listglobalrestrictions", "listrestrictedassets",
+    "listtagsforaddress", "purgerestrictedassetsnapshot", "reissuerestrictedasset",
+    "transferrestrictedasset", "viewmyrestrictedaddresses", "viewmytaggedaddresses",
+
+    # Rewards
+    "getdistributestatus", "getrewardinfo", "getrewardsnapshot", "getsnapshotrequest",
+    "listrewards", "listsnapshotrequests", "purgerewardsnapshot",
+
+    # Util
+    "createmultisig", "estimatefee", "estimatepriority", "estimatesmartfee",
+    "estimatesmartpriority", "signmessagewithprivkey", "validateaddress", "verifymessage",
+
+    # Wallet
+    "abandontransaction", "abortrescan", "addmultisigaddress", "backupwallet", "bumpfee",
+    "createwallet", "dumpprivkey", "dumpwallet", "encryptwallet", "getaccount", "getaccountaddress",
+    "getaddressesbyaccount", "getbalance", "getnewaddress", "getrawchangeaddress",
+    "getreceivedbyaccount", "getreceivedbyaddress", "gettransaction", "getunconfirmedbalance",
+    "getwalletinfo", "importaddress", "importmulti", "importprivkey", "importpubkey",
+    "importwallet", "keypoolrefill", "listaccounts", "listaddressgroupings", "listlockunspent",
+    "listreceivedbyaccount", "listreceivedbyaddress", "listsinceblock", "listtransactions",
+    "listunspent", "listwalletdir", "listwallets", "loadwallet", "lockunspent", "move",
+    "removeprunedfunds", "rescanblockchain", "sendfrom", "sendmany", "sendtoaddress", "setaccount",
+    "settxfee", "signrawtransactionwithkey", "signrawtransactionwithwallet", "unloadwallet",
+    "walletlock", "walletpassphrase", "walletpassphrasechange",
+})
+
+# Commands that never change node, chain or wallet state
+READ_ONLY_COMMANDS: FrozenSet[str] = frozenset({
+    # Addressindex
+    "getaddressbalance", "getaddressdeltas", "getaddressmempool", "getaddresstxids",
+    "getaddressutxos",
+
+    # Assets
+    "getassetdata", "getcacheinfo", "getsnapshot", "listaddressesbyasset",
+    "listassetbalancesbyaddress", "listassets", "listmyassets",
+
+    # Blockchain
+    "decodeblock", "getbestblockhash", "getblock", "getblockchaininfo", "getblockcount",
+    "getblockhash", "getblockhashes", "getblockheader", "getchaintips", "getchaintxstats",
+    "getdifficulty", "getmempoolancestors", "getmempooldescendants", "getmempoolentry",
+    "getmempoolinfo", "getrawmempool", "getspentinfo", "gettxout", "gettxoutproof",
+    "gettxoutsetinfo", "verifychain", "verifytxoutproof",
+
+    # Control
+    "getinfo", "getmemoryinfo", "getrpcinfo", "help", "uptime",
+
+    # Generating
+    "getgenerate",
+
+    # Messages
+    "viewallmessagechannels", "viewallmessages",
+
+    # Mining
+    "getblocktemplate", "getevrprogpowhash", "getmininginfo", "getnetworkhashps",
+
+    # Network
+    "getaddednodeinfo", "getconnectioncount", "getnettotals", "getnetworkinfo", "getpeerinfo",
+    "listbanned",
+
+    # Rawtransactions
+    "combinerawtransaction", "createrawtransaction", "decoderawtransaction", "decodescript",
+    "getrawtransaction", "testmempoolaccept",
+
+    # Restricted assets
+    "checkaddressrestriction", "checkaddresstag", "checkglobalrestriction", "getverifierstring",
+    "isvalidverifierstring", "listaddressesfortag", "listaddressrestrictions",
+    "listglobalrestrictions", "listtagsforaddress", "viewmyrestrictedaddresses",
+    "viewmytaggedaddresses",
+
+    # Rewards
+    "getdistributestatus", "getsnapshotrequest", "listsnapshotrequests",
+
+    # Util
+    "createmultisig", "estimatefee", "estimatesmartfee", "validateaddress", "verifymessage",
+
+    # Wallet
+    "getaccount", "getaddressesbyaccount", "getbalance", "getreceivedbyaccount",
+    "getreceivedbyaddress", "gettransaction", "getunconfirmedbalance", "getwalletinfo",
+    "listaccounts", "listaddressgroupings", "listlockunspent", "listreceivedbyaccount",
+    "listreceivedbyaddress", "listsinceblock", "listtransactions", "listunspent", "listwallets",
+})
+
+
+# State-changing commands that can be repeated without further effect
+IDEMPOTENT_WRITE_COMMANDS: FrozenSet[str] = frozenset({
+    "abortrescan", "clearbanned", "importaddress", "importmulti", "importprivkey", "importpubkey",
+    "keypoolrefill", "lockunspent", "preciousblock", "savemempool", "setaccount", "settxfee",
+    "walletlock", "walletpassphrase",
+})
+
+# Commands that are safe to resend when it is unknown whether the node ran them.
+# Anything else (transfer, issue, sendrawtransaction, sendtoaddress, ...) could
+# run twice.
+IDEMPOTENT_COMMANDS: FrozenSet[str] = READ_ONLY_COMMANDS | IDEMPOTENT_WRITE_COMMANDS
+
+
+def is_read_only(command: str) -> bool:
+    """Check whether an RPC command is free of side effects."""
+    return command in READ_ONLY_COMMANDS
+
+
+def is_idempotent(command: str) -> bool:
+    """Check whether an RPC command can safely be sent more than once."""
+    return command in IDEMPOTENT_COMMANDS
@@ -0,0 +1,335 @@
+"""
+evrmore-rpc: Compact column tables for large address index results
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+getaddressutxos and getaddressdeltas for a busy address return hundreds
+of thousands of entries. As a list of dicts each entry costs around 600
+bytes (a dict, a 64-character txid string, int objects). UtxoTable and
+DeltaTable store the same data by column:
+
+- numbers in array.array columns: 8 bytes for satoshis, 4 for heights
+  and indexes
+- txids packed as 32 raw bytes, in four uint64 columns
+- addresses and scripts, which repeat, as 4-byte codes into a table of
+  their distinct values
+
+which is under 70 bytes per entry. Rows are made on access, as slotted
+UtxoRow/DeltaRow objects with the RPC's field names:
+
+    utxos = client.utxo_table(["EXaddr1", "EXaddr2"])
+    balance = utxos.total()
+    mature = utxos.filter(max_height=tip - 100)
+    for utxo in mature:
+        spend(utxo.txid, utxo.outputIndex, utxo.satoshis)
+
+total() and filter() work on the columns, without making a row per
+entry. The node returns entries in height order, so height filters are
+usually two binary searches and a slice of each column; tables that are
+not in height order are filtered by a scan in C. The number columns
+support the buffer protocol, e.g. numpy.frombuffer(utxos.satoshis,
+dtype="int64") is a zero-copy view.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import compress, islice
+from operator import and_, le
+from struct import Struct
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Typecodes: signed 64-bit satoshis, 32-bit heights and indexes (the node's own sizes)
+SATOSHIS = "q"
+HEIGHT = "i"
+INDEX = "I"
+
+# A txid's 32 bytes as four uint64 columns
+_TXID = Struct(">4Q")
+
+
+class _Row:
+    """A row of a table: slotted, with the RPC's field names."""
+
+    __slots__ = ()
+
+    def __init__(self, *values: Any):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the row as the RPC's dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = " ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"<{type(self).__name__} {fields}>"
+
+
+class UtxoRow(_Row):
+    """An unspent output from getaddressutxos."""
+
+    __slots__ = ("address", "txid", "outputIndex", "script", "satoshis", "height")
+
+    address: str
+    txid: str
+    outputIndex: int
+    script: str
+    satoshis: int
+    height: int
+
+
+class DeltaRow(_Row):
+    """A balance change from getaddressdeltas."""
+
+    __slots__ = ("satoshis", "txid", "index", "blockindex", "height", "address")
+
+    satoshis: int
+    txid: str
+    index: int
+    blockindex: int
+    height: int
+    address: str
+
+
+class _Table:
+    """
+    Column storage for a list of records with the same fields.
+
+    Subclasses name their row class, their number columns with typecodes
+    and their repeating string columns; "txid" is packed.
+    """
+
+    ROW: type = _Row
+    NUMBERS: Tuple[Tuple[str, str], ...] = ()
+    STRINGS: Tuple[str, ...] = ()
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        """
+        Initialize the table.
+
+        Args:
+            records: The RPC's result entries, e.g. from client.getaddressutxos()
+                or client.stream("getaddressutxos", ...)
+        """
+        self._numbers: Dict[str, array] = {name: array(code) for name, code in self.NUMBERS}
+        self._codes: Dict[str, array] = {name: array(INDEX) for name in self.STRINGS}
+        # Distinct values of each string column, shared by tables sliced from this one
+        self._values: Dict[str, List[str]] = {name: [] for name in self.STRINGS}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in self.STRINGS}
+        self._txids: Tuple[array, ...] = tuple(array("Q") for _ in range(4))
+        self.sorted = True
+        self.extend(records)
+
+    # ===== BUILDING =====
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add one entry of the RPC's result."""
+        self.extend((record,))
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add entries of the RPC's result.
+
+        Raises:
+            KeyError, ValueError, TypeError, OverflowError: If an entry does not fit
+                the table; the entries added by this call are removed again
+        """
+        start, was_sorted = len(self), self.sorted
+        try:
+            self._extend(records)
+        except Exception:
+            for column in (*self._numbers.values(), *self._codes.values(), *self._txids):
+                del column[start:]
+            self.sorted = was_sorted
+            raise
+
+    def _extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        numbers = [(name, column.append) for name, column in self._numbers.items()]
+        strings = [(name, self._codes[name].append, self._lookup[name], self._values[name])
+                   for name in self.STRINGS]
+        txids = [column.append for column in self._txids]
+        unpack, fromhex = _TXID.unpack, bytes.fromhex
+        heights = self._numbers["height"]
+        last = heights[-1] if heights else None
+        for record in records:
+            for name, add in numbers:
+                add(record[name])
+            for name, add, lookup, values in strings:
+                value = record[name]
+                code = lookup.get(value)
+                if code is None:
+                    code = lookup[value] = len(values)
+                    values.append(value)
+                add(code)
+            for add, part in zip(txids, unpack(fromhex(record["txid"]))):
+                add(part)
+            height = record["height"]
+            if last is not None and height < last:
+                self.sorted = False
+            last = height
+
+    def _derive(self, numbers: Dict[str, array], codes: Dict[str, array], txids: Tuple[array, ...],
+                keeps_order: bool = False) -> "_Table":
+        """Make a table of the same kind from selected columns, sharing the string values."""
+        table = type(self).__new__(type(self))
+        table._numbers, table._codes, table._txids = numbers, codes, txids
+        table._values, table._lookup = self._values, self._lookup
+        heights = numbers["height"]
+        table.sorted = (self.sorted and keeps_order) or all(map(le, heights,
+                                                                islice(heights, 1, None)))
+        return table
+
+    # ===== ACCESS =====
+
+    def __len__(self) -> int:
+        return len(self._txids[0])
+
+    def txid(self, position: int) -> str:
+        """Get the txid of a row."""
+        return _TXID.pack(*(column[position] for column in self._txids)).hex()
+
+    def _row(self, position: int) -> _Row:
+        values = []
+        for name in self.ROW.__slots__:
+            if name == "txid":
+                values.append(self.txid(position))
+            elif name in self._numbers:
+                values.append(self._numbers[name][position])
+            else:
+                values.append(self._values[name][self._codes[name][position]])
+        return self.ROW(*values)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        """Get a row, or a table of the rows in a slice."""
+        if isinstance(key, slice):
+            return self._derive({name: column[key] for name, column in self._numbers.items()},
+                                {name: column[key] for name, column in self._codes.items()},
+                                tuple(column[key] for column in self._txids),
+                                keeps_order=key.step is None or key.step > 0)
+        count = len(self)
+        if key < 0:
+            key += count
+        if not 0 <= key < count:
+            raise IndexError("table index out of range")
+        return self._row(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(len(self)):
+            yield self._row(position)
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Get a column: an array for numbers, a list of str for txids and strings.
+
+        Raises:
+            KeyError: If the table has no such field
+        """
+        if name in self._numbers:
+            return self._numbers[name]
+        if name == "txid":
+            return [_TXID.pack(*parts).hex() for parts in zip(*self._txids)]
+        values = self._values[name]
+        return [values[code] for code in self._codes[name]]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get the rows as the RPC's list of dicts."""
+        return [row.to_dict() for row in self]
+
+    @property
+    def satoshis(self) -> array:
+        """The satoshis column."""
+        return self._numbers["satoshis"]
+
+    @property
+    def heights(self) -> array:
+        """The height column."""
+        return self._numbers["height"]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns and the distinct string values."""
+        columns = [*self._numbers.values(), *self._codes.values(), *self._txids]
+        size = sum(column.itemsize * len(column) for column in columns)
+        return size + sum(len(value) for values in self._values.values() for value in values)
+
+    # ===== COLUMN OPERATIONS =====
+
+    def total(self) -> int:
+        """Sum the satoshis of all rows."""
+        return sum(self._numbers["satoshis"])
+
+    def totals_by_address(self) -> Dict[str, int]:
+        """Sum the satoshis of the rows of each address."""
+        sums = [0] * len(self._values["address"])
+        for code, satoshis in zip(self._codes["address"], self._numbers["satoshis"]):
+            sums[code] += satoshis
+        return {address: total for address, total in zip(self._values["address"], sums)}
+
+    def take(self, positions: Iterable[int]) -> Any:
+        """Get a table of the rows at the given positions, in that order."""
+        positions = positions if isinstance(positions, (list, range)) else list(positions)
+        return self._derive({name: array(column.typecode, map(column.__getitem__, positions))
+                             for name, column in self._numbers.items()},
+                            {name: array(INDEX, map(column.__getitem__, positions))
+                             for name, column in self._codes.items()},
+                            tuple(array("Q", map(column.__getitem__, positions))
+                                  for column in self._txids))
+
+    def filter(self, min_height: Optional[int] = None, max_height: Optional[int] = None,
+               address: Optional[str] = None) -> Any:
+        """
+        Get a table of the rows within a height range and/or of one address.
+
+        Args:
+            min_height: Lowest height to keep
+            max_height: Highest height to keep
+            address: Keep only this address's rows
+
+        Returns:
+            A table of the same kind
+        """
+        heights = self._numbers["height"]
+        table = self
+        if self.sorted and (min_height is not None or max_height is not None):
+            start = 0 if min_height is None else bisect_left(heights, min_height)
+            end = len(heights) if max_height is None else bisect_right(heights, max_height)
+            table = self[start:end]
+            min_height = max_height = None
+        selectors = []
+        if min_height is not None:
+            selectors.append(map(min_height.__le__, heights))
+        if max_height is not None:
+            selectors.append(map(max_height.__ge__, heights))
+        if address is not None:
+            code = self._lookup["address"].get(address, -1)
+            selectors.append(map(code.__eq__, table._codes["address"]))
+        if not selectors:
+            return table
+        keep = selectors[0]
+        for selector in selectors[1:]:
+            keep = map(and_, keep, selector)
+        return table.take(list(compress(range(len(table)), keep)))
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} rows={len(self)} nbytes={self.nbytes}>"
+
+
+class UtxoTable(_Table):
+    """The result of getaddressutxos, stored by column. Iterating yields UtxoRow."""
+
+    ROW = UtxoRow
+    NUMBERS = (("outputIndex", INDEX), ("satoshis", SATOSHIS), ("height", HEIGHT))
+    STRINGS = ("address", "script")
+
+
+class DeltaTable(_Table):
+    """The result of getaddressdeltas, stored by column. Iterating yields DeltaRow."""
+
+    ROW = DeltaRow
+    NUMBERS = (("satoshis", SATOSHIS), ("index", INDEX), ("blockindex", INDEX), ("height", HEIGHT))
+    STRINGS = ("address",)
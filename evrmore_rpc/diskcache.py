@@ -0,0 +1,260 @@
+"""
+evrmore-rpc: Persistent on-disk cache for immutable responses
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+A SQLite file holding responses that never change: blocks, headers and
+transactions keyed by hash. It is used as the second tier of a
+ResponseCache, so a restarted indexer reads confirmed data from local disk
+instead of refetching it from evrmored:
+
+    cache = ResponseCache(disk=DiskCache("~/.evrmore-rpc/cache.db", max_bytes=20 * 2**30),
+                          warm_start=True)
+    client = EvrmoreClient(cache=cache)
+
+- The database runs in WAL mode, so any number of processes can read while
+  one writes. Each thread gets its own connection.
+- Responses larger than a few hundred bytes are zlib-compressed.
+- The stored size is kept as a running total in the database, updated in
+  the same transaction as every write, so all processes share it. When it
+  exceeds max_bytes, the oldest entries are deleted until it is back under
+  90% of the budget. compact() returns the freed pages to the filesystem.
+"""
+
+import os
+import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+SCHEMA_VERSION = 1
+
+# Responses smaller than this are stored uncompressed
+COMPRESS_MIN_BYTES = 512
+
+
+class DiskCache:
+    """SQLite-backed key/value store for immutable RPC responses."""
+
+    def __init__(self,
+                 path: Union[str, Path],
+                 max_bytes: int = 4 * 1024 ** 3,
+                 compress: bool = True,
+                 timeout: float = 30.0):
+        """
+        Open (or create) a disk cache.
+
+        Args:
+            path: Database file path
+            max_bytes: Budget for stored (compressed) responses
+            compress: zlib-compress responses of COMPRESS_MIN_BYTES or more
+            timeout: Seconds to wait for another process's write lock
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.timeout = timeout
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+        conn = self._connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"{self.path} has cache schema {version}, expected {SCHEMA_VERSION}")
+        with self._transaction(conn):
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " data BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " compressed INTEGER NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS totals ("
+                " name TEXT PRIMARY KEY,"
+                " value INTEGER NOT NULL)"
+            )
+            conn.execute("INSERT OR IGNORE INTO totals (name, value) VALUES ('bytes', 0)")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self._bytes = self._stored_bytes(conn)
+
+        # Statistics (this process only, updated under _lock)
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    @contextmanager
+    def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+        """Run a block as one write transaction, taking the write lock up front."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _stored_bytes(conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT value FROM totals WHERE name = 'bytes'").fetchone()[0]
+
+    @staticmethod
+    def _unpack(blob: bytes, compressed: int) -> bytes:
+        return zlib.decompress(blob) if compressed else bytes(blob)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Read a stored response.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            The encoded response, or None if it is not stored
+        """
+        row = self._connection().execute(
+            "SELECT data, compressed FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if row is None:
+            return None
+        return self._unpack(*row)
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store a response, evicting the oldest entries if over budget.
+
+        Args:
+            key: Entry key
+            data: The encoded response
+        """
+        compressed = self.compress and len(data) >= COMPRESS_MIN_BYTES
+        blob = zlib.compress(data, 1) if compressed else data
+        conn = self._connection()
+        with self._transaction(conn):
+            # A replaced entry's size leaves the total
+            old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, data, size, compressed) VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), int(compressed))
+            )
+            conn.execute(
+                "UPDATE totals SET value = value + ? WHERE name = 'bytes'",
+                (len(blob) - (old[0] if old else 0),)
+            )
+            total = self._stored_bytes(conn)
+        with self._lock:
+            self.writes += 1
+        self._bytes = total
+        if total > self.max_bytes:
+            self.evict()
+
+    def evict(self, target_bytes: Optional[int] = None) -> int:
+        """
+        Delete the oldest entries until the stored size is at most target_bytes.
+
+        Args:
+            target_bytes: Size to shrink to (defaults to 90% of max_bytes)
+
+        Returns:
+            The number of entries deleted
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+        conn = self._connection()
+        deleted = 0
+        with self._transaction(conn):
+            total = self._stored_bytes(conn)
+            if total > target_bytes:
+                # Only the oldest rows are read, up to the ones that bring the total under target
+                cutoff = None
+                for rowid, size in conn.execute("SELECT rowid, size FROM entries ORDER BY rowid"):
+                    total -= size
+                    cutoff = rowid
+                    deleted += 1
+                    if total <= target_bytes:
+                        break
+                conn.execute("DELETE FROM entries WHERE rowid <= ?", (cutoff,))
+                conn.execute("UPDATE totals SET value = ? WHERE name = 'bytes'", (total,))
+        self._bytes = total
+        with self._lock:
+            self.evictions += deleted
+        return deleted
+
+    def compact(self) -> None:
+        """Checkpoint the WAL and VACUUM the database to return freed space to the filesystem."""
+        conn = self._connection()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def iter_recent(self) -> Iterator[Tuple[str, bytes]]:
+        """Iterate over stored (key, response) pairs, newest first."""
+        cursor = self._connection().execute(
+            "SELECT key, data, compressed FROM entries ORDER BY rowid DESC"
+        )
+        for key, blob, compressed in cursor:
+            yield key, self._unpack(blob, compressed)
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        conn = self._connection()
+        with self._transaction(conn):
+            conn.execute("DELETE FROM entries")
+            conn.execute("UPDATE totals SET value = 0 WHERE name = 'bytes'")
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the store's size and this process's counters."""
+        with self._lock:
+            hits, misses, writes, evictions = self.hits, self.misses, self.writes, self.evictions
+        lookups = hits + misses
+        return {
+            "path": str(self.path),
+            "entries": len(self),
+            "bytes": self._stored_bytes(self._connection()),
+            "max_bytes": self.max_bytes,
+            "file_bytes": os.path.getsize(self.path) if self.path.exists() else 0,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "writes": writes,
+            "evictions": evictions,
+        }
+
+    def close(self) -> None:
+        """Close every connection opened by this cache."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def __repr__(self) -> str:
+        return f"<DiskCache {self.path} {self._bytes}/{self.max_bytes} bytes>"
@@ -0,0 +1,30 @@
+"""
+evrmore-rpc: Exceptions
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+"""
+
+
+class EvrmoreRPCError(Exception):
+    """Exception raised when an RPC command fails."""
+    pass
+
+
+class EvrmoreConnectionError(EvrmoreRPCError):
+    """Exception raised when the node cannot be reached or does not answer in time."""
+    pass
+
+
+class EvrmoreWorkQueueError(EvrmoreRPCError):
+    """Exception raised when the node rejects a request because its RPC work queue is full."""
+    pass
+
+
+class EvrmoreCircuitOpenError(EvrmoreConnectionError):
+    """Exception raised without contacting the node because its circuit breaker is open."""
+    pass
+
+
+class EvrmoreOverloadError(EvrmoreRPCError):
+    """Exception raised without contacting the node because the client's request queue is full."""
+    pass
@@ -0,0 +1,402 @@
+"""
+evrmore-rpc: Client-side concurrency limit for async requests
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+evrmored runs rpcthreads requests at once and queues up to rpcworkqueue
+more. Beyond that it answers "Work queue depth exceeded". ConcurrencyLimiter
+keeps that queue on the client side instead. At most max_in_flight requests
+are sent at once, and up to max_queue more wait in FIFO order. When the
+wait queue is full, the overflow policy decides what happens to a new
+request:
+
+- "block": the caller keeps waiting, behind the queue, until there is room
+- "fail":  the new request fails at once with EvrmoreOverloadError
+- "shed":  the oldest waiting request fails with EvrmoreOverloadError and
+           the new one takes its place (fresh requests win, stale ones are dropped);
+           with max_queue=0 there is nothing to shed and the new request fails
+
+queue_timeout bounds how long any request waits for a slot.
+
+get_stats() reports the queue depth and wait times, to tune max_in_flight
+against the node's rpcthreads and rpcworkqueue.
+
+AdaptiveLimiter moves the window instead of fixing it, because the right
+concurrency changes with what the node is doing (syncing, reindexing,
+serving other clients). It shrinks on work-queue rejections, connection
+errors and latency spikes, and grows while requests succeed at the
+baseline latency and the window is in use:
+
+- "aimd":     add one slot per window of successes; multiply by backoff_ratio
+              on overload (at most once per round trip)
+- "gradient": scale the window by the ratio of long-term to recent latency,
+              plus a headroom of sqrt(limit) slots (after Netflix's gradient2)
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from evrmore_rpc.exceptions import (
+    EvrmoreCircuitOpenError,
+    EvrmoreConnectionError,
+    EvrmoreOverloadError,
+    EvrmoreWorkQueueError,
+)
+
+BLOCK = "block"
+FAIL = "fail"
+SHED = "shed"
+
+OVERFLOW_POLICIES = (BLOCK, FAIL, SHED)
+
+# Number of recent wait times kept for percentiles
+WAIT_SAMPLES = 1024
+
+AIMD = "aimd"
+GRADIENT = "gradient"
+
+ALGORITHMS = (AIMD, GRADIENT)
+
+
+class ConcurrencyLimiter:
+    """
+    Bounded in-flight window and wait queue for one event loop's requests.
+
+    Not thread-safe; use it from the event loop running the client.
+    """
+
+    def __init__(self,
+                 max_in_flight: int = 16,
+                 max_queue: int = 1024,
+                 overflow: str = BLOCK,
+                 queue_timeout: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_in_flight: Requests sent to the node at once
+            max_queue: Requests waiting for a slot before the overflow policy applies
+            overflow: What to do when the queue is full: "block", "fail" or "shed"
+            queue_timeout: Seconds a request may wait for a slot (None to wait indefinitely)
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+        self.limit = max_in_flight
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.queue_timeout = queue_timeout
+
+        self._in_flight = 0
+        self._queue: Deque[asyncio.Future] = deque()
+        # Callers waiting for room in the queue (overflow="block")
+        self._blocked: Deque[asyncio.Future] = deque()
+
+        # Statistics
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.shed = 0
+        self.timeouts = 0
+        self.completed = 0
+        self.errors = 0
+        self.peak_queue_depth = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently sent and not yet answered."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting for a slot, including those blocked behind a full queue."""
+        return len(self._queue) + len(self._blocked)
+
+    async def acquire(self) -> None:
+        """
+        Wait for an in-flight slot.
+
+        Raises:
+            EvrmoreOverloadError: If the request is rejected, shed or times out
+        """
+        if self._in_flight < self.limit and not self._queue and not self._blocked:
+            self._in_flight += 1
+            self.admitted += 1
+            self._record_wait(0.0)
+            return
+
+        start = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        if len(self._queue) < self.max_queue:
+            self._queue.append(future)
+        elif self.overflow == FAIL or (self.overflow == SHED and not self._queue):
+            # With max_queue=0 there is no waiting request to shed
+            self.rejected += 1
+            raise EvrmoreOverloadError(
+                f"Request queue full ({self._in_flight} in flight, {len(self._queue)} waiting)"
+            )
+        elif self.overflow == SHED:
+            victim = self._queue.popleft()
+            if not victim.done():
+                victim.set_exception(EvrmoreOverloadError("Request shed from a full queue"))
+                self.shed += 1
+            self._queue.append(future)
+        else:
+            self._blocked.append(future)
+        self.queued += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+
+        try:
+            if self.queue_timeout is None:
+                await future
+            else:
+                await asyncio.wait_for(future, self.queue_timeout)
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # Admitted just as the wait ended; pass the slot on
+                self.release()
+            else:
+                future.cancel()
+                self._discard(future)
+            if isinstance(e, asyncio.TimeoutError):
+                self.timeouts += 1
+                raise EvrmoreOverloadError(
+                    f"No request slot free after {self.queue_timeout} seconds"
+                ) from None
+            raise
+        self.admitted += 1
+        self._record_wait(time.monotonic() - start)
+
+    def release(self, latency: Optional[float] = None,
+                error: Optional[BaseException] = None) -> None:
+        """
+        Free a slot taken by acquire() and hand it to the next waiting request.
+
+        Args:
+            latency: Seconds the request took, if it was sent
+            error: The exception the request raised, if any
+        """
+        self._in_flight -= 1
+        if latency is not None:
+            self.record(latency, error)
+        self._wake()
+
+    def record(self, latency: float, error: Optional[BaseException]) -> None:
+        """Record the outcome of a request (subclasses adjust the limit here)."""
+        self.completed += 1
+        if error is not None:
+            self.errors += 1
+
+    def _wake(self) -> None:
+        """Admit waiting requests while slots are free."""
+        while self._in_flight < self.limit:
+            self._refill()
+            waiters = self._queue or self._blocked
+            if not waiters:
+                return
+            future = waiters.popleft()
+            if not future.done():
+                self._in_flight += 1
+                future.set_result(None)
+        self._refill()
+
+    def _refill(self) -> None:
+        """Move blocked callers into the queue as it drains."""
+        while self._blocked and len(self._queue) < self.max_queue:
+            future = self._blocked.popleft()
+            if not future.done():
+                self._queue.append(future)
+
+    def _discard(self, future: asyncio.Future) -> None:
+        for waiters in (self._queue, self._blocked):
+            try:
+                waiters.remove(future)
+                return
+            except ValueError:
+                pass
+
+    def _record_wait(self, wait: float) -> None:
+        self._wait_total += wait
+        self._wait_max = max(self._wait_max, wait)
+        self._waits.append(wait)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the current window, queue depth, counters and wait times in milliseconds."""
+        waits = sorted(self._waits)
+
+        def percentile(p: float) -> float:
+            return waits[min(len(waits) - 1, int(len(waits) * p))] * 1000 if waits else 0.0
+
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "shed": self.shed,
+            "timeouts": self.timeouts,
+            "completed": self.completed,
+            "errors": self.errors,
+            "wait_ms_mean": self._wait_total / self.admitted * 1000 if self.admitted else 0.0,
+            "wait_ms_p50": percentile(0.5),
+            "wait_ms_p99": percentile(0.99),
+            "wait_ms_max": self._wait_max * 1000,
+        }
+
+    def __repr__(self) -> str:
+        return (f"<{type(self).__name__} {self._in_flight}/{self.limit} in flight,"
+                f" {self.queue_depth} waiting>")
+
+
+class AdaptiveLimiter(ConcurrencyLimiter):
+    """ConcurrencyLimiter whose window follows the node's latency and errors."""
+
+    def __init__(self,
+                 initial_limit: int = 4,
+                 min_limit: int = 1,
+                 max_limit: int = 256,
+                 algorithm: str = AIMD,
+                 backoff_ratio: float = 0.7,
+                 latency_tolerance: float = 2.0,
+                 smoothing: float = 0.2,
+                 long_window: int = 500,
+                 max_queue: int = 1024,
+                 overflow: str = BLOCK,
+                 queue_timeout: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting window
+            min_limit: Smallest window
+            max_limit: Largest window
+            algorithm: "aimd" or "gradient"
+            backoff_ratio: Factor applied to the window on overload
+            latency_tolerance: Latency above tolerance * the long-term average counts as a spike
+            smoothing: Weight of each new window estimate (gradient)
+            long_window: Samples averaged into the long-term latency
+            max_queue: Requests waiting for a slot before the overflow policy applies
+            overflow: What to do when the queue is full: "block", "fail" or "shed"
+            queue_timeout: Seconds a request may wait for a slot (None to wait indefinitely)
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"algorithm must be one of {ALGORITHMS}, got {algorithm!r}")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Need 1 <= min_limit <= initial_limit <= max_limit")
+        super().__init__(max_in_flight=initial_limit, max_queue=max_queue, overflow=overflow,
+                         queue_timeout=queue_timeout)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.algorithm = algorithm
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.long_window = long_window
+
+        self._estimate = float(initial_limit)
+        self._cooldown_until = float("-inf")
+        self._long_latency: Optional[float] = None
+        # Latency samples of the current round (one window's worth of requests)
+        self._round_total = 0.0
+        self._round_count = 0
+        self._round_busy = False
+
+        self.increases = 0
+        self.decreases = 0
+        self.history: Deque[Tuple[float, int]] = deque([(time.monotonic(), initial_limit)],
+                                                       maxlen=1000)
+
+    @property
+    def long_latency(self) -> Optional[float]:
+        """Long-term average latency of successful requests, in seconds."""
+        return self._long_latency
+
+    def record(self, latency: float, error: Optional[BaseException]) -> None:
+        super().record(latency, error)
+        if isinstance(error, EvrmoreCircuitOpenError):
+            # Never reached the node
+            return
+        if isinstance(error, (EvrmoreWorkQueueError, EvrmoreConnectionError)):
+            self._back_off(latency)
+            return
+
+        long_latency = self._long_latency
+        if long_latency is None:
+            self._long_latency = latency
+        else:
+            self._long_latency += (latency - long_latency) / self.long_window
+        # Only grow while the window is in use; an idle client proves nothing
+        busy = self._in_flight + 1 >= self.limit / 2
+
+        if self.algorithm == AIMD:
+            if long_latency is not None and latency > long_latency * self.latency_tolerance:
+                self._back_off(latency)
+            elif busy:
+                self._resize(self._estimate + 1.0 / self._estimate)
+            return
+
+        self._round_total += latency
+        self._round_count += 1
+        self._round_busy = self._round_busy or busy
+        if self._round_count < self.limit:
+            return
+        short_latency = self._round_total / self._round_count
+        busy = self._round_busy
+        self._round_total, self._round_count, self._round_busy = 0.0, 0, False
+        if short_latency > 0 and self._long_latency > 0:
+            ratio = self.latency_tolerance * self._long_latency / short_latency
+            gradient = max(0.5, min(1.0, ratio))
+        else:
+            gradient = 1.0
+        target = self._estimate * gradient + (math.sqrt(self._estimate) if busy else 0.0)
+        self._resize(self._estimate * (1 - self.smoothing) + target * self.smoothing)
+
+    def _back_off(self, latency: float) -> None:
+        """Shrink the window, at most once per round trip however many requests failed in it."""
+        now = time.monotonic()
+        if now < self._cooldown_until:
+            return
+        self._cooldown_until = now + max(latency, self._long_latency or 0.0)
+        self._resize(self._estimate * self.backoff_ratio)
+
+    def _resize(self, estimate: float) -> None:
+        self._estimate = max(float(self.min_limit), min(float(self.max_limit), estimate))
+        limit = int(self._estimate)
+        if limit == self.limit:
+            return
+        if limit > self.limit:
+            self.increases += 1
+        else:
+            self.decreases += 1
+        self.limit = limit
+        self.history.append((time.monotonic(), limit))
+        self._wake()
+
+    def get_limit_history(self) -> List[Tuple[float, int]]:
+        """Get (seconds since the first entry, limit) pairs for every change of the window."""
+        start = self.history[0][0]
+        return [(at - start, limit) for at, limit in self.history]
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats.update({
+            "algorithm": self.algorithm,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "long_latency_ms": (self._long_latency * 1000
+                                if self._long_latency is not None else None),
+        })
+        return stats
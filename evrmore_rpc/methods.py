@@ -0,0 +1,87 @@
+"""
+evrmore-rpc: Pre-generated RPC method table
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Every command in RPC_COMMANDS is bound once as a real method on the client
+class, so `client.getblockcount` is a plain attribute lookup instead of a
+`__getattr__` call that builds a new closure. Each command also gets a
+payload template: the request bytes are assembled from a precomputed
+prefix, the encoded params and the request id, so only the arguments are
+run through the JSON encoder.
+
+Commands not in the table still work through the client's dynamic
+`__getattr__` fallback.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Sequence
+
+from evrmore_rpc.codec import JSONCodec
+from evrmore_rpc.commands import RPC_COMMANDS
+
+
+class RPCMethod:
+    """Precomputed request template for one RPC command."""
+
+    __slots__ = ("name", "name_bytes", "prefix", "no_params")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.name_bytes = name.encode()
+        self.prefix = b'{"jsonrpc":"1.0","method":"' + self.name_bytes + b'","params":'
+        self.no_params = self.prefix + b'[],"id":'
+
+    def encode(self, codec: JSONCodec, args: Sequence[Any], request_id: int) -> bytes:
+        """
+        Build the JSON-RPC request body for a call.
+
+        Args:
+            codec: Codec used to encode the params
+            args: Arguments for the command
+            request_id: JSON-RPC request id
+
+        Returns:
+            The encoded request body
+        """
+        if args:
+            return b'%s%s,"id":%d}' % (self.prefix, codec.dumps(args), request_id)
+        return b'%s%d}' % (self.no_params, request_id)
+
+    def __repr__(self) -> str:
+        return f"<RPCMethod {self.name}>"
+
+
+# Request templates for every known command
+METHOD_TABLE: Dict[str, RPCMethod] = {name: RPCMethod(name) for name in RPC_COMMANDS}
+
+
+def make_method(name: str) -> Callable[..., Any]:
+    """Create the client method for an RPC command."""
+    def method(self, *args: Any, fields: Any = None) -> Any:
+        return self.execute_command(name, *args, fields=fields)
+
+    method.__name__ = name
+    method.__doc__ = f"Execute the `{name}` RPC command."
+    return method
+
+
+def bind_methods(cls: type, names: Iterable[str] = RPC_COMMANDS) -> type:
+    """
+    Bind an RPC method for each command onto a class.
+
+    Attributes the class already defines are left untouched.
+
+    Args:
+        cls: The client class
+        names: Command names to bind
+
+    Returns:
+        The class, for use as a decorator
+    """
+    for name in names:
+        if hasattr(cls, name):
+            continue
+        method = make_method(name)
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+        setattr(cls, name, method)
+    return cls
@@ -25,6 +25,9 @@ The models are organized into categories matching the Evrmore RPC command groups
 - Address Index: Address-based indexing and queries
 - Raw Transactions: Low-level transaction handling
 - Wallet: Wallet management and transactions
+
+lazy(Model, data) wraps a raw result in any of these models and validates
+each field only when it is first read.
 """
 
 # Base models
@@ -93,6 +96,9 @@ from evrmore_rpc.models.wallet import (
     UnspentOutput
 )
 
+# Lazily validated wrappers
+from evrmore_rpc.models.lazy import LazyModel, lazy, lazy_class
+
 __all__ = [
     # Base models
     "Amount", "Address", "Asset", "Transaction", "BaseBlock", "RPCResponse",
@@ -117,5 +123,8 @@ __all__ = [
     "DecodedTransaction", "DecodedScript", "TransactionInput", "TransactionOutput",
     
     # Wallet models
-    "WalletInfo", "WalletTransaction", "UnspentOutput"
+    "WalletInfo", "WalletTransaction", "UnspentOutput",
+    
+    # Lazily validated wrappers
+    "LazyModel", "lazy", "lazy_class"
 ] 
\ No newline at end of file
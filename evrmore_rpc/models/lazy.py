@@ -0,0 +1,301 @@
+"""
+evrmore-rpc: Lazily validated models
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Validating a whole Block costs the same whether a handler reads two
+fields or all of them. lazy() wraps the raw response dict in the model
+without validating anything; each field is validated (and coerced, e.g.
+float to Decimal) on first access and the result is kept, so later reads
+are plain attribute lookups:
+
+    block = lazy(Block, client.getblock(block_hash))
+    if block.height > checkpoint:       # only height is validated
+        ...
+    block.validate()                    # everything else, now
+
+The object is an instance of a subclass of the model (LazyBlock is a
+Block), so isinstance checks and type-checkers see the model's fields.
+Field validators run per field; model-level validators and missing
+required fields are only reported when the whole model is validated.
+repr(), ==, iteration, model_dump(), model_dump_json(), copying and
+pickling validate the whole model first; pickles load as the plain model.
+
+The raw dict is wrapped, not copied: do not change it afterwards.
+"""
+
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from typing_extensions import Annotated
+
+T = TypeVar('T', bound=BaseModel)
+
+# BaseModel's slots, set through their descriptors
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+_new = object.__new__
+
+_MISSING = object()
+
+# Types whose values pass validation unchanged when they already have the type
+_EXACT_TYPES = (int, str, bool, float)
+
+
+def _raw(instance: BaseModel) -> Optional[Dict[str, Any]]:
+    """Get a lazy instance's raw dict; copies made by pydantic never have one."""
+    try:
+        return object.__getattribute__(instance, "_lazy_raw")
+    except AttributeError:
+        return None
+
+
+class _LazyField:
+    """
+    Class attribute of a lazy class for one field.
+
+    It is a non-data descriptor: once the field's value is in the
+    instance's __dict__, reads find it there and never get here.
+    """
+
+    __slots__ = ("name", "key", "field", "check", "exact")
+
+    def __init__(self, name: str, field: FieldInfo, check: Optional[Callable[[Any], Any]]):
+        self.name = name
+        self.key = field.alias or name
+        self.field = field
+        # A standalone validator, or None to validate through the model (validate_assignment)
+        self.check = check
+        # Values of this type are returned as they are, skipping validation
+        exact = check is not None and field.annotation in _EXACT_TYPES and not field.metadata
+        self.exact = field.annotation if exact else None
+
+    def __get__(self, instance: Optional[BaseModel], owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        name = self.name
+        raw = _raw(instance)
+        if raw is None:
+            raise AttributeError(f"{type(instance).__name__!r} object has no attribute {name!r}")
+        value = raw.get(self.key, _MISSING)
+        if value is _MISSING:
+            if self.field.is_required():
+                # Raises the ValidationError naming the missing field
+                type(instance).__lazy_model__.model_validate(raw)
+            value = self.field.get_default(call_default_factory=True)
+        elif type(value) is not self.exact:
+            validator = type(instance).__pydantic_validator__
+            if self.check is None:
+                validator.validate_assignment(instance, name, value)
+                return instance.__dict__[name]
+            try:
+                value = self.check(value)
+            except ValidationError:
+                # Raises the same error with the field's location
+                validator.validate_assignment(instance, name, value)
+                raise
+        instance.__dict__[name] = value
+        return value
+
+
+class LazyModel(BaseModel):
+    """Base of the lazy model classes made by lazy_class()."""
+
+    # The raw dict, None once fully validated
+    __slots__ = ("_lazy_raw",)
+
+    # The model the lazy class was made from
+    __lazy_model__: Type[BaseModel]
+    # Field name -> its descriptor on the lazy class
+    __lazy_fields__: Dict[str, _LazyField]
+
+    def __getattr__(self, name: str) -> Any:
+        """Fill BaseModel's other slots on first use; lazy() only sets the raw dict."""
+        if name == "__pydantic_fields_set__":
+            # The fields present in the raw dict, as model_validate() would set
+            raw = _raw(self) or {}
+            fields = type(self).__lazy_fields__.values()
+            value: Any = {field.name for field in fields if field.key in raw}
+            _set_fields_set(self, value)
+        elif name == "__pydantic_extra__":
+            value = None
+            _set_extra(self, value)
+        elif name == "__pydantic_private__":
+            private = type(self).__private_attributes__
+            value = {key: attr.get_default() for key, attr in private.items()} if private else None
+            _set_private(self, value)
+        else:
+            return super().__getattr__(name)
+        return value
+
+    @property
+    def is_validated(self) -> bool:
+        """True once every field has been validated."""
+        return _raw(self) is None
+
+    def validate(self: T) -> T:  # type: ignore[override]
+        """
+        Validate every field not validated yet, and the model as a whole.
+
+        Returns:
+            The instance itself
+
+        Raises:
+            pydantic.ValidationError: If the raw dict does not fit the model
+        """
+        raw = _raw(self)
+        if raw is None:
+            return self
+        full = type(self).__lazy_model__.model_validate(raw)
+        # Fields already read (or assigned) keep their values
+        values = dict(full.__dict__)
+        values.update(self.__dict__)
+        _set_dict(self, values)
+        _set_fields_set(self, full.__pydantic_fields_set__ | self.__pydantic_fields_set__)
+        _set_extra(self, full.__pydantic_extra__)
+        if full.__pydantic_private__ is not None:
+            _set_private(self, {**full.__pydantic_private__, **(self.__pydantic_private__ or {})})
+        _set_raw(self, None)
+        return self
+
+    # Everything that reads all fields validates the whole model first
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        if getattr(type(other), "__lazy_model__", type(other)) is not type(self).__lazy_model__:
+            return False
+        self.validate()
+        if isinstance(other, LazyModel):
+            other.validate()
+        return (self.__dict__ == other.__dict__
+                and self.__pydantic_extra__ == other.__pydantic_extra__
+                and self.__pydantic_private__ == other.__pydantic_private__)
+
+    def __iter__(self) -> Any:
+        self.validate()
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        self.validate()
+        return super().__repr_args__()
+
+    def __reduce__(self) -> Any:
+        # Lazy classes are made at runtime: pickle as the plain model
+        self.validate()
+        return _unpickle, (type(self).__lazy_model__, self.__getstate__())
+
+    def __copy__(self: T) -> T:
+        self.validate()
+        return super().__copy__()
+
+    def __deepcopy__(self: T, memo: Optional[Dict[int, Any]] = None) -> T:
+        self.validate()
+        return super().__deepcopy__(memo)
+
+    def model_copy(self: T, *args: Any, **kwargs: Any) -> T:
+        self.validate()
+        return super().model_copy(*args, **kwargs)
+
+    def model_dump(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        self.validate()
+        return super().model_dump(*args, **kwargs)
+
+    def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
+        self.validate()
+        return super().model_dump_json(*args, **kwargs)
+
+
+_set_raw = LazyModel.__dict__["_lazy_raw"].__set__
+
+
+def _unpickle(model: Type[T], state: Dict[Any, Any]) -> T:
+    instance = model.__new__(model)
+    instance.__setstate__(state)
+    return instance
+
+
+def _lazy_fields(model: Type[BaseModel]) -> Dict[str, _LazyField]:
+    """
+    Compile the per-field descriptors of a lazy class.
+
+    A field validates with its own TypeAdapter, several times faster than
+    validate_assignment, if the model has no field validators or config
+    that the field would miss on its own.
+    """
+    standalone = not model.model_config and not model.__pydantic_decorators__.field_validators
+    fields = {}
+    for name, field in model.model_fields.items():
+        check = None
+        if standalone:
+            check = TypeAdapter(Annotated[field.annotation, field]).validator.validate_python
+        fields[name] = _LazyField(name, field, check)
+    return fields
+
+
+# Model -> its lazy class
+_lazy_classes: Dict[type, type] = {}
+
+
+def lazy_class(model: Type[T]) -> Type[T]:
+    """Get the cached lazy subclass of a model, e.g. LazyBlock for Block."""
+    cls = _lazy_classes.get(model)
+    if cls is None:
+        fields = _lazy_fields(model)
+        cls = type(f"Lazy{model.__name__}", (LazyModel, model), {
+            "__module__": model.__module__,
+            "__doc__": f"{model.__name__} validated field by field on first access.",
+            "__lazy_model__": model,
+            "__lazy_fields__": fields,
+        })
+        # Set after the class is made, so pydantic does not take them for field defaults
+        for name, descriptor in fields.items():
+            setattr(cls, name, descriptor)
+        cls = _lazy_classes.setdefault(model, cls)
+    return cls
+
+
+def lazy_constructor(model: Type[T]) -> Callable[[Dict[str, Any]], T]:
+    """
+    Get a function that wraps raw dicts in a model, like lazy(model, data).
+
+    It skips lazy()'s class lookup, for wrapping every item of a list.
+    """
+    cls = lazy_class(model)
+
+    def construct(data: Dict[str, Any]) -> T:
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected dict for {model.__name__}, got {type(data).__name__}")
+        instance = _new(cls)
+        _set_raw(instance, data)
+        return instance
+
+    return construct
+
+
+def lazy(model: Type[T], data: Dict[str, Any]) -> T:
+    """
+    Wrap a raw response dict in a model, validating each field on first access.
+
+    Only the raw dict is stored; the model's other state is set up when it
+    is first used.
+
+    Args:
+        model: The model class, e.g. Block
+        data: The raw result, e.g. from client.getblock()
+
+    Returns:
+        An instance of the model's lazy subclass
+
+    Raises:
+        TypeError: If data is not a dict
+    """
+    if not isinstance(data, dict):
+        raise TypeError(f"Expected dict for {model.__name__}, got {type(data).__name__}")
+    instance = _new(_lazy_classes.get(model) or lazy_class(model))
+    _set_raw(instance, data)
+    return instance
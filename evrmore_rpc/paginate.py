@@ -0,0 +1,174 @@
+"""
+evrmore-rpc: Auto-paginating iterators for list commands
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+listassets, listmyassets, listaddressesbyasset and listassetbalancesbyaddress
+take count/start arguments. The client's iter_* helpers page through them
+automatically, with `for` or `async for`:
+
+    for name in client.iter_assets("CATS*", page_size=1000):
+        ...
+
+    async for address, balance in client.iter_addresses_by_asset("CATS"):
+        ...
+
+Array results yield their elements, object results yield (key, value)
+pairs, like client.stream(). While the caller works through one page, the
+next `prefetch` pages are already being fetched, so at most prefetch + 1
+pages are held in memory at a time.
+
+Paginator.cursor is the offset just past the last item yielded. Save it
+and pass it back as start= to resume after a restart:
+
+    pages = client.iter_assets(page_size=1000)
+    for name in pages:
+        index(name)
+        checkpoint(pages.cursor)
+
+    for name in client.iter_assets(page_size=1000, start=saved_cursor):
+        ...
+
+Offsets are positions in the node's sorted listing, so assets created
+before the cursor's position between runs shift the resumed listing.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Deque, Iterator, List, Sequence
+
+if TYPE_CHECKING:  # pragma: no cover
+    from evrmore_rpc.client import EvrmoreClient
+
+# Builds a command's arguments for one page from (count, start)
+PageArgs = Callable[[int, int], Sequence[Any]]
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_PREFETCH = 2
+
+
+def page_items(page: Any) -> List[Any]:
+    """Split a page into the items it yields: elements or (key, value) pairs."""
+    if isinstance(page, dict):
+        return list(page.items())
+    if isinstance(page, list):
+        return page
+    return [] if page is None else [page]
+
+
+class Paginator:
+    """
+    Pages through a list command: iterate it with `for` or `async for`.
+
+    Each iteration starts from the current cursor, so a paginator that was
+    stopped early continues where it left off when iterated again.
+    """
+
+    def __init__(self, client: "EvrmoreClient", command: str, page_args: PageArgs,
+                 page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = DEFAULT_PREFETCH,
+                 start: int = 0):
+        """
+        Initialize the paginator.
+
+        Args:
+            client: The client that sends the page requests
+            command: The RPC command to page through
+            page_args: Builds the command's arguments from (count, start)
+            page_size: Items requested per page
+            prefetch: Pages fetched ahead of the one being iterated
+            start: Offset of the first item, e.g. a saved cursor
+
+        Raises:
+            ValueError: If page_size, prefetch or start is out of range
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if prefetch < 0:
+            raise ValueError("prefetch must not be negative")
+        if start < 0:
+            raise ValueError("start must not be negative")
+        self.client = client
+        self.command = command
+        self.page_args = page_args
+        self.page_size = page_size
+        self.prefetch = prefetch
+
+        # Offset just past the last item yielded
+        self.cursor = start
+        # Pages received so far
+        self.pages = 0
+        # True once a short page showed the listing has ended
+        self.exhausted = False
+
+    def _take(self, page: Any) -> List[Any]:
+        """Count a received page and return its items."""
+        self.pages += 1
+        items = page_items(page)
+        if len(items) < self.page_size:
+            self.exhausted = True
+        return items
+
+    def __iter__(self) -> Iterator[Any]:
+        if self.exhausted:
+            return
+        client, command, page_args, size = self.client, self.command, self.page_args, self.page_size
+        fetch = lambda offset: client.execute_command_sync(command, *page_args(size, offset))
+        if self.prefetch == 0:
+            while not self.exhausted:
+                for item in self._take(fetch(self.cursor)):
+                    self.cursor += 1
+                    yield item
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.prefetch, thread_name_prefix="evrmore-pages")
+        pending: Deque[Future] = deque()
+        offset = self.cursor
+        try:
+            while True:
+                # The next page plus `prefetch` pages ahead of it
+                while len(pending) <= self.prefetch:
+                    pending.append(executor.submit(fetch, offset))
+                    offset += size
+                items = self._take(pending.popleft().result())
+                for item in items:
+                    self.cursor += 1
+                    yield item
+                if self.exhausted:
+                    return
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        if self.exhausted:
+            return
+        client, command, page_args, size = self.client, self.command, self.page_args, self.page_size
+
+        def fetch(offset: int) -> asyncio.Future:
+            call = client.execute_command_async(command, *page_args(size, offset))
+            return asyncio.ensure_future(call)
+
+        pending: Deque[asyncio.Future] = deque()
+        offset = self.cursor
+        try:
+            while True:
+                while len(pending) <= self.prefetch:
+                    pending.append(fetch(offset))
+                    offset += size
+                items = self._take(await pending.popleft())
+                for item in items:
+                    self.cursor += 1
+                    yield item
+                if self.exhausted:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+            # Retrieve the cancelled tasks' outcomes so none is reported as never retrieved
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def __repr__(self) -> str:
+        return f"<Paginator {self.command} cursor={self.cursor} page_size={self.page_size}>"
@@ -0,0 +1,259 @@
+"""
+evrmore-rpc: Field projection for large responses
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+Block processors often need a few fields of `getblock <hash> 2`, not the
+whole nested dict. Pass fields= to any call to get only those fields:
+
+    block = client.getblock(block_hash, 2, fields=["hash", "tx[].txid", "tx[].vout[].value"])
+
+Path syntax:
+- "a.b"   nested member b of member a
+- "a[]"   every element of array a ("[]" alone: every element of an array result)
+- "*"     every member of an object, e.g. "*.fee" for `getrawmempool true`
+A path that stops at an object or array keeps that whole subtree.
+
+fields= also takes a pydantic model class. The paths are derived from the
+model's fields (following nested models, lists and dicts of models), and
+the projected result is validated into the model. A slim model built from
+the few fields you need, or one of evrmore_rpc.models, works as a schema:
+
+    class Tx(BaseModel):
+        txid: str
+        vout: List[TransactionOutput]
+
+    class BlockTxs(BaseModel):
+        hash: str
+        tx: List[Tx]
+
+    block = client.getblock(block_hash, 2, fields=BlockTxs)
+
+With pysimdjson installed and the default "float" number mode, the body is
+parsed into simdjson's native document and only the selected fields are
+turned into Python objects; unwanted subtrees are never materialized.
+Otherwise the response is decoded by the client's codec and pruned.
+"""
+
+import threading
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from evrmore_rpc.codec import JSONCodec, simdjson
+from evrmore_rpc.typed import get_adapter
+
+# Tree node: member name -> subtree, with "[]" for array elements and "*"
+# for every member; None keeps the whole value
+Tree = Optional[Dict[str, Any]]
+
+EACH = "[]"
+ANY = "*"
+
+_local = threading.local()
+
+
+def _tokens(path: str) -> List[str]:
+    tokens = []
+    for segment in path.split("."):
+        name = segment
+        arrays = 0
+        while name.endswith(EACH):
+            name = name[:-2]
+            arrays += 1
+        if name:
+            tokens.append(name)
+        elif not arrays:
+            raise ValueError(f"Empty segment in field path {path!r}")
+        tokens.extend([EACH] * arrays)
+    return tokens
+
+
+def _merge(tree: Dict[str, Any], tokens: Sequence[str]) -> None:
+    """Add one path to a tree; a shorter path keeping a whole subtree wins."""
+    node = tree
+    for i, token in enumerate(tokens):
+        last = i == len(tokens) - 1
+        if token in node and node[token] is None:
+            return
+        if last:
+            node[token] = None
+            return
+        node = node.setdefault(token, {})
+
+
+def _model_tree(model: type) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        tree[field.alias or name] = _annotation_tree(field.annotation)
+    return tree
+
+
+def _annotation_tree(annotation: Any) -> Tree:
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is Union:
+        trees = [_annotation_tree(arg) for arg in args if arg is not type(None)]
+        # A union of different shapes keeps the whole value
+        return trees[0] if len(trees) == 1 else None
+    if origin in (list, List, tuple, set, frozenset) and args:
+        element = _annotation_tree(args[0])
+        return None if element is None else {EACH: element}
+    if origin in (dict, Dict) and len(args) == 2:
+        value = _annotation_tree(args[1])
+        return None if value is None else {ANY: value}
+    if isinstance(annotation, type) and hasattr(annotation, "model_fields"):
+        return _model_tree(annotation)
+    return None
+
+
+_OBJECTS: Tuple[type, ...] = (dict,)
+_ARRAYS: Tuple[type, ...] = (list,)
+if simdjson is not None:
+    _OBJECTS += (simdjson.Object,)
+    _ARRAYS += (simdjson.Array,)
+
+_MISSING = object()
+
+
+def _materialize(value: Any) -> Any:
+    """Turn a simdjson proxy into plain Python objects."""
+    if simdjson is not None:
+        if isinstance(value, simdjson.Object):
+            return value.as_dict()
+        if isinstance(value, simdjson.Array):
+            return value.as_list()
+    return value
+
+
+def _build(tree: Tree) -> Callable[[Any], Any]:
+    """
+    Compile a tree into a function that projects a value.
+
+    Values shaped differently from the tree (e.g. `getblock` verbosity 1
+    where the paths expect verbosity 2) are returned whole.
+    """
+    if tree is None:
+        return _materialize
+
+    if EACH in tree:
+        element = _build(tree[EACH])
+
+        def each(value: Any) -> Any:
+            if isinstance(value, _ARRAYS):
+                return [element(item) for item in value]
+            return _materialize(value)
+        return each
+
+    every = _build(tree[ANY]) if ANY in tree else None
+    members = [(key, _build(subtree)) for key, subtree in tree.items() if key != ANY]
+
+    def select(value: Any) -> Any:
+        if not isinstance(value, _OBJECTS):
+            return _materialize(value)
+        projected = {key: every(item) for key, item in value.items()} if every is not None else {}
+        for key, project in members:
+            item = value.get(key, _MISSING)
+            if item is not _MISSING:
+                projected[key] = project(item)
+        return projected
+    return select
+
+
+class Projection:
+    """A compiled set of field paths, optionally tied to a pydantic model."""
+
+    def __init__(self, fields: Union[Sequence[str], type]):
+        """
+        Compile a projection.
+
+        Args:
+            fields: Field paths, or a pydantic model class to derive them from
+        """
+        self.model: Optional[type] = None
+        if isinstance(fields, type):
+            if not hasattr(fields, "model_fields"):
+                raise TypeError(f"{fields.__name__} is not a pydantic model")
+            self.model = fields
+            self.tree: Dict[str, Any] = _model_tree(fields)
+        else:
+            if isinstance(fields, str):
+                raise TypeError("fields must be a list of paths, not a single string")
+            self.tree = {}
+            for path in fields:
+                _merge(self.tree, _tokens(path))
+        self._project = _build(self.tree)
+
+    def apply(self, value: Any) -> Any:
+        """Project a decoded result (or a simdjson document)."""
+        return self._project(value)
+
+    def decode(self, codec: JSONCodec, body: bytes) -> Dict[str, Any]:
+        """
+        Decode a JSON-RPC response body, projecting its result.
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if simdjson is not None and codec.numbers == "float":
+            parser = getattr(_local, "parser", None)
+            if parser is None:
+                parser = _local.parser = simdjson.Parser()
+            try:
+                document = parser.parse(body)
+            except RuntimeError as e:
+                raise ValueError(str(e)) from e
+            if not hasattr(document, "keys"):
+                return {"result": None, "error": _materialize(document)}
+            response = {"error": _materialize(document.get("error")), "id": document.get("id")}
+            response["result"] = self.apply(document.get("result"))
+            return response
+        response = codec.loads(body)
+        if isinstance(response, dict) and "result" in response:
+            response["result"] = self.apply(response["result"])
+        return response
+
+    def finish(self, result: Any) -> Any:
+        """Validate a projected result into the model, if there is one."""
+        if self.model is None or result is None:
+            return result
+        if isinstance(result, list):
+            return get_adapter(List[self.model]).validate_python(result)
+        return self.model.model_validate(result)
+
+    def paths(self) -> List[str]:
+        """List the compiled paths, e.g. for inspecting what a model selects."""
+        found: List[str] = []
+
+        def walk(node: Tree, prefix: str) -> None:
+            if node is None:
+                found.append(prefix or EACH)
+                return
+            for key, child in node.items():
+                if key == EACH:
+                    walk(child, prefix + EACH)
+                else:
+                    walk(child, f"{prefix}.{key}" if prefix else key)
+
+        walk(self.tree, "")
+        return found
+
+    def __repr__(self) -> str:
+        target = self.model.__name__ if self.model is not None else ", ".join(self.paths())
+        return f"<Projection {target}>"
+
+
+@lru_cache(maxsize=256)
+def _compile(fields: Union[Tuple[str, ...], type]) -> Projection:
+    return Projection(fields)
+
+
+def get_projection(fields: Union[Projection, Sequence[str], type]) -> Projection:
+    """Get a compiled projection for a fields= argument, reusing earlier compilations."""
+    if isinstance(fields, Projection):
+        return fields
+    if isinstance(fields, type):
+        return _compile(fields)
+    if isinstance(fields, str):
+        raise TypeError("fields must be a list of paths, not a single string")
+    return _compile(tuple(fields))
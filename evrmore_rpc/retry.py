@@ -0,0 +1,193 @@
+"""
+evrmore-rpc: Retry policy and circuit breaker
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+RetryPolicy decides whether a failed call is resent and how long to wait:
+exponential backoff with full jitter, so a burst of callers that failed
+together do not retry together.
+
+- A "Work queue depth exceeded" rejection (EvrmoreWorkQueueError) is always
+  retried: the node turned the request away before running it.
+- Connection errors and timeouts (EvrmoreConnectionError) are retried only
+  for idempotent commands (see commands.IDEMPOTENT_COMMANDS). A timed-out
+  `transfer` or `sendrawtransaction` may already have run.
+- RPC errors returned by the node and open circuits are never retried.
+
+CircuitBreaker tracks the health of one node. After failure_threshold
+consecutive connection or work-queue failures it opens and calls fail
+immediately with EvrmoreCircuitOpenError. After reset_timeout seconds a few
+trial calls are let through (half-open), and the first success closes it.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from evrmore_rpc.commands import is_idempotent
+from evrmore_rpc.exceptions import (
+    EvrmoreCircuitOpenError,
+    EvrmoreConnectionError,
+    EvrmoreWorkQueueError,
+)
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter, limited to calls that are safe to resend."""
+
+    def __init__(self,
+                 max_attempts: int = 4,
+                 backoff_base: float = 0.05,
+                 backoff_max: float = 2.0,
+                 jitter: bool = True):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Total attempts per call, including the first
+            backoff_base: Delay in seconds before the first retry (before jitter)
+            backoff_max: Upper bound on the delay between attempts
+            jitter: Pick each delay uniformly between 0 and the backoff ("full jitter")
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+    def is_retryable(self, commands: Iterable[str], error: Exception) -> bool:
+        """
+        Check whether a failed call (or batch) may be resent.
+
+        Args:
+            commands: The commands in the failed request
+            error: The error it raised
+
+        Returns:
+            True if resending cannot run a command twice
+        """
+        if isinstance(error, EvrmoreCircuitOpenError):
+            return False
+        if isinstance(error, EvrmoreWorkQueueError):
+            return True
+        if isinstance(error, EvrmoreConnectionError):
+            return all(is_idempotent(command) for command in commands)
+        return False
+
+    def get_delay(self, attempt: int) -> float:
+        """Get the delay in seconds before retry number attempt (0-based)."""
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+    def next_delay(self, commands: Iterable[str], error: Exception,
+                   attempt: int) -> Optional[float]:
+        """
+        Get the delay before the next attempt, or None to give up.
+
+        Args:
+            commands: The commands in the failed request
+            error: The error it raised
+            attempt: Number of attempts already made, minus one
+
+        Returns:
+            Seconds to wait before resending, or None if the error should be raised
+        """
+        if attempt + 1 >= self.max_attempts or not self.is_retryable(commands, error):
+            return None
+        return self.get_delay(attempt)
+
+    def __repr__(self) -> str:
+        return (f"<RetryPolicy max_attempts={self.max_attempts} "
+                f"backoff={self.backoff_base}-{self.backoff_max}s jitter={self.jitter}>")
+
+
+class CircuitBreaker:
+    """Per-node circuit breaker (closed, open, half-open)."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 half_open_max_calls: int = 1):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before trial calls are allowed
+            half_open_max_calls: Trial calls allowed at once while half-open
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = self.CLOSED
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    def allow(self) -> bool:
+        """Check whether a call may be sent now, reserving a trial slot when half-open."""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self._rejected += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._trials = 0
+            if self.state == self.HALF_OPEN:
+                if self._trials >= self.half_open_max_calls:
+                    self._rejected += 1
+                    return False
+                self._trials += 1
+            return True
+
+    def record_success(self) -> None:
+        """Record a call the node answered."""
+        with self._lock:
+            self._failures = 0
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self._trials = 0
+
+    def release(self) -> None:
+        """Free the trial slot of a call that ended without an answer, e.g. one cancelled."""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def record_failure(self) -> None:
+        """Record a call the node failed to answer."""
+        with self._lock:
+            self._failures += 1
+            tripped = self.state == self.CLOSED and self._failures >= self.failure_threshold
+            if self.state == self.HALF_OPEN or tripped:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trials = 0
+                self._times_opened += 1
+
+    def retry_after(self) -> float:
+        """Get the seconds left until an open circuit allows a trial call."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the breaker's state and counters."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "times_opened": self._times_opened,
+                "rejected": self._rejected,
+            }
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker {self.state} failures={self._failures}/{self.failure_threshold}>"
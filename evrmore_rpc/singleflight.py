@@ -0,0 +1,144 @@
+"""
+evrmore-rpc: Single-flight deduplication of identical in-flight RPC calls
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+When several callers ask for the same read-only (method, params) while a
+request for it is already on the wire, they wait for that request instead
+of sending their own, and all receive its result or its exception.
+
+Note that coalesced callers share the same result object; treat results as
+read-only or copy them before mutating.
+"""
+
+import asyncio
+import json
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def call_key(command: str, args: Tuple[Any, ...]) -> Tuple[str, str]:
+    """Build a hashable key identifying an RPC call."""
+    return command, json.dumps(args, sort_keys=True, default=str)
+
+
+class _SyncCall:
+    """An in-flight synchronous call that other threads can wait on."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls into one execution.
+
+    Works for coroutines on any event loop and for threads in sync code.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sync_calls: Dict[Hashable, _SyncCall] = {}
+        self._async_calls: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]"
+        ) = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Statistics
+        self.executed = 0
+        self.coalesced = 0
+
+    def do_sync(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func, or wait for an identical call already running in another thread.
+
+        Args:
+            key: Identity of the call
+            func: Performs the call
+
+        Returns:
+            The result of the call
+        """
+        with self._lock:
+            call = self._sync_calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._sync_calls[key] = _SyncCall()
+                self.executed += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._sync_calls[key]
+            call.event.set()
+
+    async def do_async(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await factory(), or join an identical call already in flight on this loop.
+
+        The call runs in its own task, so cancelling one waiter does not
+        cancel the request for the others.
+
+        Args:
+            key: Identity of the call
+            factory: Returns the awaitable performing the call
+
+        Returns:
+            The result of the call
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.get(loop)
+        if calls is None:
+            calls = self._async_calls[loop] = {}
+
+        task = calls.get(key)
+        if task is None:
+            task = loop.create_task(factory())
+            calls[key] = task
+            self.executed += 1
+
+            def finished(done: asyncio.Task) -> None:
+                calls.pop(key, None)
+                # Mark the exception as retrieved in case every waiter was cancelled
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(finished)
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        return len(self._sync_calls) + sum(len(calls) for calls in list(self._async_calls.values()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get single-flight statistics."""
+        total = self.executed + self.coalesced
+        return {
+            "calls": total,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_rate": self.coalesced / total if total else 0.0,
+            "in_flight": self.in_flight(),
+        }
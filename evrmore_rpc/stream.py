@@ -0,0 +1,341 @@
+"""
+evrmore-rpc: Streaming parser for large JSON-RPC responses
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+`getblock <hash> 2`, `getrawmempool true` or `listassets "*" true` can
+return tens of megabytes. client.stream() parses the response body as it
+arrives and yields the result one piece at a time, so only one element is
+held in memory at a time:
+
+- array results yield their elements
+- object results yield (key, value) pairs
+- any other result is yielded as a single item
+
+A huge array inside an object result can be expanded as well: with
+expand=("tx",), `getblock <hash> 2` yields its other members as usual and
+then one ("tx", tx) pair per transaction. An expanded empty array yields
+nothing.
+
+    for txid, entry in client.stream("getrawmempool", True):
+        ...
+
+    async for asset in client.stream("listassets", "*", False):
+        ...
+
+    for key, value in client.stream("getblock", block_hash, 2, expand=("tx",)):
+        ...
+
+Elements are decoded by the standard library's C scanner (raw_decode), so
+only the outer structure is walked in Python. An element cut by the end of
+a chunk is not decoded again with every chunk: its nesting depth is
+tracked over the new text only, its text is kept as a list of pieces, and
+it is decoded once, when it closes. Streams are sent outside the cache,
+single-flight and retry layers: a retry could not undo the items already
+yielded.
+"""
+
+import codecs
+import json
+import re
+from typing import (TYPE_CHECKING, AbstractSet, Any, AsyncIterator, Iterable, Iterator, List,
+                    Optional, Sequence)
+
+from evrmore_rpc.codec import OBJECT_PAIRS, PARSE_FLOAT, satoshi_result, satoshi_value
+from evrmore_rpc.exceptions import EvrmoreRPCError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from evrmore_rpc.client import EvrmoreClient
+
+# Bytes read from the socket at a time
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that change the nesting depth, outside and inside strings
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'["\\]')
+
+# Parser states
+_START = 0        # before the envelope's "{"
+_MEMBER = 1       # before an envelope key, "," or "}"
+_COLON = 2        # before the ":" after a key
+_VALUE = 3        # before the value of an envelope member other than "result"
+_RESULT = 4       # before the value of "result"
+_ITEMS = 5        # inside the result array or object: before an element or key, "," or the end
+_ITEM = 6         # before the value of a result object member
+_NESTED = 7       # inside an expanded array member of the result object
+_DONE = 8         # after the envelope's "}"
+
+# Returned by _value when the buffer holds only part of a value
+_INCOMPLETE = object()
+
+
+class StreamParser:
+    """
+    Push parser for a JSON-RPC response envelope.
+
+    feed() takes raw body chunks and returns the result items completed so
+    far. close() returns any remaining items once the body has ended. The
+    envelope's "error" member is left in error for the caller to raise.
+    """
+
+    def __init__(self, numbers: str = "float", command: Optional[str] = None,
+                 expand: AbstractSet[str] = frozenset()):
+        """
+        Initialize the parser.
+
+        Args:
+            numbers: How fractional numbers are decoded: "float", "decimal" or "satoshis"
+            command: The command the response is for, which decides how a bare
+                     amount result is decoded in the "satoshis" number mode
+            expand: Members of an object result whose array value is yielded as
+                    one (key, element) pair per element
+        """
+        self._expand = expand
+        self._decoder = json.JSONDecoder(parse_float=PARSE_FLOAT[numbers],
+                                         object_pairs_hook=OBJECT_PAIRS[numbers])
+        self._satoshis = numbers == "satoshis"
+        self._command = command
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._next = _VALUE
+        self._member: Optional[str] = None
+        self._scalar: Any = None
+
+        # The value cut by the end of the buffer: its start in the buffer, the
+        # text before this buffer, and how far it has been scanned
+        self._open: Optional[int] = None
+        self._pieces: List[str] = []
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+
+        # "array", "object" or "scalar" once the result has started
+        self.kind: Optional[str] = None
+        self.error: Any = None
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse the next chunk of the body and return the completed items."""
+        self._extend(self._text.decode(chunk))
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Finish parsing at the end of the body.
+
+        Raises:
+            EvrmoreRPCError: If the body is not a complete JSON-RPC response
+        """
+        self._extend(self._text.decode(b"", final=True))
+        items = self._parse(final=True)
+        if self._state != _DONE or self._buffer[self._pos:].strip(_WHITESPACE):
+            raise EvrmoreRPCError("Invalid JSON response")
+        # Held back until now: a null result may come with an error
+        if self.kind == "scalar" and self.error is None:
+            scalar = self._scalar
+            items.append(satoshi_result(self._command, scalar) if self._satoshis else scalar)
+        return items
+
+    def _extend(self, text: str) -> None:
+        """Start the next buffer with text, keeping the unconsumed rest of the current one."""
+        buffer = self._buffer
+        if self._open is None:
+            # At most a short number, literal or whitespace is left over
+            self._buffer = buffer[self._pos:] + text
+        else:
+            self._pieces.append(buffer[self._open:])
+            self._scan -= len(buffer)
+            self._open = 0
+            self._buffer = text
+        self._pos = 0
+
+    def _skip(self) -> Optional[str]:
+        """Skip whitespace and return the next character, or None at the end of the buffer."""
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _value(self, final: bool) -> Any:
+        """Decode the value at the current position, or return _INCOMPLETE."""
+        buffer = self._buffer
+        if self._open is None:
+            pos = self._pos
+            if buffer[pos] not in '[{"':
+                return self._scalar_value(final)
+            try:
+                value, self._pos = self._decoder.raw_decode(buffer, pos)
+                return value
+            except json.JSONDecodeError:
+                pass
+            # Cut by the end of the buffer: decode it once it closes
+            self._open = self._scan = pos
+            self._depth = 0
+            self._in_string = False
+
+        end = self._close_scan()
+        if end < 0:
+            if final:
+                raise EvrmoreRPCError("Invalid JSON response")
+            return _INCOMPLETE
+        text = buffer[self._open:end]
+        if self._pieces:
+            self._pieces.append(text)
+            text = "".join(self._pieces)
+            self._pieces = []
+        self._open = None
+        try:
+            value, stop = self._decoder.raw_decode(text)
+        except json.JSONDecodeError:
+            raise EvrmoreRPCError("Invalid JSON response")
+        if stop != len(text):
+            raise EvrmoreRPCError("Invalid JSON response")
+        self._pos = end
+        return value
+
+    def _close_scan(self) -> int:
+        """Scan the open value's new text; return the position just past its end, or -1."""
+        buffer = self._buffer
+        pos, depth, in_string = self._scan, self._depth, self._in_string
+        end = -1
+        while True:
+            match = (_STRING_END if in_string else _STRUCTURE).search(buffer, pos)
+            if match is None:
+                # pos can be past the end after a backslash: the escaped character is in
+                # the next chunk
+                pos = max(pos, len(buffer))
+                break
+            pos = match.end()
+            char = match.group()
+            if char == "\\":
+                pos += 1
+            elif char == '"':
+                in_string = not in_string
+                if not in_string and depth == 0:
+                    end = pos
+                    break
+            elif char in "[{":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    end = pos
+                    break
+        self._scan, self._depth, self._in_string = pos, depth, in_string
+        return end
+
+    def _scalar_value(self, final: bool) -> Any:
+        """Decode a number or literal, which is short enough to retry with the next chunk."""
+        buffer = self._buffer
+        try:
+            value, end = self._decoder.raw_decode(buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise EvrmoreRPCError("Invalid JSON response")
+            return _INCOMPLETE
+        if end == len(buffer) and not final and buffer[end - 1].isdigit():
+            # A number may continue in the next chunk
+            return _INCOMPLETE
+        self._pos = end
+        return value
+
+    def _punctuation(self, char: str) -> bool:
+        """Consume a structural character of the current state; False if a value starts here."""
+        state = self._state
+        if state == _START:
+            if char != "{":
+                raise EvrmoreRPCError("Invalid JSON response")
+            self._state = _MEMBER
+        elif state == _COLON:
+            if char != ":":
+                raise EvrmoreRPCError("Invalid JSON response")
+            self._state = self._next
+        elif char == ",":
+            if state in (_VALUE, _RESULT, _ITEM):
+                raise EvrmoreRPCError("Invalid JSON response")
+        elif state == _MEMBER and char == "}":
+            self._state = _DONE
+        elif state == _RESULT and char in "[{":
+            self.kind = "array" if char == "[" else "object"
+            self._state = _ITEMS
+        elif state == _ITEMS and char == ("]" if self.kind == "array" else "}"):
+            self._state = _MEMBER
+        elif state == _ITEM and char == "[" and self._member in self._expand:
+            self._state = _NESTED
+        elif state == _NESTED and char == "]":
+            self._state = _ITEMS
+        else:
+            return False
+        self._pos += 1
+        return True
+
+    def _parse(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        while self._state != _DONE:
+            if self._open is None:
+                char = self._skip()
+                if char is None:
+                    return items
+                if self._punctuation(char):
+                    continue
+            value = self._value(final)
+            if value is _INCOMPLETE:
+                return items
+            self._accept(value, items)
+        return items
+
+    def _accept(self, value: Any, items: List[Any]) -> None:
+        """Take a decoded value in the current state."""
+        state = self._state
+        if state == _MEMBER or (state == _ITEMS and self.kind == "object"):
+            if not isinstance(value, str):
+                raise EvrmoreRPCError("Invalid JSON response")
+            self._member = value
+            self._next = _ITEM if state == _ITEMS else _RESULT if value == "result" else _VALUE
+            self._state = _COLON
+        elif state == _VALUE:
+            if self._member == "error":
+                self.error = value
+            self._state = _MEMBER
+        elif state == _RESULT:
+            self.kind = "scalar"
+            self._scalar = value
+            self._state = _MEMBER
+        elif state == _ITEMS:
+            items.append(satoshi_result(self._command, value) if self._satoshis else value)
+        else:
+            # _ITEM, or an element of an expanded array member (_NESTED)
+            key = self._member
+            items.append((key, satoshi_value(key, value) if self._satoshis else value))
+            if state == _ITEM:
+                self._state = _ITEMS
+
+
+class ResponseStream:
+    """
+    The result of client.stream(): iterate it with `for` or `async for`.
+
+    The request is sent when iteration starts; each stream can be iterated once.
+    """
+
+    def __init__(self, client: "EvrmoreClient", command: str, args: Sequence[Any],
+                 chunk_size: int = CHUNK_SIZE,
+                 expand: Iterable[str] = ()):
+        self.client = client
+        self.command = command
+        self.args = tuple(args)
+        self.chunk_size = chunk_size
+        self.expand = frozenset(expand)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.client._stream_sync(self.command, self.args, self.chunk_size, self.expand)
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.client._stream_async(self.command, self.args, self.chunk_size, self.expand)
+
+    def __repr__(self) -> str:
+        return f"<ResponseStream {self.command}>"
@@ -0,0 +1,362 @@
+"""
+evrmore-rpc: Lightweight sync transport on http.client
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+requests runs every call through hooks, adapters, header merging and
+cookie handling. For small calls such as getblockcount on localhost that
+per-call Python work costs more than the round trip itself.
+
+HTTPClientSession is a drop-in for the few requests.Session features the
+sync client uses, built directly on persistent http.client connections:
+
+- the request headers (including Authorization) are built once
+- sockets are kept alive and reused from a small idle pool, which also
+  makes the session safe to share between threads
+- an idle socket the node has closed is detected before reuse and replaced
+
+Select it with EvrmoreClient(transport="http.client").
+
+Both sync transports can also reach the node over a Unix domain socket
+(unix:///path URLs): HTTPClientSession through _UnixConnection, and
+requests through UnixSocketAdapter, which serves every request from one
+urllib3 pool of socket connections.
+
+PerThreadSession gives every thread its own session of either kind, for
+EvrmoreClient(thread_safe="per_thread").
+"""
+
+import http.client
+import select
+import socket
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from evrmore_rpc.exceptions import EvrmoreConnectionError
+
+# Idle connections kept for reuse (requests' default pool size)
+DEFAULT_POOL_SIZE = 10
+
+
+class _Connection(http.client.HTTPConnection):
+    """HTTPConnection with optional TCP_NODELAY on every (re)connect."""
+
+    def __init__(self, host: str, port: int, timeout: float, tcp_nodelay: bool):
+        super().__init__(host, port, timeout=timeout)
+        self.tcp_nodelay = tcp_nodelay
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1 if self.tcp_nodelay else 0)
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix domain socket."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _UnixSocketConnection(urllib3.connection.HTTPConnection):
+    """urllib3 connection over a Unix domain socket."""
+
+    def __init__(self, *args, socket_path: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout if isinstance(self.timeout, (int, float)) else None)
+        try:
+            sock.connect(self.socket_path)
+        except OSError as e:
+            sock.close()
+            raise urllib3.exceptions.NewConnectionError(
+                self, f"Failed to connect to {self.socket_path}: {e}"
+            )
+        return sock
+
+
+class _UnixSocketPool(urllib3.HTTPConnectionPool):
+    ConnectionCls = _UnixSocketConnection
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """requests adapter that sends every request to one Unix domain socket."""
+
+    def __init__(self, socket_path: str, pool_maxsize: Optional[int] = None,
+                 pool_block: bool = False):
+        super().__init__()
+        self.socket_path = socket_path
+        self._pool = _UnixSocketPool("localhost", maxsize=pool_maxsize or DEFAULT_POOL_SIZE,
+                                     block=pool_block, socket_path=socket_path)
+
+    def get_connection(self, url, proxies=None) -> urllib3.HTTPConnectionPool:
+        return self._pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None,
+                                        cert=None) -> urllib3.HTTPConnectionPool:
+        return self._pool
+
+    def close(self) -> None:
+        self._pool.close()
+        super().close()
+
+
+def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Check whether an idle connection's socket was closed by the peer."""
+    sock = connection.sock
+    if sock is None:
+        return False
+    try:
+        # An idle keep-alive socket is only readable once the peer closed it
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+class HTTPClientResponse:
+    """The parts of requests.Response the sync client reads."""
+
+    def __init__(self, session: "HTTPClientSession", connection: http.client.HTTPConnection,
+                 response: http.client.HTTPResponse, stream: bool):
+        self._session = session
+        self._connection: Optional[http.client.HTTPConnection] = connection
+        self._response = response
+        self.status_code = response.status
+        self._content: Optional[bytes] = None
+        if not stream:
+            self._content = self._read(None)
+
+    def _read(self, amount: Optional[int]) -> bytes:
+        try:
+            data = self._response.read(amount)
+        except (OSError, http.client.HTTPException) as e:
+            self.close()
+            raise EvrmoreConnectionError(f"Request failed: {e}")
+        if amount is None or not data:
+            self._release()
+        return data
+
+    def _release(self) -> None:
+        """Hand the connection back to the session once the body is fully read."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            self._session._checkin(connection)
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = self._read(None)
+        return self._content
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield the body in chunks of up to chunk_size bytes."""
+        while True:
+            chunk = self._read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """Discard the rest of the body; a half-read connection cannot be reused."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            self._session._discard(connection)
+
+
+class HTTPClientSession:
+    """A minimal keep-alive HTTP session for JSON-RPC POSTs."""
+
+    def __init__(self, url: str, headers: Dict[str, str], timeout: float = 30,
+                 pool_maxsize: Optional[int] = None, tcp_nodelay: bool = True,
+                 socket_path: Optional[str] = None, pool_block: bool = False):
+        """
+        Initialize the session.
+
+        Args:
+            url: The node's URL; every request is posted to it
+            headers: Headers sent with every request
+            timeout: Default socket timeout in seconds
+            pool_maxsize: Idle connections kept for reuse
+            tcp_nodelay: Disable Nagle's algorithm on connections
+            socket_path: Connect to this Unix domain socket instead of the URL's host and port
+            pool_block: Never hold more than pool_maxsize connections; further
+                requests wait for a connection to be returned
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 80
+        self.path = parsed.path or "/"
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize or DEFAULT_POOL_SIZE
+        self.tcp_nodelay = tcp_nodelay
+        self.socket_path = socket_path
+
+        # Built once: http.client adds Host and Content-Length per request
+        self._headers: List[Tuple[str, str]] = list(headers.items())
+
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        # One slot per connection in use when the pool is bounded
+        self._slots: Optional[threading.Semaphore] = None
+        if pool_block:
+            self._slots = threading.Semaphore(self.pool_maxsize)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.socket_path is not None:
+            return _UnixConnection(self.socket_path, self.timeout)
+        return _Connection(self.host, self.port, self.timeout, self.tcp_nodelay)
+
+    def _checkout(self) -> http.client.HTTPConnection:
+        """Take the most recently used idle connection that is still open, or a new one."""
+        if self._slots is not None:
+            self._slots.acquire()
+        while True:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                return self._connect()
+            if not _is_dropped(connection):
+                return connection
+            connection.close()
+
+    def _checkin(self, connection: http.client.HTTPConnection) -> None:
+        """Keep a connection for reuse, unless the pool is full or the server closed it."""
+        if connection.sock is not None and not self._closed:
+            with self._lock:
+                if len(self._idle) < self.pool_maxsize:
+                    self._idle.append(connection)
+                    connection = None
+        if connection is not None:
+            connection.close()
+        if self._slots is not None:
+            self._slots.release()
+
+    def _discard(self, connection: http.client.HTTPConnection) -> None:
+        """Close a checked-out connection that cannot be reused."""
+        connection.close()
+        if self._slots is not None:
+            self._slots.release()
+
+    def post(self, url: str, data: bytes, timeout: Optional[float] = None,
+             stream: bool = False) -> HTTPClientResponse:
+        """
+        POST a request body to the node.
+
+        Args:
+            url: Ignored; requests go to the session's URL (kept for requests compatibility)
+            data: The request body
+            timeout: Socket timeout in seconds for this request
+            stream: Leave the body unread until content or iter_content is used
+
+        Returns:
+            The response
+
+        Raises:
+            EvrmoreConnectionError: If the connection fails or times out
+        """
+        connection = self._checkout()
+        if timeout is not None and timeout != connection.timeout:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+        try:
+            connection.putrequest("POST", self.path, skip_accept_encoding=True)
+            for name, value in self._headers:
+                connection.putheader(name, value)
+            connection.putheader("Content-Length", str(len(data)))
+            connection.endheaders(data)
+            response = connection.getresponse()
+        except (OSError, http.client.HTTPException) as e:
+            self._discard(connection)
+            raise EvrmoreConnectionError(f"Request failed: {e}")
+        return HTTPClientResponse(self, connection, response, stream)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def __repr__(self) -> str:
+        if self.socket_path:
+            target = f"unix://{self.socket_path}"
+        else:
+            target = f"http://{self.host}:{self.port}{self.path}"
+        return f"<HTTPClientSession {target} idle={len(self._idle)}>"
+
+
+class PerThreadSession:
+    """
+    Hands every thread its own session, so threads never share one.
+
+    Sessions are created on a thread's first request. A session whose thread
+    has exited is closed the next time a new one is created.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        """
+        Initialize the per-thread sessions.
+
+        Args:
+            factory: Creates a session (requests.Session or HTTPClientSession)
+        """
+        self.factory = factory
+        self._local = threading.local()
+        self._sessions: List[Tuple[threading.Thread, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> Any:
+        """The calling thread's session."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self.factory()
+            with self._lock:
+                finished = [pair for pair in self._sessions if not pair[0].is_alive()]
+                self._sessions = [pair for pair in self._sessions if pair[0].is_alive()]
+                self._sessions.append((threading.current_thread(), session))
+            for _, old in finished:
+                old.close()
+        return session
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        """POST through the calling thread's session."""
+        return self.session.post(url, **kwargs)
+
+    def close(self) -> None:
+        """Close every thread's session."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        self._local = threading.local()
+        for _, session in sessions:
+            session.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __repr__(self) -> str:
+        return f"<PerThreadSession sessions={len(self._sessions)}>"
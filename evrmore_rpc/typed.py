@@ -0,0 +1,314 @@
+"""
+evrmore-rpc: Typed responses through cached TypeAdapters
+Copyright (c) 2025 Manticore Technologies
+MIT License - See LICENSE file for details
+
+client.typed has a method for every command in RESPONSE_TYPES that returns
+the result as the command's model from evrmore_rpc.models:
+
+    block = client.typed.getblock(block_hash)           # Block
+    utxos = client.typed.getaddressutxos({"addresses": [address]})  # List[AddressUtxo]
+
+Each response type gets one pydantic TypeAdapter, built on first use and
+cached, so a list of 100k UTXOs is validated in a single pass of
+pydantic-core instead of one model_validate call per item.
+
+client.typed.trusted skips validation for hot paths where the node is
+trusted to send well-formed data:
+
+    utxos = client.typed.trusted.getaddressutxos({"addresses": [address]})
+
+It builds the models like BaseModel.model_construct() does (no
+validation, no coercion: numbers stay as the codec decoded them), but
+from a constructor compiled once per type, which is several times faster
+than calling model_construct for each item.
+
+client.typed.lazy wraps each model's dict and validates a field only when
+it is first read (see evrmore_rpc.models.lazy), for handlers that read a
+few fields of large results:
+
+    block = client.typed.lazy.getblock(block_hash)
+    print(block.height)                 # validates height only
+
+Results that do not match the model raise pydantic.ValidationError (a
+ValueError). Typed methods expect the default response shape, e.g.
+getblock at verbosity 1; use the plain client methods for other shapes.
+"""
+
+import re
+from functools import lru_cache
+from typing import (TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union,
+                    get_args, get_origin)
+from decimal import Decimal
+
+from pydantic import BaseModel, TypeAdapter
+
+from evrmore_rpc.models.addressindex import (AddressBalance, AddressDelta, AddressMempool,
+                                             AddressUtxo, SpentInfo)
+from evrmore_rpc.models.assets import AssetInfo, CacheInfo
+from evrmore_rpc.models.blockchain import (BlockchainInfo, Block, BlockHeader, ChainTip,
+                                           MempoolInfo, TxOut, TxOutSetInfo)
+from evrmore_rpc.models.lazy import lazy_constructor
+from evrmore_rpc.models.mining import BlockTemplate, MiningInfo
+from evrmore_rpc.models.network import NetTotals, NetworkInfo, PeerInfo
+from evrmore_rpc.models.rawtransactions import (DecodedScript, DecodedTransaction,
+                                                FundRawTransactionResult, SignRawTransactionResult)
+from evrmore_rpc.models.wallet import UnspentOutput, WalletInfo, WalletTransaction
+
+if TYPE_CHECKING:  # pragma: no cover
+    from evrmore_rpc.client import EvrmoreClient
+
+# How client.typed turns results into models
+TYPED_MODES = ("validate", "trusted", "lazy")
+
+# The type of each command's result
+RESPONSE_TYPES: Dict[str, Any] = {
+    # Blockchain
+    "getblockchaininfo": BlockchainInfo,
+    "getblock": Block,
+    "getblockheader": BlockHeader,
+    "getchaintips": List[ChainTip],
+    "getmempoolinfo": MempoolInfo,
+    "gettxout": Optional[TxOut],
+    "gettxoutsetinfo": TxOutSetInfo,
+    # Assets
+    "getassetdata": AssetInfo,
+    "getcacheinfo": CacheInfo,
+    "listaddressesbyasset": Dict[str, Decimal],
+    "listassetbalancesbyaddress": Dict[str, Decimal],
+    # Network
+    "getnetworkinfo": NetworkInfo,
+    "getpeerinfo": List[PeerInfo],
+    "getnettotals": NetTotals,
+    # Mining
+    "getmininginfo": MiningInfo,
+    "getblocktemplate": BlockTemplate,
+    # Address index
+    "getaddressbalance": AddressBalance,
+    "getaddressdeltas": List[AddressDelta],
+    "getaddressutxos": List[AddressUtxo],
+    "getaddressmempool": List[AddressMempool],
+    "getspentinfo": SpentInfo,
+    # Raw transactions
+    "decoderawtransaction": DecodedTransaction,
+    "decodescript": DecodedScript,
+    "signrawtransaction": SignRawTransactionResult,
+    "fundrawtransaction": FundRawTransactionResult,
+    # Wallet
+    "getwalletinfo": WalletInfo,
+    "gettransaction": WalletTransaction,
+    "listunspent": List[UnspentOutput],
+}
+
+
+@lru_cache(maxsize=None)
+def get_adapter(annotation: Any) -> TypeAdapter:
+    """Get the cached TypeAdapter for a type, e.g. List[AddressUtxo]."""
+    return TypeAdapter(annotation)
+
+
+def _has_models(annotation: Any) -> bool:
+    """Check whether a type contains pydantic models anywhere."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_has_models(arg) for arg in get_args(annotation))
+
+
+# BaseModel's slots, set through their descriptors: the fastest way in
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _construct_model(model: Type[BaseModel]) -> Callable[[Any], BaseModel]:
+    """Compile a model_construct equivalent for one model class."""
+    fields = model.model_fields
+    names = frozenset(fields)
+    nested = {name: get_constructor(field.annotation) for name, field in fields.items()
+              if _has_models(field.annotation)}
+
+    def _nested(data: Dict[str, Any]) -> Dict[str, Any]:
+        for name, build in nested.items():
+            value = data.get(name)
+            if value is not None:
+                data[name] = build(value)
+        return data
+
+    if model.__private_attributes__ or model.model_config.get("extra") == "allow" or any(
+            field.alias not in (None, name) for name, field in fields.items()):
+        # Leave the bookkeeping of these to pydantic
+        return lambda data: model.model_construct(**_nested(dict(data)))
+
+    new = model.__new__
+    count = len(names)
+
+    def construct(data: Dict[str, Any]) -> BaseModel:
+        # Copied: the decoded dict becomes the model's __dict__, and a
+        # result can be shared (single_flight)
+        values = dict(data)
+        if len(values) == count and names.issuperset(values):
+            fields_set = set(names)
+        else:
+            fields_set = {name for name in values if name in names}
+            for name in names - fields_set:
+                values[name] = fields[name].get_default(call_default_factory=True)
+            for name in values.keys() - names:
+                del values[name]
+        if nested:
+            _nested(values)
+        instance = new(model)
+        _set_dict(instance, values)
+        _set_fields_set(instance, fields_set)
+        _set_extra(instance, None)
+        _set_private(instance, None)
+        return instance
+
+    return construct
+
+
+@lru_cache(maxsize=None)
+def get_constructor(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Get the cached trusted constructor for a type: builds models without validation.
+
+    Lists, dicts and Optional/Union around models are followed; any other
+    value is returned as it is.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct_model(annotation)
+    if not _has_models(annotation):
+        return _identity
+    return _containers(annotation, get_constructor)
+
+
+@lru_cache(maxsize=None)
+def get_lazy_constructor(annotation: Any) -> Callable[[Any], Any]:
+    """
+    Get the cached lazy constructor for a type: wraps each model's dict, see models.lazy.
+
+    Values outside models, e.g. the amounts of Dict[str, Decimal], are validated.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return lazy_constructor(annotation)
+    if not _has_models(annotation):
+        return get_adapter(annotation).validate_python
+    return _containers(annotation, get_lazy_constructor)
+
+
+def _containers(annotation: Any,
+                get: Callable[[Any], Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Apply get(type)'s converter through the lists, dicts and Optional/Union around models."""
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (list, List, tuple, Tuple):
+        build = get(args[0])
+        return lambda value: [build(item) for item in value]
+    if origin in (dict, Dict):
+        build = get(args[1])
+        return lambda value: {key: build(item) for key, item in value.items()}
+    if origin is Union:
+        models = [arg for arg in args if _has_models(arg)]
+        build = get(models[0])
+        return lambda value: value if value is None else build(value)
+    return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _make_method(name: str) -> Callable[..., Any]:
+    annotation = RESPONSE_TYPES[name]
+
+    def method(self: "TypedMethods", *args: Any) -> Any:
+        return self.execute_command(name, *args)
+
+    method.__name__ = name
+    method.__doc__ = (f"Execute the `{name}` RPC command and return its result as"
+                      f" {_describe(annotation)}.")
+    return method
+
+
+def _describe(annotation: Any) -> str:
+    """Name a response type for docstrings, e.g. "List[AddressUtxo]"."""
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return re.sub(r"\b[\w.]+\.", "", str(annotation))
+
+
+class TypedMethods:
+    """RPC methods returning model instances: `client.typed`."""
+
+    def __init__(self, client: "EvrmoreClient", mode: str = "validate"):
+        """
+        Initialize the typed methods.
+
+        Args:
+            client: The client that sends the requests
+            mode: "validate", "trusted" (build models without validating them)
+                or "lazy" (validate each field on first access)
+        """
+        if mode not in TYPED_MODES:
+            raise ValueError(f"mode must be one of {TYPED_MODES}, got {mode!r}")
+        self.client = client
+        self.mode = mode
+        # The methods of every mode, shared between them
+        self._modes: Dict[str, "TypedMethods"] = {mode: self}
+
+    def _with_mode(self, mode: str) -> "TypedMethods":
+        if mode not in self._modes:
+            methods = TypedMethods(self.client, mode)
+            methods._modes = self._modes
+            self._modes[mode] = methods
+        return self._modes[mode]
+
+    @property
+    def trusted(self) -> "TypedMethods":
+        """The same methods, building models without validation."""
+        return self._with_mode("trusted")
+
+    @property
+    def lazy(self) -> "TypedMethods":
+        """The same methods, returning models that validate each field on first access."""
+        return self._with_mode("lazy")
+
+    def converter(self, command: str) -> Callable[[Any], Any]:
+        """
+        Get the function that turns a command's raw result into its model.
+
+        Raises:
+            KeyError: If the command has no response type
+        """
+        annotation = RESPONSE_TYPES[command]
+        if self.mode == "trusted":
+            return get_constructor(annotation)
+        if self.mode == "lazy":
+            return get_lazy_constructor(annotation)
+        return get_adapter(annotation).validate_python
+
+    def execute_command(self, command: str, *args: Any) -> Any:
+        """
+        Execute an RPC command and convert its result to the command's model.
+
+        Works like client.execute_command: awaitable in async mode.
+        """
+        convert = self.converter(command)
+        client = self.client
+
+        async def run_async() -> Any:
+            return convert(await client.execute_command_async(command, *args))
+
+        if client._async_mode is None:
+            return client._auto_result(command,
+                                       lambda: convert(client.execute_command_sync(command, *args)),
+                                       run_async)
+        if client._async_mode:
+            return run_async()
+        return convert(client.execute_command_sync(command, *args))
+
+    def __repr__(self) -> str:
+        return f"<TypedMethods mode={self.mode}>"
+
+
+for _name in RESPONSE_TYPES:
+    setattr(TypedMethods, _name, _make_method(_name))
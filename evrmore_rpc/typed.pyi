@@ -0,0 +1,96 @@
+"""
+Type stubs for evrmore_rpc.typed: the return type of each typed method.
+
+In async mode the methods return awaitables of these types.
+"""
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from evrmore_rpc.client import EvrmoreClient
+from evrmore_rpc.models.addressindex import (AddressBalance, AddressDelta, AddressMempool,
+                                             AddressUtxo, SpentInfo)
+from evrmore_rpc.models.assets import AssetInfo, CacheInfo
+from evrmore_rpc.models.blockchain import (BlockchainInfo, Block, BlockHeader, ChainTip,
+                                           MempoolInfo, TxOut, TxOutSetInfo)
+from evrmore_rpc.models.mining import BlockTemplate, MiningInfo
+from evrmore_rpc.models.network import NetTotals, NetworkInfo, PeerInfo
+from evrmore_rpc.models.rawtransactions import (DecodedScript, DecodedTransaction,
+                                                FundRawTransactionResult, SignRawTransactionResult)
+from evrmore_rpc.models.wallet import UnspentOutput, WalletInfo, WalletTransaction
+
+TYPED_MODES: Tuple[str, ...]
+RESPONSE_TYPES: Dict[str, Any]
+
+def get_adapter(annotation: Any) -> TypeAdapter: ...
+def get_constructor(annotation: Any) -> Callable[[Any], Any]: ...
+def get_lazy_constructor(annotation: Any) -> Callable[[Any], Any]: ...
+
+class TypedMethods:
+    client: EvrmoreClient
+    mode: str
+    def __init__(self, client: EvrmoreClient, mode: str = "validate") -> None: ...
+    @property
+    def trusted(self) -> TypedMethods: ...
+    @property
+    def lazy(self) -> TypedMethods: ...
+    def converter(self, command: str) -> Callable[[Any], Any]: ...
+    def execute_command(self, command: str, *args: Any) -> Any: ...
+
+    def getblockchaininfo(self, *args: Any) -> BlockchainInfo: ...
+
+    def getblock(self, *args: Any) -> Block: ...
+
+    def getblockheader(self, *args: Any) -> BlockHeader: ...
+
+    def getchaintips(self, *args: Any) -> List[ChainTip]: ...
+
+    def getmempoolinfo(self, *args: Any) -> MempoolInfo: ...
+
+    def gettxout(self, *args: Any) -> Optional[TxOut]: ...
+
+    def gettxoutsetinfo(self, *args: Any) -> TxOutSetInfo: ...
+
+    def getassetdata(self, *args: Any) -> AssetInfo: ...
+
+    def getcacheinfo(self, *args: Any) -> CacheInfo: ...
+
+    def listaddressesbyasset(self, *args: Any) -> Dict[str, Decimal]: ...
+
+    def listassetbalancesbyaddress(self, *args: Any) -> Dict[str, Decimal]: ...
+
+    def getnetworkinfo(self, *args: Any) -> NetworkInfo: ...
+
+    def getpeerinfo(self, *args: Any) -> List[PeerInfo]: ...
+
+    def getnettotals(self, *args: Any) -> NetTotals: ...
+
+    def getmininginfo(self, *args: Any) -> MiningInfo: ...
+
+    def getblocktemplate(self, *args: Any) -> BlockTemplate: ...
+
+    def getaddressbalance(self, *args: Any) -> AddressBalance: ...
+
+    def getaddressdeltas(self, *args: Any) -> List[AddressDelta]: ...
+
+    def getaddressutxos(self, *args: Any) -> List[AddressUtxo]: ...
+
+    def getaddressmempool(self, *args: Any) -> List[AddressMempool]: ...
+
+    def getspentinfo(self, *args: Any) -> SpentInfo: ...
+
+    def decoderawtransaction(self, *args: Any) -> DecodedTransaction: ...
+
+    def decodescript(self, *args: Any) -> DecodedScript: ...
+
+    def signrawtransaction(self, *args: Any) -> SignRawTransactionResult: ...
+
+    def fundrawtransaction(self, *args: Any) -> FundRawTransactionResult: ...
+
+    def getwalletinfo(self, *args: Any) -> WalletInfo: ...
+
+    def gettransaction(self, *args: Any) -> WalletTransaction: ...
+
+    def listunspent(self, *args: Any) -> List[UnspentOutput]: ...
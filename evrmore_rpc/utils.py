@@ -10,6 +10,7 @@ import inspect
 import asyncio
 from functools import wraps
 import threading
+import warnings
 
 T = TypeVar('T', bound=BaseModel)
 R = TypeVar('R')  # Return type
@@ -17,8 +18,10 @@ R = TypeVar('R')  # Return type
 # Thread-local storage to track context
 _context = threading.local()
 
-def format_amount(value: Union[int, float, str]) -> Decimal:
+def format_amount(value: Union[int, float, str, Decimal]) -> Decimal:
     """Format a numeric value as a Decimal."""
+    if isinstance(value, Decimal):
+        return value
     return Decimal(str(value))
 
 def validate_response(response: Any, model: Type[T]) -> T:
@@ -51,7 +54,9 @@ def validate_list_response(response: Any, model: Type[T]) -> List[T]:
     if not isinstance(response, list):
         raise ValueError(f"Expected list, got {type(response)}")
     
-    return [validate_response(item, model) for item in response]
+    # One pass of pydantic-core over the whole list
+    from evrmore_rpc.typed import get_adapter
+    return get_adapter(List[model]).validate_python(response)
 
 def validate_dict_response(response: Any, model: Type[T]) -> Dict[str, T]:
     """
@@ -67,7 +72,8 @@ def validate_dict_response(response: Any, model: Type[T]) -> Dict[str, T]:
     if not isinstance(response, dict):
         raise ValueError(f"Expected dict, got {type(response)}")
     
-    return {key: validate_response(value, model) for key, value in response.items()}
+    from evrmore_rpc.typed import get_adapter
+    return get_adapter(Dict[str, model]).validate_python(response)
 
 def format_command_args(*args: Any) -> List[str]:
     """Format command arguments for RPC calls."""
@@ -120,9 +126,19 @@ class AwaitableResult:
     This class allows creating objects that work seamlessly in both
     synchronous and asynchronous contexts without requiring explicit
     context managers or cleanup.
+    
+    In lazy mode (``sync_func``/``async_func``) nothing is executed up front:
+    awaiting the object runs only ``async_func``, and touching its value runs
+    only ``sync_func`` (once; the value is cached). Each use therefore costs
+    exactly one execution of one implementation, and an unused result costs
+    none: pass ``unused_warning`` to warn when one is dropped, or call
+    resolve() to run ``sync_func`` right away.
     """
     
-    def __init__(self, sync_result: Any, async_coro: Awaitable[Any], cleanup_func=None):
+    def __init__(self, sync_result: Any = None, async_coro: Optional[Awaitable[Any]] = None,
+                 cleanup_func=None, *, sync_func: Optional[Callable[[], Any]] = None,
+                 async_func: Optional[Callable[[], Awaitable[Any]]] = None,
+                 unused_warning: Optional[str] = None):
         """
         Initialize the awaitable result.
         
@@ -130,17 +146,72 @@ class AwaitableResult:
             sync_result: The result to return in synchronous context
             async_coro: The coroutine to await in asynchronous context
             cleanup_func: Optional function to call for cleanup when used synchronously
+            sync_func: Lazy mode: computes the result on first synchronous use
+            async_func: Lazy mode: returns the coroutine to await in asynchronous context
+            unused_warning: Lazy mode: RuntimeWarning message for a result that is
+                            garbage collected without being awaited or used
         """
         self._sync_result = sync_result
         self._async_coro = async_coro
         self._cleanup_func = cleanup_func
+        self._sync_func = sync_func
+        self._async_func = async_func
+        self._resolved = sync_func is None
+        self._sync_error: Optional[BaseException] = None
         self._used = False
+        self._unused_warning = unused_warning
+        
+    def _close_coro(self) -> None:
+        """Close the unused coroutine to prevent 'never awaited' warnings."""
+        if self._async_coro is None:
+            return
+        if hasattr(self._async_coro, 'close'):
+            self._async_coro.close()
+        elif hasattr(self._async_coro, 'cancel'):
+            self._async_coro.cancel()
+    
+    def _resolve_sync(self) -> Any:
+        """Get the synchronous result, computing it on first use in lazy mode."""
+        if not self._used:
+            # Mark as used in sync mode
+            self._used = True
+            self._close_coro()
+        
+        if not self._resolved:
+            try:
+                self._sync_result = self._sync_func()
+            except Exception as e:
+                self._sync_error = e
+            self._resolved = True
+        
+        if self._sync_error is not None:
+            raise self._sync_error
+        return self._sync_result
+    
+    def resolve(self) -> Any:
+        """
+        Run the synchronous implementation now, if it has not run yet.
+        
+        Returns:
+            The synchronous result; awaiting the object later returns it too
+        """
+        return self._resolve_sync()
+    
+    async def _resolved_value(self) -> Any:
+        return self._resolve_sync()
         
     def __await__(self):
         """
         Make the object awaitable.
         This is called when the object is used with 'await'.
         """
+        if self._async_func is not None:
+            if self._used:
+                # Already used synchronously; don't execute a second time
+                return self._resolved_value().__await__()
+            self._used = True
+            return self._async_func().__await__()
+        
         self._used = True
         return self._async_coro.__await__()
     
@@ -149,74 +220,111 @@ class AwaitableResult:
         Forward attribute access to the sync result.
         This allows using the object directly as if it were the sync result.
         """
-        # Mark as used in sync mode
-        if not self._used:
-            self._used = True
-            # Cancel the coroutine to prevent warnings
-            if hasattr(self._async_coro, 'close'):
-                self._async_coro.close()
-            elif hasattr(self._async_coro, 'cancel'):
-                self._async_coro.cancel()
-        
-        return getattr(self._sync_result, name)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._resolve_sync(), name)
     
     def __getitem__(self, key):
         """
         Forward item access to the sync result.
         This allows using the object with dictionary-like syntax.
         """
-        # Mark as used in sync mode
-        if not self._used:
-            self._used = True
-            # Cancel the coroutine to prevent warnings
-            if hasattr(self._async_coro, 'close'):
-                self._async_coro.close()
-            elif hasattr(self._async_coro, 'cancel'):
-                self._async_coro.cancel()
-        
-        return self._sync_result[key]
+        return self._resolve_sync()[key]
     
     def __str__(self):
         """Return string representation of the sync result."""
-        # Mark as used in sync mode
-        if not self._used:
-            self._used = True
-            # Cancel the coroutine to prevent warnings
-            if hasattr(self._async_coro, 'close'):
-                self._async_coro.close()
-            elif hasattr(self._async_coro, 'cancel'):
-                self._async_coro.cancel()
-        
-        return str(self._sync_result)
+        return str(self._resolve_sync())
     
     def __repr__(self):
         """Return representation of the sync result."""
-        # Mark as used in sync mode
-        if not self._used:
-            self._used = True
-            # Cancel the coroutine to prevent warnings
-            if hasattr(self._async_coro, 'close'):
-                self._async_coro.close()
-            elif hasattr(self._async_coro, 'cancel'):
-                self._async_coro.cancel()
-        
-        return repr(self._sync_result)
+        return repr(self._resolve_sync())
+    
+    # Value protocol, so the result behaves like the sync value it wraps
+    
+    def __eq__(self, other):
+        return self._resolve_sync() == other
+    
+    def __ne__(self, other):
+        return self._resolve_sync() != other
+    
+    def __lt__(self, other):
+        return self._resolve_sync() < other
+    
+    def __le__(self, other):
+        return self._resolve_sync() <= other
+    
+    def __gt__(self, other):
+        return self._resolve_sync() > other
+    
+    def __ge__(self, other):
+        return self._resolve_sync() >= other
+    
+    def __hash__(self):
+        return hash(self._resolve_sync())
+    
+    def __bool__(self):
+        return bool(self._resolve_sync())
+    
+    def __len__(self):
+        return len(self._resolve_sync())
+    
+    def __iter__(self):
+        return iter(self._resolve_sync())
+    
+    def __contains__(self, item):
+        return item in self._resolve_sync()
+    
+    def __int__(self):
+        return int(self._resolve_sync())
+    
+    def __float__(self):
+        return float(self._resolve_sync())
+    
+    def __index__(self):
+        return self._resolve_sync().__index__()
+    
+    def __format__(self, format_spec):
+        return format(self._resolve_sync(), format_spec)
+    
+    def __add__(self, other):
+        return self._resolve_sync() + other
+    
+    def __radd__(self, other):
+        return other + self._resolve_sync()
+    
+    def __sub__(self, other):
+        return self._resolve_sync() - other
+    
+    def __rsub__(self, other):
+        return other - self._resolve_sync()
+    
+    def __mul__(self, other):
+        return self._resolve_sync() * other
+    
+    def __rmul__(self, other):
+        return other * self._resolve_sync()
+    
+    def __truediv__(self, other):
+        return self._resolve_sync() / other
+    
+    def __rtruediv__(self, other):
+        return other / self._resolve_sync()
     
     def __del__(self):
         """Clean up resources when the object is garbage collected."""
         # If we have a cleanup function and the object was used in sync mode
-        if self._cleanup_func and self._used:
+        if getattr(self, '_cleanup_func', None) and self._used:
             try:
                 self._cleanup_func()
             except Exception:
                 pass
         
         # Cancel the coroutine if it wasn't awaited
-        if not self._used:
-            if hasattr(self._async_coro, 'close'):
-                self._async_coro.close()
-            elif hasattr(self._async_coro, 'cancel'):
-                self._async_coro.cancel()
+        if hasattr(self, '_used') and not self._used:
+            self._close_coro()
+            # Nothing ran: say so, like a coroutine that was never awaited
+            if getattr(self, '_unused_warning', None):
+                warnings.warn(self._unused_warning, RuntimeWarning)
 
 def sync_or_async(sync_func: Callable[..., R], async_func: Callable[..., Awaitable[R]]) -> Callable[..., Union[R, Awaitable[R]]]:
     """
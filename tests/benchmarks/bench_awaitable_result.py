@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: HTTP requests per call in auto-detect mode.
+
+With async_mode=None (after client.reset()) every call returns a lazy
+AwaitableResult. This counts the HTTP requests the fake node receives for
+sync use and for await, and reports the per-call latency of each path.
+Both should show exactly 1.00 request per call.
+
+Usage:
+    python tests/benchmarks/bench_awaitable_result.py [--num-calls 2000]
+"""
+
+import argparse
+import asyncio
+import time
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+def bench_sync(client: EvrmoreClient, num_calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        # Using the value triggers the (only) request
+        int(client.getblockcount())
+    return time.perf_counter() - start
+
+
+async def bench_async(client: EvrmoreClient, num_calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        await client.getblockcount()
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with FakeNode(latency=0) as node:
+        client = EvrmoreClient(url=node.url).reset()
+
+        node.reset_counters()
+        elapsed = bench_sync(client, args.num_calls)
+        print(f"sync  : {node.http_requests / args.num_calls:.2f} requests/call  "
+              f"{elapsed / args.num_calls * 1e6:8.1f} us/call")
+        client.close_sync()
+
+        client = EvrmoreClient(url=node.url).reset()
+        node.reset_counters()
+        elapsed = asyncio.run(bench_async(client, args.num_calls))
+        print(f"await : {node.http_requests / args.num_calls:.2f} requests/call  "
+              f"{elapsed / args.num_calls * 1e6:8.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent calls from sync code, threads vs the background loop.
+
+Fetches --calls block hashes from a fake node with per-call latency:
+
+- serial: one blocking call after another
+- threads: a ThreadPoolExecutor of --concurrency workers sharing one sync client
+- background map: EvrmoreBackgroundClient.map with --concurrency calls in flight
+
+The fake node runs in a child process to keep it off the client's GIL.
+
+Usage:
+    python tests/benchmarks/bench_background.py [--calls 2000] [--concurrency 16] [--latency 0.005]
+"""
+
+import argparse
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from evrmore_rpc import EvrmoreBackgroundClient, EvrmoreClient
+from fake_node import FakeNode
+
+
+def serve(latency: float, urls: multiprocessing.Queue, stop: multiprocessing.Event) -> None:
+    with FakeNode(latency=latency, rpcthreads=64) as node:
+        urls.put(node.url)
+        stop.wait()
+
+
+def report(label: str, calls: int, elapsed: float, threads: int) -> None:
+    print(f"{label:16} calls/s={calls / elapsed:7.0f} time={elapsed * 1000:8.1f} ms"
+          f" peak threads={threads}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    urls, stop = ctx.Queue(), ctx.Event()
+    server = ctx.Process(target=serve, args=(args.latency, urls, stop))
+    server.start()
+    try:
+        url = urls.get(timeout=60)
+        heights = range(args.calls)
+
+        client = EvrmoreClient(url=url, rpcuser="user", rpcpassword="pass", async_mode=False,
+                               pool_maxsize=args.concurrency)
+        begin = time.perf_counter()
+        for height in heights[:args.calls // 10]:
+            client.getblockhash(height)
+        report("serial (1/10th)", args.calls // 10, time.perf_counter() - begin,
+               threading.active_count())
+
+        begin = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            list(executor.map(client.getblockhash, heights))
+            threads = threading.active_count()
+        report("threads", args.calls, time.perf_counter() - begin, threads)
+        client.close_sync()
+
+        with EvrmoreBackgroundClient(url=url, rpcuser="user", rpcpassword="pass") as background:
+            background.getblockcount()
+            begin = time.perf_counter()
+            list(background.map("getblockhash", heights, concurrency=args.concurrency))
+            report("background map", args.calls, time.perf_counter() - begin,
+                   threading.active_count())
+    finally:
+        stop.set()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
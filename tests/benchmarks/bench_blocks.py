@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: backfilling a block range one height at a time vs iter_blocks.
+
+The serial loop keeps one of the node's rpcthreads busy. iter_blocks keeps
+`concurrency` fetches in flight, optionally as JSON-RPC batches, and
+verbosity 0 skips building and decoding the block JSON entirely.
+
+Usage:
+    python tests/benchmarks/bench_blocks.py [--blocks 500] [--rpcthreads 4]
+"""
+
+import argparse
+import asyncio
+import time
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+def report(label: str, count: int, elapsed: float) -> None:
+    print(f"{label:34} blocks={count:6} time={elapsed * 1000:8.1f} ms"
+          f" rate={count / elapsed:8.0f}/s")
+
+
+def serial(client: EvrmoreClient, start: int, end: int) -> int:
+    count = 0
+    for height in range(start, end):
+        client.getblock(client.getblockhash(height), 1)
+        count += 1
+    return count
+
+
+async def run_async(node: FakeNode, start: int, end: int, **kwargs) -> int:
+    async with EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass",
+                             async_mode=True) as client:
+        return sum([1 async for _ in client.iter_blocks(start, end, **kwargs)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=500)
+    parser.add_argument("--rpcthreads", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    start, end = 1000, 1000 + args.blocks
+    threads = args.rpcthreads
+    with FakeNode(latency=args.latency, rpcthreads=threads) as node:
+        client = EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass", async_mode=False)
+        runs = [
+            ("serial getblockhash + getblock", lambda: serial(client, start, end)),
+            (f"sync concurrency={threads}",
+             lambda: sum(1 for _ in client.iter_blocks(start, end, concurrency=threads))),
+            (f"sync concurrency={threads} batch=10",
+             lambda: sum(1 for _ in client.iter_blocks(start, end, concurrency=threads,
+                                                       batch_size=10))),
+            (f"async concurrency={threads}",
+             lambda: asyncio.run(run_async(node, start, end, concurrency=threads))),
+            (f"async concurrency={threads} batch=10",
+             lambda: asyncio.run(run_async(node, start, end, concurrency=threads, batch_size=10))),
+            (f"async concurrency={threads} verbosity=0",
+             lambda: asyncio.run(run_async(node, start, end, concurrency=threads, verbosity=0))),
+        ]
+        for label, run in runs:
+            begin = time.perf_counter()
+            count = run()
+            report(label, count, time.perf_counter() - begin)
+        client.close_sync()
+
+
+if __name__ == "__main__":
+    main()
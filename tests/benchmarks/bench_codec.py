@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: decoding a large `getblock <hash> 2` response with each codec.
+
+Compares the installed JSON codecs and number modes on a synthetic
+verbosity-2 block, and the old path (stdlib floats + format_amount).
+
+Usage:
+    python tests/benchmarks/bench_codec.py [--txs 2000] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+
+from evrmore_rpc.codec import CODECS, get_codec
+from evrmore_rpc.utils import format_amount
+from fake_node import make_block
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--txs", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    block = make_block("00" * 32, verbosity=2, tx_count=args.txs)
+    body = json.dumps({"result": block, "error": None, "id": 1}).encode()
+    print(f"response size: {len(body) / 1e6:.1f} MB")
+
+    def legacy():
+        result = json.loads(body)["result"]
+        for tx in result["tx"]:
+            for vout in tx["vout"]:
+                format_amount(vout["value"])
+
+    print(f"{'stdlib + format_amount':28} {timed(legacy, args.repeat):8.2f} ms")
+
+    for name in CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            continue
+        print(f"{name + ' (float)':28} {timed(lambda: codec.loads(body), args.repeat):8.2f} ms")
+
+    for numbers in ("decimal", "satoshis"):
+        codec = get_codec("auto", numbers)
+        elapsed = timed(lambda: codec.loads(body), args.repeat)
+        print(f"{'json (' + numbers + ')':28} {elapsed:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
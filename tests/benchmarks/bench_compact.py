@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory and column operations of UtxoTable vs lists of dicts and models.
+
+An exchange hot wallet's getaddressutxos result can hold hundreds of
+thousands of outputs. This compares the memory each representation keeps
+alive (traced with tracemalloc after the decoded body is freed) and the
+time to sum the balance and to select the outputs in a height range.
+
+Usage:
+    python tests/benchmarks/bench_compact.py [--items 200000] [--addresses 4]
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from evrmore_rpc.codec import get_codec
+from evrmore_rpc.compact import UtxoTable
+from evrmore_rpc.models import AddressUtxo
+from evrmore_rpc.typed import get_adapter
+from fake_node import block_hash
+
+
+def make_utxos(count: int, addresses: int) -> List[dict]:
+    return [{"address": f"EXaddr{i % addresses}", "txid": block_hash(i), "outputIndex": i % 4,
+             "script": "76a914" + f"{i % addresses:040x}" + "88ac", "satoshis": 100_000_000 + i,
+             "height": 500_000 + i // 4} for i in range(count)]
+
+
+def retained(build: Callable[[], Any]) -> Any:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def timed(run: Callable[[], Any], rounds: int = 5) -> float:
+    run()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--addresses", type=int, default=4)
+    args = parser.parse_args()
+    codec = get_codec()
+    result = make_utxos(args.items, args.addresses)
+    body = json.dumps({"result": result, "error": None, "id": 1}).encode()
+    low, high = 500_000 + args.items // 8, 500_000 + args.items // 8 * 3
+    print(f"getaddressutxos: {args.items} utxos, body={len(body) / 1e6:.1f} MB, codec={codec.name}")
+
+    dicts, dicts_size = retained(lambda: codec.loads(body)["result"])
+    adapter = get_adapter(List[AddressUtxo])
+    models, models_size = retained(lambda: adapter.validate_python(codec.loads(body)["result"]))
+    table, table_size = retained(lambda: UtxoTable(codec.loads(body)["result"]))
+    print(f"{'':18} {'bytes/utxo':>10} {'vs dicts':>9} {'sum':>9} {'height range':>13}")
+    rows = [
+        ("list of dicts", dicts_size,
+         lambda: sum(u["satoshis"] for u in dicts),
+         lambda: [u for u in dicts if low <= u["height"] <= high]),
+        ("list of models", models_size,
+         lambda: sum(u.satoshis for u in models),
+         lambda: [u for u in models if low <= u.height <= high]),
+        ("UtxoTable", table_size, table.total,
+         lambda: table.filter(min_height=low, max_height=high)),
+    ]
+    for label, size, total, select in rows:
+        assert total() == table.total()
+        print(f"{label:18} {size / args.items:10.0f} {dicts_size / size:8.1f}x "
+              f"{timed(total):7.2f}ms {timed(select):11.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
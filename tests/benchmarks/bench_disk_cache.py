@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Benchmark: re-reading a range of blocks after a restart with a disk cache.
+
+The first run fetches every block from the fake node and writes it to the
+disk tier. The second run uses a fresh client and an empty memory tier, as
+after a process restart, and is served from the SQLite file.
+
+Usage:
+    python tests/benchmarks/bench_disk_cache.py [--blocks 2000] [--txs 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from evrmore_rpc import EvrmoreClient, ResponseCache, DiskCache
+from fake_node import FakeNode, block_hash
+
+
+def run(node: FakeNode, path: str, blocks: int, label: str) -> None:
+    cache = ResponseCache(disk=DiskCache(path))
+    client = EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass", async_mode=False,
+                           cache=cache)
+    node.reset_counters()
+    start = time.perf_counter()
+    for height in range(blocks):
+        client.getblock(block_hash(height), 2)
+    elapsed = time.perf_counter() - start
+    stats = cache.get_stats()
+    print(f"{label:8} http={node.http_requests:6} disk_hits={stats['disk_hits']:6} "
+          f"time={elapsed * 1000:9.1f} ms  file={stats['disk']['file_bytes'] / 1e6:6.1f} MB")
+    client.close_sync()
+    cache.disk.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.0005)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, FakeNode(latency=args.latency) as node:
+        path = os.path.join(tmp, "cache.db")
+        run(node, path, args.blocks, "cold")
+        run(node, path, args.blocks, "restart")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark: reading a few fields of eagerly validated vs lazy models.
+
+A block processor that reads `hash` and `height` of every block still pays
+for validating the whole Block (all txids included) with model_validate.
+lazy() wraps the dict and validates only the fields that are read; the
+run fails if that is not faster than model_validate. Also shown: summing
+satoshis over a large getaddressutxos result, one field of every item,
+against validating the whole list with the cached TypeAdapter.
+
+Usage:
+    python tests/benchmarks/bench_lazy.py [--txs 2000] [--utxos 100000] [--rounds 2000]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, List
+
+from evrmore_rpc.models import AddressUtxo, Block, lazy
+from evrmore_rpc.typed import get_adapter, get_lazy_constructor
+from fake_node import block_hash, make_block
+
+
+def per_call(run: Callable[[], Any], rounds: int) -> float:
+    run()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--txs", type=int, default=2000)
+    parser.add_argument("--utxos", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    for txs in (10, args.txs):
+        block = make_block(block_hash(1), 1, tx_count=txs)
+        print(f"getblock, {txs} txids: read hash and height")
+        rows = [
+            ("raw dict", lambda: (block["hash"], block["height"])),
+            ("model_validate", lambda: (lambda b: (b.hash, b.height))(Block.model_validate(block))),
+            ("lazy", lambda: (lambda b: (b.hash, b.height))(lazy(Block, block))),
+            ("lazy + validate()", lambda: lazy(Block, block).validate()),
+        ]
+        timings = {}
+        for label, run in rows:
+            timings[label] = per_call(run, args.rounds)
+            print(f"  {label:22} {timings[label] * 1e6:8.2f} us")
+        assert timings["lazy"] < timings["model_validate"], \
+            "lazy() lost to model_validate on a sparse read"
+
+    utxos = [{"address": "EXaddr1", "txid": block_hash(i), "outputIndex": i % 4,
+              "script": "76a914" + "ab" * 20 + "88ac",
+              "satoshis": 100_000_000 + i, "height": 500_000 + i} for i in range(args.utxos)]
+    print(f"getaddressutxos, {args.utxos} utxos: sum satoshis")
+    eager, lazy_list = get_adapter(List[AddressUtxo]), get_lazy_constructor(List[AddressUtxo])
+    rows = [
+        ("raw dicts", lambda: sum(u["satoshis"] for u in utxos)),
+        ("cached TypeAdapter", lambda: sum(u.satoshis for u in eager.validate_python(utxos))),
+        ("lazy", lambda: sum(u.satoshis for u in lazy_list(utxos))),
+    ]
+    for label, run in rows:
+        print(f"  {label:22} {per_call(run, 3) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
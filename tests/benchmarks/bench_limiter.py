@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: a large burst of concurrent calls with and without a limiter.
+
+Without a limiter the burst overruns the fake node's work queue and the
+overflow fails with "Work queue depth exceeded". With a limiter sized to
+rpcthreads + rpcworkqueue, the overflow waits on the client and every call
+completes. Queue depth and wait times are printed for tuning.
+
+The adaptive limiters start from a small window with no knowledge of the
+node and should converge near its capacity; their window history is printed.
+They find the capacity by overshooting it, so they run with a RetryPolicy
+that resends the few rejected requests.
+
+Usage:
+    python tests/benchmarks/bench_limiter.py [--burst 5000] [--rpcworkqueue 16]
+"""
+
+import argparse
+import asyncio
+import time
+
+from evrmore_rpc import EvrmoreClient, ConcurrencyLimiter, AdaptiveLimiter, RetryPolicy
+from fake_node import FakeNode, block_hash
+
+
+async def burst(node: FakeNode, size: int, limiter, retry=None) -> None:
+    client = EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass", async_mode=True,
+                           pool_maxsize=size, limiter=limiter, retry=retry)
+    node.reset_counters()
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.getblock(block_hash(h % 1000)) for h in range(size)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    await client.close()
+    failed = sum(isinstance(r, Exception) for r in results)
+    if isinstance(limiter, AdaptiveLimiter):
+        label = limiter.algorithm
+    else:
+        label = f"limit={limiter.limit}" if limiter else "no limit"
+    print(f"{label:10} ok={size - failed:6} failed={failed:6} rejected={node.rejected:6} "
+          f"time={elapsed * 1000:8.1f} ms")
+    if limiter:
+        stats = limiter.get_stats()
+        print(f"{'':10} peak_queue_depth={stats['peak_queue_depth']}"
+              f" wait p50={stats['wait_ms_p50']:.1f} ms "
+              f"p99={stats['wait_ms_p99']:.1f} ms max={stats['wait_ms_max']:.1f} ms")
+    if isinstance(limiter, AdaptiveLimiter):
+        steps = [limit for _, limit in limiter.get_limit_history()]
+        more = " ..." if len(steps) > 30 else ""
+        print(f"{'':10} window: {' '.join(map(str, steps[:30]))}{more} "
+              f"final={limiter.limit}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--burst", type=int, default=5000)
+    parser.add_argument("--rpcthreads", type=int, default=4)
+    parser.add_argument("--rpcworkqueue", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.001)
+    args = parser.parse_args()
+
+    window = args.rpcthreads + args.rpcworkqueue
+    with FakeNode(latency=args.latency, rpcthreads=args.rpcthreads,
+                  rpcworkqueue=args.rpcworkqueue) as node:
+        asyncio.run(burst(node, args.burst, None))
+        fixed = ConcurrencyLimiter(max_in_flight=window, max_queue=args.burst)
+        asyncio.run(burst(node, args.burst, fixed))
+        for algorithm in ("aimd", "gradient"):
+            adaptive = AdaptiveLimiter(algorithm=algorithm, max_queue=args.burst)
+            asyncio.run(burst(node, args.burst, adaptive,
+                              RetryPolicy(max_attempts=10, backoff_base=0.01)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark: one giant `listassets "*" true` vs paging with iter_assets.
+
+The giant call holds the whole listing in memory at once. Paging holds
+prefetch + 1 pages; prefetching hides the per-page round trip behind the
+caller's own processing (simulated with --work per asset).
+
+Usage:
+    python tests/benchmarks/bench_paginate.py [--assets 50000] [--page-size 1000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+def asset(i: int) -> dict:
+    return {"name": f"ASSET{i:06}", "amount": 21000000, "units": 0, "reissuable": 1,
+            "has_ipfs": 0, "block_height": 100000 + i, "blockhash": f"{i:064x}"}
+
+
+def measure(label: str, run) -> None:
+    start = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:24} assets={count:7} time={elapsed * 1000:8.1f} ms peak={peak / 1e6:7.1f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=50_000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--work", type=float, default=0.00001,
+                        help="seconds of processing per asset")
+    args = parser.parse_args()
+
+    assets = {f"ASSET{i:06}": asset(i) for i in range(args.assets)}
+    names = list(assets)
+
+    def listassets(pattern="*", verbose=False, count=None, start=0):
+        page = names[start:] if count is None else names[start:start + count]
+        return {name: assets[name] for name in page} if verbose else page
+
+    def process(items) -> int:
+        count = 0
+        deadline = time.perf_counter()
+        for _ in items:
+            count += 1
+            deadline += args.work
+            while time.perf_counter() < deadline:
+                pass
+        return count
+
+    with FakeNode(latency=args.latency, handlers={"listassets": listassets}) as node:
+        client = EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass", async_mode=False,
+                               timeout=300)
+        measure("single call", lambda: process(client.listassets("*", True).items()))
+        for prefetch in (0, 2):
+            measure(f"iter_assets prefetch={prefetch}",
+                    lambda: process(client.iter_assets("*", True, page_size=args.page_size,
+                                                       prefetch=prefetch)))
+        client.close_sync()
+
+
+if __name__ == "__main__":
+    main()
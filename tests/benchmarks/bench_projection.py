@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark: decoding `getblock <hash> 2` in full vs projected with fields=.
+
+A block processor that only needs txids and output values decodes the
+whole nested block by default. With fields= and pysimdjson, only the
+selected fields become Python objects; without it the block is decoded
+by the codec and then pruned, which frees the rest early but does not
+save decode time. Times are for the client-side decode of one response body;
+peak is the memory allocated while decoding it.
+
+Usage:
+    python tests/benchmarks/bench_projection.py [--txs 2000] [--rounds 20]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import List
+
+from pydantic import BaseModel
+
+from evrmore_rpc.codec import get_codec, simdjson
+from evrmore_rpc.projection import get_projection
+from fake_node import block_hash, make_block
+
+FIELDS = ["hash", "tx[].txid", "tx[].vout[].value"]
+
+
+class Output(BaseModel):
+    value: float
+
+
+class Tx(BaseModel):
+    txid: str
+    vout: List[Output]
+
+
+class BlockTxs(BaseModel):
+    hash: str
+    tx: List[Tx]
+
+
+def measure(label: str, decode, rounds: int) -> None:
+    decode()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decode()
+    elapsed = (time.perf_counter() - start) / rounds
+
+    tracemalloc.start()
+    result = decode()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"{label:28} decode={elapsed * 1000:8.2f} ms peak={peak / 1e6:7.2f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--txs", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    block = make_block(block_hash(1), 2, tx_count=args.txs)
+    body = json.dumps({"result": block, "error": None, "id": 1}).encode()
+    print(f"body={len(body) / 1e6:.1f} MB txs={args.txs}")
+
+    codec = get_codec("json")
+    paths, model = get_projection(FIELDS), get_projection(BlockTxs)
+    print(f"projection parser: {'simdjson' if simdjson is not None else 'json + prune'}")
+    measure("full", lambda: codec.loads(body)["result"], args.rounds)
+    measure("full + model_validate", lambda: BlockTxs.model_validate(codec.loads(body)["result"]),
+            args.rounds)
+    measure("fields=paths", lambda: paths.decode(codec, body)["result"], args.rounds)
+    measure("fields=model", lambda: model.finish(model.decode(codec, body)["result"]), args.rounds)
+
+if __name__ == "__main__":
+    main()
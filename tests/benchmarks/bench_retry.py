@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark: a burst of concurrent calls against a node with a small work queue.
+
+The fake node works on `rpcthreads` requests at once and rejects requests
+beyond `rpcworkqueue` waiting with "Work queue depth exceeded", like
+evrmored. Without a retry policy the overflow fails. With one, rejected
+calls back off with jitter and all of them complete.
+
+Usage:
+    python tests/benchmarks/bench_retry.py [--burst 200] [--rpcworkqueue 16]
+"""
+
+import argparse
+import asyncio
+import time
+
+from evrmore_rpc import EvrmoreClient, RetryPolicy
+from fake_node import FakeNode, block_hash
+
+
+async def burst(node: FakeNode, size: int, retry) -> None:
+    client = EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass", async_mode=True,
+                           pool_maxsize=size, retry=retry)
+    node.reset_counters()
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.getblock(block_hash(h)) for h in range(size)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    await client.close()
+    failed = sum(isinstance(r, Exception) for r in results)
+    label = "retry" if retry else "no retry"
+    print(f"{label:10} ok={size - failed:5} failed={failed:5} rejected={node.rejected:5} "
+          f"http={node.http_requests:5} time={elapsed * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--rpcthreads", type=int, default=4)
+    parser.add_argument("--rpcworkqueue", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.002)
+    args = parser.parse_args()
+
+    with FakeNode(latency=args.latency, rpcthreads=args.rpcthreads,
+                  rpcworkqueue=args.rpcworkqueue) as node:
+        asyncio.run(burst(node, args.burst, None))
+        retry = RetryPolicy(max_attempts=10, backoff_base=0.01, backoff_max=0.5)
+        asyncio.run(burst(node, args.burst, retry))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: peak memory of `getrawmempool true` and `getblock <hash> 2`
+buffered vs streamed.
+
+The fake node runs in a child process so only the client's allocations are
+traced. The buffered call holds the whole body plus the decoded dict; the
+stream holds one chunk and one entry (or transaction) at a time.
+
+Usage:
+    python tests/benchmarks/bench_stream.py [--entries 100000] [--block-txs 20000]
+"""
+
+import argparse
+import multiprocessing
+import time
+import tracemalloc
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+def mempool_entry(i: int) -> dict:
+    return {
+        "size": 250, "fee": 0.0001125, "modifiedfee": 0.0001125, "time": 1700000000 + i,
+        "height": 1000000, "descendantcount": 1, "descendantsize": 250, "descendantfees": 11250,
+        "ancestorcount": 1, "ancestorsize": 250, "ancestorfees": 11250,
+        "depends": [],
+    }
+
+
+def block_tx(i: int) -> dict:
+    return {
+        "txid": f"{i:064x}", "hash": f"{i:064x}", "size": 225, "version": 2, "locktime": 0,
+        "hex": "02" * 225,
+        "vin": [{"txid": f"{i + 1:064x}", "vout": 0, "scriptSig": {"asm": "", "hex": "00" * 107},
+                 "sequence": 4294967295}],
+        "vout": [{"value": 12.5, "n": 0,
+                  "scriptPubKey": {"asm": "OP_DUP OP_HASH160", "hex": "76a9" * 12,
+                                   "type": "pubkeyhash", "addresses": ["E" * 34]}}],
+    }
+
+
+def serve(entries: int, block_txs: int, ports: multiprocessing.Queue,
+          stop: multiprocessing.Event) -> None:
+    mempool = {f"{i:064x}": mempool_entry(i) for i in range(entries)}
+    block = {"hash": "00" * 32, "height": 1000000, "tx": [block_tx(i) for i in range(block_txs)]}
+    handlers = {
+        "getrawmempool": lambda verbose=False: mempool if verbose else list(mempool),
+        "getblock": lambda block_hash, verbosity=1: block,
+    }
+    with FakeNode(latency=0, handlers=handlers) as node:
+        ports.put(node.url)
+        stop.wait()
+
+
+def measure(label: str, func) -> None:
+    start = time.perf_counter()
+    count = func()
+    elapsed = time.perf_counter() - start
+    # Traced separately: tracemalloc slows allocation-heavy code a lot
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:12} entries={count:8} peak={peak / 1e6:8.1f} MB time={elapsed * 1000:8.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--block-txs", type=int, default=20_000)
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    ports, stop = ctx.Queue(), ctx.Event()
+    server = ctx.Process(target=serve, args=(args.entries, args.block_txs, ports, stop))
+    server.start()
+    try:
+        client = EvrmoreClient(url=ports.get(timeout=60), rpcuser="user", rpcpassword="pass",
+                               async_mode=False, json_codec="json", timeout=300)
+        client.getblockcount()
+
+        measure("buffered", lambda: len(client.getrawmempool(True)))
+        measure("stream", lambda: sum(1 for _ in client.stream("getrawmempool", True)))
+        # Each transaction arrives as a ("tx", tx) pair
+        measure("block", lambda: len(client.getblock("00" * 32, 2)["tx"]))
+        measure("blockstream", lambda: sum(key == "tx" for key, _ in
+                                           client.stream("getblock", "00" * 32, 2, expand=("tx",))))
+    finally:
+        stop.set()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
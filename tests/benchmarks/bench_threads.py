@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark: many threads sharing one sync client.
+
+Compares the default shared session with thread_safe="pool" (a blocking
+pool of pool_maxsize connections) and thread_safe="per_thread" (one
+session per thread), counting the connections the node sees and urllib3's
+"Connection pool is full" warnings. The fake node runs in a child process
+to keep it off the client's GIL.
+
+Usage:
+    python tests/benchmarks/bench_threads.py [--calls 5000] [--threads 32] [--pool-maxsize 8]
+"""
+
+import argparse
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+class WarningCounter(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += "Connection pool is full" in record.getMessage()
+
+
+def serve(urls: multiprocessing.Queue, stop: multiprocessing.Event) -> None:
+    with FakeNode(latency=0.001, rpcthreads=64) as node:
+        urls.put(node.url)
+        stop.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--pool-maxsize", type=int, default=8)
+    args = parser.parse_args()
+
+    counter = WarningCounter()
+    logging.getLogger("urllib3").addHandler(counter)
+
+    ctx = multiprocessing.get_context("spawn")
+    urls, stop = ctx.Queue(), ctx.Event()
+    server = ctx.Process(target=serve, args=(urls, stop))
+    server.start()
+    try:
+        url = urls.get(timeout=60)
+        for transport in ("requests", "http.client"):
+            for mode in (False, "pool", "per_thread"):
+                client = EvrmoreClient(url=url, rpcuser="user", rpcpassword="pass",
+                                       async_mode=False, transport=transport, thread_safe=mode,
+                                       pool_maxsize=args.pool_maxsize)
+                opened = []
+                connect = client._new_sync_session
+
+                def new_session():
+                    session = connect()
+                    opened.append(session)
+                    return session
+
+                client._new_sync_session = new_session
+                counter.count = 0
+                with ThreadPoolExecutor(max_workers=args.threads) as executor:
+                    begin = time.perf_counter()
+                    list(executor.map(lambda _: client.getblockcount(), range(args.calls)))
+                    elapsed = time.perf_counter() - begin
+                client.close_sync()
+                print(f"{transport:12} thread_safe={str(mode):10} sessions={len(opened):3} "
+                      f"calls/s={args.calls / elapsed:7.0f} pool-full warnings={counter.count}")
+    finally:
+        stop.set()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
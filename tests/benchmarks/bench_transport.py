@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark: sync calls per second, requests vs the http.client transport.
+
+Runs stress_test_sync with getblockcount against a zero-latency fake node,
+so the client's per-call overhead dominates. The fake node runs in a child
+process to keep it off the client's GIL.
+
+Usage:
+    python tests/benchmarks/bench_transport.py [--calls 5000] [--concurrency 1 4]
+"""
+
+import argparse
+import multiprocessing
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+def serve(ports: multiprocessing.Queue, stop: multiprocessing.Event) -> None:
+    with FakeNode(latency=0, rpcthreads=16) as node:
+        ports.put(node.url)
+        stop.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    ports, stop = ctx.Queue(), ctx.Event()
+    server = ctx.Process(target=serve, args=(ports, stop))
+    server.start()
+    try:
+        url = ports.get(timeout=60)
+        for concurrency in args.concurrency:
+            for transport in ("requests", "http.client"):
+                client = EvrmoreClient(url=url, rpcuser="user", rpcpassword="pass",
+                                       async_mode=False, transport=transport)
+                client.getblockcount()
+                results = client.stress_test_sync(num_calls=args.calls, concurrency=concurrency)
+                client.close_sync()
+                print(f"{transport:12} concurrency={concurrency:3} "
+                      f"calls/s={results['requests_per_second']:8.0f} "
+                      f"median={results['median_time']:6.3f} ms")
+    finally:
+        stop.set()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: turning large results into models, per item vs cached TypeAdapter vs trusted.
+
+getaddressutxos for a busy address and listaddressesbyasset for a widely
+held asset return 100k+ entries. Validating them item by item with
+model_validate pays pydantic's per-call overhead for every entry; the
+cached TypeAdapter behind client.typed validates the whole list in one
+call, and client.typed.trusted builds the models without validating.
+Times include decoding the response body with the codec; "raw" is the
+decode alone. With 100k new objects per call the cyclic GC's passes are a
+large share of every variant; --no-gc shows the conversion cost alone.
+
+Usage:
+    python tests/benchmarks/bench_typed.py [--items 100000] [--rounds 5] [--no-gc]
+"""
+
+import argparse
+import gc
+import json
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+from evrmore_rpc.codec import get_codec
+from evrmore_rpc.models import AddressUtxo
+from evrmore_rpc.typed import get_adapter, get_constructor
+from fake_node import block_hash
+
+
+def make_utxos(count: int) -> List[dict]:
+    return [{"address": "EXaddr1", "txid": block_hash(i), "outputIndex": i % 4,
+             "script": "76a914" + "ab" * 20 + "88ac",
+             "satoshis": 100_000_000 + i, "height": 1_000_000 - i} for i in range(count)]
+
+
+def make_holders(count: int) -> Dict[str, float]:
+    return {f"EX{i:032d}": round(i * 0.37, 8) for i in range(count)}
+
+
+def measure(label: str, convert, rounds: int) -> float:
+    convert()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        convert()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"  {label:26} {elapsed * 1000:9.1f} ms")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--no-gc", action="store_true", help="disable the cyclic garbage collector")
+    args = parser.parse_args()
+    if args.no_gc:
+        gc.disable()
+    codec = get_codec()
+
+    body = json.dumps({"result": make_utxos(args.items), "error": None, "id": 1}).encode()
+    print(f"getaddressutxos: {args.items} utxos, body={len(body) / 1e6:.1f} MB, codec={codec.name}")
+    adapter, construct = get_adapter(List[AddressUtxo]), get_constructor(List[AddressUtxo])
+    measure("raw", lambda: codec.loads(body)["result"], args.rounds)
+    per_item = measure("model_validate per item",
+                       lambda: [AddressUtxo.model_validate(u) for u in codec.loads(body)["result"]],
+                       args.rounds)
+    cached = measure("cached TypeAdapter",
+                     lambda: adapter.validate_python(codec.loads(body)["result"]), args.rounds)
+    trusted = measure("trusted", lambda: construct(codec.loads(body)["result"]), args.rounds)
+    print(f"  speedup vs per item: adapter {per_item / cached:.2f}x,"
+          f" trusted {per_item / trusted:.2f}x")
+
+    body = json.dumps({"result": make_holders(args.items), "error": None, "id": 1}).encode()
+    print(f"listaddressesbyasset: {args.items} holders, body={len(body) / 1e6:.1f} MB")
+    adapter = get_adapter(Dict[str, Decimal])
+    measure("raw", lambda: codec.loads(body)["result"], args.rounds)
+    per_item = measure("Decimal(str()) per item",
+                       lambda: {k: Decimal(str(v)) for k, v in codec.loads(body)["result"].items()},
+                       args.rounds)
+    cached = measure("cached TypeAdapter",
+                     lambda: adapter.validate_python(codec.loads(body)["result"]), args.rounds)
+    print(f"  speedup vs per item: adapter {per_item / cached:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark: calls per second over TCP loopback vs a Unix domain socket.
+
+Runs getblockcount against a zero-latency fake node listening on both, so
+per-call transport overhead dominates. The fake node runs in a child
+process to keep it off the client's GIL.
+
+Usage:
+    python tests/benchmarks/bench_unix_socket.py [--calls 5000] [--concurrency 1 8]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+
+from evrmore_rpc import EvrmoreClient
+from fake_node import FakeNode
+
+
+def serve(socket_path: str, urls: multiprocessing.Queue, stop: multiprocessing.Event) -> None:
+    with FakeNode(latency=0, rpcthreads=16, socket_path=socket_path) as node:
+        urls.put((node.url, node.unix_url))
+        stop.wait()
+
+
+async def run_async(url: str, calls: int, concurrency: int) -> dict:
+    async with EvrmoreClient(url=url, rpcuser="user", rpcpassword="pass",
+                             async_mode=True) as client:
+        await client.getblockcount()
+        return await client.stress_test(num_calls=calls, concurrency=concurrency)
+
+
+def run_sync(url: str, calls: int, concurrency: int, transport: str) -> dict:
+    client = EvrmoreClient(url=url, rpcuser="user", rpcpassword="pass", async_mode=False,
+                           transport=transport)
+    client.getblockcount()
+    results = client.stress_test_sync(num_calls=calls, concurrency=concurrency)
+    client.close_sync()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+
+    socket_path = os.path.join(tempfile.mkdtemp(), "rpc.sock")
+    ctx = multiprocessing.get_context("spawn")
+    urls, stop = ctx.Queue(), ctx.Event()
+    server = ctx.Process(target=serve, args=(socket_path, urls, stop))
+    server.start()
+    try:
+        tcp_url, unix_url = urls.get(timeout=60)
+        for concurrency in args.concurrency:
+            for client in ("requests", "http.client", "aiohttp"):
+                for label, url in (("tcp", tcp_url), ("unix", unix_url)):
+                    if client == "aiohttp":
+                        results = asyncio.run(run_async(url, args.calls, concurrency))
+                    else:
+                        results = run_sync(url, args.calls, concurrency, client)
+                    print(f"{client:12} {label:5} concurrency={concurrency:3} "
+                          f"calls/s={results['requests_per_second']:8.0f} "
+                          f"median={results['median_time']:6.3f} ms")
+    finally:
+        stop.set()
+        server.join()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+if __name__ == "__main__":
+    main()
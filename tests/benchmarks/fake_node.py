@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+In-process fake evrmored JSON-RPC server for benchmarks.
+
+Serves single and batch JSON-RPC requests over HTTP from a background thread,
+so benchmarks can run without a real node. Like evrmored, only `rpcthreads`
+HTTP requests are worked on at once and each takes `latency` seconds, which
+makes round-trip savings (batching, coalescing, caching) visible. With
+`rpcworkqueue` set, requests beyond that many waiting get evrmored's
+"Work queue depth exceeded" rejection.
+
+Usage:
+    with FakeNode(latency=0.001) as node:
+        client = EvrmoreClient(url=node.url, rpcuser="user", rpcpassword="pass")
+        ...
+        print(node.http_requests, node.rpc_calls)
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from aiohttp import web
+
+TIP_HEIGHT = 1_000_000
+
+
+def block_hash(height: int) -> str:
+    """Deterministic fake block hash for a height."""
+    return hashlib.sha256(str(height).encode()).hexdigest()
+
+
+def make_block(block_hash_hex: str, verbosity: int = 1, tx_count: int = 10,
+               confirmations: int = 1) -> Any:
+    """Build a synthetic block in the shape returned by getblock."""
+    txids = [hashlib.sha256(f"{block_hash_hex}:{i}".encode()).hexdigest() for i in range(tx_count)]
+    if verbosity == 0:
+        return "00" * 80 + "ab" * 250 * tx_count
+    block = {
+        "hash": block_hash_hex,
+        "confirmations": confirmations,
+        "strippedsize": 250 * tx_count,
+        "size": 250 * tx_count,
+        "weight": 1000 * tx_count,
+        "height": 1,
+        "version": 805306368,
+        "versionHex": "30000000",
+        "merkleroot": txids[0],
+        "tx": txids,
+        "time": 1700000000,
+        "mediantime": 1699999000,
+        "nonce": 0,
+        "bits": "1b01c3a5",
+        "difficulty": 35541.73894602,
+        "chainwork": "0000000000000000000000000000000000000000000000000000a8f3a2c1d1f0",
+        "headerhash": block_hash_hex,
+        "mixhash": block_hash_hex,
+        "nonce64": 1234567890,
+    }
+    if verbosity == 2:
+        block["tx"] = [
+            {
+                "txid": txid,
+                "hash": txid,
+                "size": 250,
+                "vin": [{"txid": txids[0], "vout": 0, "sequence": 4294967295}],
+                "vout": [
+                    {
+                        "value": 1250.5 + n,
+                        "n": n,
+                        "scriptPubKey": {
+                            "asm": "OP_DUP OP_HASH160 00 OP_EQUALVERIFY OP_CHECKSIG",
+                            "hex": "76a914" + "00" * 20 + "88ac",
+                            "type": "pubkeyhash",
+                            "addresses": ["EXaMPLEaddressXXXXXXXXXXXXXXXXXXX"],
+                        },
+                    }
+                    for n in range(2)
+                ],
+            }
+            for txid in txids
+        ]
+    return block
+
+
+def default_handlers() -> Dict[str, Callable[..., Any]]:
+    """RPC handlers used by the fake node."""
+    return {
+        "getblockcount": lambda: TIP_HEIGHT,
+        "getbestblockhash": lambda: block_hash(TIP_HEIGHT),
+        "getblockhash": lambda height: block_hash(height),
+        "getblock": lambda h, verbosity=1: make_block(h, verbosity, confirmations=100),
+        "getblockheader": lambda h, verbose=True: {"hash": h, "height": TIP_HEIGHT,
+                                                   "confirmations": 1,
+                                                   "previousblockhash": block_hash(TIP_HEIGHT - 1)},
+        "getrawtransaction": lambda txid, verbose=False: "01000000" + txid * 4,
+        "getblockchaininfo": lambda: {"chain": "main", "blocks": TIP_HEIGHT, "headers": TIP_HEIGHT,
+                                      "bestblockhash": block_hash(TIP_HEIGHT)},
+    }
+
+
+class FakeNode:
+    """A minimal evrmored stand-in serving JSON-RPC over HTTP."""
+
+    def __init__(self, latency: float = 0.0005, rpcthreads: int = 4,
+                 rpcworkqueue: Optional[int] = None,
+                 handlers: Optional[Dict[str, Callable[..., Any]]] = None,
+                 host: str = "127.0.0.1", port: int = 0, socket_path: Optional[str] = None):
+        self.latency = latency
+        self.rpcthreads = rpcthreads
+        self.rpcworkqueue = rpcworkqueue
+        self.rejected = 0
+        self._queued = 0
+        self.handlers = default_handlers()
+        if handlers:
+            self.handlers.update(handlers)
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._started = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def unix_url(self) -> str:
+        return f"unix://{self.socket_path}"
+
+    def reset_counters(self) -> None:
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self.rejected = 0
+
+    def _call(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.rpc_calls += 1
+        handler = self.handlers.get(request.get("method"))
+        if handler is None:
+            error = {"code": -32601, "message": "Method not found"}
+            return {"result": None, "error": error, "id": request.get("id")}
+        try:
+            result = handler(*request.get("params", []))
+            return {"result": result, "error": None, "id": request.get("id")}
+        except Exception as e:
+            error = {"code": -1, "message": str(e)}
+            return {"result": None, "error": error, "id": request.get("id")}
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.http_requests += 1
+        body = json.loads(await request.read())
+        if self.rpcworkqueue is not None and self._queued >= self.rpcthreads + self.rpcworkqueue:
+            self.rejected += 1
+            return web.Response(status=500, text="Work queue depth exceeded")
+        self._queued += 1
+        try:
+            async with self._workers:
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if isinstance(body, list):
+                    response = [self._call(item) for item in body]
+                else:
+                    response = self._call(body)
+        finally:
+            self._queued -= 1
+        return web.Response(body=json.dumps(response).encode(), content_type="application/json")
+
+    async def _serve(self) -> None:
+        self._workers = asyncio.Semaphore(self.rpcthreads)
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_post("/", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        if self.socket_path:
+            await web.UnixSite(self._runner, self.socket_path).start()
+        self._started.set()
+
+    def start(self) -> "FakeNode":
+        self._loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._serve())
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+    def __enter__(self) -> "FakeNode":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
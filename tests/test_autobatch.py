@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for transparent auto-batching of async calls.
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
+
+
+def mock_async_post(calls):
+    """Patch aiohttp.ClientSession.post, echoing params and recording each payload."""
+    def answer(request):
+        if request["method"] == "fail":
+            return {"result": None, "error": {"code": -1, "message": "Failed"}, "id": request["id"]}
+        return {"result": request["params"], "error": None, "id": request["id"]}
+
+    def post(url, data=None, timeout=None):
+        payload = json.loads(data)
+        calls.append(payload)
+        response = AsyncMock()
+        response.status = 200
+
+        async def mock_read():
+            if isinstance(payload, list):
+                return json.dumps([answer(request) for request in payload]).encode()
+            return json.dumps(answer(payload)).encode()
+
+        response.read = mock_read
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        return context
+    return patch('aiohttp.ClientSession.post', side_effect=post)
+
+
+class TestAutoBatch:
+    """Tests for the AutoBatcher dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent calls are flushed as one batch."""
+        posts = []
+        with mock_async_post(posts):
+            client = EvrmoreClient(async_mode=True, auto_batch=True)
+            results = await asyncio.gather(*(client.getblockhash(h) for h in range(10)))
+
+            assert results == [[h] for h in range(10)]
+            assert len(posts) == 1
+            assert len(posts[0]) == 10
+            assert client.auto_batcher.get_stats()["batches_sent"] == 1
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_max_size_splits_batches(self):
+        """Test that batches never exceed max_size."""
+        posts = []
+        with mock_async_post(posts):
+            client = EvrmoreClient(async_mode=True, auto_batch=True, auto_batch_max_size=4)
+            results = await asyncio.gather(*(client.getblockhash(h) for h in range(10)))
+
+            assert results == [[h] for h in range(10)]
+            assert [len(p) if isinstance(p, list) else 1 for p in posts] == [4, 4, 2]
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_single_call_sent_plain(self):
+        """Test that a lone call is sent as a plain request."""
+        posts = []
+        with mock_async_post(posts):
+            client = EvrmoreClient(async_mode=True, auto_batch=True)
+            assert await client.getblockhash(5) == [5]
+            assert isinstance(posts[0], dict)
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_per_call(self):
+        """Test that a failing call does not fail its batch neighbours."""
+        posts = []
+        with mock_async_post(posts):
+            client = EvrmoreClient(async_mode=True, auto_batch=True)
+            results = await asyncio.gather(client.getblockhash(1), client.fail(),
+                                           return_exceptions=True)
+
+            assert results[0] == [1]
+            assert isinstance(results[1], EvrmoreRPCError)
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_transport_error_fails_all_waiters(self):
+        """Test that a failed batch request is raised to every caller."""
+        failure = EvrmoreRPCError("Request failed: boom")
+        with patch('aiohttp.ClientSession.post', side_effect=failure):
+            client = EvrmoreClient(async_mode=True, auto_batch=True)
+            results = await asyncio.gather(client.getblockhash(1), client.getblockhash(2),
+                                           return_exceptions=True)
+
+            assert all(isinstance(r, EvrmoreRPCError) for r in results)
+            await client.close()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the sync facade over a background event loop.
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreBackgroundClient, EvrmoreClient, EvrmoreRPCError
+
+
+class FakeNode:
+    """Answers async calls after a delay and records where and how concurrently they ran."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.calls = []
+        self.threads = set()
+        self.in_flight = 0
+        self.peak = 0
+
+    async def execute(self, command, *args, fields=None):
+        self.calls.append((command, args, fields))
+        self.threads.add(threading.current_thread().name)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if command == "fail" or args == ("fail",):
+                raise EvrmoreRPCError("RPC error (-1): boom")
+            if command == "getblockhash":
+                return f"{args[0]:064x}"
+            return len(self.calls)
+        finally:
+            self.in_flight -= 1
+
+    async def batch(self, calls, return_exceptions=False):
+        return [call[1] for call in calls]
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def node():
+    node = FakeNode()
+    with patch.object(EvrmoreClient, 'execute_command_async', node.execute), \
+            patch.object(EvrmoreClient, 'execute_batch_async', node.batch), \
+            patch.object(EvrmoreClient, 'close', node.close):
+        yield node
+
+
+class TestBackgroundClient:
+    """Tests for EvrmoreBackgroundClient."""
+
+    def test_blocking_calls_run_on_loop_thread(self, node):
+        """Test that bound and dynamic methods block and run on the loop thread."""
+        with EvrmoreBackgroundClient(rpcuser="u", rpcpassword="p") as client:
+            assert client.getblockhash(5) == f"{5:064x}"
+            assert client.getnewcommand("x") == 2
+            assert client.getblock("00", 1, fields=["hash"]) == 3
+        assert node.threads == {"evrmore-loop"}
+        assert node.calls[2] == ("getblock", ("00", 1), ["hash"])
+        assert client.client._async_mode is True
+
+    def test_submit_returns_futures(self, node):
+        """Test that submitted calls run concurrently and resolve as futures."""
+        with EvrmoreBackgroundClient() as client:
+            futures = [client.submit("getblockhash", height) for height in range(20)]
+            assert all(isinstance(future, Future) for future in futures)
+            assert [future.result() for future in futures] == [f"{h:064x}" for h in range(20)]
+        assert node.peak == 20
+
+    def test_map_order_and_concurrency(self, node):
+        """Test that map yields in input order with at most `concurrency` calls in flight."""
+        with EvrmoreBackgroundClient() as client:
+            hashes = list(client.map("getblockhash", range(50), concurrency=5))
+        assert hashes == [f"{h:064x}" for h in range(50)]
+        assert node.peak == 5
+
+    def test_map_argument_tuples(self, node):
+        """Test that tuples are spread as arguments and anything else is the only argument."""
+        with EvrmoreBackgroundClient() as client:
+            list(client.map("getblock", [("00", 1), ["a", "b"]]))
+        assert [call[1] for call in node.calls] == [("00", 1), (["a", "b"],)]
+
+    def test_map_reads_input_lazily(self, node):
+        """Test that map over an endless input only submits one window ahead."""
+        with EvrmoreBackgroundClient(concurrency=4) as client:
+            results = client.map("getblockhash", itertools.count())
+            assert list(itertools.islice(results, 10)) == [f"{h:064x}" for h in range(10)]
+            results.close()
+            time.sleep(0.05)
+        assert len(node.calls) <= 14
+
+    def test_map_errors(self, node):
+        """Test that a failed call raises in order, or is yielded with return_exceptions."""
+        with EvrmoreBackgroundClient() as client:
+            results = list(client.map("getblock", ["a", "fail", "b"], return_exceptions=True))
+            assert [isinstance(result, EvrmoreRPCError) for result in results] == [False, True,
+                                                                                   False]
+            seen = []
+            with pytest.raises(EvrmoreRPCError):
+                for result in client.map("getblock", ["a", "fail", "b"], concurrency=1):
+                    seen.append(result)
+            assert len(seen) == 1
+
+    def test_many_sync_threads_share_one_loop(self, node):
+        """Test that callers on many threads are all served by the one loop."""
+        with EvrmoreBackgroundClient() as client:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(client.getblockhash, range(64)))
+        assert results == [f"{h:064x}" for h in range(64)]
+        assert node.threads == {"evrmore-loop"}
+        assert node.peak > 8
+
+    def test_execute_batch(self, node):
+        """Test that batches are forwarded to the async client."""
+        with EvrmoreBackgroundClient() as client:
+            assert client.execute_batch([("getblockhash", 1), ("getblockhash", 2)]) == [1, 2]
+
+    def test_close(self, node):
+        """Test that close stops the loop thread and later calls are refused."""
+        client = EvrmoreBackgroundClient()
+        client.close()
+        assert node.closed
+        assert not client._thread.is_alive()
+        client.close()
+        with pytest.raises(RuntimeError):
+            client.getblockcount()
+
+    def test_calls_from_loop_thread_are_refused(self, node):
+        """Test that calling the facade from its own loop raises instead of deadlocking."""
+        with EvrmoreBackgroundClient() as client:
+            async def nested():
+                return client.getblockcount()
+
+            with pytest.raises(RuntimeError):
+                asyncio.run_coroutine_threadsafe(nested(), client._loop).result()
+
+    def test_wraps_existing_client(self, node):
+        """Test that an existing client is used as given."""
+        inner = EvrmoreClient(async_mode=False)
+        with EvrmoreBackgroundClient(client=inner) as client:
+            assert client.client is inner
+            assert client.getblockcount() == 1
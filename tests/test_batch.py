@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON-RPC batch support.
+"""
+
+import json
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError, RPCBatch
+
+
+def batch_echo(payload, errors=()):
+    """Build a batch response for a payload, answering in reverse order."""
+    response = []
+    for request in reversed(payload):
+        if request["method"] in errors:
+            response.append({"result": None, "error": {"code": -5, "message": "Not found"},
+                             "id": request["id"]})
+        else:
+            response.append({"result": [request["method"], *request["params"]], "error": None,
+                             "id": request["id"]})
+    return response
+
+
+def mock_sync_post(errors=()):
+    """Patch requests.Session.post to answer batches via batch_echo."""
+    def post(url, data=None, timeout=None):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps(batch_echo(json.loads(data), errors)).encode()
+        return response
+    return patch('requests.Session.post', side_effect=post)
+
+
+def mock_async_post(errors=()):
+    """Patch aiohttp.ClientSession.post to answer batches via batch_echo."""
+    def post(url, data=None, timeout=None):
+        response = AsyncMock()
+        response.status = 200
+
+        async def mock_read():
+            return json.dumps(batch_echo(json.loads(data), errors)).encode()
+
+        response.read = mock_read
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+        return context
+    return patch('aiohttp.ClientSession.post', side_effect=post)
+
+
+class TestBatch:
+    """Tests for batch execution on EvrmoreClient."""
+
+    def test_batch_payload_has_unique_ids(self):
+        """Test that batch payloads get unique ids."""
+        client = EvrmoreClient()
+        payload = client._prepare_batch_payload(["getblockcount", ("getblockhash", 1),
+                                                 ("getblock", "00ab", 2)])
+        assert [p["method"] for p in payload] == ["getblockcount", "getblockhash", "getblock"]
+        assert payload[2]["params"] == ["00ab", 2]
+        assert len({p["id"] for p in payload}) == 3
+
+    def test_execute_batch_sync_matches_ids(self):
+        """Test that results are returned in request order with one POST."""
+        with mock_sync_post() as mock_post:
+            client = EvrmoreClient()
+            results = client.execute_batch_sync([("getblockhash", 1), ("getblockhash", 2),
+                                                 "getblockcount"])
+
+            assert results == [["getblockhash", 1], ["getblockhash", 2], ["getblockcount"]]
+            mock_post.assert_called_once()
+
+    def test_execute_batch_sync_errors(self):
+        """Test per-entry error handling."""
+        with mock_sync_post(errors=("getblock",)):
+            client = EvrmoreClient()
+            results = client.execute_batch_sync(["getblockcount", ("getblock", "bad")],
+                                                return_exceptions=True)
+            assert results[0] == ["getblockcount"]
+            assert isinstance(results[1], EvrmoreRPCError)
+
+            with pytest.raises(EvrmoreRPCError) as excinfo:
+                client.execute_batch_sync(["getblockcount", ("getblock", "bad")])
+            assert "Not found" in str(excinfo.value)
+
+    def test_execute_batch_empty(self):
+        """Test that an empty batch makes no request."""
+        with patch('requests.Session.post') as mock_post:
+            client = EvrmoreClient()
+            assert client.execute_batch_sync([]) == []
+            mock_post.assert_not_called()
+
+    def test_execute_batch_rejected(self):
+        """Test a batch rejected as a whole by the node."""
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            error = {"code": -32700, "message": "Parse error"}
+            body = {"result": None, "error": error, "id": None}
+            mock_response.content = json.dumps(body).encode()
+            mock_post.return_value = mock_response
+
+            client = EvrmoreClient()
+            with pytest.raises(EvrmoreRPCError) as excinfo:
+                client.execute_batch_sync(["getblockcount"])
+            assert "Parse error" in str(excinfo.value)
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_async(self):
+        """Test asynchronous batch execution."""
+        with mock_async_post() as mock_post:
+            client = EvrmoreClient()
+            results = await client.execute_batch_async([("getblockhash", 1), "getblockcount"])
+
+            assert results == [["getblockhash", 1], ["getblockcount"]]
+            mock_post.assert_called_once()
+            await client.close()
+
+
+class TestRPCBatch:
+    """Tests for the RPCBatch builder."""
+
+    def test_builder_sync(self):
+        """Test the builder as a sync context manager."""
+        with mock_sync_post(errors=("getblock",)) as mock_post:
+            client = EvrmoreClient(async_mode=False)
+            with client.batch(return_exceptions=True) as batch:
+                assert isinstance(batch, RPCBatch)
+                count = batch.getblockcount()
+                block = batch.getblock("bad")
+                assert not count.done()
+                assert len(batch) == 2
+
+            assert count.result() == ["getblockcount"]
+            assert isinstance(block.exception(), EvrmoreRPCError)
+            with pytest.raises(EvrmoreRPCError):
+                block.result()
+            mock_post.assert_called_once()
+            assert len(batch) == 0
+
+    def test_builder_execute_raises(self):
+        """Test that execute() raises the first failure by default."""
+        with mock_sync_post(errors=("getblock",)):
+            client = EvrmoreClient(async_mode=False)
+            batch = client.batch()
+            batch.getblock("bad")
+            with pytest.raises(EvrmoreRPCError):
+                batch.execute()
+
+            batch = client.batch(return_exceptions=True)
+            batch.getblock("bad")
+            assert isinstance(batch.execute()[0], EvrmoreRPCError)
+
+    def test_unexecuted_result(self):
+        """Test accessing a result before the batch is executed."""
+        client = EvrmoreClient()
+        call = client.batch().getblockcount()
+        with pytest.raises(RuntimeError):
+            call.result()
+
+    @pytest.mark.asyncio
+    async def test_builder_async(self):
+        """Test the builder as an async context manager."""
+        with mock_async_post() as mock_post:
+            client = EvrmoreClient()
+            async with client.batch() as batch:
+                first = batch.getblockhash(1)
+                second = batch.add("getblockhash", 2)
+
+            assert first.result() == ["getblockhash", 1]
+            assert second.result() == ["getblockhash", 2]
+            mock_post.assert_called_once()
+            await client.close()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel ordered block range fetcher.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
+
+
+def fake_hash(height):
+    return f"{height:064x}"
+
+
+class FakeChain:
+    """Serves getblockhash/getblock with random delays and records concurrency."""
+
+    def __init__(self, tip=99, max_delay=0.005, fail_height=None):
+        self.tip = tip
+        self.max_delay = max_delay
+        self.fail_height = fail_height
+        self.calls = []
+        self.batches = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def answer(self, command, args):
+        self.calls.append(command)
+        if command == "getblockcount":
+            return self.tip
+        if command == "getblockhash":
+            if args[0] == self.fail_height:
+                raise EvrmoreRPCError("RPC error (-8): Block height out of range")
+            return fake_hash(args[0])
+        height = int(args[0], 16)
+        if args[1] == 0:
+            return f"raw{height}"
+        return {"hash": args[0], "height": height}
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def sync(self, command, *args):
+        self.enter()
+        try:
+            time.sleep(random.uniform(0, self.max_delay))
+            return self.answer(command, args)
+        finally:
+            self.leave()
+
+    def batch_sync(self, calls, return_exceptions=False):
+        self.batches.append(len(calls))
+        self.enter()
+        try:
+            time.sleep(random.uniform(0, self.max_delay))
+            return [self.answer(call[0], call[1:]) for call in calls]
+        finally:
+            self.leave()
+
+    async def async_(self, command, *args):
+        self.enter()
+        try:
+            await asyncio.sleep(random.uniform(0, self.max_delay))
+            return self.answer(command, args)
+        finally:
+            self.leave()
+
+    async def batch_async(self, calls, return_exceptions=False):
+        self.batches.append(len(calls))
+        self.enter()
+        try:
+            await asyncio.sleep(random.uniform(0, self.max_delay))
+            return [self.answer(call[0], call[1:]) for call in calls]
+        finally:
+            self.leave()
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        for name, fake in (('execute_command_sync', self.sync),
+                           ('execute_batch_sync', self.batch_sync),
+                           ('execute_command_async', self.async_),
+                           ('execute_batch_async', self.batch_async)):
+            self.stack.enter_context(patch.object(EvrmoreClient, name, fake))
+        return self
+
+    def __exit__(self, *exc):
+        # Let abandoned fetch threads finish before the next test patches the client
+        for thread in threading.enumerate():
+            if thread.name.startswith("evrmore-blocks"):
+                thread.join(timeout=1)
+        self.stack.close()
+
+
+class TestSyncBlockRange:
+    """Tests for iterating blocks synchronously."""
+
+    @pytest.mark.parametrize("batch_size", [1, 7])
+    def test_height_order(self, batch_size):
+        """Test that blocks come out in height order despite out-of-order completion."""
+        with FakeChain() as chain:
+            client = EvrmoreClient(async_mode=False)
+            blocks = list(client.iter_blocks(10, 60, concurrency=4, batch_size=batch_size))
+        assert [height for height, _ in blocks] == list(range(10, 60))
+        assert all(block["height"] == height for height, block in blocks)
+        assert 1 < chain.peak <= 4
+        if batch_size > 1:
+            # Seven units of 7 heights as batches; the last height as single calls
+            assert chain.batches == [7] * 14
+
+    def test_raw_hex_to_tip(self):
+        """Test verbosity 0 and stopping at the tip when end is omitted."""
+        with FakeChain(tip=20) as chain:
+            client = EvrmoreClient(async_mode=False)
+            blocks = list(client.iter_blocks(15, verbosity=0))
+        assert blocks == [(height, f"raw{height}") for height in range(15, 21)]
+        assert chain.calls[0] == "getblockcount"
+
+    def test_error_and_resume(self):
+        """Test that a failure raises in order and the cursor resumes at the failed height."""
+        with FakeChain(fail_height=33):
+            client = EvrmoreClient(async_mode=False)
+            blocks = client.iter_blocks(0, 50, concurrency=4)
+            seen = []
+            with pytest.raises(EvrmoreRPCError, match="out of range"):
+                for height, _ in blocks:
+                    seen.append(height)
+        assert seen == list(range(33))
+        assert blocks.cursor == 33
+
+    def test_invalid_arguments(self):
+        """Test that out-of-range settings are rejected."""
+        client = EvrmoreClient(async_mode=False)
+        with pytest.raises(ValueError):
+            client.iter_blocks(10, 5)
+        with pytest.raises(ValueError):
+            client.iter_blocks(0, 10, concurrency=0)
+
+
+class TestAsyncBlockRange:
+    """Tests for iterating blocks asynchronously."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [1, 5])
+    async def test_height_order(self, batch_size):
+        """Test that blocks come out in height order with async for."""
+        with FakeChain() as chain:
+            client = EvrmoreClient(async_mode=True)
+            blocks = client.iter_blocks(0, 40, concurrency=3, batch_size=batch_size)
+            heights = [height async for height, _ in blocks]
+        assert heights == list(range(40))
+        assert chain.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_reorder_buffer_bounded(self):
+        """Test that a slow consumer stalls fetching at the reorder buffer's size."""
+        with FakeChain(max_delay=0) as chain:
+            client = EvrmoreClient(async_mode=True)
+            iterator = client.iter_blocks(0, 1000, concurrency=4).__aiter__()
+            await iterator.__anext__()
+            await asyncio.sleep(0.05)
+            # Two calls per height: 8 buffered units plus the one being consumed
+            assert len(chain.calls) <= 2 * 9
+            await iterator.aclose()
+        assert chain.in_flight == 0
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk executor.
+"""
+
+import asyncio
+import itertools
+import random
+import threading
+import time
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreClient, EvrmoreClientPool, EvrmoreConnectionError, EvrmoreRPCError
+from evrmore_rpc.bulk import BulkResult
+
+
+class FakeNode:
+    """Answers getrawtransaction calls and batches with random delays, recording concurrency."""
+
+    def __init__(self, max_delay=0.005, bad=(), down_chunks=()):
+        self.max_delay = max_delay
+        self.bad = set(bad)
+        self.down_chunks = set(down_chunks)
+        self.singles = 0
+        self.batches = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def answer(self, args):
+        if args[0] in self.bad:
+            return EvrmoreRPCError("RPC error (-5): No such mempool or blockchain transaction")
+        return {"txid": args[0], "verbose": args[1:]}
+
+    def enter(self):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def batch_answers(self, calls):
+        self.batches.append(len(calls))
+        if calls[0][1] in self.down_chunks:
+            raise EvrmoreConnectionError("Request failed: connection reset")
+        return [self.answer(call[1:]) for call in calls]
+
+    def sync(self, command, *args):
+        self.singles += 1
+        self.enter()
+        try:
+            time.sleep(random.uniform(0, self.max_delay))
+            result = self.answer(args)
+        finally:
+            self.leave()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def batch_sync(self, calls, return_exceptions=False):
+        self.enter()
+        try:
+            time.sleep(random.uniform(0, self.max_delay))
+            return self.batch_answers(calls)
+        finally:
+            self.leave()
+
+    async def batch_async(self, calls, return_exceptions=False):
+        self.enter()
+        try:
+            await asyncio.sleep(random.uniform(0, self.max_delay))
+            return self.batch_answers(calls)
+        finally:
+            self.leave()
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        for name, fake in (('execute_command_sync', self.sync),
+                           ('execute_batch_sync', self.batch_sync),
+                           ('execute_batch_async', self.batch_async)):
+            self.stack.enter_context(patch.object(EvrmoreClient, name, fake))
+        return self
+
+    def __exit__(self, *exc):
+        # Let abandoned worker threads finish before the next test patches the client
+        for thread in threading.enumerate():
+            if thread.name.startswith("evrmore-bulk"):
+                thread.join(timeout=1)
+        self.stack.close()
+
+
+TXIDS = [f"{i:064x}" for i in range(250)]
+
+
+class TestSyncBulk:
+    """Tests for iterating a bulk run with worker threads."""
+
+    def test_ordered_results(self):
+        """Test that every call yields a BulkResult in input order, sent in chunks."""
+        with FakeNode() as node:
+            client = EvrmoreClient(async_mode=False)
+            run = client.bulk("getrawtransaction", ((txid, True) for txid in TXIDS), workers=4,
+                              chunk_size=40)
+            items = list(run)
+        assert all(isinstance(item, BulkResult) for item in items)
+        assert [item.index for item in items] == list(range(250))
+        assert [item.result()["txid"] for item in items] == TXIDS
+        assert items[0].args == (TXIDS[0], True)
+        assert sorted(node.batches) == [10] + [40] * 6
+        assert 1 < node.peak <= 4
+        assert (run.completed, run.failed) == (250, 0)
+
+    def test_failures_are_per_item(self):
+        """Test that failed calls and failed chunks are reported without stopping the run."""
+        bad = {TXIDS[3], TXIDS[77]}
+        with FakeNode(bad=bad, down_chunks={TXIDS[100]}):
+            client = EvrmoreClient(async_mode=False)
+            run = client.bulk("getrawtransaction", TXIDS, workers=3, chunk_size=50)
+            items = list(run)
+        failed = [item.index for item in items if not item.ok]
+        assert failed == [3, 77] + list(range(100, 150))
+        assert isinstance(items[120].error, EvrmoreConnectionError)
+        with pytest.raises(EvrmoreRPCError):
+            items[3].result()
+        assert items[4].ok and items[4].value["txid"] == TXIDS[4]
+        assert (run.completed, run.failed) == (250, 52)
+
+    def test_single_calls(self):
+        """Test that chunk_size=1 sends single calls and catches their errors."""
+        with FakeNode(bad={TXIDS[1]}) as node:
+            client = EvrmoreClient(async_mode=False)
+            items = list(client.bulk("getrawtransaction", TXIDS[:5], workers=2, chunk_size=1))
+        assert [item.ok for item in items] == [True, False, True, True, True]
+        assert node.singles == 5 and node.batches == []
+
+    def test_as_completed(self):
+        """Test that ordered=False yields every call once, as chunks finish."""
+        with FakeNode(max_delay=0.01):
+            client = EvrmoreClient(async_mode=False)
+            items = list(client.bulk("getrawtransaction", TXIDS, workers=8, chunk_size=5,
+                                     ordered=False))
+        assert sorted(item.index for item in items) == list(range(250))
+        assert all(item.value["txid"] == TXIDS[item.index] for item in items)
+
+    def test_lazy_input_and_bounded_window(self):
+        """Test that an endless input is read at most 2 * workers chunks ahead."""
+        with FakeNode(max_delay=0) as node:
+            client = EvrmoreClient(async_mode=False)
+            params = (f"{i:064x}" for i in itertools.count())
+            results = iter(client.bulk("getrawtransaction", params, workers=2, chunk_size=10))
+            assert [item.index for item in itertools.islice(results, 25)] == list(range(25))
+            results.close()
+        assert len(node.batches) <= 3 + 4
+
+    def test_workers_default_to_pool_size(self):
+        """Test that workers default to the client's connection pool size."""
+        assert EvrmoreClient(async_mode=False, pool_maxsize=24).bulk("getblock", []).workers == 24
+        assert EvrmoreClient(async_mode=False).bulk("getblock", []).workers == 10
+
+    def test_client_pool(self):
+        """Test that a pool runs bulk calls over its nodes, with workers for all connections."""
+        pool = EvrmoreClientPool(["http://u:p@10.0.0.1:8819", "http://u:p@10.0.0.2:8819"],
+                                 async_mode=False,
+                                 health_check_interval=None, pool_maxsize=3)
+        assert pool.bulk("getblock", []).workers == 6
+        single = EvrmoreClientPool(["http://u:p@10.0.0.1:8819"], async_mode=False)
+        assert single.bulk("getblock", []).workers == 10
+        with FakeNode() as node:
+            results = list(pool.bulk("getrawtransaction", TXIDS, chunk_size=25))
+        assert [item.result()["txid"] for item in results] == TXIDS
+        assert sum(stats["requests"] for stats in pool.get_stats()) == len(node.batches) == 10
+        assert all(stats["requests"] for stats in pool.get_stats())
+
+    def test_invalid_arguments(self):
+        """Test that zero workers or chunk size are rejected."""
+        client = EvrmoreClient(async_mode=False)
+        with pytest.raises(ValueError):
+            client.bulk("getblock", [], workers=0)
+        with pytest.raises(ValueError):
+            client.bulk("getblock", [], chunk_size=0)
+
+
+class TestAsyncBulk:
+    """Tests for iterating a bulk run with tasks."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ordered", [True, False])
+    async def test_results(self, ordered):
+        """Test async for over ordered and as-completed runs, with at most `workers` in flight."""
+        with FakeNode(bad={TXIDS[9]}) as node:
+            client = EvrmoreClient(async_mode=True)
+            items = [item async for item in client.bulk("getrawtransaction", TXIDS, workers=3,
+                                                        chunk_size=20, ordered=ordered)]
+        indexes = [item.index for item in items]
+        assert (indexes if ordered else sorted(indexes)) == list(range(250))
+        assert [item.index for item in items if not item.ok] == [9]
+        assert node.peak == 3
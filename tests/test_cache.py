@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for the chain-aware response cache.
+"""
+
+import json
+import time
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from evrmore_rpc import EvrmoreClient, ResponseCache, CachePolicy
+from evrmore_rpc.cache import IMMUTABLE, TIP, TTL, MISS
+from evrmore_rpc.codec import get_codec
+
+
+class FakeChain:
+    """Answers JSON-RPC payloads from an in-memory chain and counts calls."""
+
+    def __init__(self, height=100):
+        self.hashes = [f"{h:064x}" for h in range(height + 1)]
+        self.calls = []
+
+    def extend(self, fork_at=None):
+        if fork_at is not None:
+            forked = [f"f{h:063x}" for h in range(fork_at, len(self.hashes))]
+            self.hashes = self.hashes[:fork_at] + forked
+        self.hashes.append(f"{len(self.hashes):064x}")
+
+    def answer(self, method, params):
+        self.calls.append(method)
+        tip = len(self.hashes) - 1
+        if method == "getbestblockhash":
+            return self.hashes[-1]
+        if method == "getblockcount":
+            return tip
+        if method == "getblockhash":
+            return self.hashes[params[0]]
+        if method in ("getblockheader", "getblock"):
+            height = self.hashes.index(params[0])
+            return {"hash": params[0], "height": height, "confirmations": tip - height + 1,
+                    "previousblockhash": self.hashes[height - 1] if height else None}
+        if method == "getblockchaininfo":
+            return {"blocks": tip, "bestblockhash": self.hashes[-1]}
+        if method == "getrawmempool":
+            return ["aa"]
+        return None
+
+    def post(self, url, data=None, timeout=None):
+        request = json.loads(data)
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps({"result": self.answer(request["method"], request["params"]),
+                                       "error": None, "id": request["id"]}).encode()
+        return response
+
+    def patch(self):
+        return patch('requests.Session.post', side_effect=self.post)
+
+
+def make_client(chain, **cache_kwargs):
+    cache_kwargs.setdefault("tip_poll_interval", 0)
+    return EvrmoreClient(async_mode=False, cache=ResponseCache(**cache_kwargs))
+
+
+class TestResponseCache:
+    """Tests for ResponseCache storage and eviction."""
+
+    def make_cache(self, **kwargs):
+        cache = ResponseCache(tip_poll_interval=None, **kwargs)
+        cache.codec = get_codec("json")
+        cache.set_tip("00" * 32, 100)
+        return cache
+
+    def test_hits_return_copies(self):
+        """Test that callers can mutate results without corrupting the cache."""
+        cache = self.make_cache()
+        cache.put("decoderawtransaction", ("00",), {"vout": [1]})
+        cache.get("decoderawtransaction", ("00",))["vout"].append(2)
+        assert cache.get("decoderawtransaction", ("00",)) == {"vout": [1]}
+
+    def test_lru_byte_budget(self):
+        """Test that least recently used entries are evicted to stay within max_bytes."""
+        cache = self.make_cache(max_bytes=300)
+        for n in range(4):
+            cache.put("decodescript", (str(n),), "x" * 80)
+        assert cache.get("decodescript", ("0",)) is MISS
+        assert cache.get("decodescript", ("3",)) == "x" * 80
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 300 and stats["evictions"] >= 1
+
+    def test_ttl_expiry(self):
+        """Test that TTL entries expire."""
+        cache = self.make_cache(policies={"getrawmempool": CachePolicy(TTL, ttl=0.02)})
+        cache.put("getrawmempool", (), ["aa"])
+        assert cache.get("getrawmempool", ()) == ["aa"]
+        time.sleep(0.03)
+        assert cache.get("getrawmempool", ()) is MISS
+
+    def test_policy_overrides(self):
+        """Test that policies can be changed or disabled per command."""
+        cache = ResponseCache(policies={"getblockcount": None, "listmyassets": CachePolicy(TIP)})
+        assert not cache.handles("getblockcount")
+        assert cache.handles("listmyassets")
+        with pytest.raises(ValueError):
+            CachePolicy(TTL)
+
+    def test_stale_generation_rejected(self):
+        """Test that a TIP response fetched before a tip change is not stored."""
+        cache = self.make_cache()
+        generation = cache.generation
+        cache.note_tip("11" * 32)
+        cache.put("getblockchaininfo", (), {"blocks": 100}, generation)
+        assert cache.get("getblockchaininfo", ()) is MISS
+
+    def test_block_hash_by_depth(self):
+        """Test that heights near the tip are tip-scoped and deep ones immutable."""
+        cache = self.make_cache(reorg_depth=6)
+        cache.put("getblockhash", (50,), "deep")
+        cache.put("getblockhash", (99,), "shallow")
+        cache.set_tip("22" * 32, 101, "00" * 32)
+        assert cache.get("getblockhash", (50,)) == "deep"
+        assert cache.get("getblockhash", (99,)) is MISS
+
+    def test_reorg_drops_height_entries(self):
+        """Test that a tip that does not extend the old one drops height-keyed entries."""
+        cache = self.make_cache()
+        cache.put("getblockhash", (50,), "deep")
+        cache.put("decodescript", ("00",), "kept")
+        cache.set_tip("33" * 32, 101, "ff" * 32)
+        assert cache.get("getblockhash", (50,)) is MISS
+        assert cache.get("decodescript", ("00",)) == "kept"
+        assert cache.get_stats()["reorgs"] == 1
+
+    def test_attach_zmq(self):
+        """Test that hashblock notifications invalidate tip-scoped entries."""
+        handlers = {}
+        zmq_client = MagicMock()
+        zmq_client.on = lambda topic: lambda func: handlers.setdefault(topic, func)
+
+        cache = self.make_cache()
+        cache.attach_zmq(zmq_client)
+        cache.put("getblockchaininfo", (), {"blocks": 100})
+        handler, = handlers.values()
+        handler(MagicMock(hex="44" * 32))
+        assert cache.get("getblockchaininfo", ()) is MISS
+        assert cache.claim_tip_check() and cache.take_pending_tip() == "44" * 32
+
+
+class TestClientCache:
+    """Tests for caching in EvrmoreClient."""
+
+    def test_immutable_block_served_from_cache(self):
+        """Test that a deeply confirmed block is fetched once."""
+        chain = FakeChain()
+        with chain.patch():
+            client = make_client(chain)
+            first = client.getblock(chain.hashes[10])
+            chain.calls.clear()
+            assert client.getblock(chain.hashes[10]) == first
+            assert "getblock" not in chain.calls
+
+    def test_tip_entries_cleared_on_new_block(self):
+        """Test that until-next-block entries are refetched after the tip moves."""
+        chain = FakeChain()
+        with chain.patch():
+            client = make_client(chain)
+            assert client.getblockchaininfo()["blocks"] == 100
+            chain.calls.clear()
+            assert client.getblockchaininfo()["blocks"] == 100
+            assert chain.calls == ["getbestblockhash"]
+
+            chain.extend()
+            assert client.getblockchaininfo()["blocks"] == 101
+            assert client.cache.tip_height == 101
+
+    def test_recent_block_is_tip_scoped(self):
+        """Test that a block with few confirmations is refetched after the next block."""
+        chain = FakeChain()
+        with chain.patch():
+            client = make_client(chain)
+            assert client.getblock(chain.hashes[100])["confirmations"] == 1
+            chain.extend()
+            assert client.getblock(chain.hashes[100])["confirmations"] == 2
+
+    def test_reorg_refetches_heights(self):
+        """Test that getblockhash answers are refetched after a reorg."""
+        chain = FakeChain()
+        with chain.patch():
+            client = make_client(chain, reorg_depth=2)
+            old = client.getblockhash(98)
+            chain.extend(fork_at=97)
+            assert client.getblockhash(98) != old
+            assert client.cache.get_stats()["reorgs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_cache(self):
+        """Test that the async path shares the same cache."""
+        chain = FakeChain()
+
+        def post(url, data=None, timeout=None):
+            request = json.loads(data)
+            response = AsyncMock()
+            response.status = 200
+            body = json.dumps({"result": chain.answer(request["method"], request["params"]),
+                               "error": None, "id": request["id"]}).encode()
+            response.read = AsyncMock(return_value=body)
+            context = AsyncMock()
+            context.__aenter__.return_value = response
+            return context
+
+        with patch('aiohttp.ClientSession.post', side_effect=post):
+            client = EvrmoreClient(async_mode=True, cache=ResponseCache(tip_poll_interval=60))
+            await client.getblock(chain.hashes[10])
+            chain.calls.clear()
+            await client.getblock(chain.hashes[10])
+            assert chain.calls == []
+            assert client.cache.get_stats()["hits"] == 1
+            await client.close()
@@ -3,10 +3,12 @@
 Tests for the EvrmoreClient class.
 """
 
+import gc
 import os
+import json
 import pytest
 import asyncio
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import patch, MagicMock, AsyncMock, mock_open
 
 from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
 
@@ -29,7 +31,8 @@ class TestEvrmoreClient:
         with patch('requests.Session.post') as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"result": "test_result", "error": None, "id": 1}
+            mock_response.content = json.dumps({"result": "test_result", "error": None,
+                                                "id": 1}).encode()
             mock_post.return_value = mock_response
             
             client = EvrmoreClient()
@@ -48,11 +51,11 @@ class TestEvrmoreClient:
             mock_response = AsyncMock()
             mock_response.status = 200
             
-            # Set up the json method to return a coroutine that returns the result
-            async def mock_json():
-                return {"result": "test_result", "error": None, "id": 1}
+            # Set up the read method to return a coroutine that returns the body
+            async def mock_read():
+                return json.dumps({"result": "test_result", "error": None, "id": 1}).encode()
             
-            mock_response.json = mock_json
+            mock_response.read = mock_read
             mock_context = AsyncMock()
             mock_context.__aenter__.return_value = mock_response
             mock_post.return_value = mock_context
@@ -70,11 +73,11 @@ class TestEvrmoreClient:
         with patch('requests.Session.post') as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
+            mock_response.content = json.dumps({
                 "result": None, 
                 "error": {"code": -1, "message": "Test error"}, 
                 "id": 1
-            }
+            }).encode()
             mock_post.return_value = mock_response
             
             client = EvrmoreClient()
@@ -85,6 +88,130 @@ class TestEvrmoreClient:
             
             assert "Test error" in str(excinfo.value)
     
+    def test_auto_mode_sync_single_request(self):
+        """Test that auto mode sends exactly one request when used synchronously."""
+        with patch('requests.Session.post') as mock_post, \
+             patch('aiohttp.ClientSession.post') as mock_async_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps({"result": 100, "error": None, "id": 1}).encode()
+            mock_post.return_value = mock_response
+            
+            client = EvrmoreClient().reset()
+            result = client.getblockcount()
+            mock_post.assert_not_called()
+            
+            assert result == 100
+            assert result + 1 == 101
+            mock_post.assert_called_once()
+            mock_async_post.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_auto_mode_async_single_request(self):
+        """Test that awaiting in auto mode does not also make a sync request."""
+        with patch('requests.Session.post') as mock_post, \
+             patch('aiohttp.ClientSession.post') as mock_async_post:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+            
+            async def mock_read():
+                return json.dumps({"result": 100, "error": None, "id": 1}).encode()
+            
+            mock_response.read = mock_read
+            mock_context = AsyncMock()
+            mock_context.__aenter__.return_value = mock_response
+            mock_async_post.return_value = mock_context
+            
+            client = EvrmoreClient().reset()
+            assert await client.getblockcount() == 100
+            mock_async_post.assert_called_once()
+            mock_post.assert_not_called()
+            await client.close()
+    
+    def test_auto_mode_detected_at_construction(self):
+        """Test that a client made with async_mode=None fixes its mode from the context."""
+        assert EvrmoreClient()._async_mode is False
+        with patch.object(EvrmoreClient, 'execute_command_sync', return_value=100):
+            assert type(EvrmoreClient().getblockcount()) is int
+    
+    def test_auto_mode_runs_state_changing_calls(self):
+        """Test that state-changing calls in auto mode run even when the result is never used."""
+        with patch.object(EvrmoreClient, 'execute_command_sync', return_value="txid") as mock_sync:
+            client = EvrmoreClient().reset()
+            client.sendtoaddress("EXaddr", 1)
+            mock_sync.assert_called_once_with("sendtoaddress", "EXaddr", 1, fields=None)
+            client.getblockcount()
+            assert mock_sync.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_auto_mode_warns_on_dropped_call(self):
+        """Test that a state-changing call dropped unused in async code warns that it never ran."""
+        with patch.object(EvrmoreClient, 'execute_command_sync') as mock_sync, \
+             patch.object(EvrmoreClient, 'execute_command_async',
+                          AsyncMock(return_value=True)) as mock_async:
+            client = EvrmoreClient().reset()
+            with pytest.warns(RuntimeWarning, match="lockunspent was neither awaited nor used"):
+                client.lockunspent(False, [])
+                gc.collect()
+            assert await client.lockunspent(True, []) is True
+            mock_sync.assert_not_called()
+            mock_async.assert_called_once()
+    
+    def test_pool_defaults_from_config(self):
+        """Test that pool sizing is derived from evrmore.conf."""
+        mock_config_content = """
+        rpcthreads=8
+        rpcworkqueue=32
+        rpcservertimeout=30
+        """
+        with patch('pathlib.Path.exists', return_value=True):
+            with patch('builtins.open', mock_open(read_data=mock_config_content)):
+                client = EvrmoreClient(rpcuser="user", rpcpassword="pass")
+        
+        assert client.pool_maxsize == 40
+        assert client.pool_maxsize_per_host == 40
+        assert client.keepalive_timeout == 29
+        
+        client.initialize_sync()
+        adapter = client.sync_session.get_adapter(client.url)
+        assert adapter._pool_maxsize == 40
+        client.close_sync()
+    
+    def test_pool_explicit_options(self):
+        """Test explicit pool options override config-derived defaults."""
+        client = EvrmoreClient(pool_maxsize=64, pool_maxsize_per_host=32, keepalive_timeout=5,
+                               tcp_nodelay=False)
+        assert client.pool_maxsize == 64
+        assert client.pool_maxsize_per_host == 32
+        
+        client.initialize_sync()
+        adapter = client.sync_session.get_adapter(client.url)
+        assert adapter._pool_maxsize == 64
+        assert adapter.poolmanager.connection_pool_kw['socket_options'] == []
+        client.close_sync()
+    
+    @pytest.mark.asyncio
+    async def test_pool_async_connector(self):
+        """Test that the aiohttp connector is sized from the pool options."""
+        client = EvrmoreClient(pool_maxsize=64, pool_maxsize_per_host=32, keepalive_timeout=5)
+        await client.initialize_async()
+        connector = client.async_session.connector
+        assert connector.limit == 64
+        assert connector.limit_per_host == 32
+        await client.close()
+    
+    def test_prewarm_sync(self):
+        """Test that prewarming issues the requested number of calls."""
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps({"result": 1, "error": None, "id": 1}).encode()
+            mock_post.return_value = mock_response
+            
+            client = EvrmoreClient(prewarm_connections=3)
+            client.initialize_sync()
+            assert mock_post.call_count == 3
+    
     def test_reset(self):
         """Test client reset."""
         client = EvrmoreClient()
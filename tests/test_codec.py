@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the pluggable JSON codecs.
+"""
+
+import json
+import pytest
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+from evrmore_rpc import EvrmoreClient
+from evrmore_rpc.codec import get_codec, StdlibCodec, OrjsonCodec, CODECS, orjson
+
+BODY = (b'{"result": {"value": 1250.12345678, "difficulty": 35541.7389460212, "height": 5},'
+        b' "error": null, "id": 1}')
+
+BLOCKCHAIN = (b'{"result": {"difficulty": 35541.73894602, "verificationprogress": 0.99999999,'
+              b' "blocks": 5},'
+              b' "error": null, "id": 1}')
+
+
+class TestCodec:
+    """Tests for codec selection and number handling."""
+
+    def test_auto_prefers_fast_codec(self):
+        """Test that auto picks an installed fast codec for float mode."""
+        codec = get_codec("auto")
+        if orjson is not None:
+            assert isinstance(codec, OrjsonCodec)
+        assert codec.loads(BODY)["result"]["height"] == 5
+
+    def test_exact_modes_use_stdlib(self):
+        """Test that decimal and satoshis modes use the stdlib codec."""
+        assert isinstance(get_codec("auto", "decimal"), StdlibCodec)
+        assert isinstance(get_codec("auto", "satoshis"), StdlibCodec)
+        if orjson is not None:
+            with pytest.raises(ValueError):
+                get_codec("orjson", "decimal")
+
+    def test_unknown_codec(self):
+        """Test that unknown names and modes are rejected."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+        with pytest.raises(ValueError):
+            get_codec("json", "fixed")
+
+    def test_decimal_numbers(self):
+        """Test that amounts decode as exact Decimals."""
+        result = get_codec("json", "decimal").loads(BODY)["result"]
+        assert result["value"] == Decimal("1250.12345678")
+        assert result["difficulty"] == Decimal("35541.7389460212")
+        assert result["height"] == 5
+
+    def test_satoshi_numbers(self):
+        """Test that amounts, by key or command, decode as integer satoshis and nothing else."""
+        codec = get_codec("json", "satoshis")
+        result = codec.loads(BODY)["result"]
+        assert result["value"] == 125012345678
+        assert isinstance(result["difficulty"], float)
+        info = codec.loads(BLOCKCHAIN)["result"]
+        assert info == {"difficulty": 35541.73894602, "verificationprogress": 0.99999999,
+                        "blocks": 5}
+        assert isinstance(info["difficulty"], float)
+        entry = codec.loads(b'{"fee": 0.00000001, "fees": {"base": 21000000000.00000000},'
+                            b' "balance": 7}')
+        assert entry == {"fee": 1, "fees": {"base": 2100000000000000000}, "balance": 7}
+        body = codec.loads(b'{"result": 35541.73894602, "error": null, "id": 1}')
+        assert codec.convert_result("getbalance", body["result"]) == 3554173894602
+        assert codec.convert_result("getdifficulty", body["result"]) == 35541.73894602
+
+    @pytest.mark.parametrize("name", [name for name in CODECS
+                                      if name == "json" or name == "orjson" and orjson])
+    def test_dumps_round_trip(self, name):
+        """Test that payloads encode to bytes, including Decimal params."""
+        codec = get_codec(name)
+        data = codec.dumps({"method": "sendtoaddress", "params": ["addr", Decimal("1.5")], "id": 1})
+        assert isinstance(data, bytes)
+        assert json.loads(data)["params"] == ["addr", 1.5]
+        exact = Decimal("21000000000.00000001")
+        data = codec.dumps({"params": [exact, (1, 2), 0.5, {"fee": Decimal("1E-8")}]})
+        assert data == b'{"params":[21000000000.00000001,[1,2],0.5,{"fee":0.00000001}]}'
+        assert json.loads(data, parse_float=Decimal)["params"][0] == exact
+        data = codec.dumps({"params": ["0", '"1"', (Decimal("-2.50"),), "\u00e9"]})
+        assert data == b'{"params":["0","\\"1\\"",[-2.50],"\\u00e9"]}'
+        with pytest.raises(TypeError):
+            codec.dumps({"params": [object()]})
+
+
+class TestClientCodec:
+    """Tests for codec use in EvrmoreClient."""
+
+    def test_client_posts_encoded_bytes(self):
+        """Test that the client sends pre-encoded bytes and decodes with its codec."""
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = BODY
+            mock_post.return_value = mock_response
+
+            client = EvrmoreClient(async_mode=False, json_numbers="decimal")
+            result = client.getblock("00ab")
+
+            assert result["value"] == Decimal("1250.12345678")
+            sent = mock_post.call_args.kwargs["data"]
+            assert isinstance(sent, bytes)
+            assert json.loads(sent)["method"] == "getblock"
+
+    def test_client_satoshi_results(self):
+        """Test that bare results are amounts only for commands that return one."""
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = b'{"result": 35541.73894602, "error": null, "id": 1}'
+            mock_post.return_value = mock_response
+
+            client = EvrmoreClient(async_mode=False, json_numbers="satoshis")
+            assert client.getbalance() == 3554173894602
+            assert client.getdifficulty() == 35541.73894602
+
+    def test_client_invalid_json(self):
+        """Test that undecodable bodies raise EvrmoreRPCError."""
+        from evrmore_rpc import EvrmoreRPCError
+
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = b"<html>"
+            mock_post.return_value = mock_response
+
+            client = EvrmoreClient(async_mode=False)
+            with pytest.raises(EvrmoreRPCError):
+                client.getblockcount()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for the compact address index tables.
+"""
+
+import hashlib
+import random
+import sys
+import pytest
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreClient
+from evrmore_rpc.compact import DeltaRow, DeltaTable, UtxoRow, UtxoTable
+from evrmore_rpc.utils import AwaitableResult
+
+
+def txid(i):
+    return hashlib.sha256(str(i).encode()).hexdigest()
+
+
+def utxos(count):
+    return [{"address": f"EXaddr{i % 3}", "txid": txid(i), "outputIndex": i % 4,
+             "script": f"76a914{i % 3:040d}88ac", "satoshis": 100_000_000 + i,
+             "height": 1000 + i // 2}
+            for i in range(count)]
+
+
+def deltas(count):
+    return [{"satoshis": (-1) ** i * (5000 + i), "txid": txid(i), "index": i % 2,
+             "blockindex": i % 7,
+             "height": 2000 + i, "address": "EXaddr0"} for i in range(count)]
+
+
+class FakeStream:
+    """Stands in for client.stream(): yields the records with for and async for."""
+
+    def __init__(self, records):
+        self.records = records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    async def __aiter__(self):
+        for record in self.records:
+            yield record
+
+
+class TestUtxoTable:
+    """Tests for UtxoTable."""
+
+    def test_rows_round_trip(self):
+        """Test that rows come back equal to the RPC's dicts, by index, slice and iteration."""
+        records = utxos(100)
+        table = UtxoTable(records)
+        assert len(table) == 100
+        assert table.to_records() == records
+        assert isinstance(table[0], UtxoRow) and table[0].to_dict() == records[0]
+        assert table[-1].txid == records[-1]["txid"]
+        assert [row.satoshis for row in table[10:20]] == [r["satoshis"] for r in records[10:20]]
+        assert table.column("script") == [r["script"] for r in records]
+        assert table.column("txid")[5] == records[5]["txid"]
+        assert table[3] == UtxoTable(records)[3]
+        with pytest.raises(IndexError):
+            table[100]
+
+    def test_memory(self):
+        """Test that the columns take a small fraction of the dicts' size."""
+        records = utxos(1000)
+        table = UtxoTable(records)
+        dicts = sum(sys.getsizeof(r) + sys.getsizeof(r["txid"]) for r in records)
+        assert table.nbytes < 60 * 1000
+        assert table.nbytes * 5 < dicts
+
+    def test_total_and_by_address(self):
+        """Test the column sums."""
+        records = utxos(300)
+        table = UtxoTable(records)
+        assert table.total() == sum(r["satoshis"] for r in records)
+        expected = {}
+        for r in records:
+            expected[r["address"]] = expected.get(r["address"], 0) + r["satoshis"]
+        assert table.totals_by_address() == expected
+
+    @pytest.mark.parametrize("shuffle", [False, True])
+    def test_filter(self, shuffle):
+        """Test height and address filters, on sorted (bisect) and unsorted (scan) tables."""
+        records = utxos(500)
+        if shuffle:
+            random.Random(7).shuffle(records)
+        table = UtxoTable(records)
+        assert table.sorted is not shuffle
+
+        def expect(test):
+            return [r for r in records if test(r)]
+
+        assert table.filter(min_height=1100, max_height=1149).to_records() == \
+            expect(lambda r: 1100 <= r["height"] <= 1149)
+        assert table.filter(max_height=1010).to_records() == expect(lambda r: r["height"] <= 1010)
+        assert table.filter(min_height=1200, address="EXaddr1").to_records() == \
+            expect(lambda r: r["height"] >= 1200 and r["address"] == "EXaddr1")
+        assert len(table.filter(address="EXnobody")) == 0
+        assert table.filter() is table
+
+    def test_take_and_numbers(self):
+        """Test that take keeps the order given, and number columns are arrays."""
+        table = UtxoTable(utxos(10))
+        picked = table.take([9, 0, 5])
+        assert [row.txid for row in picked] == [txid(9), txid(0), txid(5)]
+        assert not picked.sorted
+        assert table.satoshis.typecode == "q"
+        assert list(table.heights) == [1000 + i // 2 for i in range(10)]
+
+    def test_bad_entry_rolls_back(self):
+        """Test that a failed extend leaves the table as it was."""
+        table = UtxoTable(utxos(5))
+        bad = utxos(8)[5:]
+        bad[2] = dict(bad[2], txid="not hex")
+        with pytest.raises(ValueError):
+            table.extend(bad)
+        assert len(table) == 5 and len(table.satoshis) == 5
+        table.append(utxos(6)[5])
+        assert table.to_records() == utxos(6)
+
+
+class TestDeltaTable:
+    """Tests for DeltaTable."""
+
+    def test_signed_amounts(self):
+        """Test that negative deltas are kept and summed into the net change."""
+        records = deltas(50)
+        table = DeltaTable(records)
+        assert isinstance(table[1], DeltaRow) and table[1].satoshis < 0
+        assert table.to_records() == records
+        assert table.total() == sum(r["satoshis"] for r in records)
+        assert table.filter(min_height=2040).total() == sum(r["satoshis"] for r in records[40:])
+
+
+class TestClientTables:
+    """Tests for client.utxo_table and client.delta_table."""
+
+    def test_sync(self):
+        """Test that the streamed result fills a table, with the address list built for the call."""
+        records = utxos(20)
+        with patch.object(EvrmoreClient, 'stream', return_value=FakeStream(records)) as stream:
+            table = EvrmoreClient(async_mode=False).utxo_table("EXaddr0")
+        stream.assert_called_once_with("getaddressutxos", {"addresses": ["EXaddr0"]})
+        assert isinstance(table, UtxoTable) and table.to_records() == records
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        """Test that async mode fills the table with async for, in chunks."""
+        records = deltas(2500)
+        with patch.object(EvrmoreClient, 'stream', return_value=FakeStream(records)) as stream:
+            table = await EvrmoreClient(async_mode=True).delta_table(["EXaddr0"], 10, 20)
+        stream.assert_called_once_with("getaddressdeltas",
+                                       {"addresses": ["EXaddr0"], "start": 10, "end": 20})
+        assert table.to_records() == records
+
+    @pytest.mark.asyncio
+    async def test_auto_mode(self):
+        """Test that auto mode returns an AwaitableResult."""
+        with patch.object(EvrmoreClient, 'stream', return_value=FakeStream(utxos(3))):
+            client = EvrmoreClient()
+            client.reset()
+            result = client.utxo_table(["EXaddr0"])
+            assert isinstance(result, AwaitableResult)
+            assert len(await result) == 3
@@ -71,6 +71,32 @@ class TestEvrmoreConfig:
             assert host == '127.0.0.1'
             assert port == 18819
     
+    def test_get_rpc_server_limits(self):
+        """Test getting RPC server capacity settings."""
+        mock_config_content = """
+        rpcthreads=8
+        rpcworkqueue=64
+        """
+        with patch('pathlib.Path.exists', return_value=True):
+            with patch('builtins.open', mock_open(read_data=mock_config_content)):
+                config = EvrmoreConfig()
+                assert config.get_rpc_server_limits() == {'rpcthreads': 8, 'rpcworkqueue': 64}
+        
+        with patch('pathlib.Path.exists', return_value=False):
+            assert EvrmoreConfig().get_rpc_server_limits() == {}
+    
+    def test_get_rpc_server_limits_skips_bad_values(self):
+        """Test that values that are not integers are skipped with a warning."""
+        mock_config_content = """
+        rpcthreads=8 # tuned
+        rpcworkqueue=64
+        """
+        with patch('pathlib.Path.exists', return_value=True):
+            with patch('builtins.open', mock_open(read_data=mock_config_content)):
+                config = EvrmoreConfig()
+                with pytest.warns(RuntimeWarning, match="rpcthreads"):
+                    assert config.get_rpc_server_limits() == {'rpcworkqueue': 64}
+    
     def test_get_rpc_credentials_from_config(self):
         """Test getting RPC credentials from config file."""
         mock_config_content = """
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent disk cache tier.
+"""
+
+import asyncio
+import multiprocessing
+import sqlite3
+import threading
+import pytest
+
+from evrmore_rpc import EvrmoreClient, ResponseCache, DiskCache
+from evrmore_rpc.cache import MISS
+from evrmore_rpc.codec import get_codec
+from test_cache import FakeChain
+
+
+def _write_entries(path, start, count):
+    disk = DiskCache(path)
+    for i in range(start, start + count):
+        disk.put(f"key{i}", b"x" * 1000)
+    disk.close()
+
+
+class TestDiskCache:
+    """Tests for DiskCache storage, eviction and compaction."""
+
+    def test_roundtrip_and_compression(self, tmp_path):
+        """Test that large responses are compressed and read back intact."""
+        disk = DiskCache(tmp_path / "cache.db")
+        data = b'{"tx":[' + b'"ab",' * 1000 + b'"ab"]}'
+        disk.put("big", data)
+        disk.put("small", b"1")
+        assert disk.get("big") == data
+        assert disk.get("small") == b"1"
+        assert disk.get("missing") is None
+        assert disk.get_stats()["bytes"] < len(data)
+        disk.close()
+
+    def test_evicts_oldest_over_budget(self, tmp_path):
+        """Test that the oldest entries go first once max_bytes is exceeded."""
+        disk = DiskCache(tmp_path / "cache.db", max_bytes=10_000, compress=False)
+        for i in range(15):
+            disk.put(f"key{i}", b"x" * 1000)
+        assert disk.get_stats()["bytes"] <= 10_000
+        assert disk.get("key0") is None
+        assert disk.get("key14") is not None
+        assert disk.evictions > 0
+        disk.compact()
+        disk.close()
+
+    def test_replace_keeps_running_total(self, tmp_path):
+        """Test that overwriting a key replaces its size in the total instead of adding to it."""
+        disk = DiskCache(tmp_path / "cache.db", max_bytes=10_000, compress=False)
+        for _ in range(20):
+            disk.put("key", b"x" * 1000)
+        disk.put("key", b"x" * 10)
+        assert disk.get_stats()["bytes"] == 10
+        assert disk.evictions == 0
+        other = DiskCache(tmp_path / "cache.db")
+        other.put("other", b"y" * 100)
+        assert disk.get_stats()["bytes"] == 110
+        disk.clear()
+        assert other.get_stats()["bytes"] == 0
+        disk.close()
+        other.close()
+
+    def test_rejects_unknown_schema(self, tmp_path):
+        """Test that a database from another schema version is not opened."""
+        path = tmp_path / "cache.db"
+        conn = sqlite3.connect(str(path))
+        conn.execute("PRAGMA user_version = 2")
+        conn.close()
+        with pytest.raises(ValueError, match="schema 2"):
+            DiskCache(path)
+
+    def test_counters_across_threads(self, tmp_path):
+        """Test that lookups from many threads are all counted."""
+        disk = DiskCache(tmp_path / "cache.db")
+        disk.put("key", b"1")
+
+        def lookups():
+            for _ in range(200):
+                disk.get("key")
+                disk.get("missing")
+
+        threads = [threading.Thread(target=lookups) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = disk.get_stats()
+        assert stats["hits"] == stats["misses"] == 1600
+        disk.close()
+
+    def test_survives_reopen(self, tmp_path):
+        """Test that entries persist across instances."""
+        _write_entries(tmp_path / "cache.db", 0, 3)
+        disk = DiskCache(tmp_path / "cache.db")
+        assert len(disk) == 3
+        assert [key for key, _ in disk.iter_recent()] == ["key2", "key1", "key0"]
+        disk.close()
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test that several processes can write the same database."""
+        path = tmp_path / "cache.db"
+        DiskCache(path).close()
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_write_entries, args=(path, i * 50, 50)) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            assert worker.exitcode == 0
+        disk = DiskCache(path)
+        assert len(disk) == 150
+        disk.close()
+
+
+class TestResponseCacheDiskTier:
+    """Tests for ResponseCache with a disk tier."""
+
+    def make_cache(self, path, **kwargs):
+        cache = ResponseCache(tip_poll_interval=None, disk=DiskCache(path), **kwargs)
+        cache.bind(get_codec("json"))
+        cache.set_tip("00" * 32, 100)
+        return cache
+
+    def test_only_hash_keyed_immutables_persist(self, tmp_path):
+        """Test that TIP and height-keyed entries stay in memory only."""
+        cache = self.make_cache(tmp_path / "cache.db")
+        cache.put("getblock", ("aa",), {"hash": "aa", "confirmations": 50})
+        cache.put("getblock", ("bb",), {"hash": "bb", "confirmations": 1})
+        cache.put("getblockhash", (10,), "aa")
+        assert len(cache.disk) == 1
+
+    def test_memory_miss_falls_back_to_disk(self, tmp_path):
+        """Test that a fresh cache serves entries written by an earlier one."""
+        first = self.make_cache(tmp_path / "cache.db")
+        first.put("getrawtransaction", ("tx", True), {"txid": "tx", "confirmations": 10})
+        second = self.make_cache(tmp_path / "cache.db")
+        assert len(second) == 0
+        assert second.get("getrawtransaction", ("tx", True)) == {"txid": "tx", "confirmations": 10}
+        assert second.disk_hits == 1
+        # Promoted to memory
+        assert len(second) == 1
+
+    def test_number_modes_are_separate(self, tmp_path):
+        """Test that satoshi-mode entries are not served to float-mode caches."""
+        sats = ResponseCache(tip_poll_interval=None, disk=DiskCache(tmp_path / "cache.db"))
+        sats.bind(get_codec("json", "satoshis"))
+        sats.put("decoderawtransaction", ("00",), {"vout": [{"value": 100000000}]})
+        floats = self.make_cache(tmp_path / "cache.db")
+        assert floats.get("decoderawtransaction", ("00",)) is MISS
+
+    def test_async_disk_tier_runs_off_the_loop(self, tmp_path):
+        """Test that get_async() and put_async() do the SQLite work in an executor thread."""
+        cache = self.make_cache(tmp_path / "cache.db")
+        threads = []
+        for name in ("get", "put"):
+            method = getattr(cache.disk, name)
+            def record(*args, method=method):
+                threads.append(threading.current_thread())
+                return method(*args)
+            setattr(cache.disk, name, record)
+
+        async def run():
+            await cache.put_async("getrawtransaction", ("tx", True),
+                                  {"txid": "tx", "confirmations": 10})
+            cache.clear()
+            return await cache.get_async("getrawtransaction", ("tx", True))
+
+        assert asyncio.run(run()) == {"txid": "tx", "confirmations": 10}
+        assert len(threads) == 2
+        assert threading.current_thread() not in threads
+        assert cache.disk_hits == 1
+
+    def test_warm_start(self, tmp_path):
+        """Test that warm_start loads the newest disk entries into memory."""
+        first = self.make_cache(tmp_path / "cache.db")
+        for i in range(5):
+            first.put("decoderawtransaction", (f"{i:02x}",), {"n": i})
+        warm = self.make_cache(tmp_path / "cache.db", warm_start=True)
+        assert len(warm) == 5
+        assert warm.get("decoderawtransaction", ("04",)) == {"n": 4}
+        assert warm.disk_hits == 0
+
+    def test_client_restart_skips_node(self, tmp_path):
+        """Test that confirmed blocks are not refetched after a restart."""
+        chain = FakeChain()
+        block_hash = chain.hashes[10]
+        for _ in range(2):
+            cache = ResponseCache(tip_poll_interval=0, disk=DiskCache(tmp_path / "cache.db"))
+            client = EvrmoreClient(async_mode=False, cache=cache)
+            with chain.patch():
+                assert client.getblock(block_hash)["height"] == 10
+        assert chain.calls.count("getblock") == 1
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for lazily validated models.
+"""
+
+import copy
+import pickle
+from decimal import Decimal
+from typing import List
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreClient
+from evrmore_rpc.models import (AddressUtxo, Block, LazyModel, Network, NetworkInfo, lazy,
+                                lazy_class)
+from evrmore_rpc.typed import TypedMethods
+
+BLOCK = {"hash": "00" * 32, "confirmations": 3, "strippedsize": 200, "size": 250, "weight": 800,
+         "height": 7, "version": 1, "versionHex": "00000001", "merkleroot": "ab" * 32,
+         "tx": ["cd" * 32], "time": 1700000000, "mediantime": 1699999000, "nonce": 0,
+         "bits": "1d00ffff", "difficulty": 1.5, "chainwork": "01", "headerhash": "ef" * 32,
+         "mixhash": "12" * 32, "nonce64": 42}
+
+
+class Checked(BaseModel):
+    amount: int
+    label: str = "none"
+
+    @field_validator("amount")
+    @classmethod
+    def positive(cls, value):
+        if value <= 0:
+            raise ValueError("amount must be positive")
+        return value
+
+
+class TestLazyModel:
+    """Tests for lazy()."""
+
+    def test_fields_validated_on_access(self):
+        """Test that only read fields are validated, coerced and kept."""
+        block = lazy(Block, BLOCK)
+        assert isinstance(block, Block) and isinstance(block, LazyModel)
+        assert block.__dict__ == {}
+        assert block.difficulty == Decimal("1.5") and isinstance(block.difficulty, Decimal)
+        assert block.height == 7
+        assert block.__dict__ == {"difficulty": Decimal("1.5"), "height": 7}
+        assert block.model_fields_set == Block.model_validate(BLOCK).model_fields_set
+        assert block.difficulty is block.difficulty
+        assert not block.is_validated
+
+    def test_defaults_and_missing_fields(self):
+        """Test that absent optional fields get defaults and absent required ones raise."""
+        raw = dict(BLOCK)
+        del raw["hash"]
+        block = lazy(Block, raw)
+        assert block.previousblockhash is None
+        assert "previousblockhash" not in block.model_fields_set
+        assert block.height == 7
+        with pytest.raises(ValidationError) as error:
+            block.hash
+        assert error.value.errors()[0]["loc"] == ("hash",)
+
+    def test_invalid_field_raises_on_access(self):
+        """Test that a bad field raises with its location, and other fields still work."""
+        block = lazy(Block, dict(BLOCK, height="tip"))
+        assert block.size == 250
+        with pytest.raises(ValidationError) as error:
+            block.height
+        assert error.value.errors()[0]["loc"] == ("height",)
+        with pytest.raises(ValidationError):
+            block.validate()
+
+    def test_validate(self):
+        """Test that validate() fills every field and keeps values already read or assigned."""
+        block = lazy(Block, BLOCK)
+        block.height
+        block.confirmations = 4
+        assert block.validate() is block
+        assert block.is_validated
+        assert block.confirmations == 4 and block.nonce64 == 42
+        assert set(block.__dict__) == set(Block.model_fields)
+        assert block.validate() is block
+
+    def test_whole_model_operations(self):
+        """Test that ==, repr, dumps, copies and pickles see every field."""
+        eager = Block.model_validate(BLOCK)
+        assert lazy(Block, BLOCK) == eager and eager == lazy(Block, BLOCK)
+        assert lazy(Block, BLOCK) != lazy(Block, dict(BLOCK, height=8))
+        assert lazy(Block, BLOCK) != lazy(AddressUtxo, {})
+        assert repr(lazy(Block, BLOCK)).startswith("LazyBlock(hash=")
+        assert lazy(Block, BLOCK).model_dump() == eager.model_dump()
+        assert lazy(Block, BLOCK).model_dump_json() == eager.model_dump_json()
+        assert dict(lazy(Block, BLOCK)) == dict(eager)
+        assert copy.deepcopy(lazy(Block, BLOCK)) == eager
+        restored = pickle.loads(pickle.dumps(lazy(Block, BLOCK)))
+        assert type(restored) is Block and restored == eager
+
+    def test_nested_models(self):
+        """Test that a nested field is validated into its models when read."""
+        network = {"name": "ipv4", "limited": False, "reachable": True,
+                   "proxy_randomize_credentials": False}
+        info = lazy(NetworkInfo, {"version": 1, "networks": [network]})
+        assert isinstance(info.networks[0], Network) and info.networks[0].proxy is None
+        assert info.localaddresses == []
+
+    def test_field_validators(self):
+        """Test that models with field validators run them per field."""
+        assert lazy_class(Checked).__lazy_fields__["amount"].check is None
+        assert lazy(Checked, {"amount": 5}).amount == 5
+        with pytest.raises(ValidationError, match="amount must be positive"):
+            lazy(Checked, {"amount": 0}).amount
+        assert lazy(Checked, {"amount": 0}).label == "none"
+
+    def test_class_cache_and_input(self):
+        """Test that lazy classes are made once and only dicts are wrapped."""
+        assert lazy_class(Block) is lazy_class(Block)
+        assert type(lazy(Block, BLOCK)) is lazy_class(Block)
+        with pytest.raises(TypeError):
+            lazy(Block, ["not", "a", "dict"])
+
+
+class TestTypedLazy:
+    """Tests for client.typed.lazy."""
+
+    def test_lazy_methods(self):
+        """Test that lists of models are wrapped item by item and other values validated."""
+        results = {
+            "getaddressutxos": [{"address": "EX", "txid": "ab", "outputIndex": 0, "script": "76",
+                                 "satoshis": 5, "height": 9}] * 3,
+            "listaddressesbyasset": {"EXaddr": 1.25},
+            "gettxout": None,
+            "getblock": BLOCK,
+        }
+
+        def execute(self, command, *args, fields=None):
+            return results[command]
+
+        with patch.object(EvrmoreClient, 'execute_command_sync', execute):
+            client = EvrmoreClient(async_mode=False)
+            utxos: List[AddressUtxo] = client.typed.lazy.getaddressutxos({})
+            assert [type(u) for u in utxos] == [lazy_class(AddressUtxo)] * 3
+            assert utxos[0].satoshis == 5 and not utxos[0].is_validated
+            assert client.typed.lazy.listaddressesbyasset("CATS") == {"EXaddr": Decimal("1.25")}
+            assert client.typed.lazy.gettxout("00", 0) is None
+            assert client.typed.lazy.getblock("00") == client.typed.getblock("00")
+            assert client.typed.lazy.mode == "lazy"
+        with pytest.raises(ValueError):
+            TypedMethods(EvrmoreClient(async_mode=False), mode="eager")
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Tests for the client-side concurrency limiters.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from evrmore_rpc import (
+    EvrmoreClient,
+    EvrmoreOverloadError,
+    EvrmoreWorkQueueError,
+    ConcurrencyLimiter,
+    AdaptiveLimiter,
+)
+
+
+async def hold(limiter, seconds, log=None):
+    await limiter.acquire()
+    try:
+        if log is not None:
+            log.append(limiter.in_flight)
+        await asyncio.sleep(seconds)
+    finally:
+        limiter.release(seconds)
+
+
+class TestConcurrencyLimiter:
+    """Tests for ConcurrencyLimiter admission and overflow policies."""
+
+    def test_rejects_bad_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(max_in_flight=0)
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(overflow="drop")
+        with pytest.raises(ValueError):
+            ConcurrencyLimiter(max_queue=-1)
+
+    @pytest.mark.asyncio
+    async def test_caps_in_flight(self):
+        """Test that no more than max_in_flight requests run at once, in FIFO order."""
+        limiter = ConcurrencyLimiter(max_in_flight=3)
+        log = []
+        await asyncio.gather(*(hold(limiter, 0.01, log) for _ in range(20)))
+        assert max(log) == 3
+        stats = limiter.get_stats()
+        assert stats["admitted"] == stats["completed"] == 20
+        assert stats["queued"] == 17
+        assert stats["peak_queue_depth"] == 17
+        assert stats["in_flight"] == stats["queue_depth"] == 0
+        assert stats["wait_ms_max"] > 0
+
+    @pytest.mark.asyncio
+    async def test_fail_fast(self):
+        """Test that overflow="fail" rejects requests beyond the queue."""
+        limiter = ConcurrencyLimiter(max_in_flight=1, max_queue=2, overflow="fail")
+        results = await asyncio.gather(*(hold(limiter, 0.01) for _ in range(5)),
+                                       return_exceptions=True)
+        assert sum(isinstance(r, EvrmoreOverloadError) for r in results) == 2
+        assert limiter.rejected == 2
+
+    @pytest.mark.asyncio
+    async def test_shed_oldest(self):
+        """Test that overflow="shed" drops the oldest waiting request for the newest."""
+        limiter = ConcurrencyLimiter(max_in_flight=1, max_queue=2, overflow="shed")
+        results = await asyncio.gather(*(hold(limiter, 0.01) for _ in range(5)),
+                                       return_exceptions=True)
+        # The first runs; of the four that waited, the two oldest are shed
+        shed = [isinstance(r, EvrmoreOverloadError) for r in results]
+        assert shed == [False, True, True, False, False]
+        assert limiter.shed == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("overflow", ["fail", "shed"])
+    async def test_zero_queue_rejects(self, overflow):
+        """Test that with max_queue=0 requests beyond the window are rejected, even if shedding."""
+        limiter = ConcurrencyLimiter(max_in_flight=2, max_queue=0, overflow=overflow)
+        results = await asyncio.gather(*(hold(limiter, 0.01) for _ in range(4)),
+                                       return_exceptions=True)
+        assert [isinstance(r, EvrmoreOverloadError) for r in results] == [False, False, True, True]
+        assert limiter.rejected == 2 and limiter.shed == 0
+        assert limiter.in_flight == limiter.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_block_waits_for_room(self):
+        """Test that overflow="block" completes every request without exceeding the queue."""
+        limiter = ConcurrencyLimiter(max_in_flight=2, max_queue=3, overflow="block")
+        results = await asyncio.gather(*(hold(limiter, 0.005) for _ in range(12)),
+                                       return_exceptions=True)
+        assert not any(isinstance(r, Exception) for r in results)
+        assert limiter.completed == 12
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """Test that waiting longer than queue_timeout fails and frees the queue entry."""
+        limiter = ConcurrencyLimiter(max_in_flight=1, queue_timeout=0.01)
+        results = await asyncio.gather(hold(limiter, 0.05), hold(limiter, 0.0),
+                                       return_exceptions=True)
+        assert isinstance(results[1], EvrmoreOverloadError)
+        assert limiter.timeouts == 1
+        assert limiter.queue_depth == 0 and limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_removed(self):
+        """Test that a cancelled waiter neither leaks a slot nor blocks the queue."""
+        limiter = ConcurrencyLimiter(max_in_flight=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        assert limiter.in_flight == 0 and limiter.queue_depth == 0
+        await limiter.acquire()
+        assert limiter.in_flight == 1
+
+
+class TestClientLimiter:
+    """Tests for the limiter on EvrmoreClient."""
+
+    def test_true_sizes_to_node(self):
+        """Test that limiter=True uses rpcthreads + rpcworkqueue."""
+        with patch('evrmore_rpc.client.EvrmoreConfig.get_rpc_server_limits',
+                   return_value={"rpcthreads": 8, "rpcworkqueue": 32}):
+            client = EvrmoreClient(async_mode=True, limiter=True)
+        assert client.limiter.limit == 40
+
+    @pytest.mark.asyncio
+    async def test_requests_are_limited(self):
+        """Test that concurrent calls never exceed the limit."""
+        active = []
+        peak = []
+
+        async def send(self, payload, decode=None):
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.005)
+            active.pop()
+            return {"result": 1, "error": None, "id": 1}
+
+        client = EvrmoreClient(async_mode=True, limiter=ConcurrencyLimiter(max_in_flight=4))
+        with patch.object(EvrmoreClient, '_send_async', send):
+            results = await asyncio.gather(*(client.getblockcount() for _ in range(50)))
+        assert results == [1] * 50
+        assert max(peak) == 4
+        assert client.limiter.get_stats()["completed"] == 50
+
+
+def saturate(limiter, latency, error=None, rounds=1):
+    """Fill the window, then complete every request with the same outcome."""
+    for _ in range(rounds):
+        for _ in range(limiter.limit):
+            limiter._in_flight += 1
+        for _ in range(limiter._in_flight):
+            limiter.release(latency, error)
+
+
+class TestAdaptiveLimiter:
+    """Tests for AdaptiveLimiter window control."""
+
+    def test_rejects_bad_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(algorithm="vegas")
+        with pytest.raises(ValueError):
+            AdaptiveLimiter(initial_limit=8, max_limit=4)
+
+    def test_aimd_grows_while_healthy(self):
+        """Test additive increase while the window is full and latency is flat."""
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=10)
+        saturate(limiter, 0.01, rounds=40)
+        assert limiter.limit == 10
+        assert limiter.increases == 6
+
+    def test_aimd_idle_client_does_not_grow(self):
+        """Test that a mostly idle window is not grown."""
+        limiter = AdaptiveLimiter(initial_limit=8)
+        for _ in range(100):
+            limiter._in_flight += 1
+            limiter.release(0.01)
+        assert limiter.limit == 8
+
+    def test_aimd_backs_off_once_per_round_trip(self):
+        """Test multiplicative decrease on work-queue errors, once per cooldown."""
+        limiter = AdaptiveLimiter(initial_limit=20)
+        saturate(limiter, 0.01)
+        saturate(limiter, 10.0, EvrmoreWorkQueueError("Work queue depth exceeded"))
+        assert limiter.limit == 14
+        assert limiter.decreases == 1
+
+    def test_aimd_backs_off_on_latency_spike(self):
+        """Test that latency far above the baseline shrinks the window."""
+        limiter = AdaptiveLimiter(initial_limit=20, latency_tolerance=2.0)
+        saturate(limiter, 0.01)
+        limiter._in_flight += 1
+        limiter.release(0.05)
+        assert limiter.limit == 14
+
+    def test_gradient_follows_latency(self):
+        """Test that gradient grows at flat latency and shrinks when latency climbs."""
+        limiter = AdaptiveLimiter(initial_limit=8, algorithm="gradient", latency_tolerance=1.5)
+        saturate(limiter, 0.01, rounds=20)
+        grown = limiter.limit
+        assert grown > 8
+        saturate(limiter, 0.1, rounds=20)
+        assert limiter.limit < grown
+        assert limiter.get_stats()["algorithm"] == "gradient"
+
+    def test_respects_bounds(self):
+        """Test that the window stays within min_limit and max_limit."""
+        limiter = AdaptiveLimiter(initial_limit=2, min_limit=2, backoff_ratio=0.1)
+        saturate(limiter, 0.01, EvrmoreWorkQueueError("full"))
+        assert limiter.limit == 2
+
+    def test_growth_admits_waiters(self):
+        """Test that growing the window admits queued requests."""
+        async def run():
+            limiter = AdaptiveLimiter(initial_limit=1)
+            await limiter.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0)
+            limiter._resize(2.0)
+            await asyncio.wait_for(waiter, 1)
+            return limiter.in_flight
+        assert asyncio.run(run()) == 2
+
+    @pytest.mark.asyncio
+    async def test_stress_test_reports_convergence(self):
+        """Test that stress_test_async reports the limiter and its history."""
+        async def send(self, payload, decode=None):
+            await asyncio.sleep(0.001)
+            return {"result": 1, "error": None, "id": 1}
+
+        client = EvrmoreClient(async_mode=True,
+                               limiter=AdaptiveLimiter(initial_limit=2, max_limit=8))
+        with patch.object(EvrmoreClient, '_send_async', send), \
+                patch.object(EvrmoreClient, 'initialize_async'):
+            report = await client.stress_test_async(num_calls=200, concurrency=50)
+        assert report["limiter"]["completed"] == 200
+        assert report["limit_history"][0][1] == 2
+        assert report["limiter"]["limit"] > 2
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-generated RPC method table.
+"""
+
+import json
+import pytest
+from unittest.mock import patch, MagicMock
+
+from evrmore_rpc import EvrmoreClient
+from evrmore_rpc.codec import get_codec
+from evrmore_rpc.commands import RPC_COMMANDS, READ_ONLY_COMMANDS
+from evrmore_rpc.methods import METHOD_TABLE, RPCMethod
+
+
+def mock_sync_post(sent):
+    """Patch requests.Session.post, recording each request body."""
+    def post(url, data=None, timeout=None):
+        sent.append(data)
+        response = MagicMock()
+        response.status_code = 200
+        params = json.loads(data)["params"]
+        response.content = json.dumps({"result": params, "error": None, "id": 1}).encode()
+        return response
+    return patch('requests.Session.post', side_effect=post)
+
+
+class TestMethodTable:
+    """Tests for RPCMethod templates and class binding."""
+
+    def test_known_commands_are_bound(self):
+        """Test that every known command is a real method on the class."""
+        assert READ_ONLY_COMMANDS <= RPC_COMMANDS
+        for name in RPC_COMMANDS:
+            assert name in EvrmoreClient.__dict__
+        assert EvrmoreClient.getblockcount.__name__ == "getblockcount"
+
+    def test_existing_attributes_not_overwritten(self):
+        """Test that binding leaves client methods alone."""
+        assert EvrmoreClient.batch.__qualname__ == "EvrmoreClient.batch"
+
+    @pytest.mark.parametrize("codec_name", ["json", "auto"])
+    @pytest.mark.parametrize("args", [(), ("00ab", 2), ({"addresses": ["addr"]},)])
+    def test_template_matches_payload(self, codec_name, args):
+        """Test that template bytes decode to the same payload as a dict."""
+        codec = get_codec(codec_name)
+        data = METHOD_TABLE["getblock"].encode(codec, args, 7)
+        assert json.loads(data) == {"jsonrpc": "1.0", "id": 7, "method": "getblock",
+                                    "params": list(args)}
+
+    def test_name_bytes(self):
+        """Test that method names are precomputed as bytes."""
+        method = RPCMethod("getbestblockhash")
+        assert method.name_bytes == b"getbestblockhash"
+        assert method.prefix.startswith(b'{"jsonrpc":"1.0","method":"getbestblockhash"')
+
+    def test_table_call(self):
+        """Test that a bound method sends its command and arguments."""
+        sent = []
+        with mock_sync_post(sent):
+            client = EvrmoreClient(async_mode=False)
+            assert client.getblockhash(5) == [5]
+            assert json.loads(sent[0])["method"] == "getblockhash"
+
+    def test_unknown_command_falls_back(self):
+        """Test that unknown names still go through dynamic dispatch."""
+        sent = []
+        with mock_sync_post(sent):
+            client = EvrmoreClient(async_mode=False)
+            assert "notarealcommand" not in EvrmoreClient.__dict__
+            assert client.notarealcommand(1, "a") == [1, "a"]
+            assert json.loads(sent[0])["method"] == "notarealcommand"
+
+    def test_ids_are_unique(self):
+        """Test that template and fallback requests share the id sequence."""
+        sent = []
+        with mock_sync_post(sent):
+            client = EvrmoreClient(async_mode=False)
+            client.getblockcount()
+            client.notarealcommand()
+            client.getblockcount()
+            assert [json.loads(data)["id"] for data in sent] == [1, 2, 3]
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Tests for auto-paginating iterators.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
+from evrmore_rpc.paginate import Paginator
+
+
+ASSETS = [f"ASSET{i:04}" for i in range(250)]
+HOLDERS = {f"EAddress{i:04}": float(i) for i in range(45)}
+
+
+@pytest.fixture(autouse=True)
+def join_prefetch_threads():
+    """Let abandoned prefetch threads finish before the next test patches the client."""
+    yield
+    for thread in threading.enumerate():
+        if thread.name.startswith("evrmore-pages"):
+            thread.join(timeout=1)
+
+
+class FakeLister:
+    """Serves list commands by count/start and records the calls made."""
+
+    def __init__(self, delay=0.0, fail_at=None):
+        self.calls = []
+        self.delay = delay
+        self.fail_at = fail_at
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def page(self, command, args):
+        count, start = args[2], args[3]
+        self.calls.append((command, tuple(args)))
+        if self.fail_at is not None and start >= self.fail_at:
+            raise EvrmoreRPCError("RPC error (-1): boom")
+        if command == "listassets":
+            return ASSETS[start:start + count]
+        if command == "listmyassets":
+            return {name: 1.0 for name in ASSETS[start:start + count]}
+        return dict(list(HOLDERS.items())[start:start + count])
+
+    def sync(self, command, *args):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.page(command, args)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    async def async_(self, command, *args):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return self.page(command, args)
+        finally:
+            self.in_flight -= 1
+
+
+class TestSyncPaginator:
+    """Tests for iterating pages synchronously."""
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_all_items(self, prefetch):
+        """Test that every asset is yielded once, in order, whatever the prefetch."""
+        lister = FakeLister()
+        with patch.object(EvrmoreClient, 'execute_command_sync', lister.sync):
+            client = EvrmoreClient(async_mode=False)
+            pages = client.iter_assets("ASSET*", page_size=100, prefetch=prefetch)
+            assert list(pages) == ASSETS
+        assert pages.cursor == 250
+        assert pages.pages == 3
+        assert pages.exhausted
+        assert lister.calls[0] == ("listassets", ("ASSET*", False, 100, 0))
+
+    def test_object_pages(self):
+        """Test that object results yield (key, value) pairs across pages."""
+        lister = FakeLister()
+        with patch.object(EvrmoreClient, 'execute_command_sync', lister.sync):
+            client = EvrmoreClient(async_mode=False)
+            assert dict(client.iter_addresses_by_asset("CATS", page_size=10)) == HOLDERS
+        assert lister.calls[0] == ("listaddressesbyasset", ("CATS", False, 10, 0))
+
+    def test_exact_multiple_of_page_size(self):
+        """Test that a listing ending on a page boundary stops at the empty page."""
+        lister = FakeLister()
+        with patch.object(EvrmoreClient, 'execute_command_sync', lister.sync):
+            client = EvrmoreClient(async_mode=False)
+            assert len(list(client.iter_assets(page_size=50, prefetch=0))) == 250
+        assert len(lister.calls) == 6
+
+    def test_prefetch_bounds_in_flight(self):
+        """Test that at most prefetch + 1 pages are requested ahead."""
+        lister = FakeLister(delay=0.01)
+        with patch.object(EvrmoreClient, 'execute_command_sync', lister.sync):
+            client = EvrmoreClient(async_mode=False)
+            pages = client.iter_assets(page_size=10, prefetch=2)
+            iterator = iter(pages)
+            next(iterator)
+            time.sleep(0.05)
+            assert len(lister.calls) == 3
+            iterator.close()
+        assert lister.peak <= 2
+
+    def test_resume_from_cursor(self):
+        """Test that a saved cursor resumes right after the last item yielded."""
+        lister = FakeLister()
+        with patch.object(EvrmoreClient, 'execute_command_sync', lister.sync):
+            client = EvrmoreClient(async_mode=False)
+            pages = client.iter_assets(page_size=40)
+            first = []
+            for name in pages:
+                first.append(name)
+                if len(first) == 55:
+                    break
+            assert pages.cursor == 55
+            rest = list(client.iter_assets(page_size=40, start=pages.cursor))
+        assert first + rest == ASSETS
+
+    def test_error_keeps_cursor(self):
+        """Test that a failing page raises and leaves the cursor at the last item yielded."""
+        lister = FakeLister(fail_at=100)
+        with patch.object(EvrmoreClient, 'execute_command_sync', lister.sync):
+            client = EvrmoreClient(async_mode=False)
+            pages = client.iter_assets(page_size=50, prefetch=1)
+            seen = []
+            with pytest.raises(EvrmoreRPCError, match="boom"):
+                for name in pages:
+                    seen.append(name)
+        assert seen == ASSETS[:100]
+        assert pages.cursor == 100
+
+    def test_invalid_arguments(self):
+        """Test that out-of-range settings are rejected."""
+        client = EvrmoreClient(async_mode=False)
+        with pytest.raises(ValueError):
+            client.iter_assets(page_size=0)
+        with pytest.raises(ValueError):
+            Paginator(client, "listassets", lambda count, start: (), prefetch=-1)
+
+
+class TestAsyncPaginator:
+    """Tests for iterating pages asynchronously."""
+
+    @pytest.mark.asyncio
+    async def test_all_items(self):
+        """Test that every item is yielded with async for."""
+        lister = FakeLister(delay=0.001)
+        with patch.object(EvrmoreClient, 'execute_command_async', lister.async_):
+            client = EvrmoreClient(async_mode=True)
+            pages = client.iter_asset_balances_by_address("EAddr", page_size=7)
+            balances = [pair async for pair in pages]
+        assert dict(balances) == HOLDERS
+        assert lister.calls[0] == ("listassetbalancesbyaddress", ("EAddr", False, 7, 0))
+
+    @pytest.mark.asyncio
+    async def test_prefetch_overlaps_processing(self):
+        """Test that the next pages are fetched while the caller processes the current one."""
+        lister = FakeLister(delay=0.02)
+        with patch.object(EvrmoreClient, 'execute_command_async', lister.async_):
+            client = EvrmoreClient(async_mode=True)
+            start = time.perf_counter()
+            async for index, name in _enumerate(client.iter_assets(page_size=50, prefetch=2)):
+                if index % 50 == 0:
+                    await asyncio.sleep(0.02)
+            elapsed = time.perf_counter() - start
+        # Six serial fetch + process rounds would take 0.22 s
+        assert elapsed < 0.18
+        assert lister.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_prefetch(self):
+        """Test that breaking out cancels the pages fetched ahead."""
+        lister = FakeLister(delay=0.05)
+        with patch.object(EvrmoreClient, 'execute_command_async', lister.async_):
+            client = EvrmoreClient(async_mode=True)
+            pages = client.iter_my_assets(page_size=10, prefetch=3)
+            iterator = pages.__aiter__()
+            assert await iterator.__anext__() == (ASSETS[0], 1.0)
+            await iterator.aclose()
+        assert lister.in_flight == 0
+        assert pages.cursor == 1
+
+
+async def _enumerate(items):
+    index = 0
+    async for item in items:
+        yield index, item
+        index += 1
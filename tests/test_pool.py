@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the multi-node EvrmoreClientPool.
+"""
+
+import asyncio
+import pytest
+from functools import partial
+
+from evrmore_rpc import (AdaptiveLimiter, ConcurrencyLimiter, EvrmoreClient, EvrmoreClientPool,
+                         EvrmoreConnectionError, EvrmoreRPCError, EvrmoreWorkQueueError)
+
+URLS = ["http://u:p@10.0.0.1:8819", "http://u:p@10.0.0.2:8819", "http://u:p@10.0.0.3:8819"]
+
+
+def make_pool(heights=(100, 100, 100), down=(), **kwargs):
+    """Build a pool whose node clients answer from memory instead of the network."""
+    kwargs.setdefault("async_mode", False)
+    pool = EvrmoreClientPool(URLS, **kwargs)
+    for index, node in enumerate(pool.nodes):
+        def call(command, *args, index=index):
+            if index in down:
+                raise EvrmoreConnectionError("Request failed: connection refused")
+            if command == "getblockcount":
+                return heights[index]
+            if command == "fail":
+                raise EvrmoreRPCError("RPC error (-1): failed")
+            return index
+
+        async def call_async(command, *args, call=call):
+            await asyncio.sleep(0)
+            return call(command, *args)
+
+        def batch(calls, return_exceptions=False, index=index):
+            return [index] * len(calls)
+
+        node.client.execute_command_sync = call
+        node.client.execute_command_async = call_async
+        node.client.execute_batch_sync = batch
+    return pool
+
+
+class TestClientPool:
+    """Tests for node selection, failover and health checks."""
+
+    @pytest.mark.filterwarnings("error::pytest.PytestUnraisableExceptionWarning")
+    def test_invalid_arguments(self):
+        """Test that empty pools and unknown strategies are rejected."""
+        with pytest.raises(ValueError):
+            EvrmoreClientPool([])
+        with pytest.raises(ValueError):
+            EvrmoreClientPool(URLS, strategy="random")
+
+    def test_read_only_calls_spread(self):
+        """Test that idle nodes share read-only calls evenly."""
+        pool = make_pool()
+        picks = [pool.getblockhash(1) for _ in range(30)]
+        assert sorted(picks.count(i) for i in range(3)) == [10, 10, 10]
+
+    def test_least_outstanding(self):
+        """Test that the node with fewest in-flight calls is picked."""
+        pool = make_pool(health_check_interval=None)
+        pool.nodes[0].outstanding = 2
+        pool.nodes[1].outstanding = 1
+        assert pool.getblockhash(1) == 2
+
+    def test_ewma_prefers_fast_node(self):
+        """Test that the ewma strategy prefers the lowest latency node."""
+        pool = make_pool(strategy="ewma", health_check_interval=None)
+        for node, latency in zip(pool.nodes, (0.050, 0.002, 0.030)):
+            node.latency = latency
+        assert all(pool.getblockhash(1) == 1 for _ in range(5))
+
+    def test_failover_on_connection_error(self):
+        """Test that read-only calls move on from an unreachable node."""
+        pool = make_pool(down={0, 1}, health_check_interval=None)
+        assert all(pool.getblockhash(1) == 2 for _ in range(6))
+        stats = pool.get_stats()
+        assert not stats[0]["in_rotation"] and stats[0]["failures"] == 1
+        assert stats[2]["outstanding"] == 0
+
+    def test_all_nodes_down(self):
+        """Test that the connection error is raised once every node failed."""
+        pool = make_pool(down={0, 1, 2}, health_check_interval=None)
+        with pytest.raises(EvrmoreConnectionError):
+            pool.getblockhash(1)
+
+    def test_writes_use_primary_without_failover(self):
+        """Test that state-changing calls go to the primary and are never retried."""
+        pool = make_pool(health_check_interval=None)
+        assert all(pool.sendtoaddress("addr", 1) == 0 for _ in range(3))
+
+        pool = make_pool(down={0}, health_check_interval=None)
+        with pytest.raises(EvrmoreConnectionError):
+            pool.sendtoaddress("addr", 1)
+        # The primary is now cooling down, so the next write goes to node 1
+        assert pool.sendtoaddress("addr", 1) == 1
+
+    def test_rpc_errors_do_not_fail_over(self):
+        """Test that RPC errors are raised without marking the node down."""
+        pool = make_pool(health_check_interval=None)
+        with pytest.raises(EvrmoreRPCError):
+            pool.fail()
+        assert all(s["in_rotation"] and s["failures"] == 0 for s in pool.get_stats())
+
+    def test_lagging_node_leaves_rotation(self):
+        """Test that nodes behind the best height by more than the threshold are skipped."""
+        pool = make_pool(heights=(100, 97, 99), max_height_lag=2)
+        picks = {pool.getblockhash(1) for _ in range(12)}
+        assert picks == {0, 2}
+        assert [s["lagging"] for s in pool.get_stats()] == [False, True, False]
+
+    def test_batches_are_routed_whole(self):
+        """Test that a batch goes to a single node."""
+        pool = make_pool(health_check_interval=None)
+        assert len(set(pool.execute_batch_sync([("getblockhash", 1), ("getblockhash", 2)]))) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_calls(self):
+        """Test async balancing, health checks and failover."""
+        pool = make_pool(heights=(100, 100, 90), down={0}, async_mode=True)
+        await pool.check_health_async()
+        results = await asyncio.gather(*(pool.getblockhash(h) for h in range(10)))
+        assert set(results) == {1}
+        stats = pool.get_stats()
+        assert stats[2]["lagging"] and not stats[0]["in_rotation"]
+        await pool.close()
+
+    def test_stress_test(self):
+        """Test that the built-in stress test runs over the pool."""
+        pool = make_pool(health_check_interval=None)
+        results = pool.stress_test(num_calls=9, command="getblockcount", concurrency=3)
+        assert results["num_calls"] == 9
+        assert sum(s["requests"] for s in pool.get_stats()) == 9
+
+    @pytest.mark.asyncio
+    async def test_limiter_per_node(self):
+        """Test that every node gets its own limiter, reported per node by the stress test."""
+        with pytest.raises(ValueError):
+            make_pool(limiter=ConcurrencyLimiter(max_in_flight=4))
+        pool = make_pool(async_mode=True, health_check_interval=None,
+                         limiter=partial(AdaptiveLimiter, initial_limit=2, max_limit=8))
+        limiters = [node.client.limiter for node in pool.nodes]
+        assert len(set(map(id, limiters))) == 3 and pool.limiter is None
+        assert all(isinstance(limiter, AdaptiveLimiter) for limiter in limiters)
+        results = await pool.stress_test(num_calls=6, command="getblockcount", concurrency=3)
+        assert set(results["node_limiters"]) == set(pool.urls)
+        assert all("limit_history" in report for report in results["node_limiters"].values())
+        await pool.close()
+
+    def test_writes_fail_over_on_full_work_queue(self):
+        """Test that a write rejected with a full work queue moves to the next node."""
+        pool = make_pool(health_check_interval=None)
+        def busy(command, *args):
+            raise EvrmoreWorkQueueError("HTTP error 500: Work queue depth exceeded")
+        pool.nodes[0].client.execute_command_sync = busy
+        assert pool.sendtoaddress("addr", 1) == 1
+
+    def test_has_client_state(self):
+        """Test that the pool sets every client attribute, and private names are never RPC calls."""
+        pool = make_pool(health_check_interval=None)
+        client = EvrmoreClient(url=URLS[0], async_mode=False)
+        assert set(vars(client)) <= set(vars(pool))
+        assert pool.codec is pool.nodes[0].client.codec and pool.retry_policy is None
+        assert pool.url == URLS[0].replace("u:p@", "") and pool.rpcuser == "u"
+        with pytest.raises(AttributeError):
+            pool._not_an_attribute
+        with pytest.raises(AttributeError):
+            client._not_an_attribute
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Tests for field projection.
+"""
+
+import json
+import pytest
+from decimal import Decimal
+from typing import Dict, List, Optional
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from pydantic import BaseModel
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
+from evrmore_rpc.codec import get_codec, simdjson
+from evrmore_rpc.models import TransactionOutput
+from evrmore_rpc.projection import Projection, get_projection
+
+
+BLOCK = {
+    "hash": "00" * 32,
+    "height": 1000,
+    "size": 12345,
+    "tx": [
+        {
+            "txid": f"{i:064x}",
+            "size": 250,
+            "vin": [{"txid": "ab" * 32, "vout": 0, "scriptSig": {"asm": "", "hex": ""}}],
+            "vout": [
+                {"value": 1250.12345678, "n": 0,
+                 "scriptPubKey": {"asm": "OP_DUP", "hex": "76a9", "type": "pubkeyhash",
+                                  "addresses": ["EXaMPLE"]}},
+                {"value": 0.5, "n": 1,
+                 "scriptPubKey": {"asm": "OP_RETURN", "hex": "6a", "type": "nulldata"}},
+            ],
+        }
+        for i in range(3)
+    ],
+}
+
+CODECS = ["json"] + (["simdjson"] if simdjson is not None else [])
+
+
+def envelope(result, error=None):
+    return json.dumps({"result": result, "error": error, "id": 1}).encode()
+
+
+class Tx(BaseModel):
+    txid: str
+    vout: List[TransactionOutput]
+
+
+class BlockTxs(BaseModel):
+    hash: str
+    tx: List[Tx]
+
+
+class MempoolFee(BaseModel):
+    fee: float
+
+
+class TestProjection:
+    """Tests for compiling and applying projections."""
+
+    def test_nested_array_paths(self):
+        """Test selecting fields inside nested arrays."""
+        projection = Projection(["hash", "tx[].txid", "tx[].vout[].value"])
+        result = projection.apply(BLOCK)
+        assert result == {
+            "hash": BLOCK["hash"],
+            "tx": [{"txid": tx["txid"], "vout": [{"value": 1250.12345678}, {"value": 0.5}]}
+                   for tx in BLOCK["tx"]],
+        }
+
+    def test_subtree_kept_whole(self):
+        """Test that a path ending at an object keeps its whole subtree and beats deeper paths."""
+        projection = Projection(["tx[].vout[].scriptPubKey.type", "tx[].vout"])
+        assert projection.apply(BLOCK)["tx"][0]["vout"] == BLOCK["tx"][0]["vout"]
+        assert projection.paths() == ["tx[].vout"]
+
+    def test_missing_fields_skipped(self):
+        """Test that fields absent from the result are left out."""
+        result = Projection(["tx[].vout[].scriptPubKey.addresses"]).apply(BLOCK)
+        assert result["tx"][0]["vout"] == [{"scriptPubKey": {"addresses": ["EXaMPLE"]}},
+                                           {"scriptPubKey": {}}]
+
+    def test_array_result_and_wildcard(self):
+        """Test projecting array results and every member of an object result."""
+        txids = [{"txid": tx["txid"]} for tx in BLOCK["tx"]]
+        assert Projection(["[].txid"]).apply(BLOCK["tx"]) == txids
+        mempool = {"aa": {"fee": 0.1, "size": 200}, "bb": {"fee": 0.2, "size": 300}}
+        assert Projection(["*.fee"]).apply(mempool) == {"aa": {"fee": 0.1}, "bb": {"fee": 0.2}}
+
+    def test_unexpected_shape_passes_through(self):
+        """Test that a result shaped differently from the paths is returned as is."""
+        verbosity_1 = dict(BLOCK, tx=[tx["txid"] for tx in BLOCK["tx"]])
+        assert Projection(["tx[].txid"]).apply(verbosity_1)["tx"] == verbosity_1["tx"]
+
+    def test_invalid_fields(self):
+        """Test that malformed field arguments are rejected."""
+        with pytest.raises(ValueError):
+            Projection(["tx..txid"])
+        with pytest.raises(TypeError):
+            get_projection("tx[].txid")
+        with pytest.raises(TypeError):
+            Projection(dict)
+
+    def test_model_paths(self):
+        """Test deriving paths from a pydantic model, following nested models and lists."""
+        class Entry(BaseModel):
+            fees: Dict[str, MempoolFee]
+            note: Optional[str] = None
+
+        assert Projection(BlockTxs).paths() == [
+            "hash", "tx[].txid", "tx[].vout[].value", "tx[].vout[].n",
+            "tx[].vout[].scriptPubKey.asm", "tx[].vout[].scriptPubKey.hex",
+            "tx[].vout[].scriptPubKey.reqSigs", "tx[].vout[].scriptPubKey.type",
+            "tx[].vout[].scriptPubKey.addresses",
+        ]
+        assert Projection(Entry).tree == {"fees": {"*": {"fee": None}}, "note": None}
+
+    def test_compiled_once(self):
+        """Test that equal field lists share one compiled projection."""
+        assert get_projection(["hash", "tx[].txid"]) is get_projection(("hash", "tx[].txid"))
+        assert get_projection(BlockTxs) is get_projection(BlockTxs)
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_decode(self, codec):
+        """Test decoding and projecting a response body with each codec."""
+        projection = Projection(["height", "tx[].vout[].value"])
+        response = projection.decode(get_codec(codec), envelope(BLOCK))
+        assert response["error"] is None
+        vout = [{"value": 1250.12345678}, {"value": 0.5}]
+        assert response["result"] == {"height": 1000, "tx": [{"vout": vout}] * 3}
+
+    @pytest.mark.parametrize("codec", CODECS)
+    def test_decode_invalid_json(self, codec):
+        """Test that an invalid body raises ValueError like the codecs do."""
+        with pytest.raises(ValueError):
+            Projection(["hash"]).decode(get_codec(codec), b'{"result": [1, 2')
+
+    def test_decode_number_modes(self):
+        """Test that projected amounts follow the codec's number mode."""
+        projection = Projection(["tx[].vout[].value"])
+        response = projection.decode(get_codec("json", numbers="decimal"), envelope(BLOCK))
+        assert response["result"]["tx"][0]["vout"][0]["value"] == Decimal("1250.12345678")
+
+
+class TestClientProjection:
+    """Tests for fields= on client calls."""
+
+    def sync_response(self, body):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = body
+        return response
+
+    def test_sync_fields(self):
+        """Test projecting a result synchronously through a generated method."""
+        with patch('requests.Session.post', return_value=self.sync_response(envelope(BLOCK))):
+            client = EvrmoreClient(async_mode=False)
+            block = client.getblock(BLOCK["hash"], 2, fields=["tx[].txid"])
+        assert block == {"tx": [{"txid": tx["txid"]} for tx in BLOCK["tx"]]}
+
+    def test_sync_model(self):
+        """Test that a model class projects and validates the result."""
+        with patch('requests.Session.post', return_value=self.sync_response(envelope(BLOCK))):
+            client = EvrmoreClient(async_mode=False)
+            block = client.getblock(BLOCK["hash"], 2, fields=BlockTxs)
+        assert isinstance(block, BlockTxs)
+        assert block.tx[0].vout[0].scriptPubKey.addresses == ["EXaMPLE"]
+
+    def test_sync_model_list_result(self):
+        """Test that each element of an array result is validated."""
+        with patch('requests.Session.post', return_value=self.sync_response(envelope(BLOCK["tx"]))):
+            client = EvrmoreClient(async_mode=False)
+            txs = client.execute_command("getrawtransactions", fields=Tx)
+        assert [tx.txid for tx in txs] == [tx["txid"] for tx in BLOCK["tx"]]
+
+    def test_sync_rpc_error(self):
+        """Test that RPC errors still raise with fields set."""
+        body = envelope(None, {"code": -5, "message": "Block not found"})
+        with patch('requests.Session.post', return_value=self.sync_response(body)):
+            client = EvrmoreClient(async_mode=False)
+            with pytest.raises(EvrmoreRPCError, match="Block not found"):
+                client.getblock("ff" * 32, 2, fields=["hash"])
+
+    def test_cache_bypassed(self):
+        """Test that projected results are neither read from nor written to the cache."""
+        response = self.sync_response(envelope(BLOCK))
+        with patch('requests.Session.post', return_value=response) as mock_post:
+            client = EvrmoreClient(async_mode=False, cache=True)
+            client.cache.claim_tip_check = lambda: False
+            client.getblock(BLOCK["hash"], 2, fields=["hash"])
+            assert len(client.cache) == 0
+            assert client.getblock(BLOCK["hash"], 2) == BLOCK
+            assert client.getblock(BLOCK["hash"], 2, fields=["height"]) == {"height": 1000}
+        assert mock_post.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_async_fields(self):
+        """Test projecting a result asynchronously."""
+        response = AsyncMock()
+        response.status = 200
+        response.read.return_value = envelope(BLOCK)
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+
+        with patch('aiohttp.ClientSession.post', return_value=context):
+            client = EvrmoreClient(async_mode=True, auto_batch=True)
+            block = await client.getblock(BLOCK["hash"], 2, fields=["hash", "tx[].vout[].n"])
+            await client.close()
+        assert block == {"hash": BLOCK["hash"], "tx": [{"vout": [{"n": 0}, {"n": 1}]}] * 3}
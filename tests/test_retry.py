@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Tests for the retry policy and circuit breaker.
+"""
+
+import asyncio
+import json
+import time
+import aiohttp
+import pytest
+import requests
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from evrmore_rpc import (
+    EvrmoreClient,
+    EvrmoreRPCError,
+    EvrmoreConnectionError,
+    EvrmoreWorkQueueError,
+    EvrmoreCircuitOpenError,
+    RetryPolicy,
+    CircuitBreaker,
+)
+from evrmore_rpc.commands import is_idempotent
+
+OK = json.dumps({"result": 7, "error": None, "id": 1}).encode()
+
+
+def sync_response(status=200, content=OK, text=""):
+    response = MagicMock()
+    response.status_code = status
+    response.content = content
+    response.text = text
+    return response
+
+
+def mock_sync_post(*outcomes):
+    """Patch requests.Session.post to raise or return each outcome in turn."""
+    return patch('requests.Session.post', side_effect=list(outcomes))
+
+
+class TestRetryPolicy:
+    """Tests for retry classification and backoff."""
+
+    def test_idempotency_table(self):
+        """Test that reads are idempotent and transfers, issues and broadcasts are not."""
+        assert is_idempotent("getblock")
+        assert is_idempotent("lockunspent")
+        for command in ("transfer", "issue", "sendrawtransaction", "sendtoaddress"):
+            assert not is_idempotent(command)
+
+    def test_classification(self):
+        """Test which errors are retried for which commands."""
+        policy = RetryPolicy()
+        connection = EvrmoreConnectionError("Request failed")
+        busy = EvrmoreWorkQueueError("HTTP error 500: Work queue depth exceeded")
+        assert policy.is_retryable(["getblock"], connection)
+        assert not policy.is_retryable(["transfer"], connection)
+        assert not policy.is_retryable(["getblock", "sendrawtransaction"], connection)
+        assert policy.is_retryable(["sendrawtransaction"], busy)
+        assert not policy.is_retryable(["getblock"], EvrmoreRPCError("RPC error (-5): not found"))
+        assert not policy.is_retryable(["getblock"], EvrmoreCircuitOpenError("Circuit open"))
+
+    def test_backoff(self):
+        """Test exponential backoff, the cap, jitter and max_attempts."""
+        policy = RetryPolicy(max_attempts=3, backoff_base=0.1, backoff_max=0.3, jitter=False)
+        error = EvrmoreConnectionError("Request failed")
+        assert [policy.get_delay(n) for n in range(4)] == [0.1, 0.2, 0.3, 0.3]
+        assert policy.next_delay(["getblock"], error, 1) == 0.2
+        assert policy.next_delay(["getblock"], error, 2) is None
+
+        jittered = RetryPolicy(backoff_base=0.1, backoff_max=1.0)
+        assert all(0 <= jittered.get_delay(3) <= 0.8 for _ in range(100))
+
+    def test_invalid_max_attempts(self):
+        """Test that max_attempts must allow at least one attempt."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestClientRetry:
+    """Tests for retries in EvrmoreClient."""
+
+    def test_sync_retries_transient_errors(self):
+        """Test that connection errors and a full work queue are retried."""
+        busy = sync_response(500, text="Work queue depth exceeded")
+        with mock_sync_post(requests.ConnectionError("reset"), busy, sync_response()) as mock_post:
+            client = EvrmoreClient(async_mode=False, retry=RetryPolicy(backoff_base=0))
+            assert client.getblock("00ab") == 7
+            assert mock_post.call_count == 3
+
+    def test_sync_does_not_retry_unsafe_commands(self):
+        """Test that a state-changing command is not resent after a connection error."""
+        with mock_sync_post(requests.ConnectionError("reset"), sync_response()) as mock_post:
+            client = EvrmoreClient(async_mode=False, retry=RetryPolicy(backoff_base=0))
+            with pytest.raises(EvrmoreConnectionError):
+                client.transfer("ASSET", 1, "addr")
+            assert mock_post.call_count == 1
+
+    def test_work_queue_error(self):
+        """Test that a full work queue raises EvrmoreWorkQueueError without a policy."""
+        with mock_sync_post(sync_response(500, text="Work queue depth exceeded")):
+            client = EvrmoreClient(async_mode=False)
+            with pytest.raises(EvrmoreWorkQueueError):
+                client.getblockcount()
+
+    def test_batch_retry(self):
+        """Test that a read-only batch is resent as a whole."""
+        batch = json.dumps([{"result": 1, "error": None, "id": 1},
+                            {"result": 2, "error": None, "id": 2}]).encode()
+        with mock_sync_post(requests.ConnectionError("reset"),
+                            sync_response(content=batch)) as mock_post:
+            client = EvrmoreClient(async_mode=False, retry=RetryPolicy(backoff_base=0))
+            assert client.execute_batch_sync([("getblockhash", 1), ("getblockhash", 2)]) == [1, 2]
+            assert mock_post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_retries_client_error(self):
+        """Test that aiohttp.ClientError is retried for idempotent commands."""
+        def ok_context():
+            response = AsyncMock()
+            response.status = 200
+            response.read = AsyncMock(return_value=OK)
+            context = AsyncMock()
+            context.__aenter__.return_value = response
+            return context
+
+        outcomes = [aiohttp.ClientConnectionError("reset"), ok_context()]
+        with patch('aiohttp.ClientSession.post', side_effect=outcomes) as mock_post:
+            client = EvrmoreClient(async_mode=True, retry=RetryPolicy(backoff_base=0))
+            assert await client.getblockcount() == 7
+            assert mock_post.call_count == 2
+            await client.close()
+
+
+class TestCircuitBreaker:
+    """Tests for the per-node circuit breaker."""
+
+    def test_state_machine(self):
+        """Test closed -> open -> half-open -> closed transitions."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        assert breaker.allow() and breaker.state == CircuitBreaker.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow()
+
+        time.sleep(0.06)
+        assert breaker.allow() and breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.get_stats()["times_opened"] == 1
+
+    def test_half_open_failure_reopens(self):
+        """Test that a failed trial call opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_release_frees_trial_slot(self):
+        """Test that release() frees a half-open trial slot without closing the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.allow() and not breaker.allow()
+        breaker.release()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.get_stats()["consecutive_failures"] == 1
+        assert breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_keeps_circuit_half_open(self):
+        """Test that a cancelled or undecodable trial call is not counted as a success."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        client = EvrmoreClient(async_mode=True, circuit_breaker=breaker)
+        breaker.record_failure()
+        with patch.object(client, "_send_async", AsyncMock(side_effect=asyncio.CancelledError)):
+            with pytest.raises(asyncio.CancelledError):
+                await client.getblockcount()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with mock_sync_post(sync_response(content=b"not json")):
+            with pytest.raises(EvrmoreRPCError):
+                client.execute_command_sync("getblockcount")
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.get_stats()["consecutive_failures"] == 1
+        with mock_sync_post(sync_response()):
+            assert client.execute_command_sync("getblockcount") == 7
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_client_fails_fast(self):
+        """Test that an open circuit stops requests from reaching the node."""
+        errors = [requests.ConnectionError("refused")] * 2
+        with mock_sync_post(*errors) as mock_post:
+            client = EvrmoreClient(async_mode=False,
+                                   circuit_breaker=CircuitBreaker(failure_threshold=2))
+            for _ in range(2):
+                with pytest.raises(EvrmoreConnectionError):
+                    client.getblockcount()
+            with pytest.raises(EvrmoreCircuitOpenError):
+                client.getblockcount()
+            assert mock_post.call_count == 2
+
+    def test_rpc_errors_keep_circuit_closed(self):
+        """Test that errors returned by a live node do not count as failures."""
+        error = json.dumps({"result": None, "error": {"code": -5, "message": "nope"},
+                            "id": 1}).encode()
+        with mock_sync_post(*[sync_response(content=error)] * 3):
+            client = EvrmoreClient(async_mode=False,
+                                   circuit_breaker=CircuitBreaker(failure_threshold=2))
+            for _ in range(3):
+                with pytest.raises(EvrmoreRPCError):
+                    client.getblock("00ab")
+            assert client.circuit_breaker.state == CircuitBreaker.CLOSED
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Tests for single-flight deduplication of identical in-flight calls.
+"""
+
+import asyncio
+import threading
+import time
+import json
+import pytest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
+from evrmore_rpc.singleflight import SingleFlight, call_key
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight primitive."""
+
+    def test_call_key_handles_unhashable_params(self):
+        """Test that keys can be built from list and dict params."""
+        params = ({"addresses": ["a"]},)
+        assert call_key("getaddressutxos", params) == call_key("getaddressutxos", params)
+        assert call_key("getblock", ("00", 1)) != call_key("getblock", ("00", 2))
+
+    def test_sync_threads_share_one_call(self):
+        """Test that concurrent threads asking for the same key execute once."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        executions = []
+
+        def slow():
+            executions.append(1)
+            started.set()
+            release.wait()
+            return "result"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do_sync("k", slow)))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        while flight.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert results == ["result"] * 5
+        assert len(executions) == 1
+        assert flight.get_stats()["coalesced"] == 4
+        assert flight.in_flight() == 0
+
+    def test_sync_exception_shared(self):
+        """Test that followers receive the leader's exception."""
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do_sync("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        # Key is released after failure
+        assert flight.do_sync("k", lambda: 1) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_coalesces(self):
+        """Test that concurrent coroutines share one execution."""
+        flight = SingleFlight()
+        executions = []
+
+        async def fetch():
+            executions.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(flight.do_async("k", fetch) for _ in range(10)))
+        assert results == ["result"] * 10
+        assert len(executions) == 1
+        assert flight.get_stats()["coalesced"] == 9
+
+    @pytest.mark.asyncio
+    async def test_async_cancelled_waiter_does_not_cancel_others(self):
+        """Test that cancelling the first waiter leaves the call running."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        first = asyncio.ensure_future(flight.do_async("k", fetch))
+        second = asyncio.ensure_future(flight.do_async("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        assert await second == "result"
+
+
+class TestClientSingleFlight:
+    """Tests for single-flight on EvrmoreClient."""
+
+    @pytest.mark.asyncio
+    async def test_async_identical_calls_coalesced(self):
+        """Test that identical async read-only calls send one request."""
+        with patch('aiohttp.ClientSession.post') as mock_post:
+            mock_response = AsyncMock()
+            mock_response.status = 200
+
+            async def mock_read():
+                await asyncio.sleep(0.01)
+                return json.dumps({"result": {"hash": "00ab"}, "error": None, "id": 1}).encode()
+
+            mock_response.read = mock_read
+            mock_context = AsyncMock()
+            mock_context.__aenter__.return_value = mock_response
+            mock_post.return_value = mock_context
+
+            client = EvrmoreClient(async_mode=True, single_flight=True)
+            results = await asyncio.gather(*(client.getblock("00ab") for _ in range(5)))
+
+            assert all(r == {"hash": "00ab"} for r in results)
+            mock_post.assert_called_once()
+            assert client.single_flight.get_stats()["coalesced"] == 4
+            await client.close()
+
+    def test_state_changing_calls_not_coalesced(self):
+        """Test that commands with side effects always reach the node."""
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps({"result": "addr", "error": None, "id": 1}).encode()
+            mock_post.return_value = mock_response
+
+            client = EvrmoreClient(async_mode=False, single_flight=True)
+            client.getnewaddress()
+            client.getnewaddress()
+
+            assert mock_post.call_count == 2
+            assert client.single_flight.get_stats()["calls"] == 0
+
+    def test_sync_error_propagates(self):
+        """Test that RPC errors still raise through single-flight."""
+        with patch('requests.Session.post') as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            error = {"code": -5, "message": "Block not found"}
+            mock_response.content = json.dumps({"result": None, "error": error, "id": 1}).encode()
+            mock_post.return_value = mock_response
+
+            client = EvrmoreClient(async_mode=False, single_flight=True)
+            with pytest.raises(EvrmoreRPCError):
+                client.getblock("bad")
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming response parsing.
+"""
+
+import json
+import pytest
+from decimal import Decimal
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from evrmore_rpc import EvrmoreClient, EvrmoreRPCError
+from evrmore_rpc.stream import StreamParser
+
+
+def envelope(result, error=None):
+    return json.dumps({"result": result, "error": error, "id": 1}, indent=1).encode()
+
+
+def parse(body, chunk_size=1, numbers="float", expand=frozenset()):
+    parser = StreamParser(numbers, expand=expand)
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[i:i + chunk_size]))
+    items.extend(parser.close())
+    return items, parser
+
+
+def chunks(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class TestStreamParser:
+    """Tests for StreamParser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, 4096])
+    def test_array_items(self, chunk_size):
+        """Test that array elements are yielded one by one, whatever the chunking."""
+        result = [{"txid": f"{i:064x}", "vout": [{"value": 1.5, "n": 0}]} for i in range(20)]
+        result += [12345, "x", None]
+        items, parser = parse(envelope(result), chunk_size)
+        assert items == result
+        assert parser.kind == "array"
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+    def test_object_members(self, chunk_size):
+        """Test that object results are yielded as (key, value) pairs."""
+        result = {f"{i:064x}": {"size": i, "fee": 0.0001} for i in range(10)}
+        items, parser = parse(envelope(result), chunk_size)
+        assert dict(items) == result
+        assert parser.kind == "object"
+
+    @pytest.mark.parametrize("chunk_size", [1, 4, 4096])
+    def test_expanded_array_members(self, chunk_size):
+        """Test that only expanded array members yield one (key, element) pair per element."""
+        txs = [{"txid": f"{i:064x}", "hex": "ab\\\"]}" * i, "vout": [{"value": 1.5}]}
+               for i in range(5)]
+        block = {"hash": "00" * 32, "height": 7, "tx": txs, "empty": [], "nextblockhash": "11" * 32}
+        items, parser = parse(envelope(block), chunk_size)
+        assert dict(items) == block
+        items, parser = parse(envelope(block), chunk_size, expand={"tx", "hash"})
+        assert items == [("hash", "00" * 32), ("height", 7)] + [("tx", tx) for tx in txs] + [
+            ("empty", []), ("nextblockhash", "11" * 32)]
+        assert parser.kind == "object"
+
+    def test_open_value_decoded_once(self):
+        """Test that a value spanning many chunks is decoded once, when it closes, not per chunk."""
+        vin = [{"txid": "cd" * 32, "scriptSig": {"asm": "[ALL]"}}]
+        element = json.dumps({"hex": "ab" * 50000, "vin": vin})
+        body = b'{"result":[' + element.encode() + b'],"error":null,"id":1}'
+        parser = StreamParser()
+        calls = []
+        raw_decode = parser._decoder.raw_decode
+        parser._decoder.raw_decode = lambda *args: calls.append(1) or raw_decode(*args)
+        items = []
+        for chunk in chunks(body, 100):
+            items.extend(parser.feed(chunk))
+        items.extend(parser.close())
+        assert items == [json.loads(element)]
+        # One failed attempt when the element starts, one decode when it closes, then the envelope
+        assert len(calls) < 10
+
+    def test_scalar_result(self):
+        """Test that scalar results are yielded once."""
+        assert parse(envelope(1234567))[0] == [1234567]
+        assert parse(envelope([]))[0] == []
+
+    def test_error_envelope(self):
+        """Test that the error member is captured and a null result is not yielded."""
+        items, parser = parse(envelope(None, {"code": -5, "message": "Block not found"}))
+        assert items == []
+        assert parser.error == {"code": -5, "message": "Block not found"}
+
+    def test_numbers_split_across_chunks(self):
+        """Test that a number cut at a chunk boundary is not yielded early."""
+        parser = StreamParser()
+        assert parser.feed(b'{"result":[12') == []
+        assert parser.feed(b'34,5') == [1234]
+        assert parser.feed(b'6]') == [56]
+        assert parser.feed(b',"error":null,"id":1}') == []
+        assert parser.close() == []
+
+    def test_multibyte_characters_split(self):
+        """Test that UTF-8 sequences split across chunks decode correctly."""
+        items, _ = parse(envelope(["ÉVR ⚡ asset"]).replace(b"\\u00c9", "É".encode()))
+        assert items == ["ÉVR ⚡ asset"]
+
+    def test_number_modes(self):
+        """Test that the decimal and satoshis modes apply to streamed items."""
+        body = b'{"result":[{"value":1250.12345678}],"error":null,"id":1}'
+        assert parse(body, 4, "decimal")[0] == [{"value": Decimal("1250.12345678")}]
+        assert parse(body, 4, "satoshis")[0] == [{"value": 125012345678}]
+
+    def test_truncated_body(self):
+        """Test that a body cut short raises."""
+        with pytest.raises(EvrmoreRPCError):
+            parse(envelope([1, 2, 3])[:-8], 4)
+        with pytest.raises(EvrmoreRPCError):
+            parse(b'{"result":{"tx":[{"txid":"ab"', 4)
+
+
+class TestClientStream:
+    """Tests for EvrmoreClient.stream()."""
+
+    def sync_response(self, body, status=200):
+        response = MagicMock()
+        response.status_code = status
+        response.text = body.decode()
+        response.iter_content = lambda chunk_size: iter(chunks(body, chunk_size))
+        return response
+
+    def test_sync_stream(self):
+        """Test streaming a large result synchronously."""
+        mempool = {f"{i:064x}": {"size": 250, "fee": 0.0001} for i in range(500)}
+        response = self.sync_response(envelope(mempool))
+        with patch('requests.Session.post', return_value=response) as mock_post:
+            client = EvrmoreClient(async_mode=False)
+            items = client.stream("getrawmempool", True, chunk_size=1024)
+            assert mock_post.call_count == 0
+            assert dict(items) == mempool
+            assert mock_post.call_args.kwargs["stream"] is True
+
+    def test_sync_stream_expand(self):
+        """Test that expand= reaches the parser."""
+        block = {"hash": "00" * 32, "tx": [{"txid": "aa"}, {"txid": "bb"}]}
+        with patch('requests.Session.post', return_value=self.sync_response(envelope(block))):
+            client = EvrmoreClient(async_mode=False)
+            items = list(client.stream("getblock", "00" * 32, 2, chunk_size=8, expand=("tx",)))
+        assert items == [("hash", "00" * 32), ("tx", {"txid": "aa"}), ("tx", {"txid": "bb"})]
+
+    def test_sync_stream_rpc_error(self):
+        """Test that an RPC error in the envelope raises after iteration."""
+        body = envelope(None, {"code": -8, "message": "Invalid parameter"})
+        with patch('requests.Session.post', return_value=self.sync_response(body)):
+            client = EvrmoreClient(async_mode=False)
+            with pytest.raises(EvrmoreRPCError, match="Invalid parameter"):
+                list(client.stream("getrawmempool", True))
+
+    def test_sync_stream_http_error(self):
+        """Test that a non-200 status raises without parsing."""
+        response = self.sync_response(b"Work queue depth exceeded", 500)
+        with patch('requests.Session.post', return_value=response):
+            client = EvrmoreClient(async_mode=False)
+            with pytest.raises(EvrmoreRPCError, match="Work queue"):
+                list(client.stream("getrawmempool"))
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self):
+        """Test streaming a large result asynchronously."""
+        assets = [f"ASSET{i}" for i in range(1000)]
+        body = envelope(assets)
+
+        async def iter_chunked(size):
+            for chunk in chunks(body, size):
+                yield chunk
+
+        response = AsyncMock()
+        response.status = 200
+        response.content.iter_chunked = iter_chunked
+        context = AsyncMock()
+        context.__aenter__.return_value = response
+
+        with patch('aiohttp.ClientSession.post', return_value=context):
+            client = EvrmoreClient(async_mode=True)
+            items = [item async for item in client.stream("listassets", "*", False, chunk_size=100)]
+            await client.close()
+        assert items == assets
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Tests for the sync transports: http.client, Unix domain sockets and thread safety.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import socket
+import socketserver
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from evrmore_rpc import EvrmoreClient, EvrmoreConfig, EvrmoreConnectionError, EvrmoreWorkQueueError
+from evrmore_rpc.transport import HTTPClientSession, PerThreadSession, UnixSocketAdapter
+
+
+class RPCHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        # Drop idle keep-alive connections after idle_timeout, without notice
+        self.timeout = self.server.idle_timeout
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.auth.append(self.headers.get("Authorization"))
+        method = request["method"]
+        if method == "slow":
+            time.sleep(0.02)
+        if method == "overloaded":
+            status, body = 500, b"Work queue depth exceeded"
+        elif method == "getrawmempool":
+            mempool = {f"{i:064x}": {"fee": 0.0001} for i in range(300)}
+            body = json.dumps({"result": mempool, "error": None, "id": request["id"]}).encode()
+            status = 200
+        else:
+            body = json.dumps({"result": 1000, "error": None, "id": request["id"]}).encode()
+            status = 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.server.close_after_response:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class UnixRPCHandler(RPCHandler):
+    # TCP_NODELAY does not apply to Unix sockets
+    disable_nagle_algorithm = False
+
+
+class UnixHTTPServer(ThreadingHTTPServer):
+    address_family = socket.AF_UNIX
+    # A full Unix socket backlog refuses connections instead of queueing SYNs
+    request_queue_size = 64
+
+    def server_bind(self):
+        # HTTPServer.server_bind expects a (host, port) address
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = "localhost", 0
+
+
+def start_server(server):
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.auth = []
+    server.close_after_response = False
+    server.idle_timeout = None
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def server():
+    server = start_server(ThreadingHTTPServer(("127.0.0.1", 0), RPCHandler))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def unix_server(tmp_path):
+    server = start_server(UnixHTTPServer(str(tmp_path / "rpc.sock"), UnixRPCHandler))
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(server, transport="http.client", **kwargs):
+    host, port = server.server_address
+    return EvrmoreClient(url=f"http://{host}:{port}", rpcuser="user", rpcpassword="pass",
+                         async_mode=False, transport=transport, **kwargs)
+
+
+class TestHTTPClientTransport:
+    """Tests for EvrmoreClient(transport="http.client")."""
+
+    def test_calls_reuse_one_connection(self, server):
+        """Test that sequential calls share one connection and a prebuilt auth header."""
+        client = make_client(server)
+        assert client.sync_session is None
+        for _ in range(20):
+            assert client.getblockcount() == 1000
+        assert isinstance(client.sync_session, HTTPClientSession)
+        assert server.connections == 1
+        assert set(server.auth) == {"Basic " + base64.b64encode(b"user:pass").decode()}
+        client.close_sync()
+
+    def test_reconnects_after_server_close(self, server):
+        """Test that a connection closed by the node is replaced transparently."""
+        server.close_after_response = True
+        client = make_client(server)
+        for _ in range(3):
+            assert client.getblockcount() == 1000
+        assert server.connections == 3
+
+    def test_replaces_idle_connection_dropped_by_node(self, server):
+        """Test that an idle connection the node dropped silently is detected before reuse."""
+        server.idle_timeout = 0.1
+        client = make_client(server)
+        assert client.getblockcount() == 1000
+        time.sleep(0.3)
+        assert client.getblockcount() == 1000
+        assert server.connections == 2
+
+    def test_threads_share_session(self, server):
+        """Test that concurrent threads each get their own connection from the pool."""
+        client = make_client(server, pool_maxsize=4)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda _: client.getblockcount(), range(200)))
+        assert results == [1000] * 200
+        assert server.connections <= 8
+        assert len(client.sync_session._idle) <= 4
+
+    def test_http_error(self, server):
+        """Test that non-200 responses map to the same errors as the requests transport."""
+        client = make_client(server)
+        with pytest.raises(EvrmoreWorkQueueError):
+            client.execute_command("overloaded")
+        assert client.getblockcount() == 1000
+
+    def test_stream(self, server):
+        """Test that client.stream() works over the transport and reuses the connection."""
+        client = make_client(server)
+        assert len(dict(client.stream("getrawmempool", True, chunk_size=512))) == 300
+        assert client.getblockcount() == 1000
+        assert server.connections == 1
+
+    def test_connection_refused(self):
+        """Test that an unreachable node raises EvrmoreConnectionError."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = EvrmoreClient(url=f"http://127.0.0.1:{port}", rpcuser="u", rpcpassword="p",
+                               async_mode=False, transport="http.client")
+        with pytest.raises(EvrmoreConnectionError):
+            client.getblockcount()
+
+    def test_unknown_transport(self):
+        """Test that an unknown transport name is rejected."""
+        with pytest.raises(ValueError):
+            EvrmoreClient(async_mode=False, transport="urllib")
+
+
+class TestUnixSocket:
+    """Tests for unix:///path URLs."""
+
+    @pytest.mark.parametrize("transport", ["requests", "http.client"])
+    def test_sync_transports(self, unix_server, transport):
+        """Test that both sync transports reach the node over the socket and keep it open."""
+        client = EvrmoreClient(url=f"unix://{unix_server.server_address}", rpcuser="user",
+                               rpcpassword="pass",
+                               async_mode=False, transport=transport)
+        assert client.socket_path == unix_server.server_address
+        assert client.url == f"unix://{unix_server.server_address}"
+        for _ in range(5):
+            assert client.getblockcount() == 1000
+        assert len(dict(client.stream("getrawmempool", True, chunk_size=512))) == 300
+        assert server_connections(unix_server) == 1
+        assert set(unix_server.auth) == {"Basic " + base64.b64encode(b"user:pass").decode()}
+        if transport == "requests":
+            adapter = client.sync_session.get_adapter("http://localhost")
+            assert isinstance(adapter, UnixSocketAdapter)
+        client.close_sync()
+
+    def test_async(self, unix_server):
+        """Test that the async client uses aiohttp's UnixConnector."""
+        async def run():
+            async with EvrmoreClient(url=f"unix://{unix_server.server_address}", rpcuser="user",
+                                     rpcpassword="pass", async_mode=True) as client:
+                results = await asyncio.gather(*(client.getblockcount() for _ in range(10)))
+                chunks = [pair async for pair in client.stream("getrawmempool", True)]
+            return results, chunks
+
+        results, chunks = asyncio.run(run())
+        assert results == [1000] * 10
+        assert len(chunks) == 300
+
+    def test_credentials_in_url(self, unix_server):
+        """Test that credentials can be given in the unix:// URL."""
+        client = EvrmoreClient(url=f"unix://alice:secret@{unix_server.server_address}",
+                               async_mode=False)
+        assert client.getblockcount() == 1000
+        assert unix_server.auth == ["Basic " + base64.b64encode(b"alice:secret").decode()]
+
+    def test_missing_socket(self, tmp_path):
+        """Test that a socket nobody listens on raises EvrmoreConnectionError."""
+        for transport in ("requests", "http.client"):
+            client = EvrmoreClient(url=f"unix://{tmp_path / 'missing.sock'}", rpcuser="u",
+                                   rpcpassword="p",
+                                   async_mode=False, transport=transport)
+            with pytest.raises(EvrmoreConnectionError):
+                client.getblockcount()
+
+    def test_url_without_path(self):
+        """Test that a unix:// URL without a socket path is rejected."""
+        with pytest.raises(ValueError):
+            EvrmoreClient(url="unix://", async_mode=False)
+
+    def test_config_rpcconnect(self, tmp_path, unix_server):
+        """Test that rpcconnect=unix:/path in evrmore.conf selects the socket."""
+        (tmp_path / "evrmore.conf").write_text(
+            f"rpcuser=user\nrpcpassword=pass\nrpcconnect=unix:{unix_server.server_address}\n")
+        config = EvrmoreConfig(datadir=str(tmp_path))
+        assert config.get_rpc_socket_path() == unix_server.server_address
+        client = EvrmoreClient(datadir=str(tmp_path), async_mode=False)
+        assert client.socket_path == unix_server.server_address
+        assert client.getblockcount() == 1000
+
+    def test_config_detects_datadir_socket(self, tmp_path, unix_server):
+        """Test that an rpc.sock socket in the data directory is used, and rpcport forces TCP."""
+        (tmp_path / "evrmore.conf").write_text("rpcuser=user\nrpcpassword=pass\n")
+        assert unix_server.server_address == str(tmp_path / "rpc.sock")
+        client = EvrmoreClient(datadir=str(tmp_path), async_mode=False)
+        assert client.socket_path == unix_server.server_address
+        assert client.getblockcount() == 1000
+        tcp = EvrmoreClient(datadir=str(tmp_path), rpcport=8819, async_mode=False)
+        assert tcp.socket_path is None
+
+    def test_config_ignores_regular_file(self, tmp_path):
+        """Test that a regular file named rpc.sock is not mistaken for a socket."""
+        (tmp_path / "evrmore.conf").write_text("rpcuser=user\nrpcpassword=pass\n")
+        (tmp_path / "rpc.sock").write_text("")
+        assert EvrmoreConfig(datadir=str(tmp_path)).get_rpc_socket_path() is None
+        client = EvrmoreClient(datadir=str(tmp_path), async_mode=False)
+        assert client.socket_path is None
+        assert client.url.startswith("http://")
+
+
+def server_connections(server):
+    with server.lock:
+        return server.connections
+
+
+class TestThreadSafe:
+    """Tests for EvrmoreClient(thread_safe=...)."""
+
+    @pytest.mark.parametrize("transport", ["requests", "http.client"])
+    def test_pool_bounds_connections(self, server, transport, caplog):
+        """Test that thread_safe="pool" makes extra threads wait instead of opening connections."""
+        client = make_client(server, transport=transport, thread_safe=True, pool_maxsize=4)
+        assert client.thread_safe == "pool"
+        with caplog.at_level(logging.WARNING, logger="urllib3"):
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                results = list(executor.map(lambda _: client.execute_command("slow"), range(64)))
+        assert results == [1000] * 64
+        assert server_connections(server) == 4
+        assert "Connection pool is full" not in caplog.text
+        client.close_sync()
+
+    def test_shared_pool_overflows(self, server, caplog):
+        """Test the default mode for contrast: extra threads open and discard connections."""
+        client = make_client(server, transport="requests", pool_maxsize=2)
+        with caplog.at_level(logging.WARNING, logger="urllib3"):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: client.execute_command("slow"), range(32)))
+        assert server_connections(server) > 2
+        assert "Connection pool is full" in caplog.text
+
+    @pytest.mark.parametrize("transport", ["requests", "http.client"])
+    def test_per_thread_sessions(self, server, transport):
+        """Test that thread_safe="per_thread" gives each worker its own session and connection."""
+        client = make_client(server, transport=transport, thread_safe="per_thread")
+        sessions = set()
+
+        def call(_):
+            assert client.execute_command("slow") == 1000
+            sessions.add(id(client.sync_session.session))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(call, range(40)))
+        assert isinstance(client.sync_session, PerThreadSession)
+        assert len(sessions) == len(client.sync_session) == 4
+        assert server_connections(server) == 4
+        client.close_sync()
+        assert client.sync_session is None
+
+    def test_per_thread_closes_sessions_of_finished_threads(self, server):
+        """Test that sessions of exited threads are closed rather than kept forever."""
+        client = make_client(server, thread_safe="per_thread")
+        for _ in range(5):
+            thread = threading.Thread(target=client.getblockcount)
+            thread.start()
+            thread.join()
+        assert client.getblockcount() == 1000
+        assert len(client.sync_session) == 1
+
+    def test_concurrent_first_calls_create_one_session(self, server):
+        """Test that threads racing on a fresh client share a single lazily created session."""
+        client = make_client(server)
+        created = []
+        new_session = client._new_sync_session
+
+        def slow_new_session():
+            created.append(1)
+            time.sleep(0.05)
+            return new_session()
+
+        client._new_sync_session = slow_new_session
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert list(executor.map(lambda _: client.getblockcount(), range(8))) == [1000] * 8
+        assert len(created) == 1
+
+    def test_stress_test_sync_reuses_workers(self, server):
+        """Test that stress_test_sync runs on long-lived worker threads."""
+        client = make_client(server, thread_safe="per_thread")
+        results = client.stress_test_sync(num_calls=100, concurrency=4)
+        assert results["num_calls"] == 100 and results["last_result"] == 1000
+        assert server_connections(server) == 4
+
+    def test_invalid_mode(self):
+        """Test that an unknown thread_safe mode is rejected."""
+        with pytest.raises(ValueError):
+            EvrmoreClient(async_mode=False, thread_safe="locked")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for typed responses.
+"""
+
+from decimal import Decimal
+from typing import List
+import pytest
+from pydantic import ValidationError
+from unittest.mock import patch
+
+from evrmore_rpc import EvrmoreClient, EvrmoreClientPool
+from evrmore_rpc.models import AddressUtxo, Block, NetworkInfo, TxOut
+from evrmore_rpc.typed import RESPONSE_TYPES, TypedMethods, get_adapter, get_constructor
+from evrmore_rpc.utils import AwaitableResult, validate_list_response
+
+
+def utxo(i):
+    return {"address": "EXaddr", "txid": f"{i:064x}", "outputIndex": i % 3, "script": "76a914",
+            "satoshis": 1000 + i, "height": 100 + i}
+
+
+BLOCK = {"hash": "00" * 32, "confirmations": 3, "strippedsize": 200, "size": 250, "weight": 800,
+         "height": 7, "version": 1, "versionHex": "00000001", "merkleroot": "ab" * 32,
+         "tx": ["cd" * 32], "time": 1700000000, "mediantime": 1699999000, "nonce": 0,
+         "bits": "1d00ffff", "difficulty": 1.5, "chainwork": "01", "headerhash": "ef" * 32,
+         "mixhash": "12" * 32, "nonce64": 42}
+
+NETWORK = {"version": 1, "subversion": "/Evrmore:1/", "protocolversion": 70028,
+           "localservices": "0d", "localrelay": True, "timeoffset": 0, "connections": 8,
+           "relayfee": 0.01,
+           "networks": [{"name": "ipv4", "limited": False, "reachable": True,
+                         "proxy_randomize_credentials": False}]}
+
+RESULTS = {
+    "getblock": BLOCK,
+    "getnetworkinfo": NETWORK,
+    "getaddressutxos": [utxo(i) for i in range(50)],
+    "listaddressesbyasset": {"EXaddr": 1.25, "EYaddr": 3},
+    "gettxout": None,
+}
+
+
+@pytest.fixture
+def node():
+    calls = []
+
+    def sync(self, command, *args, fields=None):
+        calls.append((command, args))
+        return RESULTS[command]
+
+    async def run_async(self, command, *args, fields=None):
+        return sync(self, command, *args)
+
+    with patch.object(EvrmoreClient, 'execute_command_sync', sync), \
+            patch.object(EvrmoreClient, 'execute_command_async', run_async):
+        yield calls
+
+
+class TestTypedMethods:
+    """Tests for client.typed."""
+
+    def test_validated_results(self, node):
+        """Test that results come back as the command's models, converted by pydantic."""
+        client = EvrmoreClient(async_mode=False)
+        block = client.typed.getblock(BLOCK["hash"])
+        assert isinstance(block, Block) and block.height == 7
+        assert block.difficulty == Decimal("1.5")
+        assert node == [("getblock", (BLOCK["hash"],))]
+        utxos = client.typed.getaddressutxos({"addresses": ["EXaddr"]})
+        assert [u.satoshis for u in utxos] == [1000 + i for i in range(50)]
+        assert all(isinstance(u, AddressUtxo) for u in utxos)
+        holders = client.typed.listaddressesbyasset("CATS")
+        assert holders == {"EXaddr": Decimal("1.25"), "EYaddr": Decimal(3)}
+        assert client.typed.gettxout("00", 0) is None
+
+    def test_trusted_matches_validated(self, node):
+        """Test that trusted construction gives the same models, nested and default fields too."""
+        client = EvrmoreClient(async_mode=False)
+        validated = client.typed.getnetworkinfo()
+        trusted = client.typed.trusted.getnetworkinfo()
+        assert isinstance(trusted, NetworkInfo)
+        assert type(trusted.networks[0]) is type(validated.networks[0])
+        assert trusted.networks[0].proxy is None
+        assert trusted.localaddresses == [] and trusted.warnings == ""
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert "localaddresses" not in trusted.model_fields_set
+        assert client.typed.trusted.getaddressutxos({}) == client.typed.getaddressutxos({})
+
+    def test_trusted_skips_validation(self, node):
+        """Test that trusted mode keeps values as decoded and does not share the raw dicts."""
+        client = EvrmoreClient(async_mode=False)
+        block = client.typed.trusted.getblock("00")
+        assert block.difficulty == 1.5 and not isinstance(block.difficulty, Decimal)
+        block.height = 8
+        assert BLOCK["height"] == 7
+        assert client.typed.trusted is client.typed.trusted
+        assert client.typed.trusted.trusted.mode == "trusted"
+        assert client.typed.lazy.trusted is client.typed.trusted
+
+    def test_bad_shape_raises(self, node):
+        """Test that a result that is not the model raises a ValidationError (a ValueError)."""
+        client = EvrmoreClient(async_mode=False)
+        RESULTS["getblock"] = {"hash": "00"}
+        try:
+            with pytest.raises(ValidationError):
+                client.typed.getblock("00")
+            with pytest.raises(ValueError):
+                client.typed.getblock("00")
+        finally:
+            RESULTS["getblock"] = BLOCK
+
+    @pytest.mark.asyncio
+    async def test_async_mode(self, node):
+        """Test that typed methods are awaitable in async mode."""
+        client = EvrmoreClient(async_mode=True)
+        utxos = await client.typed.getaddressutxos({})
+        assert len(utxos) == 50 and isinstance(utxos[0], AddressUtxo)
+        assert (await client.typed.trusted.getblock("00")).hash == BLOCK["hash"]
+
+    @pytest.mark.asyncio
+    async def test_auto_mode(self, node):
+        """Test that auto mode returns an AwaitableResult usable with or without await."""
+        client = EvrmoreClient()
+        client.reset()
+        result = client.typed.getblock("00")
+        assert isinstance(result, AwaitableResult)
+        assert (await result).height == 7
+        assert client.typed.getblock("00").height == 7
+
+    def test_client_pool(self, node):
+        """Test that a client pool has typed methods of its own."""
+        pool = EvrmoreClientPool(["http://u:p@10.0.0.1:8819", "http://u:p@10.0.0.2:8819"],
+                                 async_mode=False,
+                                 health_check_interval=None)
+        assert pool.typed.client is pool and pool.typed is pool.typed
+        assert pool.typed.getblock("00").height == 7
+        assert isinstance(pool.typed.trusted.getnetworkinfo(), NetworkInfo)
+
+    def test_methods_are_documented(self):
+        """Test that every response type has a method, documented with its type."""
+        for name in RESPONSE_TYPES:
+            assert callable(getattr(TypedMethods, name))
+        assert "List[AddressUtxo]" in TypedMethods.getaddressutxos.__doc__
+        assert "Optional[TxOut]" in TypedMethods.gettxout.__doc__
+        with pytest.raises(KeyError):
+            EvrmoreClient(async_mode=False).typed.converter("getnewcommand")
+
+
+class TestAdapters:
+    """Tests for the cached adapters and constructors."""
+
+    def test_cached(self):
+        """Test that adapters and constructors are built once per type."""
+        assert get_adapter(List[AddressUtxo]) is get_adapter(List[AddressUtxo])
+        assert get_constructor(List[AddressUtxo]) is get_constructor(List[AddressUtxo])
+        assert get_constructor(List[str])("abc") == "abc"
+
+    def test_optional_constructor(self):
+        """Test that Optional models are built, and None passes through."""
+        build = get_constructor(RESPONSE_TYPES["gettxout"])
+        assert build(None) is None
+        out = build({"bestblock": "00", "confirmations": 1, "value": 2.5,
+                     "scriptPubKey": {}, "coinbase": False})
+        assert isinstance(out, TxOut) and out.value == 2.5
+
+    def test_constructor_ignores_unknown_keys(self):
+        """Test that keys the model does not declare are dropped, as model_construct does."""
+        built = get_constructor(AddressUtxo)(dict(utxo(1), newfield=True))
+        assert built.model_dump() == utxo(1)
+        assert isinstance(built.model_fields_set, set)
+
+    def test_list_validation_uses_adapter(self):
+        """Test that validate_list_response validates in one pass and still rejects non-lists."""
+        utxos = validate_list_response([utxo(1), AddressUtxo(**utxo(2))], AddressUtxo)
+        assert [u.height for u in utxos] == [101, 102]
+        with pytest.raises(ValueError):
+            validate_list_response({"not": "a list"}, AddressUtxo)
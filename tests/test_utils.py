@@ -3,9 +3,11 @@
 Tests for the utility functions in utils.py.
 """
 
+import gc
 import pytest
 import asyncio
 import json
+import warnings
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 from pydantic import BaseModel
@@ -198,6 +200,70 @@ class TestUtils:
         # Cleanup should not be called in async mode
         cleanup_func.assert_not_called()
     
+    def test_awaitable_result_lazy_sync(self):
+        """Test that a lazy AwaitableResult only runs the sync function, once."""
+        sync_func = MagicMock(return_value={"blocks": 5})
+        async_func = MagicMock()
+        
+        result = AwaitableResult(sync_func=sync_func, async_func=async_func)
+        sync_func.assert_not_called()
+        
+        assert result["blocks"] == 5
+        assert result == {"blocks": 5}
+        assert len(result) == 1
+        sync_func.assert_called_once()
+        async_func.assert_not_called()
+    
+    def test_awaitable_result_lazy_value_protocol(self):
+        """Test that a lazy AwaitableResult behaves like its value."""
+        result = AwaitableResult(sync_func=lambda: 42, async_func=MagicMock())
+        assert result == 42
+        assert result + 1 == 43
+        assert int(result) == 42
+        assert f"{result:05d}" == "00042"
+        assert bool(result)
+    
+    def test_awaitable_result_lazy_sync_error(self):
+        """Test that a lazy sync failure is raised on use and not retried."""
+        sync_func = MagicMock(side_effect=ValueError("boom"))
+        result = AwaitableResult(sync_func=sync_func, async_func=MagicMock())
+        with pytest.raises(ValueError):
+            str(result)
+        with pytest.raises(ValueError):
+            result["key"]
+        sync_func.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_awaitable_result_lazy_async(self):
+        """Test that awaiting a lazy AwaitableResult only runs the async function."""
+        sync_func = MagicMock()
+        calls = []
+        
+        async def mock_coro():
+            calls.append(1)
+            return "async_result"
+        
+        result = AwaitableResult(sync_func=sync_func, async_func=mock_coro)
+        assert calls == []
+        assert await result == "async_result"
+        assert calls == [1]
+        sync_func.assert_not_called()
+    
+    def test_awaitable_result_resolve_and_unused_warning(self):
+        """Test that resolve() runs the sync function now, and dropping an unused result warns."""
+        sync_func = MagicMock(return_value=3)
+        result = AwaitableResult(sync_func=sync_func, async_func=MagicMock(),
+                                 unused_warning="never sent")
+        assert result.resolve() == 3 and result == 3
+        sync_func.assert_called_once()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            del result
+        with pytest.warns(RuntimeWarning, match="never sent"):
+            AwaitableResult(sync_func=sync_func, async_func=MagicMock(),
+                            unused_warning="never sent")
+            gc.collect()
+    
     def test_sync_or_async_in_sync_context(self):
         """Test sync_or_async in synchronous context."""
         # Create mock functions